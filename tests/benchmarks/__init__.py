@@ -0,0 +1 @@
+"""Throughput benchmarks (marked slow; run with `make bench`)."""
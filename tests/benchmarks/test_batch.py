@@ -0,0 +1,122 @@
+"""Benchmark `π batch` against the offline fake transport.
+
+Runs many orchestrator workflows, each calling a research stage, through
+run_batch with real observers, pool and workflow MCP tools, and checks
+that concurrent workflows keep their contexts, logs and traces apart.
+"""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from π.bridge import pool, session
+from π.bridge.fake import (
+    FakeScript,
+    init_message,
+    result_message,
+    text_message,
+    tool_result_message,
+    tool_use_message,
+)
+from π.cli.batch import BatchJob, run_batch
+from π.core.enums import Command
+
+OBJECTIVES = 48
+WORKERS = 16
+# Simulated model latency per message
+LATENCY_S = 0.005
+TOOL_CALLS = 5
+
+
+def _streams(n: int) -> dict[str, list[dict]]:
+    """Orchestrator and research streams of workflow n."""
+    stage = [init_message(f"stage-{n}")]
+    for i in range(TOOL_CALLS):
+        stage += [
+            text_message(f"Reading module {i}"),
+            tool_use_message(f"r{n}-{i}", "Read", {"file_path": f"/repo/w{n}/m{i}.py"}),
+            tool_result_message(f"r{n}-{i}", "x = 1"),
+        ]
+    stage.append(result_message(f"stage-{n}", result="NEEDS_IMPLEMENTATION: no"))
+    orchestrator = [
+        init_message(f"orchestrator-{n}"),
+        tool_use_message(
+            f"o{n}", "mcp__workflow__research_codebase", {"query": f"area {n}"}
+        ),
+        result_message(
+            f"orchestrator-{n}",
+            result="done",
+            cost_usd=0.01,
+            structured_output={
+                "research_doc_path": f"/research/{n}.md",
+                "research_summary": "NEEDS_IMPLEMENTATION: no",
+                "needs_implementation": False,
+                "status": "no_changes_needed",
+                "summary": f"workflow {n}",
+            },
+        ),
+    ]
+    return {f"/1_research_codebase area {n}": stage, f"objective {n}": orchestrator}
+
+
+@pytest.mark.slow
+def test_batch_throughput(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, capsys: pytest.CaptureFixture
+):
+    """Workers should overlap workflows without mixing their logs."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        session,
+        "get_command_map",
+        lambda: {Command.RESEARCH_CODEBASE: "/1_research_codebase"},
+    )
+    streams: dict[str, list[dict]] = {}
+    for n in range(OBJECTIVES):
+        streams.update(_streams(n))
+    script = FakeScript(streams=streams, latency_s=LATENCY_S)
+    pool.set_client_factory(script.client_factory())
+    jobs = [BatchJob(id=str(n), objective=f"objective {n}") for n in range(OBJECTIVES)]
+
+    start = time.perf_counter()
+    try:
+        with capsys.disabled():
+            summary, output = asyncio.run(
+                run_batch(
+                    jobs,
+                    workers=WORKERS,
+                    output=tmp_path / "results.jsonl",
+                    # Fake sessions edit nothing, so one checkout is safe
+                    worktrees=False,
+                )
+            )
+    finally:
+        pool.set_client_factory(None)
+    elapsed = time.perf_counter() - start
+
+    with capsys.disabled():
+        print(
+            f"\nBatch of {OBJECTIVES} with {WORKERS} workers: {elapsed:.2f}s, "
+            f"{summary.per_hour:,.0f} objectives/h, "
+            f"concurrency {summary.concurrency:.1f}"
+        )
+
+    results = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [r["status"] for r in results[:-1]] == ["no_changes_needed"] * OBJECTIVES
+    assert summary.cost_usd == pytest.approx(0.01 * OBJECTIVES)
+    assert summary.concurrency > WORKERS / 2
+    # Each workflow's log holds its own stage's tool calls and no one else's,
+    # and its trace only its own research stage
+    for result in results[:-1]:
+        n = int(result["id"])
+        log_path = Path(result["log_path"])
+        log = log_path.read_text(encoding="utf-8")
+        assert f"/repo/w{n}/" in log
+        assert f"/repo/w{(n + 1) % OBJECTIVES}/" not in log
+        trace = json.loads(
+            log_path.with_suffix(".trace.json").read_text(encoding="utf-8")
+        )
+        stages = [e for e in trace["traceEvents"] if e.get("cat") == "stage"]
+        assert [e["name"] for e in stages] == ["research_codebase"]
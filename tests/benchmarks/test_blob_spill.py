@@ -0,0 +1,61 @@
+"""Benchmark blob spill on an implement-heavy event stream.
+
+Implement stages rewrite the same files repeatedly; without blobs every
+Write logs (and JSON-escapes) the whole file body again.
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from π.workflow.blobs import BlobStore
+from π.workflow.observer import LoggingObserver
+
+WRITES = 2_000
+FILES = 20
+
+# File bodies of ~40 KB, each rewritten WRITES / FILES times
+_BODIES = [
+    f'"""Module {n}."""\n\n' + "def handler(event):\n    return event\n" * 1000
+    for n in range(FILES)
+]
+
+
+def _emit(observer: LoggingObserver) -> float:
+    """Emit the stream and drain it; return total seconds."""
+    start = time.perf_counter()
+    for i in range(WRITES):
+        n = i % FILES
+        observer.on_tool_start(
+            "Write",
+            {"file_path": f"/repo/src/module_{n}.py", "content": _BODIES[n]},
+            agent_id="stage:implement_plan",
+        )
+    observer.close()
+    return time.perf_counter() - start
+
+
+@pytest.mark.slow
+def test_blob_spill_log_volume(tmp_path: Path, capsys: pytest.CaptureFixture):
+    """Spilled logs should be far smaller; write times are reported."""
+    inline_path = tmp_path / "inline.log"
+    inline_s = _emit(LoggingObserver(inline_path))
+
+    blobs = BlobStore(tmp_path / "blobs", threshold=4096)
+    spilled_path = tmp_path / "spilled.log"
+    spilled_s = _emit(LoggingObserver(spilled_path, blobs=blobs))
+
+    inline_bytes = inline_path.stat().st_size
+    spilled_bytes = spilled_path.stat().st_size + blobs.bytes_spilled
+    with capsys.disabled():
+        print(
+            f"\nBlob spill ({WRITES} Writes of {FILES} files): "
+            f"inline {inline_bytes / 1e6:,.1f} MB in {inline_s:.2f}s, "
+            f"spilled {spilled_bytes / 1e6:,.1f} MB (log + blobs) "
+            f"in {spilled_s:.2f}s"
+        )
+
+    assert spilled_path.read_text().count("TOOL_START: Write") == WRITES
+    assert len(list((tmp_path / "blobs").glob("*/*"))) == FILES
+    assert spilled_bytes * 10 < inline_bytes
@@ -0,0 +1,137 @@
+"""Benchmark stage sessions end-to-end against the offline fake transport.
+
+Runs real ClaudeSDKClient sessions through run_claude_session (pool, hooks,
+message dispatch, observers) with the model replaced by FakeTransport, to
+measure π's own per-message overhead, memory per concurrent session and
+behaviour with many workflows in flight.
+"""
+
+import asyncio
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from π.bridge import pool, session
+from π.bridge.cache import set_stage_cache_enabled
+from π.bridge.fake import (
+    FakeScript,
+    init_message,
+    result_message,
+    text_message,
+    tool_result_message,
+    tool_use_message,
+)
+from π.core.enums import Command
+from π.workflow.bus import ObserverBus
+from π.workflow.observer import LoggingObserver
+
+WORKFLOWS = 128
+# Simulated model latency per message
+LATENCY_S = 0.01
+TOOL_CALLS = 10
+
+
+def _stage_stream(n: int) -> list[dict]:
+    """A research session: reads, notes and a result."""
+    session_id = f"fake-{n}"
+    stream = [init_message(session_id)]
+    for i in range(TOOL_CALLS):
+        tool_use_id = f"t{n}-{i}"
+        stream += [
+            text_message(f"Looking at module {i}"),
+            tool_use_message(tool_use_id, "Read", {"file_path": f"/repo/m{i}.py"}),
+            tool_result_message(tool_use_id, "def f():\n    return 1\n" * 50),
+        ]
+    stream.append(result_message(session_id, result="NEEDS_IMPLEMENTATION: no"))
+    return stream
+
+
+@pytest.fixture
+def fake(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    """Route stage sessions to a fake script with one stream per workflow."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv(pool.POOL_SIZE_ENV, "0")
+    monkeypatch.setattr(
+        session,
+        "get_command_map",
+        lambda: {Command.RESEARCH_CODEBASE: "/1_research_codebase"},
+    )
+    set_stage_cache_enabled(False)
+    script = FakeScript(
+        streams={f"workflow-{n}": _stage_stream(n) for n in range(WORKFLOWS)}
+    )
+    pool.set_client_factory(script.client_factory())
+    yield script
+    pool.set_client_factory(None)
+    set_stage_cache_enabled(True)
+
+
+async def _run_workflows(count: int, observer=None) -> list[str]:
+    try:
+        results = await asyncio.gather(
+            *(
+                session.run_claude_session(
+                    tool_command=Command.RESEARCH_CODEBASE,
+                    query=f"workflow-{n}",
+                    observer=observer,
+                    agent_id=f"stage:research:{n}",
+                )
+                for n in range(count)
+            )
+        )
+    finally:
+        await pool.close_client_pool()
+    return [result for result, *_ in results]
+
+
+@pytest.mark.slow
+def test_per_message_overhead(
+    fake: FakeScript, tmp_path: Path, capsys: pytest.CaptureFixture
+):
+    """Report π's overhead per replayed message."""
+    observer = ObserverBus([LoggingObserver(tmp_path / "run.log")])
+
+    start = time.perf_counter()
+    results = asyncio.run(_run_workflows(WORKFLOWS, observer))
+    elapsed = time.perf_counter() - start
+    observer.close()
+
+    per_message_us = elapsed / fake.stats.messages * 1e6
+    with capsys.disabled():
+        print(
+            f"\nFake stage sessions: {WORKFLOWS} sessions, "
+            f"{fake.stats.messages} messages in {elapsed:.2f}s "
+            f"({per_message_us:.0f} us/message, "
+            f"{fake.stats.hook_calls} hook calls)"
+        )
+
+    assert results == ["NEEDS_IMPLEMENTATION: no"] * WORKFLOWS
+
+
+@pytest.mark.slow
+def test_concurrent_workflows_overlap(fake: FakeScript, capsys: pytest.CaptureFixture):
+    """Concurrent sessions should overlap their model latency."""
+    fake.latency_s = LATENCY_S
+    serial_s = len(_stage_stream(0)) * LATENCY_S
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = asyncio.run(_run_workflows(WORKFLOWS))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    with capsys.disabled():
+        print(
+            f"\n{WORKFLOWS} concurrent workflows at {LATENCY_S * 1000:.0f} ms/message: "
+            f"{elapsed:.2f}s (one alone: {serial_s:.2f}s), "
+            f"peak {peak / WORKFLOWS / 1024:.0f} KiB/workflow"
+        )
+
+    assert len(results) == WORKFLOWS
+    assert fake.stats.connects == WORKFLOWS
+    # Far below WORKFLOWS * serial_s: sessions wait on latency concurrently
+    # (observed ~13x faster; the margin absorbs loaded machines)
+    assert elapsed < serial_s * WORKFLOWS / 4
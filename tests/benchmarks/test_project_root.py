@@ -0,0 +1,87 @@
+"""Benchmark project root discovery on hook and tracker hot paths.
+
+Compares the memoized pure-Python resolver against the previous
+implementation, which forked `git rev-parse --show-toplevel` on every call
+made outside a directory with project markers.
+"""
+
+import subprocess
+import time
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from π.bridge.session import WriteTracker
+from π.core.enums import Command
+from π.hooks.utils import compact_path
+from π.utils import PROJECT_MARKERS, get_project_root
+
+CALLS = 200
+
+
+def _subprocess_project_root(start_path: Path | None = None) -> Path:
+    """Previous behaviour: marker check, then fork git for every call."""
+    cwd = start_path or Path.cwd()
+    if any((cwd / m).exists() for m in PROJECT_MARKERS):
+        return cwd
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return Path(result.stdout.strip())
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return cwd
+
+
+def _time(func: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        func()
+    return (time.perf_counter() - start) / CALLS
+
+
+@pytest.mark.slow
+def test_project_root_hot_paths(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+):
+    """Memoized discovery should make per-call root lookups negligible."""
+    repo = tmp_path / "repo"
+    subdir = repo / "src" / "pkg"
+    subdir.mkdir(parents=True)
+    subprocess.run(["git", "init", "-q", str(repo)], check=True)
+    monkeypatch.chdir(subdir)
+
+    doc = repo / "thoughts" / "shared" / "plans" / "plan.md"
+    doc.parent.mkdir(parents=True)
+    doc.write_text("# Plan\n")
+    tracker = WriteTracker(command=Command.CREATE_PLAN)
+    tracker.on_tool_use("thoughts/shared/plans/plan.md")
+    source = subdir / "module.py"
+
+    results: dict[str, tuple[float, float]] = {}
+    for name, call, module in (
+        ("compact_path", lambda: compact_path(source), "π.hooks.utils"),
+        ("get_doc_path", tracker.get_doc_path, "π.bridge.session"),
+    ):
+        with patch(f"{module}.get_project_root", _subprocess_project_root):
+            before = _time(call)
+        after = _time(call)
+        results[name] = (before, after)
+
+    with capsys.disabled():
+        for name, (before, after) in results.items():
+            print(
+                f"\n{name} ({CALLS} calls): before {before * 1e6:,.0f} us/call, "
+                f"after {after * 1e6:,.1f} us/call ({before / after:,.0f}x)"
+            )
+
+    assert get_project_root() == repo.resolve()
+    # Memoized lookups are ~20-60x faster; require 5x to avoid racing timings
+    for before, after in results.values():
+        assert after * 5 < before
@@ -0,0 +1,106 @@
+"""Benchmark a full workflow run replayed from a recording.
+
+Replays an orchestrator session and a long research stage session through
+π.cli.runner.run at full speed, so the orchestrator loop, stage loop,
+dispatch_message, WriteTracker and every observer (Rich display, logs,
+event log, metrics, tracer) process the same workload on every change.
+"""
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from π.bridge import session
+from π.bridge.fake import (
+    init_message,
+    result_message,
+    text_message,
+    tool_result_message,
+    tool_use_message,
+)
+from π.bridge.recording import SessionRecorder, load_recording
+from π.cli.runner import run
+from π.core.enums import Command
+
+OBJECTIVE = "Document the auth module"
+STAGE_PROMPT = "/1_research_codebase auth"
+TOOL_CALLS = 1_000
+
+
+def _write_recording(path: Path) -> None:
+    """Write a recording of an orchestrator run with one research stage."""
+    recorder = SessionRecorder(path, objective=OBJECTIVE, driver="orchestrator")
+
+    stage = [init_message("stage")]
+    for i in range(TOOL_CALLS):
+        stage += [
+            text_message(f"Reading module {i}"),
+            tool_use_message(f"r{i}", "Read", {"file_path": f"/repo/m{i}.py"}),
+            tool_result_message(f"r{i}", "def f():\n    return 1\n" * 20),
+        ]
+    doc = "thoughts/shared/research/auth.md"
+    stage += [
+        tool_use_message("w", "Write", {"file_path": doc, "content": "# Auth"}),
+        tool_result_message("w", "ok"),
+        result_message("stage", result="NEEDS_IMPLEMENTATION: no"),
+    ]
+    recorder.write_session(STAGE_PROMPT, stage)
+
+    recorder.write_session(
+        OBJECTIVE,
+        [
+            init_message("orchestrator"),
+            tool_use_message(
+                "o1", "mcp__workflow__research_codebase", {"query": "auth"}
+            ),
+            tool_result_message("o1", "recorded result (replaced on replay)"),
+            result_message(
+                "orchestrator",
+                result="done",
+                structured_output={
+                    "research_doc_path": doc,
+                    "research_summary": "NEEDS_IMPLEMENTATION: no",
+                    "needs_implementation": False,
+                    "status": "no_changes_needed",
+                    "summary": "Nothing to change",
+                },
+            ),
+        ],
+    )
+    recorder.close()
+
+
+@pytest.mark.slow
+def test_replay_run(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, capsys: pytest.CaptureFixture
+):
+    """A replayed run should reproduce the workflow output at full speed."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        session,
+        "get_command_map",
+        lambda: {Command.RESEARCH_CODEBASE: "/1_research_codebase"},
+    )
+    path = tmp_path / "run.jsonl.gz"
+    _write_recording(path)
+    recording = load_recording(path)
+
+    start = time.perf_counter()
+    with capsys.disabled():
+        output = asyncio.run(run(recording.objective, replay=recording))
+    elapsed = time.perf_counter() - start
+
+    stats = recording.script.stats
+    with capsys.disabled():
+        print(
+            f"\nReplayed run: {stats.messages} messages in {elapsed:.2f}s "
+            f"({stats.messages / elapsed:,.0f} messages/s)"
+        )
+
+    assert output is not None
+    assert output.status == "no_changes_needed"
+    assert stats.sessions == 2
+    assert stats.mcp_calls == 1
+    assert stats.messages == recording.messages
@@ -0,0 +1,79 @@
+"""Benchmark dangerous command matching with large rule sets.
+
+Compares the combined matcher with thousands of organization rules against
+the default rules alone and against searching each precompiled rule in
+turn, as the previous implementation did.
+"""
+
+import random
+import re
+import string
+import time
+
+import pytest
+
+from π.hooks.rules import DEFAULT_RULES, CommandMatcher, SafetyRule
+
+ORG_RULES = 5_000
+COMMANDS = 2_000
+
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(5, 10)))
+
+
+def _org_rules(rng: random.Random) -> list[SafetyRule]:
+    """Half regex rules on a command and flag, half literal deny entries."""
+    rules = [
+        SafetyRule(f"org rule {i}", pattern=rf"{_word(rng)}\s+--{_word(rng)}")
+        for i in range(ORG_RULES // 2)
+    ]
+    rules.extend(
+        SafetyRule(f"org literal {i}", literal=f"{_word(rng)} {_word(rng)}")
+        for i in range(ORG_RULES // 2)
+    )
+    return rules
+
+
+def _per_command_s(match: object, commands: list[str]) -> float:
+    start = time.perf_counter()
+    for cmd in commands:
+        match(cmd)  # type: ignore[operator]
+    return (time.perf_counter() - start) / len(commands)
+
+
+@pytest.mark.slow
+def test_matcher_throughput_with_large_rule_sets(capsys: pytest.CaptureFixture):
+    """Combined matching should far outpace a per-rule loop over many rules."""
+    rng = random.Random(0)
+    rules = [*DEFAULT_RULES, *_org_rules(rng)]
+    commands = [
+        f"cd src/{_word(rng)} && uv run pytest tests/{_word(rng)}.py -q | tee out.log"
+        for _ in range(COMMANDS)
+    ]
+
+    compile_start = time.perf_counter()
+    large = CommandMatcher(rules)
+    compile_s = time.perf_counter() - compile_start
+    default_s = _per_command_s(CommandMatcher(DEFAULT_RULES).match, commands)
+    large_s = _per_command_s(large.match, commands)
+    memoized_s = _per_command_s(large.match, commands)
+
+    compiled = [re.compile(rule.pattern or re.escape(rule.literal)) for rule in rules]
+    sample = commands[:50]
+    loop_s = _per_command_s(
+        lambda cmd: any(pattern.search(cmd) for pattern in compiled), sample
+    )
+
+    with capsys.disabled():
+        print(
+            f"\nCommand matching ({len(rules)} rules, compiled in {compile_s:.2f}s): "
+            f"default rules {default_s * 1e6:,.1f} us/cmd, "
+            f"combined {large_s * 1e6:,.1f} us/cmd, "
+            f"memoized {memoized_s * 1e6:,.2f} us/cmd, "
+            f"per-rule loop {loop_s * 1e6:,.0f} us/cmd"
+        )
+
+    # Relative only, with wide margins (observed ~15x and ~1000x)
+    assert large_s * 5 < loop_s
+    assert memoized_s * 10 < large_s
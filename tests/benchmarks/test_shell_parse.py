@@ -0,0 +1,48 @@
+"""Benchmark the Bash safety check on long compound command lines.
+
+Agents chain dozens of commands with `cd`, pipes and `$(...)`; the hook
+parses each line once and serves repeats from the parse cache.
+"""
+
+import time
+
+import pytest
+
+from π.hooks import shell
+from π.hooks.safety import dangerous_command_reason
+
+REPEATS = 200
+
+STEP = (
+    'cd "packages/{i}" && uv run pytest -q tests/ 2>&1 | tee "../logs/{i}.log"; '
+    'echo "done: $(date +%s)" >> ../logs/summary.txt; cd ../..; '
+)
+
+
+@pytest.mark.slow
+def test_safety_check_on_compound_commands(capsys: pytest.CaptureFixture):
+    """Cached checks should be far cheaper than cold ones."""
+    lines = [
+        "".join(STEP.format(i=f"{n}-{i}") for i in range(25)) for n in range(REPEATS)
+    ]
+    cwd = "/work/project"
+
+    start = time.perf_counter()
+    for line in lines:
+        assert dangerous_command_reason(line, cwd) is None
+    cold_s = (time.perf_counter() - start) / len(lines)
+
+    start = time.perf_counter()
+    for line in lines:
+        dangerous_command_reason(line, cwd)
+    warm_s = (time.perf_counter() - start) / len(lines)
+
+    with capsys.disabled():
+        print(
+            f"\nBash safety check ({len(lines[0]):,} chars, "
+            f"{len(shell.parse_command(lines[0]).commands)} commands): "
+            f"cold {cold_s * 1e6:,.0f} us/line, cached {warm_s * 1e6:,.0f} us/line"
+        )
+
+    # Relative only: absolute times depend on the machine (cached is ~10x)
+    assert warm_s * 3 < cold_s
@@ -18,6 +18,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from π.core.enums import DocType
+from π.utils import clear_project_root_cache
 
 # Suppress warnings from third-party libraries
 warnings.filterwarnings("ignore", category=ResourceWarning, module="claude_agent_sdk.*")
@@ -60,11 +61,14 @@ def typescript_project(tmp_path: Path) -> Path:
 
 @pytest.fixture
 def mock_claude_client() -> Generator[MagicMock]:
-    """Mock ClaudeSDKClient for workflow tests."""
-    with patch("π.bridge.session.ClaudeSDKClient") as mock_class:
+    """Mock ClaudeSDKClient for workflow tests.
+
+    Stage sessions obtain clients from the pool, which calls connect() and
+    disconnect() directly, so the mock client is the constructed instance.
+    """
+    with patch("π.bridge.pool.ClaudeSDKClient") as mock_class:
         mock_client = AsyncMock()
-        mock_class.return_value.__aenter__.return_value = mock_client
-        mock_class.return_value.__aexit__.return_value = None
+        mock_class.return_value = mock_client
         yield mock_client
 
 
@@ -192,6 +196,13 @@ def cleanup_logging_handlers():
         logger.handlers.clear()
 
 
+@pytest.fixture(autouse=True)
+def clear_project_roots():
+    """Forget memoized project roots so tests can rearrange directories."""
+    yield
+    clear_project_root_cache()
+
+
 # ============================================================================
 # Console & Spinner Mocks (for permissions/hitl tests)
 # ============================================================================
@@ -283,16 +294,15 @@ def mock_claude_client_with_responses():
 
     @contextmanager
     def _create(messages: list[MagicMock]):
-        with patch("π.bridge.session.ClaudeSDKClient") as mock_class:
+        with patch("π.bridge.pool.ClaudeSDKClient") as mock_class:
             mock_client = AsyncMock()
-            mock_class.return_value.__aenter__.return_value = mock_client
-            mock_class.return_value.__aexit__.return_value = None
+            mock_class.return_value = mock_client
 
             async def response_iterator():
                 for msg in messages:
                     yield msg
 
-            mock_client.receive_response.return_value = response_iterator()
+            mock_client.receive_response = MagicMock(return_value=response_iterator())
             yield mock_client
 
     return _create
@@ -147,12 +147,16 @@ class TestHookIntegration:
         assert result == {}
 
     @pytest.mark.asyncio
-    async def test_check_file_format_runs_checker_on_python(self, tmp_path: Path):
+    async def test_check_file_format_runs_checker_on_python(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
         """check_file_format should run checker for Python files."""
         from unittest.mock import MagicMock, patch
 
         from π.hooks import check_file_format
 
+        # Lint synchronously per edit (scheduled mode is tested below)
+        monkeypatch.setenv("PI_LINT_DEBOUNCE_S", "0")
         python_file = tmp_path / "test.py"
         python_file.write_text("print('hello')\n")
 
@@ -173,12 +177,16 @@ class TestHookIntegration:
         assert result == {}
 
     @pytest.mark.asyncio
-    async def test_check_file_format_blocks_on_failure(self, tmp_path: Path):
+    async def test_check_file_format_blocks_on_failure(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
         """check_file_format should block when checker returns exit code 2."""
         from unittest.mock import MagicMock, patch
 
         from π.hooks import check_file_format
 
+        # Lint synchronously per edit (scheduled mode is tested below)
+        monkeypatch.setenv("PI_LINT_DEBOUNCE_S", "0")
         python_file = tmp_path / "test.py"
         python_file.write_text("print('hello')\n")
 
@@ -198,3 +206,82 @@ class TestHookIntegration:
 
         assert result.get("decision") == "block"
         assert "Code quality checks failed" in result.get("reason", "")
+
+
+class TestScheduledLintHooks:
+    """Integration tests for debounced lint hooks across a turn."""
+
+    @staticmethod
+    def _edit(path: Path) -> HookInput:
+        return cast(
+            "HookInput",
+            {
+                "session_id": "session-1",
+                "tool_name": "Edit",
+                "tool_input": {"file_path": str(path)},
+            },
+        )
+
+    @pytest.mark.asyncio
+    async def test_burst_of_edits_checked_once_at_stop(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Repeated edits should collapse into one check reported on Stop."""
+        from unittest.mock import MagicMock, patch
+
+        from π.hooks import check_file_format, flush_lint_checks
+
+        monkeypatch.setenv("PI_LINT_DEBOUNCE_S", "60")
+        python_file = tmp_path / "test.py"
+        python_file.write_text("print('hello')\n")
+        context = HookContext(signal=None)
+
+        mock_checker = MagicMock(return_value=2)
+        with (
+            patch("π.hooks.linting.get_checker", return_value=mock_checker),
+            patch("π.hooks.scheduler.get_checker", return_value=mock_checker),
+        ):
+            for _ in range(10):
+                result = await check_file_format(self._edit(python_file), None, context)
+                assert result == {}
+            stop = cast("HookInput", {"session_id": "session-1"})
+            result = await flush_lint_checks(stop, None, context)
+            again = await flush_lint_checks(stop, None, context)
+
+        mock_checker.assert_called_once()
+        assert result["decision"] == "block"
+        assert "test.py" in result["reason"]
+        assert again == {}
+
+    @pytest.mark.asyncio
+    async def test_failure_reported_on_next_edit(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """A debounced failure should block the next edit of that file only."""
+        import asyncio
+        from unittest.mock import MagicMock, patch
+
+        from π.hooks import check_file_format
+
+        monkeypatch.setenv("PI_LINT_DEBOUNCE_S", "0.01")
+        bad, other = tmp_path / "bad.py", tmp_path / "other.py"
+        bad.write_text("x\n")
+        other.write_text("y\n")
+        context = HookContext(signal=None)
+
+        mock_checker = MagicMock(
+            side_effect=lambda path, _tool: 2 if path == bad else 0
+        )
+        with (
+            patch("π.hooks.linting.get_checker", return_value=mock_checker),
+            patch("π.hooks.scheduler.get_checker", return_value=mock_checker),
+            patch("π.hooks.scheduler.get_batch_checker", return_value=None),
+        ):
+            await check_file_format(self._edit(bad), None, context)
+            await asyncio.sleep(0.2)
+            unrelated = await check_file_format(self._edit(other), None, context)
+            result = await check_file_format(self._edit(bad), None, context)
+
+        assert unrelated == {}
+        assert result["decision"] == "block"
+        assert "bad.py" in result["reason"]
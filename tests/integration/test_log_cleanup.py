@@ -38,7 +38,7 @@ class TestLogCleanupIntegration:
         monkeypatch.chdir(tmp_path)
 
         # Mock the async run function to avoid actual agent execution
-        with patch("π.cli.main.asyncio.run") as mock_run:
+        with patch("asyncio.run") as mock_run:
             mock_run.return_value = MagicMock(
                 status="complete",
                 research_doc_path="/research.md",
@@ -66,7 +66,7 @@ class TestLogCleanupIntegration:
         monkeypatch.chdir(tmp_path)
 
         # Mock the async run function
-        with patch("π.cli.main.asyncio.run") as mock_run:
+        with patch("asyncio.run") as mock_run:
             mock_run.return_value = MagicMock(
                 status="complete",
                 research_doc_path="/research.md",
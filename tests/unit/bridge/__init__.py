@@ -0,0 +1 @@
+"""Unit tests for π.bridge modules."""
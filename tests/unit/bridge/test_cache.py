@@ -0,0 +1,197 @@
+"""Tests for π.bridge.cache module."""
+
+import os
+import subprocess
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from π.bridge.cache import (
+    CachedStage,
+    StageCache,
+    get_stage_cache,
+    normalize_query,
+    repo_state_hash,
+    set_stage_cache_enabled,
+)
+from π.bridge.session import _stage_cache_key
+from π.core.enums import Command
+
+pytestmark = pytest.mark.no_api
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    """Create a git repository with one commit."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "main.py").write_text("print('hello')\n")
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": "t",
+        "GIT_AUTHOR_EMAIL": "t@t",
+        "GIT_COMMITTER_NAME": "t",
+        "GIT_COMMITTER_EMAIL": "t@t",
+    }
+    for cmd in (["init", "-q"], ["add", "."], ["commit", "-qm", "init"]):
+        subprocess.run(["git", *cmd], cwd=repo, check=True, env=env)
+    return repo
+
+
+@pytest.fixture
+def cache(git_repo: Path, tmp_path: Path) -> StageCache:
+    """Create a stage cache for the git repository."""
+    return StageCache(tmp_path / "cache", root=git_repo)
+
+
+class TestRepoStateHash:
+    """Tests for repo_state_hash function."""
+
+    def test_none_outside_git(self, tmp_path: Path):
+        """Should return None when not in a git repository."""
+        assert repo_state_hash(tmp_path) is None
+
+    def test_stable_for_unchanged_tree(self, git_repo: Path):
+        """Should return the same hash for an unchanged tree."""
+        assert repo_state_hash(git_repo) == repo_state_hash(git_repo)
+
+    def test_changes_with_tracked_edit(self, git_repo: Path):
+        """Should change when a tracked file is modified."""
+        before = repo_state_hash(git_repo)
+        (git_repo / "main.py").write_text("print('changed')\n")
+        assert repo_state_hash(git_repo) != before
+
+    def test_changes_with_untracked_file(self, git_repo: Path):
+        """Should change when an untracked file is added."""
+        before = repo_state_hash(git_repo)
+        (git_repo / "new.py").write_text("x = 1\n")
+        assert repo_state_hash(git_repo) != before
+
+    def test_ignores_thoughts_directory(self, git_repo: Path):
+        """Should ignore documents written by stages under thoughts/."""
+        before = repo_state_hash(git_repo)
+        (git_repo / "thoughts" / "shared").mkdir(parents=True)
+        (git_repo / "thoughts" / "shared" / "doc.md").write_text("# Doc")
+        assert repo_state_hash(git_repo) == before
+
+
+class TestStageCache:
+    """Tests for StageCache class."""
+
+    def test_normalizes_query_in_key(self, cache: StageCache):
+        """Should key case- and whitespace-insensitively."""
+        assert normalize_query("  Find   AUTH ") == "find auth"
+        key1 = cache.key_for(Command.RESEARCH_CODEBASE, "Find auth")
+        key2 = cache.key_for(Command.RESEARCH_CODEBASE, "find   auth")
+        assert key1 == key2
+
+    def test_key_depends_on_document_content(self, cache: StageCache, tmp_path: Path):
+        """Should change the key when the input document changes."""
+        doc = tmp_path / "research.md"
+        doc.write_text("v1")
+        key1 = cache.key_for(Command.CREATE_PLAN, "plan", doc)
+        doc.write_text("v2")
+        assert cache.key_for(Command.CREATE_PLAN, "plan", doc) != key1
+
+    def test_roundtrip_and_hit_rate(self, cache: StageCache):
+        """Should return stored entries and track hits/misses."""
+        key = cache.key_for(Command.RESEARCH_CODEBASE, "q")
+        assert key is not None
+        assert cache.get(key) is None
+
+        cache.put(key, CachedStage(result="done", session_id="s1"))
+        entry = cache.get(key)
+
+        assert entry is not None
+        assert entry.result == "done"
+        assert entry.session_id == "s1"
+        assert cache.hit_rate == 0.5
+
+    def test_stale_document_is_a_miss(self, cache: StageCache, tmp_path: Path):
+        """Should discard entries whose document changed or disappeared."""
+        doc = tmp_path / "doc.md"
+        doc.write_text("# Research")
+        key = "k"
+        cache.put(key, CachedStage(result="r", session_id="s", doc_path=str(doc)))
+        assert cache.get(key) is not None
+
+        doc.write_text("# Edited")
+        assert cache.get(key) is None
+
+    def test_evicts_expired_entries(self, cache: StageCache):
+        """Should remove entries older than max_age_s."""
+        cache.put("old", CachedStage(result="r", session_id="s"))
+        old = cache.cache_dir / "old.json"
+        past = time.time() - cache.max_age_s - 10
+        os.utime(old, (past, past))
+
+        assert cache.evict() == 1
+        assert not old.exists()
+
+    def test_evicts_oldest_over_size_limit(self, cache: StageCache):
+        """Should drop least recently used entries above max_bytes."""
+        cache.put("a", CachedStage(result="x" * 100, session_id="s"))
+        past = time.time() - 60
+        os.utime(cache.cache_dir / "a.json", (past, past))
+        cache.max_bytes = 250
+        cache.put("b", CachedStage(result="y" * 100, session_id="s"))
+
+        assert not (cache.cache_dir / "a.json").exists()
+        assert (cache.cache_dir / "b.json").exists()
+
+
+class TestGetStageCache:
+    """Tests for get_stage_cache function."""
+
+    def test_disabled_returns_none(self, tmp_path: Path):
+        """Should return None when caching is disabled (--no-cache)."""
+        set_stage_cache_enabled(False)
+        try:
+            assert get_stage_cache(tmp_path) is None
+        finally:
+            set_stage_cache_enabled(True)
+
+    def test_uses_project_cache_dir(self, tmp_path: Path):
+        """Should store entries under .π/cache/stages."""
+        cache = get_stage_cache(tmp_path)
+        assert cache is not None
+        assert cache.cache_dir == tmp_path / ".π" / "cache" / "stages"
+
+    def test_worktree_keys_on_worktree_state(self, tmp_path: Path):
+        """Should key on the worktree's state but store under the project root."""
+        worktree = tmp_path / ".π" / "worktrees" / "1"
+        cache = get_stage_cache(tmp_path, worktree=worktree)
+        assert cache is not None
+        assert cache.root == worktree
+        assert cache.cache_dir == tmp_path / ".π" / "cache" / "stages"
+        assert not (worktree / ".gitignore").exists()
+
+
+class TestStageCacheKey:
+    """Tests for π.bridge.session._stage_cache_key."""
+
+    @pytest.mark.asyncio
+    async def test_hashes_repo_state_off_event_loop(self, git_repo: Path):
+        """Should run the git subprocesses on a worker thread."""
+        cache = StageCache(git_repo / ".cache", root=git_repo)
+        threads: list[int] = []
+        key_for = cache.key_for
+
+        def tracking_key_for(*args: object) -> str | None:
+            threads.append(threading.get_ident())
+            return key_for(*args)
+
+        with (
+            patch("π.bridge.session.get_stage_cache", return_value=cache),
+            patch.object(cache, "key_for", side_effect=tracking_key_for),
+        ):
+            _, key = await _stage_cache_key(
+                Command.RESEARCH_CODEBASE, "q", None, resuming=False
+            )
+
+        assert key is not None
+        assert threads
+        assert threads[0] != threading.get_ident()
@@ -0,0 +1,199 @@
+"""Tests for π.bridge.fake module."""
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+from claude_agent_sdk import (
+    AssistantMessage,
+    ClaudeAgentOptions,
+    HookMatcher,
+    ResultMessage,
+    UserMessage,
+    create_sdk_mcp_server,
+    tool,
+)
+
+from π.bridge.fake import (
+    FakeScript,
+    init_message,
+    load_stream,
+    result_message,
+    text_message,
+    tool_result_message,
+    tool_use_message,
+)
+from π.bridge.pool import create_client, set_client_factory
+
+pytestmark = pytest.mark.no_api
+
+
+@tool("echo", "Echo the input", {"x": str})
+async def _echo(args: dict) -> dict:
+    return {"content": [{"type": "text", "text": f"echo {args['x']}"}]}
+
+
+async def _run(script: FakeScript, prompt: str, options=None) -> list:
+    """Send one prompt through a fake client; return the received messages."""
+    client = script.client_factory()(options or ClaudeAgentOptions())
+    async with client:
+        await client.query(prompt)
+        return [message async for message in client.receive_response()]
+
+
+class TestFakeScript:
+    """Tests for FakeScript class."""
+
+    def test_stream_for_matches_prompt_substring(self):
+        """Should pick the stream whose key the prompt contains."""
+        research = [text_message("r")]
+        default = [text_message("d")]
+        script = FakeScript(streams={"/1_research": research}, default=default)
+
+        assert script.stream_for("/1_research_codebase auth") is research
+        assert script.stream_for("hello") is default
+
+    def test_stream_for_without_default_raises(self):
+        """Should raise LookupError when nothing matches."""
+        with pytest.raises(LookupError):
+            FakeScript().stream_for("hello")
+
+    def test_load_stream(self, tmp_path: Path):
+        """Should read one message per line, skipping blank lines."""
+        path = tmp_path / "session.jsonl"
+        messages = [init_message("s1"), result_message("s1", result="ok")]
+        path.write_text("\n".join(json.dumps(m) for m in messages) + "\n\n")
+
+        assert load_stream(path) == messages
+
+
+class TestFakeTransport:
+    """Tests for FakeTransport class."""
+
+    @pytest.mark.asyncio
+    async def test_replays_stream(self):
+        """Should replay the scripted messages through ClaudeSDKClient."""
+        script = FakeScript(
+            default=[
+                init_message("s1"),
+                text_message("hello"),
+                result_message("s1", result="done", num_turns=2, cost_usd=0.5),
+            ]
+        )
+
+        messages = await _run(script, "hi")
+
+        assert isinstance(messages[1], AssistantMessage)
+        assert messages[1].content[0].text == "hello"
+        result = messages[-1]
+        assert isinstance(result, ResultMessage)
+        assert (result.result, result.num_turns, result.total_cost_usd) == (
+            "done",
+            2,
+            0.5,
+        )
+        assert script.stats.connects == 1
+        assert script.stats.sessions == 1
+        assert script.stats.messages == 3
+
+    @pytest.mark.asyncio
+    async def test_missing_stream_returns_error_result(self):
+        """Should end with an error result when no stream matches."""
+        messages = await _run(FakeScript(), "hi")
+
+        assert len(messages) == 1
+        assert messages[0].is_error
+        assert "No fake stream" in messages[0].result
+
+    @pytest.mark.asyncio
+    async def test_runs_matching_hooks(self):
+        """Should call Pre/PostToolUse hooks for matching tools and Stop."""
+        calls: list[tuple[str, str | None, str | None]] = []
+
+        async def record(input_data, tool_use_id, _context):
+            calls.append((
+                input_data["hook_event_name"],
+                input_data.get("tool_name"),
+                tool_use_id,
+            ))
+            return {}
+
+        options = ClaudeAgentOptions(
+            hooks={
+                "PreToolUse": [HookMatcher(matcher="Bash", hooks=[record])],
+                "PostToolUse": [HookMatcher(matcher="Bash|Read", hooks=[record])],
+                "Stop": [HookMatcher(hooks=[record])],
+            }
+        )
+        script = FakeScript(
+            default=[
+                init_message("s1"),
+                tool_use_message("t1", "Bash", {"command": "ls"}),
+                tool_result_message("t1", "a.py"),
+                tool_use_message("t2", "Write", {"file_path": "/a"}),
+                tool_result_message("t2", "ok"),
+                result_message("s1"),
+            ]
+        )
+
+        await _run(script, "go", options)
+
+        assert calls == [
+            ("PreToolUse", "Bash", "t1"),
+            ("PostToolUse", "Bash", "t1"),
+            ("Stop", None, None),
+        ]
+        assert script.stats.hook_calls == 3
+
+    @pytest.mark.asyncio
+    async def test_calls_sdk_mcp_tools(self):
+        """Should answer SDK MCP tool uses from the in-process server."""
+        options = ClaudeAgentOptions(
+            mcp_servers={"t": create_sdk_mcp_server("t", tools=[_echo])}
+        )
+        script = FakeScript(
+            default=[
+                init_message("s1"),
+                tool_use_message("t1", "mcp__t__echo", {"x": "y"}),
+                # Replaced by the server's result
+                tool_result_message("t1", "scripted"),
+                result_message("s1"),
+            ]
+        )
+
+        messages = await _run(script, "go", options)
+
+        results = [m for m in messages if isinstance(m, UserMessage)]
+        assert len(results) == 1
+        assert results[0].content[0].content == [{"type": "text", "text": "echo y"}]
+        assert script.stats.mcp_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_applies_latency(self):
+        """Should wait latency_s before each replayed message."""
+        script = FakeScript(
+            default=[init_message("s1"), result_message("s1")], latency_s=0.02
+        )
+
+        start = time.perf_counter()
+        await _run(script, "go")
+
+        assert time.perf_counter() - start >= 0.04
+
+
+class TestClientFactory:
+    """Tests for create_client and set_client_factory."""
+
+    def test_create_client_uses_factory(self):
+        """Should build clients with the configured factory until reset."""
+        script = FakeScript()
+        options = ClaudeAgentOptions()
+        set_client_factory(script.client_factory())
+        try:
+            client = create_client(options)
+            assert client._custom_transport is not None
+        finally:
+            set_client_factory(None)
+
+        assert create_client(options)._custom_transport is None
@@ -0,0 +1,233 @@
+"""Tests for π.bridge.pool module."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from claude_agent_sdk import ClaudeAgentOptions
+
+from π.bridge.pool import ClientPool, get_client_pool, options_fingerprint
+
+pytestmark = pytest.mark.no_api
+
+
+def _factory(clients: list[AsyncMock], *, fail: bool = False):
+    """Build a client factory that records created clients."""
+
+    def create(_options):
+        client = AsyncMock()
+        if fail:
+            client.connect.side_effect = RuntimeError("connect failed")
+        clients.append(client)
+        return client
+
+    return create
+
+
+class TestClientPool:
+    """Tests for ClientPool class."""
+
+    @pytest.mark.asyncio
+    async def test_miss_connects_on_demand(self):
+        """Should connect a client on demand when nothing is warm."""
+        clients: list[AsyncMock] = []
+        pool = ClientPool(size=0, client_factory=_factory(clients))
+
+        async with pool.acquire(MagicMock()) as client:
+            client.connect.assert_awaited_once()
+
+        client.disconnect.assert_awaited_once()
+        assert pool.stats.misses == 1
+        assert pool.stats.hits == 0
+
+    @pytest.mark.asyncio
+    async def test_warm_client_is_a_hit(self):
+        """Should hand out the pre-spawned client and count a hit."""
+        clients: list[AsyncMock] = []
+        pool = ClientPool(size=1, client_factory=_factory(clients))
+        options = MagicMock()
+
+        pool.warm(options)
+        await asyncio.sleep(0)
+        async with pool.acquire(options) as client:
+            assert client is clients[0]
+
+        assert pool.stats.hits == 1
+        assert pool.stats.hit_rate == 1.0
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_spawns_replacement_after_checkout(self):
+        """Should keep the pool topped up after a client is handed out."""
+        clients: list[AsyncMock] = []
+        pool = ClientPool(size=1, client_factory=_factory(clients))
+        options = MagicMock()
+
+        pool.warm(options)
+        async with pool.acquire(options):
+            assert len(clients) == 2
+
+        await pool.aclose()
+        clients[1].disconnect.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_clients_are_single_use(self):
+        """Should never hand out the same client twice."""
+        clients: list[AsyncMock] = []
+        pool = ClientPool(size=1, client_factory=_factory(clients))
+        options = MagicMock()
+
+        async with pool.acquire(options) as first:
+            pass
+        async with pool.acquire(options) as second:
+            pass
+
+        assert first is not second
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_evicts_idle_clients(self):
+        """Should discard warm clients idle longer than max_idle_s."""
+        clients: list[AsyncMock] = []
+        pool = ClientPool(size=1, max_idle_s=0.0, client_factory=_factory(clients))
+        options = MagicMock()
+
+        pool.warm(options)
+        await asyncio.sleep(0.01)
+        async with pool.acquire(options) as client:
+            assert client is not clients[0]
+
+        assert pool.stats.evictions == 1
+        assert pool.stats.misses == 1
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_failed_warm_client_falls_back(self):
+        """Should retry on demand when a warm client failed to connect."""
+        clients: list[AsyncMock] = []
+        pool = ClientPool(size=1, client_factory=_factory(clients, fail=True))
+        options = MagicMock()
+
+        pool.warm(options)
+        with pytest.raises(RuntimeError, match="connect failed"):
+            async with pool.acquire(options):
+                pass
+
+        assert pool.stats.evictions >= 1
+        assert pool.stats.hits == 0
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_equal_options_share_clients(self):
+        """Should hand a warm client to an equal, separately built option set."""
+        clients: list[AsyncMock] = []
+        pool = ClientPool(size=1, client_factory=_factory(clients))
+
+        pool.warm(ClaudeAgentOptions(model="opus", allowed_tools=["Read"]))
+        async with pool.acquire(
+            ClaudeAgentOptions(model="opus", allowed_tools=["Read"])
+        ) as client:
+            assert client is clients[0]
+
+        async with pool.acquire(ClaudeAgentOptions(model="haiku")) as client:
+            assert client not in clients[:2]
+
+        assert (pool.stats.hits, pool.stats.misses) == (1, 1)
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_option_sets(self):
+        """Should drop warm clients of option sets beyond max_option_sets."""
+        clients: list[AsyncMock] = []
+        pool = ClientPool(size=1, max_option_sets=1, client_factory=_factory(clients))
+        first, second = ClaudeAgentOptions(model="a"), ClaudeAgentOptions(model="b")
+
+        pool.warm(first)
+        pool.warm(second)
+        async with pool.acquire(second):
+            clients[0].disconnect.assert_awaited_once()
+
+        assert list(pool._options) == [options_fingerprint(second)]
+        assert pool.stats.evictions == 1
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_drops_expired_option_sets(self):
+        """Should forget option sets whose idle clients all expired."""
+        clients: list[AsyncMock] = []
+        pool = ClientPool(size=1, max_idle_s=0.0, client_factory=_factory(clients))
+        expired = ClaudeAgentOptions(model="a")
+        pool.warm(expired)
+        await asyncio.sleep(0.01)
+
+        async with pool.acquire(ClaudeAgentOptions(model="b")):
+            clients[0].disconnect.assert_awaited_once()
+
+        assert options_fingerprint(expired) not in pool._options
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_wait_closes_client(self):
+        """Should disconnect a checked-out client if waiting for it is cancelled."""
+        connected = asyncio.Event()
+        clients: list[AsyncMock] = []
+        pool = ClientPool(size=1, client_factory=_factory(clients))
+        options = MagicMock()
+
+        pool.warm(options)
+        clients[0].connect.side_effect = connected.wait
+
+        async def use() -> None:
+            async with pool.acquire(options):
+                pass
+
+        task = asyncio.create_task(use())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.sleep(0)
+        connected.set()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        clients[0].disconnect.assert_awaited_once()
+        await pool.aclose()
+
+
+class TestGetClientPool:
+    """Tests for get_client_pool function."""
+
+    @pytest.fixture(autouse=True)
+    def module_pool(self, monkeypatch: pytest.MonkeyPatch) -> list[AsyncMock]:
+        """Isolate the module-level pool and build clients with mocks."""
+        clients: list[AsyncMock] = []
+        monkeypatch.setattr("π.bridge.pool._pool", None)
+        monkeypatch.setattr("π.bridge.pool._pool_loop", None)
+        monkeypatch.setattr("π.bridge.pool._client_factory", _factory(clients))
+        monkeypatch.setenv("PI_CLIENT_POOL_SIZE", "1")
+        return clients
+
+    @staticmethod
+    async def _warm_pool() -> ClientPool:
+        pool = get_client_pool()
+        pool.warm(MagicMock())
+        await asyncio.sleep(0)
+        return pool
+
+    def test_finished_loop_disconnects_clients(self, module_pool: list[AsyncMock]):
+        """Clients of a loop shut down by asyncio.run should be disconnected."""
+        first = asyncio.run(self._warm_pool())
+        module_pool[0].disconnect.assert_awaited_once()
+
+        assert asyncio.run(self._warm_pool()) is not first
+
+    def test_replacing_pool_releases_idle_clients(self, module_pool: list[AsyncMock]):
+        """A pool of a loop that is still open should release its clients."""
+        loop = asyncio.new_event_loop()
+        try:
+            first = loop.run_until_complete(self._warm_pool())
+            assert asyncio.run(self._warm_pool()) is not first
+            loop.run_until_complete(asyncio.sleep(0.01))
+        finally:
+            loop.close()
+
+        module_pool[0].disconnect.assert_awaited_once()
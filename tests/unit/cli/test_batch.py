@@ -0,0 +1,211 @@
+"""Tests for π.cli.batch module."""
+
+import asyncio
+import json
+import logging
+import subprocess
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from π.cli import main
+from π.cli.batch import BatchJob, read_jobs, run_batch
+from π.cli.runner import WorkflowRun
+from π.workflow import WorkflowOutput, get_workflow_ctx
+
+pytestmark = pytest.mark.no_api
+
+
+def _output(objective: str) -> WorkflowOutput:
+    return WorkflowOutput(
+        research_doc_path=f"/research/{objective}.md",
+        research_summary="done",
+        needs_implementation=False,
+        status="no_changes_needed",
+        summary=objective,
+    )
+
+
+class TestReadJobs:
+    """Tests for read_jobs function."""
+
+    def test_parses_objects_and_strings(self):
+        """Should accept objective objects and bare strings, skipping blanks."""
+        lines = ['{"objective": "a", "id": "x"}\n', "\n", '"b"\n']
+
+        assert read_jobs(lines) == [
+            BatchJob(id="x", objective="a"),
+            BatchJob(id="3", objective="b"),
+        ]
+
+    @pytest.mark.parametrize("line", ["not json", '{"id": 1}', '{"objective": " "}'])
+    def test_rejects_invalid_lines(self, line: str):
+        """Should name the offending line."""
+        with pytest.raises(ValueError, match="Line 2"):
+            read_jobs(['"ok"', line])
+
+
+class TestRunBatch:
+    """Tests for run_batch function."""
+
+    @pytest.fixture(autouse=True)
+    def isolate_run(self, tmp_path: Path) -> Generator[None]:
+        """Replace process-wide setup with a temp batch log."""
+        with (
+            patch("π.cli.batch.start_run", return_value=tmp_path / "batch.log"),
+            patch("π.cli.batch.finish_run", new_callable=AsyncMock),
+            patch("π.cli.batch.prewarm_stage_clients"),
+        ):
+            yield
+
+    def test_runs_workflows_concurrently(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ):
+        """Should keep up to `workers` workflows in flight, each in its own context."""
+        in_flight, peak = 0, 0
+
+        async def fake_run_workflow(objective: str, *, log_path: Path, driver: str):
+            nonlocal in_flight, peak
+            ctx = get_workflow_ctx()
+            ctx.objective = objective
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            assert get_workflow_ctx().objective == objective
+            if objective == "boom":
+                raise RuntimeError("agent failed")
+            return WorkflowRun(
+                output=_output(objective),
+                log_path=log_path,
+                trace_path=log_path.with_suffix(".trace.json"),
+                duration_s=0.01,
+                cost_usd=0.5,
+                turns=2,
+            )
+
+        jobs = [BatchJob(id=str(i), objective=f"o{i}") for i in range(7)]
+        jobs.append(BatchJob(id="bad", objective="boom"))
+        output = tmp_path / "results.jsonl"
+        with (
+            patch("π.cli.batch.run_workflow", side_effect=fake_run_workflow),
+            caplog.at_level(logging.WARNING, logger="π.cli.batch"),
+        ):
+            summary, path = asyncio.run(
+                run_batch(jobs, workers=3, output=output, worktrees=False)
+            )
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        results = {r["id"]: r for r in lines if r["type"] == "result"}
+        assert peak == 3
+        assert len(results) == 8
+        assert results["0"]["output"]["summary"] == "o0"
+        assert results["0"]["log_path"] == str(tmp_path / "batch.0001.log")
+        assert results["bad"]["status"] == "error"
+        assert results["bad"]["error"] == "RuntimeError: agent failed"
+
+        assert lines[-1]["type"] == "summary"
+        assert summary.statuses == {"no_changes_needed": 7, "error": 1}
+        assert summary.errors == 1
+        assert summary.cost_usd == pytest.approx(3.5)
+        assert summary.turns == 14
+        assert summary.concurrency > 1
+        assert "3 workflows in one checkout" in caplog.text
+
+    def test_runs_each_workflow_in_own_worktree(self, tmp_path: Path):
+        """By default, concurrent workflows get their own worktree and branch."""
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        for args in (["init", "-q"], ["commit", "-q", "--allow-empty", "-m", "i"]):
+            subprocess.run(
+                ["git", "-c", "user.name=T", "-c", "user.email=t@e", *args],
+                cwd=repo,
+                check=True,
+            )
+        cwds: dict[str, Path] = {}
+
+        async def fake_run_workflow(
+            objective: str, *, log_path: Path, driver: str, cwd: Path
+        ):
+            assert cwd not in cwds.values()
+            cwds[objective] = cwd
+            await asyncio.sleep(0.01)
+            del cwds[objective]
+            return WorkflowRun(
+                output=_output(objective),
+                log_path=log_path,
+                trace_path=log_path.with_suffix(".trace.json"),
+                duration_s=0.01,
+                cost_usd=0.0,
+                turns=1,
+            )
+
+        jobs = [BatchJob(id=str(i), objective=f"o{i}") for i in range(4)]
+        with (
+            patch("π.cli.batch.run_workflow", side_effect=fake_run_workflow),
+            patch("π.cli.batch.get_project_root", return_value=repo),
+            patch("π.cli.batch.get_worktrees_dir", return_value=tmp_path / "wt"),
+        ):
+            _, path = asyncio.run(
+                run_batch(jobs, workers=2, output=tmp_path / "r.jsonl")
+            )
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert {r["branch"] for r in lines[:-1]} == {f"pi/batch/{i}" for i in range(4)}
+        assert not (tmp_path / "wt").exists()
+
+
+class TestBatchCommand:
+    """Tests for `π batch`."""
+
+    def test_dispatches_with_options(self, tmp_path: Path):
+        """`π batch FILE -j N` should run the file's objectives with N workers."""
+        path = tmp_path / "objectives.jsonl"
+        path.write_text('"a"\n"b"\n')
+        summary = MagicMock(objectives=2, statuses={}, wall_s=1.0)
+
+        with (
+            patch(
+                "π.cli.batch.run_batch",
+                new=MagicMock(return_value=(summary, tmp_path)),
+            ) as mock,
+            patch("π.cli.batch.asyncio.run", side_effect=lambda coro: coro),
+            patch("π.cli.batch.render_batch_summary", return_value=""),
+            patch("π.cli.runner.run") as mock_workflow,
+        ):
+            main(["batch", str(path), "-j", "8", "--driver=pipeline"])
+
+        args, kwargs = mock.call_args
+        assert [job.objective for job in args[0]] == ["a", "b"]
+        assert kwargs["workers"] == 8
+        assert kwargs["driver"] == "pipeline"
+        assert kwargs["worktrees"] is None
+        mock_workflow.assert_not_called()
+
+    def test_shared_checkout(self, tmp_path: Path):
+        """`--shared-checkout` should opt out of per-objective worktrees."""
+        path = tmp_path / "objectives.jsonl"
+        path.write_text('"a"\n')
+        summary = MagicMock(objectives=1, statuses={}, wall_s=1.0)
+
+        with (
+            patch(
+                "π.cli.batch.run_batch",
+                new=MagicMock(return_value=(summary, tmp_path)),
+            ) as mock,
+            patch("π.cli.batch.asyncio.run", side_effect=lambda coro: coro),
+            patch("π.cli.batch.render_batch_summary", return_value=""),
+        ):
+            main(["batch", str(path), "--shared-checkout"])
+
+        assert mock.call_args.kwargs["worktrees"] is False
+
+    def test_rejects_invalid_file(self, tmp_path: Path):
+        """Should exit with a usage error for malformed objectives."""
+        path = tmp_path / "objectives.jsonl"
+        path.write_text("{oops\n")
+
+        with pytest.raises(SystemExit):
+            main(["batch", str(path)])
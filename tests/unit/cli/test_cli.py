@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from π.bridge.recording import SessionRecorder
 from π.cli import main
 
 
@@ -17,13 +18,13 @@ class TestMain:
         """Redirect logging to temp dir."""
         mock_logs_dir = tmp_path / ".π" / "logs"
         mock_logs_dir.mkdir(parents=True)
-        with patch("π.cli.main.get_logs_dir", return_value=mock_logs_dir):
+        with patch("π.cli.runner.get_logs_dir", return_value=mock_logs_dir):
             yield
 
     @pytest.fixture
     def mock_run(self) -> Generator[MagicMock]:
         """Mock the async run function."""
-        with patch("π.cli.main.asyncio.run") as mock:
+        with patch("asyncio.run") as mock:
             mock.return_value = MagicMock(
                 status="complete",
                 research_doc_path="/research.md",
@@ -41,6 +42,15 @@ class TestMain:
 
         assert "objective" in captured.out.lower() or "usage" in captured.out.lower()
 
+    def test_version_flag(
+        self, mock_run: MagicMock, capsys: pytest.CaptureFixture[str]
+    ):
+        """--version should print the version without starting a workflow."""
+        main(["--version"])
+
+        assert capsys.readouterr().out.startswith("π ")
+        mock_run.assert_not_called()
+
     def test_accepts_objective_argument(
         self,
         capsys: pytest.CaptureFixture[str],
@@ -62,3 +72,69 @@ class TestMain:
 
         # Should complete without error
         mock_run.assert_called_once()
+
+    def test_no_cache_flag_disables_stage_cache(
+        self,
+        mock_run: MagicMock,
+    ):
+        """--no-cache should be passed through to run()."""
+        with patch("π.cli.runner.run") as mock_workflow:
+            main(["--no-cache", "test objective"])
+
+        assert mock_workflow.call_args.kwargs["use_cache"] is False
+
+    def test_driver_flag_selects_pipeline(
+        self,
+        mock_run: MagicMock,
+    ):
+        """--driver=pipeline should be passed through to run()."""
+        with patch("π.cli.runner.run") as mock_workflow:
+            main(["--driver=pipeline", "test objective"])
+
+        assert mock_workflow.call_args.kwargs["driver"] == "pipeline"
+
+    def test_driver_defaults_to_orchestrator(
+        self,
+        mock_run: MagicMock,
+    ):
+        """Without --driver the orchestrator agent should be used."""
+        with patch("π.cli.runner.run") as mock_workflow:
+            main(["test objective"])
+
+        assert mock_workflow.call_args.kwargs["driver"] == "orchestrator"
+
+    def test_log_retention_flags(self, mock_run: MagicMock):
+        """Retention flags should build the policy passed to run()."""
+        with patch("π.cli.runner.run") as mock_workflow:
+            main(["--log-max-age=3", "--log-compress-after=0", "test objective"])
+
+        policy = mock_workflow.call_args.kwargs["retention"]
+        assert policy.max_age_s == 3 * 24 * 3600
+        assert policy.compress_after_s is None
+
+    def test_replay_flag_uses_recorded_objective(
+        self, mock_run: MagicMock, tmp_path: Path
+    ):
+        """--replay should run the recording's objective and driver."""
+        path = tmp_path / "run.jsonl.gz"
+        SessionRecorder(path, objective="recorded", driver="pipeline").close()
+
+        with patch("π.cli.runner.run") as mock_workflow:
+            main(["--replay", str(path)])
+
+        args, kwargs = mock_workflow.call_args
+        assert args == ("recorded",)
+        assert kwargs["driver"] == "pipeline"
+        assert kwargs["replay"].objective == "recorded"
+        assert kwargs["record"] is None
+
+    def test_logs_subcommand_dispatches(self):
+        """`π logs ...` should run the logs command, not a workflow."""
+        with (
+            patch("π.cli.logs.logs_main") as mock_logs,
+            patch("π.cli.runner.run") as mock_workflow,
+        ):
+            main(["logs", "--last", "3"])
+
+        mock_logs.assert_called_once_with(["--last", "3"])
+        mock_workflow.assert_not_called()
@@ -0,0 +1,142 @@
+"""Tests for π.cli.logs module."""
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from π.cli.logs import find_event_logs, logs_main, summarize
+
+
+def _write_log(path: Path, *records: dict) -> Path:
+    path.write_text("".join(json.dumps(r) + "\n" for r in records), encoding="utf-8")
+    return path
+
+
+def _tool_end(tool: str, *, is_error: bool = False, duration_ms: float = 100) -> dict:
+    return {
+        "event": "tool_end",
+        "agent_id": "stage:research",
+        "tool": tool,
+        "is_error": is_error,
+        "duration_ms": duration_ms,
+    }
+
+
+def _complete(agent_id: str, cost: float, duration_ms: int = 1000) -> dict:
+    return {
+        "event": "complete",
+        "agent_id": agent_id,
+        "turns": 2,
+        "cost_usd": cost,
+        "duration_ms": duration_ms,
+    }
+
+
+@pytest.fixture
+def logs_dir(tmp_path: Path) -> Path:
+    """Two runs: an orchestrator run and a pipeline run."""
+    _write_log(
+        tmp_path / "2026-01-01_10-00-00.jsonl",
+        {"event": "run_start", "driver": "orchestrator"},
+        _tool_end("Read", duration_ms=10),
+        _tool_end("Bash", is_error=True, duration_ms=2000),
+        _complete("stage:research", 0.5, 60_000),
+        _complete("orchestrator", 0.25),
+        {"event": "run_end"},
+    )
+    _write_log(
+        tmp_path / "2026-01-02_10-00-00.jsonl",
+        {"event": "run_start", "driver": "pipeline"},
+        _tool_end("Read", duration_ms=30),
+        _complete("stage:implement#1", 1.0),
+        _complete("stage:implement#2", 1.0),
+        _complete("orchestrator", 2.0),
+        {"event": "run_end"},
+    )
+    (tmp_path / "2026-01-02_10-00-00.log").write_text(
+        "not an event log", encoding="utf-8"
+    )
+    return tmp_path
+
+
+class TestFindEventLogs:
+    """Tests for find_event_logs function."""
+
+    def test_expands_directories_oldest_first(self, logs_dir: Path):
+        """Should list only .jsonl files, ordered by name."""
+        names = [p.name for p in find_event_logs([logs_dir])]
+        assert names == ["2026-01-01_10-00-00.jsonl", "2026-01-02_10-00-00.jsonl"]
+
+    def test_last_keeps_newest(self, logs_dir: Path):
+        """Should keep only the newest N logs."""
+        names = [p.name for p in find_event_logs([logs_dir], last=1)]
+        assert names == ["2026-01-02_10-00-00.jsonl"]
+
+
+class TestSummarize:
+    """Tests for summarize function."""
+
+    def test_aggregates_runs_tools_and_stages(self, logs_dir: Path):
+        """Should count runs, tool errors and per-stage sessions."""
+        summary = summarize(find_event_logs([logs_dir]))
+
+        assert summary.runs == 2
+        assert summary.tools["Read"].calls == 2
+        assert summary.tools["Bash"].error_rate == 1.0
+        assert summary.tool_calls == 3
+        assert summary.agents["stage:implement"].sessions == 2
+        assert summary.agents["stage:research"].durations_ms == [60_000]
+
+    def test_skips_pipeline_orchestrator_cost(self, logs_dir: Path):
+        """Should not double-count the pipeline's aggregate completion."""
+        summary = summarize(find_event_logs([logs_dir]))
+        assert summary.cost_usd == pytest.approx(0.5 + 0.25 + 1.0 + 1.0)
+        assert summary.agents["orchestrator"].sessions == 1
+
+    def test_reads_compressed_logs(self, logs_dir: Path):
+        """Should read event logs gzipped by log retention."""
+        path = logs_dir / "2026-01-01_10-00-00.jsonl"
+        packed = path.with_name(f"{path.name}.gz")
+        packed.write_bytes(gzip.compress(path.read_bytes()))
+        path.unlink()
+
+        summary = summarize(find_event_logs([logs_dir]))
+        assert summary.files == 2
+        assert summary.runs == 2
+
+    def test_counts_invalid_lines(self, tmp_path: Path):
+        """Should skip truncated or malformed lines."""
+        path = tmp_path / "run.jsonl"
+        path.write_text(
+            '{"event": "run_start"}\n{"event": "tool_e\n[1]\n', encoding="utf-8"
+        )
+
+        summary = summarize([path])
+        assert summary.runs == 1
+        assert summary.invalid_lines == 2
+
+
+class TestLogsMain:
+    """Tests for the `π logs` command."""
+
+    def test_prints_json_summary(
+        self, logs_dir: Path, capsys: pytest.CaptureFixture[str]
+    ):
+        """--json should print percentiles and error rates."""
+        logs_main([str(logs_dir), "--json"])
+
+        data = json.loads(capsys.readouterr().out)
+        assert data["runs"] == 2
+        assert data["tools"]["Read"]["p50_ms"] == 10
+        assert data["tools"]["Read"]["p95_ms"] == 30
+        assert data["tools"]["Bash"]["errors"] == 1
+
+    def test_renders_tables(self, logs_dir: Path, capsys: pytest.CaptureFixture[str]):
+        """Should render stage and tool tables."""
+        logs_main([str(logs_dir)])
+
+        out = capsys.readouterr().out
+        assert "stage:implement" in out
+        assert "Bash" in out
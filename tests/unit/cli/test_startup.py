@@ -0,0 +1,63 @@
+"""Import-time budget for `π --help` / `π --version`.
+
+Wrapper scripts call π repeatedly for preflight checks, so these paths must
+not import the SDK, Rich, pydantic, the MCP server or the command map.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative import time of π.cli (excluding interpreter startup)
+BUDGET_US = 100_000
+
+HEAVY_MODULES = (
+    "claude_agent_sdk",
+    "mcp",
+    "pydantic",
+    "rich",
+    "dotenv",
+    "asyncio",
+    "π.config",
+    "π.workflow",
+    "π.cli.runner",
+)
+
+
+def _importtime(*args: str) -> dict[str, int]:
+    """Run python -X importtime; return module -> cumulative microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    modules: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+@pytest.mark.parametrize("flag", ["--help", "--version"])
+def test_flags_skip_heavy_imports(flag: str):
+    """Should answer --help/--version without loading workflow modules."""
+    modules = _importtime("-c", f"from π.cli import main; main([{flag!r}])")
+
+    assert "π.cli.main" in modules
+    loaded = [
+        name
+        for name in modules
+        if any(name == m or name.startswith(f"{m}.") for m in HEAVY_MODULES)
+    ]
+    assert not loaded
+
+
+def test_cli_import_within_budget():
+    """Should import π.cli within the startup budget."""
+    # Best of three runs to ride out scheduler noise
+    times = [_importtime("-c", "import π.cli")["π.cli"] for _ in range(3)]
+    assert min(times) < BUDGET_US, f"π.cli imported in {min(times) / 1000:.1f} ms"
@@ -0,0 +1,123 @@
+"""Tests for π.hooks.cache module."""
+
+import os
+import time
+from pathlib import Path
+
+from π.hooks.cache import (
+    LintCache,
+    LintVerdict,
+    find_config_files,
+    get_lint_cache,
+    project_sources,
+    set_lint_cache_enabled,
+)
+
+
+class TestLintCache:
+    """Tests for LintCache class."""
+
+    def test_round_trip(self, tmp_path: Path):
+        """Should return a stored verdict for the same key."""
+        cache = LintCache(tmp_path / "cache")
+        target = tmp_path / "a.py"
+        target.write_text("x = 1\n")
+        key = cache.key_for(["ruff", "check"], [target])
+
+        assert cache.get(key) is None
+        cache.put(key, LintVerdict(exit_code=1, output="E1"))
+
+        assert cache.get(key) == LintVerdict(exit_code=1, output="E1")
+        assert cache.hit_rate == 0.5
+
+    def test_key_depends_on_content_inputs_and_command(self, tmp_path: Path):
+        """Should change the key when any keyed input changes."""
+        cache = LintCache(tmp_path / "cache")
+        target = tmp_path / "a.py"
+        config = tmp_path / "pyproject.toml"
+        target.write_text("x = 1\n")
+        config.write_text("")
+
+        base = cache.key_for(["ruff"], [target], [config])
+        assert cache.key_for(["ruff", "--fix"], [target], [config]) != base
+        config.write_text("[tool.ruff]\n")
+        assert cache.key_for(["ruff"], [target], [config]) != base
+        target.write_text("x = 2\n")
+        assert cache.key_for(["ruff"], [target]) != base
+
+    def test_sources_keyed_by_stat(self, tmp_path: Path):
+        """Should key sources on mtime and size without reading them."""
+        cache = LintCache(tmp_path / "cache")
+        target, source = tmp_path / "main.rs", tmp_path / "lib.rs"
+        target.write_text("fn main() {}")
+        source.write_text("pub fn f() {}")
+
+        base = cache.key_for(["cargo"], [target], sources=[source])
+        assert cache.key_for(["cargo"], [target], sources=[source]) == base
+        os.utime(source, ns=(0, 0))
+        assert cache.key_for(["cargo"], [target], sources=[source]) != base
+
+    def test_discards_corrupt_entry(self, tmp_path: Path):
+        """Should treat unreadable entries as misses and remove them."""
+        cache = LintCache(tmp_path / "cache")
+        (tmp_path / "cache" / "bad.json").write_text("{not json")
+
+        assert cache.get("bad") is None
+        assert not (tmp_path / "cache" / "bad.json").exists()
+
+    def test_evicts_expired_entries(self, tmp_path: Path):
+        """Should drop entries older than max_age_s."""
+        cache = LintCache(tmp_path / "cache", max_age_s=60)
+        cache.put("old", LintVerdict(exit_code=0))
+        stale = time.time() - 120
+        os.utime(tmp_path / "cache" / "old.json", (stale, stale))
+
+        assert cache.evict() == 1
+        assert cache.get("old") is None
+
+
+class TestFindConfigFiles:
+    """Tests for find_config_files function."""
+
+    def test_finds_nearest_first(self, tmp_path: Path):
+        """Should return configs from start upward, nearest first."""
+        sub = tmp_path / "pkg"
+        sub.mkdir()
+        (tmp_path / "pyproject.toml").write_text("")
+        (sub / "ruff.toml").write_text("")
+
+        found = find_config_files(sub, ["pyproject.toml", "ruff.toml"])
+
+        assert found[:2] == [sub / "ruff.toml", tmp_path / "pyproject.toml"]
+
+
+class TestProjectSources:
+    """Tests for project_sources function."""
+
+    def test_skips_build_and_hidden_dirs(self, tmp_path: Path):
+        """Should ignore target/, node_modules/ and hidden directories."""
+        for rel in ("src/main.rs", "target/debug/gen.rs", ".git/x.rs", "README.md"):
+            path = tmp_path / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("")
+
+        assert project_sources(tmp_path, [".rs"]) == [tmp_path / "src" / "main.rs"]
+
+
+class TestGetLintCache:
+    """Tests for get_lint_cache function."""
+
+    def test_disabled_returns_none(self, tmp_path: Path):
+        """Should return None when caching is disabled."""
+        set_lint_cache_enabled(False)
+        try:
+            assert get_lint_cache(tmp_path) is None
+        finally:
+            set_lint_cache_enabled(True)
+
+    def test_uses_project_cache_dir(self, tmp_path: Path):
+        """Should store entries under .π/cache/lint."""
+        cache = get_lint_cache(tmp_path)
+
+        assert cache is not None
+        assert cache.cache_dir == tmp_path / ".π" / "cache" / "lint"
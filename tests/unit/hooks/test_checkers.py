@@ -1,22 +1,41 @@
 """Tests for π.hooks.checkers module."""
 
+import threading
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
+from π.hooks.cache import LintCache
 from π.hooks.checkers import check_go, check_python, check_rust, check_typescript
+from π.hooks.daemons import DAEMONS_ENV
+
+
+@pytest.fixture(autouse=True)
+def lint_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> LintCache:
+    """Use a fresh lint cache per test instead of the project's .π/cache."""
+    cache = LintCache(tmp_path / ".lint-cache")
+    monkeypatch.setattr("π.hooks.checkers.get_lint_cache", lambda: cache)
+    return cache
+
+
+@pytest.fixture(autouse=True)
+def no_checker_daemons(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Exercise the one-shot commands (daemons are tested separately)."""
+    monkeypatch.setenv(DAEMONS_ENV, "0")
 
 
 class TestCheckPython:
     """Tests for check_python function."""
 
-    def test_runs_ruff_via_uvx(self, python_file: Path):
+    async def test_runs_ruff_via_uvx(self, python_file: Path):
         """Should run ruff via uvx when available."""
         with (
             patch("shutil.which", return_value="/usr/bin/uvx"),
             patch("π.hooks.checkers.run_check_command") as mock_run,
         ):
             mock_run.return_value = (0, "All checks passed", "")
-            result = check_python(python_file)
+            result = await check_python(python_file)
 
         mock_run.assert_called_once()
         cmd = mock_run.call_args.kwargs["cmd"]
@@ -24,7 +43,7 @@ class TestCheckPython:
         assert "ruff" in cmd
         assert result == 0
 
-    def test_falls_back_to_ruff_directly(self, python_file: Path):
+    async def test_falls_back_to_ruff_directly(self, python_file: Path):
         """Should use ruff directly when uvx not available."""
 
         def which_side_effect(cmd: str) -> str | None:
@@ -35,38 +54,38 @@ class TestCheckPython:
             patch("π.hooks.checkers.run_check_command") as mock_run,
         ):
             mock_run.return_value = (0, "Success", "")
-            result = check_python(python_file)
+            result = await check_python(python_file)
 
         cmd = mock_run.call_args.kwargs["cmd"]
         assert cmd[0] == "ruff"
         assert result == 0
 
-    def test_returns_zero_when_ruff_not_found(self, python_file: Path):
+    async def test_returns_zero_when_ruff_not_found(self, python_file: Path):
         """Should return 0 (pass) when ruff is not available."""
         with patch("shutil.which", return_value=None):
-            result = check_python(python_file)
+            result = await check_python(python_file)
 
         assert result == 0
 
-    def test_returns_zero_on_success(self, python_file: Path):
+    async def test_returns_zero_on_success(self, python_file: Path):
         """Should return 0 when ruff passes."""
         with (
             patch("shutil.which", return_value="/usr/bin/uvx"),
             patch("π.hooks.checkers.run_check_command") as mock_run,
         ):
             mock_run.return_value = (0, "All checks passed", "")
-            result = check_python(python_file)
+            result = await check_python(python_file)
 
         assert result == 0
 
-    def test_returns_two_on_failure(self, python_file: Path):
+    async def test_returns_two_on_failure(self, python_file: Path):
         """Should return 2 when ruff fails."""
         with (
             patch("shutil.which", return_value="/usr/bin/uvx"),
             patch("π.hooks.checkers.run_check_command") as mock_run,
         ):
             mock_run.return_value = (1, "", "Error: lint failed")
-            result = check_python(python_file)
+            result = await check_python(python_file)
 
         assert result == 2
 
@@ -74,32 +93,32 @@ class TestCheckPython:
 class TestCheckTypescript:
     """Tests for check_typescript function."""
 
-    def test_returns_zero_when_no_package_json(self, tmp_path: Path):
+    async def test_returns_zero_when_no_package_json(self, tmp_path: Path):
         """Should return 0 when no package.json found."""
         ts_file = tmp_path / "test.ts"
         ts_file.write_text("const x = 1;")
 
-        result = check_typescript(ts_file)
+        result = await check_typescript(ts_file)
 
         assert result == 0
 
-    def test_returns_zero_when_no_eslint_config(self, typescript_project: Path):
+    async def test_returns_zero_when_no_eslint_config(self, typescript_project: Path):
         """Should return 0 when no ESLint config found."""
         # Remove eslint config
         (typescript_project / "eslint.config.js").unlink()
         ts_file = typescript_project / "src" / "index.ts"
 
-        result = check_typescript(ts_file)
+        result = await check_typescript(ts_file)
 
         assert result == 0
 
-    def test_runs_eslint_when_configured(self, typescript_project: Path):
+    async def test_runs_eslint_when_configured(self, typescript_project: Path):
         """Should run ESLint when properly configured."""
         ts_file = typescript_project / "src" / "index.ts"
 
         with patch("π.hooks.checkers.run_check_command") as mock_run:
             mock_run.return_value = (0, "All checks passed", "")
-            result = check_typescript(ts_file)
+            result = await check_typescript(ts_file)
 
         mock_run.assert_called_once()
         cmd = mock_run.call_args.kwargs["cmd"]
@@ -107,13 +126,50 @@ class TestCheckTypescript:
         assert "eslint" in cmd
         assert result == 0
 
-    def test_returns_two_on_lint_failure(self, typescript_project: Path):
+    async def test_prefers_local_eslint_over_npx(self, typescript_project: Path):
+        """Should run node_modules/.bin/eslint directly when installed."""
+        bin_dir = typescript_project / "node_modules" / ".bin"
+        bin_dir.mkdir(parents=True)
+        (bin_dir / "eslint").write_text("#!/bin/sh\n")
+        (bin_dir / "eslint").chmod(0o755)
+        ts_file = typescript_project / "src" / "index.ts"
+
+        with patch("π.hooks.checkers.run_check_command") as mock_run:
+            mock_run.return_value = (0, "", "")
+            await check_typescript(ts_file)
+
+        assert mock_run.call_args.kwargs["cmd"][0] == str(bin_dir / "eslint")
+
+    async def test_prefers_eslint_d_daemon(
+        self, typescript_project: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Should use eslint_d when installed and daemons are enabled."""
+        monkeypatch.setenv(DAEMONS_ENV, "1")
+        bin_dir = typescript_project / "node_modules" / ".bin"
+        bin_dir.mkdir(parents=True)
+        (bin_dir / "eslint_d").write_text("#!/bin/sh\n")
+        (bin_dir / "eslint_d").chmod(0o755)
+        ts_file = typescript_project / "src" / "index.ts"
+
+        with (
+            patch("π.hooks.checkers.run_check_command") as mock_run,
+            patch("π.hooks.checkers.register_eslint_d") as mock_register,
+        ):
+            mock_run.return_value = (0, "", "")
+            await check_typescript(ts_file)
+
+        assert mock_run.call_args.kwargs["cmd"][0] == str(bin_dir / "eslint_d")
+        mock_register.assert_called_once_with(
+            str(bin_dir / "eslint_d"), typescript_project
+        )
+
+    async def test_returns_two_on_lint_failure(self, typescript_project: Path):
         """Should return 2 when ESLint fails."""
         ts_file = typescript_project / "src" / "index.ts"
 
         with patch("π.hooks.checkers.run_check_command") as mock_run:
             mock_run.return_value = (1, "", "Linting errors found")
-            result = check_typescript(ts_file)
+            result = await check_typescript(ts_file)
 
         assert result == 2
 
@@ -121,16 +177,16 @@ class TestCheckTypescript:
 class TestCheckRust:
     """Tests for check_rust function."""
 
-    def test_returns_zero_when_no_cargo_toml(self, tmp_path: Path):
+    async def test_returns_zero_when_no_cargo_toml(self, tmp_path: Path):
         """Should return 0 when no Cargo.toml found."""
         rs_file = tmp_path / "main.rs"
         rs_file.write_text("fn main() {}")
 
-        result = check_rust(rs_file)
+        result = await check_rust(rs_file)
 
         assert result == 0
 
-    def test_runs_cargo_check(self, tmp_path: Path):
+    async def test_runs_cargo_check(self, tmp_path: Path):
         """Should run cargo check when Cargo.toml exists."""
         (tmp_path / "Cargo.toml").write_text('[package]\nname = "test"')
         rs_file = tmp_path / "src" / "main.rs"
@@ -139,7 +195,7 @@ class TestCheckRust:
 
         with patch("π.hooks.checkers.run_check_command") as mock_run:
             mock_run.return_value = (0, "Checking complete", "")
-            result = check_rust(rs_file)
+            result = await check_rust(rs_file)
 
         mock_run.assert_called_once()
         cmd = mock_run.call_args.kwargs["cmd"]
@@ -147,7 +203,79 @@ class TestCheckRust:
         assert "check" in cmd
         assert result == 0
 
-    def test_returns_two_on_cargo_failure(self, tmp_path: Path):
+    async def test_scopes_to_owning_crate(self, tmp_path: Path):
+        """Should check only the workspace member that owns the file."""
+        (tmp_path / "Cargo.toml").write_text('[workspace]\nmembers = ["crates/*"]')
+        crate = tmp_path / "crates" / "core"
+        (crate / "src").mkdir(parents=True)
+        (crate / "Cargo.toml").write_text('[package]\nname = "core"')
+        rs_file = crate / "src" / "lib.rs"
+        rs_file.write_text("pub fn f() {}")
+
+        with patch("π.hooks.checkers.run_check_command") as mock_run:
+            mock_run.return_value = (0, "", "")
+            await check_rust(rs_file)
+
+        assert mock_run.call_args.kwargs["cmd"] == ["cargo", "check", "-p", "core"]
+        assert mock_run.call_args.kwargs["cwd"] == crate
+
+    async def test_virtual_manifest_checks_workspace(self, tmp_path: Path):
+        """Should fall back to the whole workspace when no crate owns the file."""
+        (tmp_path / "Cargo.toml").write_text("[workspace]\nmembers = []")
+        rs_file = tmp_path / "build.rs"
+        rs_file.write_text("fn main() {}")
+
+        with patch("π.hooks.checkers.run_check_command") as mock_run:
+            mock_run.return_value = (0, "", "")
+            await check_rust(rs_file)
+
+        assert mock_run.call_args.kwargs["cmd"] == ["cargo", "check"]
+
+    @pytest.mark.parametrize(
+        ("dependency", "reruns"),
+        [
+            ("", False),
+            ('\n[dependencies]\nb = { path = "../b" }', True),
+            ("\n[dependencies]\nb = { workspace = true }", True),
+        ],
+    )
+    async def test_cache_scoped_to_crate_and_path_dependencies(
+        self, tmp_path: Path, dependency: str, reruns: bool
+    ):
+        """Should rerun on a sibling crate change only if the crate uses it."""
+        (tmp_path / "Cargo.toml").write_text(
+            '[workspace]\nmembers = ["a", "b"]\n'
+            '[workspace.dependencies]\nb = { path = "b" }'
+        )
+        for name in ("a", "b"):
+            (tmp_path / name / "src").mkdir(parents=True)
+            (tmp_path / name / "Cargo.toml").write_text(f'[package]\nname = "{name}"')
+            (tmp_path / name / "src" / "lib.rs").write_text("pub fn f() {}")
+        (tmp_path / "a" / "Cargo.toml").write_text(f'[package]\nname = "a"{dependency}')
+        rs_file = tmp_path / "a" / "src" / "lib.rs"
+
+        with patch("π.hooks.checkers.run_check_command") as mock_run:
+            mock_run.return_value = (0, "", "")
+            await check_rust(rs_file)
+            (tmp_path / "b" / "src" / "lib.rs").write_text("pub fn g() { todo!() }")
+            await check_rust(rs_file)
+
+        assert mock_run.call_count == (2 if reruns else 1)
+
+    async def test_workspace_check_not_cached(self, tmp_path: Path):
+        """Should not cache a whole-workspace cargo check."""
+        (tmp_path / "Cargo.toml").write_text("[workspace]\nmembers = []")
+        rs_file = tmp_path / "build.rs"
+        rs_file.write_text("fn main() {}")
+
+        with patch("π.hooks.checkers.run_check_command") as mock_run:
+            mock_run.return_value = (0, "", "")
+            await check_rust(rs_file)
+            await check_rust(rs_file)
+
+        assert mock_run.call_count == 2
+
+    async def test_returns_two_on_cargo_failure(self, tmp_path: Path):
         """Should return 2 when cargo check fails."""
         (tmp_path / "Cargo.toml").write_text('[package]\nname = "test"')
         rs_file = tmp_path / "src" / "main.rs"
@@ -156,7 +284,7 @@ class TestCheckRust:
 
         with patch("π.hooks.checkers.run_check_command") as mock_run:
             mock_run.return_value = (1, "", "Compilation error")
-            result = check_rust(rs_file)
+            result = await check_rust(rs_file)
 
         assert result == 2
 
@@ -164,16 +292,16 @@ class TestCheckRust:
 class TestCheckGo:
     """Tests for check_go function."""
 
-    def test_returns_zero_when_no_go_mod(self, tmp_path: Path):
+    async def test_returns_zero_when_no_go_mod(self, tmp_path: Path):
         """Should return 0 when no go.mod found."""
         go_file = tmp_path / "main.go"
         go_file.write_text("package main")
 
-        result = check_go(go_file)
+        result = await check_go(go_file)
 
         assert result == 0
 
-    def test_prefers_golangci_lint(self, tmp_path: Path):
+    async def test_prefers_golangci_lint(self, tmp_path: Path):
         """Should use golangci-lint when available."""
         (tmp_path / "go.mod").write_text("module test")
         go_file = tmp_path / "main.go"
@@ -184,13 +312,55 @@ class TestCheckGo:
             patch("π.hooks.checkers.run_check_command") as mock_run,
         ):
             mock_run.return_value = (0, "All checks passed", "")
-            result = check_go(go_file)
+            result = await check_go(go_file)
 
         cmd = mock_run.call_args.kwargs["cmd"]
         assert "golangci-lint" in cmd
         assert result == 0
 
-    def test_falls_back_to_go_vet(self, tmp_path: Path):
+    async def test_scopes_to_package_directory(self, tmp_path: Path):
+        """Should check only the edited file's package."""
+        (tmp_path / "go.mod").write_text("module test")
+        pkg = tmp_path / "internal" / "store"
+        pkg.mkdir(parents=True)
+        go_file = pkg / "store.go"
+        go_file.write_text("package store")
+
+        with (
+            patch("shutil.which", return_value=None),
+            patch("π.hooks.checkers.run_check_command") as mock_run,
+        ):
+            mock_run.return_value = (0, "", "")
+            await check_go(go_file)
+
+        assert mock_run.call_args.kwargs["cmd"] == ["go", "vet", "./internal/store"]
+
+    async def test_cache_scoped_to_package_directory(self, tmp_path: Path):
+        """Should rerun on a change in the package, not elsewhere in the module."""
+        (tmp_path / "go.mod").write_text("module test")
+        pkg, other = tmp_path / "store", tmp_path / "api"
+        pkg.mkdir()
+        other.mkdir()
+        go_file = pkg / "store.go"
+        go_file.write_text("package store")
+        (pkg / "util.go").write_text("package store")
+        (other / "api.go").write_text("package api")
+
+        with (
+            patch("shutil.which", return_value=None),
+            patch("π.hooks.checkers.run_check_command") as mock_run,
+        ):
+            mock_run.return_value = (0, "", "")
+            await check_go(go_file)
+            (other / "api.go").write_text("package api // changed")
+            await check_go(go_file)
+            assert mock_run.call_count == 1
+            (pkg / "util.go").write_text("package store // changed")
+            await check_go(go_file)
+
+        assert mock_run.call_count == 2
+
+    async def test_falls_back_to_go_vet(self, tmp_path: Path):
         """Should fall back to go vet when golangci-lint not available."""
         (tmp_path / "go.mod").write_text("module test")
         go_file = tmp_path / "main.go"
@@ -201,14 +371,14 @@ class TestCheckGo:
             patch("π.hooks.checkers.run_check_command") as mock_run,
         ):
             mock_run.return_value = (0, "No issues found", "")
-            result = check_go(go_file)
+            result = await check_go(go_file)
 
         cmd = mock_run.call_args.kwargs["cmd"]
         assert "go" in cmd
         assert "vet" in cmd
         assert result == 0
 
-    def test_returns_two_on_lint_failure(self, tmp_path: Path):
+    async def test_returns_two_on_lint_failure(self, tmp_path: Path):
         """Should return 2 when linting fails."""
         (tmp_path / "go.mod").write_text("module test")
         go_file = tmp_path / "main.go"
@@ -219,6 +389,107 @@ class TestCheckGo:
             patch("π.hooks.checkers.run_check_command") as mock_run,
         ):
             mock_run.return_value = (1, "", "Vet errors found")
-            result = check_go(go_file)
+            result = await check_go(go_file)
 
         assert result == 2
+
+
+class TestLintCaching:
+    """Tests for lint verdict caching in checkers."""
+
+    async def test_unchanged_file_served_from_cache(
+        self, python_file: Path, lint_cache: LintCache
+    ):
+        """Should not rerun the checker for identical content."""
+        with (
+            patch("shutil.which", return_value="/usr/bin/uvx"),
+            patch("π.hooks.checkers.run_check_command") as mock_run,
+        ):
+            mock_run.return_value = (1, "", "E501 line too long")
+            first = await check_python(python_file)
+            second = await check_python(python_file)
+
+        mock_run.assert_called_once()
+        assert first == second == 2
+        assert lint_cache.hits == 1
+
+    async def test_changed_file_reruns_checker(self, python_file: Path):
+        """Should rerun the checker when file content changes."""
+        with (
+            patch("shutil.which", return_value="/usr/bin/uvx"),
+            patch("π.hooks.checkers.run_check_command") as mock_run,
+        ):
+            mock_run.return_value = (0, "", "")
+            await check_python(python_file)
+            python_file.write_text("x = 2\n", encoding="utf-8")
+            await check_python(python_file)
+
+        assert mock_run.call_count == 2
+
+    async def test_config_change_reruns_checker(self, tmp_path: Path):
+        """Should rerun the checker when a config file changes."""
+        (tmp_path / "pyproject.toml").write_text("[tool.ruff]\n")
+        py_file = tmp_path / "mod.py"
+        py_file.write_text("x = 1\n")
+
+        with (
+            patch("shutil.which", return_value="/usr/bin/uvx"),
+            patch("π.hooks.checkers.run_check_command") as mock_run,
+        ):
+            mock_run.return_value = (0, "", "")
+            await check_python(py_file)
+            (tmp_path / "pyproject.toml").write_text("[tool.ruff]\nline-length = 100\n")
+            await check_python(py_file)
+
+        assert mock_run.call_count == 2
+
+    async def test_project_source_change_reruns_cargo(self, tmp_path: Path):
+        """Should rerun project-scoped checkers when another source changes."""
+        (tmp_path / "Cargo.toml").write_text('[package]\nname = "test"')
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "main.rs").write_text("fn main() {}")
+        (src / "lib.rs").write_text("pub fn f() {}")
+
+        with patch("π.hooks.checkers.run_check_command") as mock_run:
+            mock_run.return_value = (0, "", "")
+            await check_rust(src / "main.rs")
+            await check_rust(src / "main.rs")
+            (src / "lib.rs").write_text("pub fn g() { todo!() }")
+            await check_rust(src / "main.rs")
+
+        assert mock_run.call_count == 2
+
+    async def test_keys_computed_off_event_loop(
+        self, python_file: Path, lint_cache: LintCache
+    ):
+        """Should hash files and walk sources on a worker thread."""
+        threads: list[threading.Thread] = []
+        key_for = lint_cache.key_for
+
+        def tracking_key_for(*args: object) -> str:
+            threads.append(threading.current_thread())
+            return key_for(*args)
+
+        with (
+            patch("shutil.which", return_value="/usr/bin/uvx"),
+            patch("π.hooks.checkers.run_check_command") as mock_run,
+            patch.object(lint_cache, "key_for", side_effect=tracking_key_for),
+        ):
+            mock_run.return_value = (0, "", "")
+            await check_python(python_file)
+
+        assert len(threads) == 2
+        assert threading.main_thread() not in threads
+
+    async def test_timeouts_not_cached(self, python_file: Path):
+        """Should not cache verdicts from timed out checkers."""
+        with (
+            patch("shutil.which", return_value="/usr/bin/uvx"),
+            patch("π.hooks.checkers.run_check_command") as mock_run,
+        ):
+            mock_run.return_value = (124, "", "ruff timed out")
+            await check_python(python_file)
+            await check_python(python_file)
+
+        assert mock_run.call_count == 2
@@ -0,0 +1,144 @@
+"""Tests for π.hooks.daemons module."""
+
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from π.hooks.daemons import (
+    DAEMONS_ENV,
+    RuffServer,
+    _apply_edits,
+    _format_diagnostics,
+    close_checker_daemons,
+    register_eslint_d,
+    ruff_server_check,
+)
+
+_RUFF = shutil.which("ruff")
+
+
+def _edit(start: tuple[int, int], end: tuple[int, int], text: str) -> dict:
+    return {
+        "range": {
+            "start": {"line": start[0], "character": start[1]},
+            "end": {"line": end[0], "character": end[1]},
+        },
+        "newText": text,
+    }
+
+
+class TestApplyEdits:
+    """Tests for _apply_edits function."""
+
+    def test_applies_edits_in_reverse_order(self):
+        """Should apply multiple edits without shifting later offsets."""
+        text = "import os\nimport sys\nx = 1\n"
+        edits = [_edit((0, 0), (1, 0), ""), _edit((2, 4), (2, 5), "2")]
+
+        assert _apply_edits(text, edits) == "import sys\nx = 2\n"
+
+    def test_positions_are_code_points(self):
+        """Should treat characters as code points (UTF-32 encoding)."""
+        text = "s = 'π'; y\n"
+
+        assert _apply_edits(text, [_edit((0, 9), (0, 10), "z")]) == "s = 'π'; z\n"
+
+    def test_end_past_last_line(self):
+        """Should clamp positions beyond the last line to the end of text."""
+        assert _apply_edits("a\n", [_edit((0, 1), (5, 0), "")]) == "a"
+
+
+class TestFormatDiagnostics:
+    """Tests for _format_diagnostics function."""
+
+    def test_formats_like_ruff_check(self):
+        """Should render path:line:col: CODE message lines and a summary."""
+        items = [
+            {
+                "code": "F401",
+                "message": "`os` imported but unused",
+                "range": {"start": {"line": 0, "character": 7}},
+            }
+        ]
+
+        output = _format_diagnostics(Path("a.py"), items)
+
+        assert output == "a.py:1:8: F401 `os` imported but unused\nFound 1 error.\n"
+
+
+class TestRuffServer:
+    """Tests for RuffServer class."""
+
+    async def test_missing_binary_falls_back(self, tmp_path: Path):
+        """Should return None so the caller runs the one-shot command."""
+        server = RuffServer(["nonexistent_ruff_for_test", "server"], tmp_path)
+        target = tmp_path / "a.py"
+        target.write_text("x = 1\n")
+
+        assert await server.check(target) is None
+        await server.close()
+
+    @pytest.mark.skipif(_RUFF is None, reason="ruff not installed")
+    async def test_fixes_and_reports(self, tmp_path: Path):
+        """Should apply safe fixes to the file and report the rest."""
+        # Pin the rules so the test doesn't depend on the installed ruff's
+        # default selection
+        (tmp_path / "ruff.toml").write_text('[lint]\nselect = ["F401", "E741"]\n')
+        target = tmp_path / "a.py"
+        target.write_text("import os\nl = 1\n")
+        server = RuffServer([str(_RUFF), "server"], tmp_path)
+
+        try:
+            code, stdout, _stderr = await server.check(target)
+            clean = tmp_path / "b.py"
+            clean.write_text("x = 1\n")
+            clean_result = await server.check(clean)
+        finally:
+            await server.close()
+
+        assert target.read_text() == "l = 1\n"
+        assert code == 1
+        assert "E741" in stdout
+        assert clean_result is not None
+        assert clean_result[0] == 0
+        assert not server.alive
+
+
+class TestRuffServerCheck:
+    """Tests for ruff_server_check function."""
+
+    async def test_disabled_by_env(self, tmp_path: Path, monkeypatch):
+        """Should not start a server when PI_LINT_DAEMONS=0."""
+        monkeypatch.setenv(DAEMONS_ENV, "0")
+        target = tmp_path / "a.py"
+        target.write_text("x = 1\n")
+
+        assert await ruff_server_check(["ruff", "server"], target) is None
+
+    async def test_outside_project_root(self, tmp_path: Path, monkeypatch):
+        """Should fall back for files outside the project root."""
+        monkeypatch.setattr(
+            "π.hooks.daemons.get_project_root", lambda: tmp_path / "project"
+        )
+        target = tmp_path / "a.py"
+        target.write_text("x = 1\n")
+
+        assert await ruff_server_check(["ruff", "server"], target) is None
+
+
+class TestCloseCheckerDaemons:
+    """Tests for close_checker_daemons function."""
+
+    async def test_stops_eslint_d(self, tmp_path: Path):
+        """Should stop each registered eslint_d daemon."""
+        register_eslint_d("/usr/bin/eslint_d", tmp_path)
+
+        with patch("π.hooks.daemons.run_check_command") as mock_run:
+            mock_run.return_value = (0, "", "")
+            await close_checker_daemons()
+            await close_checker_daemons()
+
+        mock_run.assert_called_once()
+        assert mock_run.call_args.kwargs["cmd"] == ["/usr/bin/eslint_d", "stop"]
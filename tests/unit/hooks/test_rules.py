@@ -0,0 +1,147 @@
+"""Tests for π.hooks.rules module."""
+
+from pathlib import Path
+
+import pytest
+
+from π.hooks.rules import (
+    DEFAULT_RULES,
+    RULES_ENV,
+    CommandMatcher,
+    SafetyRule,
+    _literal_prefix,
+    get_command_matcher,
+    load_rules,
+    reset_command_matcher,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_matcher():
+    """Rebuild the module-level matcher around each test."""
+    reset_command_matcher()
+    yield
+    reset_command_matcher()
+
+
+class TestLiteralPrefix:
+    """Tests for _literal_prefix function."""
+
+    @pytest.mark.parametrize(
+        ("pattern", "expected"),
+        [
+            (r"rm\s+-rf", ("rm", r"\s+-rf")),
+            (r"mkfs\.\w+", ("mkfs.", r"\w+")),
+            (r"terraform destroy", ("terraform destroy", "")),
+            (r"ab*c", ("a", "b*c")),
+            (r"a*b", ("", "a*b")),
+            (r"(curl|wget).*sh", ("", "(curl|wget).*sh")),
+            (r"foo|bar", ("", "foo|bar")),
+            (r"^rm", ("", "^rm")),
+        ],
+    )
+    def test_splits_pattern(self, pattern: str, expected: tuple[str, str]):
+        """Should only take text that every match starts with."""
+        assert _literal_prefix(pattern) == expected
+
+
+class TestCommandMatcher:
+    """Tests for CommandMatcher class."""
+
+    def test_reports_first_matching_rule(self):
+        """Should return the rule that matched, in rule order."""
+        matcher = CommandMatcher(DEFAULT_RULES)
+        rule = matcher.match("sudo rm -rf /")
+        assert rule is not None
+        assert rule.reason == "Dangerous rm"
+
+    def test_mixes_indexed_unindexed_and_literal_rules(self):
+        """Should match every kind of rule in the combined pattern."""
+        matcher = CommandMatcher([
+            SafetyRule("destroy", pattern=r"terraform\s+destroy"),
+            SafetyRule("force push", pattern=r"(?i)git push .*--force"),
+            SafetyRule("namespace", literal="kubectl delete namespace"),
+        ])
+
+        assert matcher.match("terraform  destroy -auto-approve").reason == "destroy"
+        assert matcher.match("GIT PUSH origin --FORCE").reason == "force push"
+        assert matcher.match("KUBECTL delete namespace prod").reason == "namespace"
+        assert matcher.match("terraform plan") is None
+
+    def test_empty_rule_set_allows_everything(self):
+        """Should allow all commands when there are no rules."""
+        assert CommandMatcher([]).match("rm -rf /") is None
+
+    def test_memoizes_bounded_verdicts(self):
+        """Should remember recent verdicts up to the cache size."""
+        matcher = CommandMatcher(DEFAULT_RULES, cache_size=2)
+        for cmd in ("ls", "pwd", "rm -rf /"):
+            matcher.match(cmd)
+
+        assert list(matcher._verdicts) == ["pwd", "rm -rf /"]
+        assert matcher.match("rm -rf /") is matcher._verdicts["rm -rf /"]
+
+    @pytest.mark.parametrize(
+        "rule",
+        [
+            SafetyRule("neither"),
+            SafetyRule("both", pattern="a", literal="a"),
+            SafetyRule("invalid", pattern="("),
+            SafetyRule("backreference", pattern=r"(a)\1"),
+        ],
+    )
+    def test_rejects_malformed_rules(self, rule: SafetyRule):
+        """Should raise ValueError for rules it cannot compile."""
+        with pytest.raises(ValueError, match=rule.reason):
+            CommandMatcher([rule])
+
+
+class TestLoadRules:
+    """Tests for load_rules and get_command_matcher."""
+
+    def test_loads_rules_file(self, tmp_path: Path):
+        """Should read pattern and literal rules in file order."""
+        rules_file = tmp_path / "rules.toml"
+        rules_file.write_text(
+            "[[rules]]\n"
+            "pattern = 'terraform\\s+destroy'\n"
+            'reason = "Terraform destroy"\n\n'
+            "[[rules]]\n"
+            'literal = "drop database"\n',
+            encoding="utf-8",
+        )
+
+        assert load_rules(rules_file) == [
+            SafetyRule("Terraform destroy", pattern=r"terraform\s+destroy"),
+            SafetyRule("drop database", literal="drop database"),
+        ]
+
+    def test_rejects_unknown_keys(self, tmp_path: Path):
+        """Should raise ValueError for entries with unexpected keys."""
+        rules_file = tmp_path / "rules.toml"
+        rules_file.write_text('[[rules]]\nregex = "x"\n', encoding="utf-8")
+
+        with pytest.raises(ValueError, match="rule 0"):
+            load_rules(rules_file)
+
+    def test_matcher_adds_rules_from_env(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Should extend the default rules with the PI_SAFETY_RULES file."""
+        rules_file = tmp_path / "rules.toml"
+        rules_file.write_text('[[rules]]\nliteral = "drop database"\n')
+        monkeypatch.setenv(RULES_ENV, str(rules_file))
+
+        matcher = get_command_matcher()
+
+        assert matcher.match("psql -c 'DROP DATABASE prod'") is not None
+        assert matcher.match("rm -rf /") is not None
+        assert get_command_matcher() is matcher
+
+    def test_invalid_rules_file_keeps_defaults(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Should fall back to the default rules if the file is invalid."""
+        monkeypatch.setenv(RULES_ENV, str(tmp_path / "missing.toml"))
+
+        assert get_command_matcher().rules == DEFAULT_RULES
@@ -0,0 +1,222 @@
+"""Tests for π.hooks.scheduler module."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from π.hooks.scheduler import (
+    DEBOUNCE_ENV,
+    LintFailure,
+    LintScheduler,
+    get_lint_scheduler,
+    lint_debounce_s,
+    lint_files,
+)
+
+
+@pytest.fixture
+def files(tmp_path: Path) -> list[Path]:
+    paths = [tmp_path / "a.py", tmp_path / "b.py", tmp_path / "c.rs"]
+    for path in paths:
+        path.write_text("")
+    return paths
+
+
+class TestLintDebounce:
+    """Tests for lint_debounce_s function."""
+
+    def test_reads_env(self, monkeypatch: pytest.MonkeyPatch):
+        """Should read the debounce interval from the environment."""
+        monkeypatch.setenv(DEBOUNCE_ENV, "0.5")
+        assert lint_debounce_s() == 0.5
+
+    def test_invalid_uses_default(self, monkeypatch: pytest.MonkeyPatch):
+        """Should fall back to the default for invalid values."""
+        monkeypatch.setenv(DEBOUNCE_ENV, "soon")
+        assert lint_debounce_s() == 1.0
+
+
+class TestLintFiles:
+    """Tests for lint_files function."""
+
+    async def test_batches_files_per_checker(self, files: list[Path]):
+        """Should use one batch invocation for files sharing a checker."""
+        py_checker, rs_checker = MagicMock(), AsyncMock(return_value=0)
+        batch = AsyncMock(return_value=2)
+
+        def get_checker(suffix: str):
+            return py_checker if suffix == ".py" else rs_checker
+
+        with (
+            patch("π.hooks.scheduler.get_checker", side_effect=get_checker),
+            patch(
+                "π.hooks.scheduler.get_batch_checker",
+                side_effect=lambda c: batch if c is py_checker else None,
+            ),
+        ):
+            failed = await lint_files(dict.fromkeys(files, "Edit"))
+
+        batch.assert_awaited_once_with(files[:2])
+        py_checker.assert_not_called()
+        rs_checker.assert_awaited_once_with(files[2], "Edit")
+        assert failed == [LintFailure(files[0]), LintFailure(files[1])]
+
+    async def test_reports_crashed_checker_as_error(self, files: list[Path]):
+        """A crashing checker should report its files as errored, not clean."""
+        crashing = MagicMock(side_effect=RuntimeError("no ruff"))
+        passing = AsyncMock(return_value=0)
+
+        def get_checker(suffix: str):
+            return crashing if suffix == ".py" else passing
+
+        with (
+            patch("π.hooks.scheduler.get_checker", side_effect=get_checker),
+            patch("π.hooks.scheduler.get_batch_checker", return_value=None),
+        ):
+            failed = await lint_files(dict.fromkeys(files, "Edit"))
+
+        assert failed == [
+            LintFailure(files[0], "RuntimeError: no ruff"),
+            LintFailure(files[1], "RuntimeError: no ruff"),
+        ]
+        passing.assert_awaited_once_with(files[2], "Edit")
+
+    async def test_skips_deleted_files(self, files: list[Path]):
+        """Should not check files removed since they were queued."""
+        files[0].unlink()
+        checker = MagicMock(return_value=0)
+
+        with (
+            patch("π.hooks.scheduler.get_checker", return_value=checker),
+            patch("π.hooks.scheduler.get_batch_checker", return_value=None),
+        ):
+            await lint_files({files[0]: "Write"})
+
+        checker.assert_not_called()
+
+
+class TestLintScheduler:
+    """Tests for LintScheduler class."""
+
+    async def test_debounces_repeated_edits(self, files: list[Path]):
+        """Should lint once after edits stop, with the files edited."""
+        scheduler = LintScheduler(debounce_s=0.05)
+
+        with patch("π.hooks.scheduler.lint_files", AsyncMock(return_value=[])) as lint:
+            for _ in range(5):
+                scheduler.schedule("s", files[0], "Edit")
+                await asyncio.sleep(0.01)
+            scheduler.schedule("s", files[1], "Write")
+            await asyncio.sleep(0.2)
+
+        lint.assert_awaited_once_with({files[0]: "Edit", files[1]: "Write"})
+        assert (scheduler.scheduled, scheduler.checked) == (6, 2)
+
+    async def test_flush_returns_failures_once(self, files: list[Path]):
+        """Should lint queued files on flush and report failures once."""
+        scheduler = LintScheduler(debounce_s=60)
+        scheduler.schedule("s", files[0], "Edit")
+
+        failure = LintFailure(files[0])
+        with patch("π.hooks.scheduler.lint_files", AsyncMock(return_value=[failure])):
+            assert await scheduler.flush("s") == [failure]
+            assert await scheduler.flush("s") == []
+
+    async def test_lint_crash_reported_as_error(self, files: list[Path]):
+        """Should report queued files as errored when linting itself crashes."""
+        scheduler = LintScheduler(debounce_s=60)
+        scheduler.schedule("s", files[0], "Edit")
+
+        crash = AsyncMock(side_effect=OSError("disk full"))
+        with patch("π.hooks.scheduler.lint_files", crash):
+            assert await scheduler.flush("s") == [
+                LintFailure(files[0], "OSError: disk full")
+            ]
+
+    async def test_take_failures_for_paths(self, files: list[Path]):
+        """Should take only the given files' failures and keep the rest."""
+        scheduler = LintScheduler(debounce_s=60)
+        for path in files[:2]:
+            scheduler.schedule("s", path, "Edit")
+        failed = [LintFailure(files[0]), LintFailure(files[1])]
+        with patch("π.hooks.scheduler.lint_files", AsyncMock(return_value=failed)):
+            await scheduler._run_pending("s")
+
+        assert scheduler.take_failures("s", [files[1]]) == failed[1:]
+        assert scheduler.take_failures("s", [files[1]]) == []
+        assert scheduler.take_failures("s") == failed[:1]
+
+    async def test_new_edit_supersedes_failure(self, files: list[Path]):
+        """Should drop an unreported failure when the file is edited again."""
+        scheduler = LintScheduler(debounce_s=60)
+        scheduler.schedule("s", files[0], "Edit")
+        failed = [LintFailure(files[0])]
+        with patch("π.hooks.scheduler.lint_files", AsyncMock(return_value=failed)):
+            await scheduler._run_pending("s")
+
+        scheduler.schedule("s", files[0], "Edit")
+
+        assert scheduler.take_failures("s") == []
+        await scheduler.aclose()
+
+    async def test_sessions_are_independent(self, files: list[Path]):
+        """Should keep queues and failures per session."""
+        scheduler = LintScheduler(debounce_s=60)
+        scheduler.schedule("a", files[0], "Edit")
+
+        assert await scheduler.flush("b") == []
+        assert scheduler._sessions["a"].pending == {files[0]: "Edit"}
+        await scheduler.aclose()
+
+    async def test_wait_for_blocks_until_lint_finishes(self, files: list[Path]):
+        """Should hold edits to a file until its in-flight lint completes."""
+        scheduler = LintScheduler(debounce_s=60)
+        release = asyncio.Event()
+
+        async def slow_lint(_files):
+            await release.wait()
+            return []
+
+        scheduler.schedule("s", files[0], "Edit")
+        with patch("π.hooks.scheduler.lint_files", side_effect=slow_lint):
+            flush = asyncio.create_task(scheduler.flush("s"))
+            await asyncio.sleep(0.01)
+            waiter = asyncio.create_task(scheduler.wait_for("s", files[0]))
+            await asyncio.sleep(0.01)
+            assert not waiter.done()
+            release.set()
+            await asyncio.wait_for(waiter, 1)
+            await flush
+
+
+class TestGetLintScheduler:
+    """Tests for get_lint_scheduler function."""
+
+    def test_cancels_scheduler_of_previous_loop(
+        self, files: list[Path], monkeypatch: pytest.MonkeyPatch
+    ):
+        """A scheduler left on another open loop should have its timers cancelled."""
+        monkeypatch.setattr("π.hooks.scheduler._scheduler", None)
+        monkeypatch.setattr("π.hooks.scheduler._scheduler_loop", None)
+        monkeypatch.setenv(DEBOUNCE_ENV, "60")
+
+        async def schedule() -> LintScheduler:
+            scheduler = get_lint_scheduler()
+            scheduler.schedule("s", files[0], "Edit")
+            return scheduler
+
+        async def current() -> LintScheduler:
+            return get_lint_scheduler()
+
+        loop = asyncio.new_event_loop()
+        try:
+            first = loop.run_until_complete(schedule())
+            timer = first._sessions["s"].timer
+            assert asyncio.run(current()) is not first
+            loop.run_until_complete(asyncio.sleep(0))
+            assert timer is not None
+            assert timer.cancelled()
+        finally:
+            loop.close()
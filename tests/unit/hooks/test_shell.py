@@ -0,0 +1,160 @@
+"""Tests for π.hooks.shell module."""
+
+import pytest
+
+from π.hooks.shell import (
+    Redirect,
+    ShellSyntaxError,
+    SimpleCommand,
+    parse_command,
+)
+
+
+def _argvs(cmd: str) -> list[tuple[str, ...]]:
+    return [command.argv for command in parse_command(cmd).commands]
+
+
+class TestParseCommand:
+    """Tests for parse_command function."""
+
+    @pytest.mark.parametrize(
+        ("cmd", "expected"),
+        [
+            ("ls -la", [("ls", "-la")]),
+            (
+                "make && make test || echo fail",
+                [("make",), ("make", "test"), ("echo", "fail")],
+            ),
+            ("a; b & c\nd", [("a",), ("b",), ("c",), ("d",)]),
+            ("(cd x && make)", [("cd", "x"), ("make",)]),
+            ("{ a; b; }", [("a",), ("b",)]),
+            (
+                "echo $(date) `whoami`",
+                [("date",), ("whoami",), ("echo", "$(date)", "`whoami`")],
+            ),
+            (
+                "diff <(ls a) <(ls b)",
+                [("ls", "a"), ("ls", "b"), ("diff", "<(ls a)", "<(ls b)")],
+            ),
+            ("if true; then a; else b; fi", [("true",), ("a",), ("b",)]),
+            ("for f in *.py; do ruff $f; done", [("ruff", "$f")]),
+            ("case $x in a|b) one;; *) two;; esac", [("one",), ("two",)]),
+            ("FOO=1 BAR=2 cmd arg", [("cmd", "arg")]),
+            ("ls # rm -rf /", [("ls",)]),
+        ],
+    )
+    def test_splits_simple_commands(self, cmd: str, expected: list[tuple[str, ...]]):
+        """Should find every simple command the line would run."""
+        assert _argvs(cmd) == expected
+
+    def test_quotes_stay_in_arguments(self):
+        """Should keep quoted operators and spaces inside one argument."""
+        commands = parse_command(
+            """git commit -m "fix: a && b; rm -rf /" 'x|y'"""
+        ).commands
+
+        assert len(commands) == 1
+        assert commands[0].argv == (
+            "git",
+            "commit",
+            "-m",
+            "fix: a && b; rm -rf /",
+            "x|y",
+        )
+        assert commands[0].text == "git commit -m x|y"
+
+    def test_pipeline_stages(self):
+        """Should group pipeline stages together."""
+        parsed = parse_command("cat f | grep x |& tee out; ls")
+
+        assert [[c.program for c in p] for p in parsed.pipelines] == [
+            ["cat", "grep", "tee"],
+            ["ls"],
+        ]
+
+    @pytest.mark.parametrize(
+        ("cmd", "expected"),
+        [
+            ("sudo -u root rm -rf x", ("rm", "-rf", "x")),
+            ("env -i A=1 B=2 nohup nice -n 5 python x.py", ("python", "x.py")),
+            ("timeout 30 pytest -q", ("pytest", "-q")),
+            ("xargs -n 1 rm -f", ("rm", "-f")),
+            ("command -v rm", ("command", "-v", "rm")),
+        ],
+    )
+    def test_unwraps_wrappers(self, cmd: str, expected: tuple[str, ...]):
+        """Should strip wrapper programs and their options."""
+        assert _argvs(cmd)[-1] == expected
+
+    def test_parses_shell_strings(self):
+        """Should parse the script of bash -c and eval as commands."""
+        assert _argvs("bash -lc 'cd /tmp && rm x'")[:2] == [("cd", "/tmp"), ("rm", "x")]
+        assert _argvs("eval 'rm -rf build'")[0] == ("rm", "-rf", "build")
+
+    def test_tracks_cd_directory(self):
+        """Should record the directory earlier cds moved to."""
+        commands = parse_command(
+            "cd src && make; cd ../docs; (cd /; ls); pwd; cd - && ls"
+        ).commands
+
+        assert [(c.program, c.cwd) for c in commands] == [
+            ("cd", "."),
+            ("make", "src"),
+            ("cd", "src"),
+            ("cd", "docs"),
+            ("ls", "/"),
+            ("pwd", "docs"),
+            ("cd", "docs"),
+            ("ls", None),
+        ]
+
+    def test_skips_heredoc_bodies(self):
+        """Should not parse heredoc bodies as commands."""
+        commands = parse_command("cat <<'EOF' > notes.md\nrm -rf /\nEOF\nls").commands
+
+        assert [c.argv for c in commands] == [("cat",), ("ls",)]
+        assert commands[0].redirects == (
+            Redirect("<<", "EOF"),
+            Redirect(">", "notes.md"),
+        )
+
+    def test_skips_heredoc_bodies_in_substitutions(self):
+        """A `)` in a heredoc body should not close the substitution."""
+        commands = parse_command("x=$(cat <<'EOF'\nhello)\nEOF\n)\nls").commands
+
+        assert [c.argv for c in commands] == [("cat",), ("ls",)]
+
+    def test_function_definitions(self):
+        """Should mark commands inside a function body with its name."""
+        commands = parse_command(":(){ :|:& };:").commands
+
+        assert [(c.program, c.function) for c in commands] == [
+            (":", ":"),
+            (":", ":"),
+            (":", None),
+        ]
+
+    def test_memoizes_parsed_form(self):
+        """Should return the cached parse for a repeated command."""
+        assert parse_command("ls -la | wc -l") is parse_command("ls -la | wc -l")
+
+    def test_program_strips_directory(self):
+        """Should expose the program name without its path."""
+        assert SimpleCommand(argv=("/usr/bin/rm", "x")).program == "rm"
+
+    @pytest.mark.parametrize(
+        "cmd",
+        ["echo 'open", 'echo "open', "echo $(date", "(ls", "{ ls;", "cat >"],
+    )
+    def test_rejects_unbalanced_input(self, cmd: str):
+        """Should raise ShellSyntaxError for input it cannot tokenize."""
+        with pytest.raises(ShellSyntaxError):
+            parse_command(cmd)
+
+    @pytest.mark.parametrize(
+        "cmd", ["echo a )", "echo hi;;", ")", "ls; )", "echo x && )"]
+    )
+    def test_rejects_stray_operators(self, cmd: str):
+        """Should raise (not loop forever) on an operator no command can start."""
+        with pytest.raises(ShellSyntaxError, match="unexpected"):
+            parse_command(cmd)
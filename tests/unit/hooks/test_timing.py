@@ -0,0 +1,52 @@
+"""Tests for π.hooks.timing module."""
+
+import pytest
+
+from π.hooks.timing import HookSpan, hook_span, subscribe_to_hook_spans, timed_hook
+
+
+@pytest.fixture
+def spans():
+    """Collect hook spans while the test runs."""
+    collected: list[HookSpan] = []
+    unsubscribe = subscribe_to_hook_spans(collected.append)
+    yield collected
+    unsubscribe()
+
+
+class TestHookSpans:
+    """Tests for hook span reporting."""
+
+    def test_hook_span_reports_block_time(self, spans: list[HookSpan]):
+        """Should report name, session and arguments of the block."""
+        with hook_span("lint", "session-1", files="3"):
+            pass
+
+        assert len(spans) == 1
+        assert (spans[0].name, spans[0].session_id) == ("lint", "session-1")
+        assert spans[0].args == {"files": "3"}
+        assert spans[0].end >= spans[0].start
+
+    async def test_timed_hook_reports_each_call(self, spans: list[HookSpan]):
+        """Should report the hook's name, session and tool_use_id."""
+
+        async def check_something(input_data, tool_use_id, context):
+            return {"decision": "ok"}
+
+        hook = timed_hook(check_something)
+        result = await hook({"session_id": "s"}, "toolu_1", None)
+
+        assert result == {"decision": "ok"}
+        assert spans[0].name == "check_something"
+        assert spans[0].args == {"tool_use_id": "toolu_1"}
+
+    def test_unsubscribed_listener_gets_nothing(self):
+        """Should stop reporting to a listener once it unsubscribes."""
+        collected: list[HookSpan] = []
+        unsubscribe = subscribe_to_hook_spans(collected.append)
+        unsubscribe()
+
+        with hook_span("lint", "s"):
+            pass
+
+        assert collected == []
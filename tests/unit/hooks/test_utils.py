@@ -1,10 +1,13 @@
 """Tests for π.hooks.utils module."""
 
-import subprocess
+import asyncio
+import time
 from pathlib import Path
 from unittest.mock import patch
 
-from π.hooks.utils import compact_path, run_check_command
+import pytest
+
+from π.hooks.utils import LINT_CONCURRENCY_ENV, compact_path, run_check_command
 
 
 class TestCompactPath:
@@ -54,49 +57,97 @@ class TestCompactPath:
 class TestRunCheckCommand:
     """Tests for run_check_command function."""
 
-    def test_success_returns_zero(self, tmp_path: Path):
+    async def test_success_returns_zero(self, tmp_path: Path):
         """Should return zero exit code on success."""
-        code, stdout, stderr = run_check_command(tmp_path, ["echo", "hello"], "echo")
+        code, stdout, stderr = await run_check_command(
+            tmp_path, ["echo", "hello"], "echo"
+        )
 
         assert code == 0
         assert "hello" in stdout
         assert stderr == ""
 
-    def test_timeout_returns_124(self, tmp_path: Path):
+    async def test_timeout_returns_124(self, tmp_path: Path):
         """Should return 124 on timeout."""
-        with patch(
-            "subprocess.run",
-            side_effect=subprocess.TimeoutExpired("cmd", 30),
-        ):
-            code, _stdout, stderr = run_check_command(
-                tmp_path, ["sleep", "100"], "test"
-            )
+        code, _stdout, stderr = await run_check_command(
+            tmp_path, ["sleep", "100"], "test", timeout=0.1
+        )
 
         assert code == 124
         assert "timed out" in stderr
 
-    def test_not_found_returns_127(self, tmp_path: Path):
+    async def test_not_found_returns_127(self, tmp_path: Path):
         """Should return 127 when command not found."""
-        with patch("subprocess.run", side_effect=FileNotFoundError()):
-            code, _stdout, stderr = run_check_command(
-                tmp_path, ["nonexistent_cmd"], "test"
-            )
+        code, _stdout, stderr = await run_check_command(
+            tmp_path, ["nonexistent_cmd_for_test"], "test"
+        )
 
         assert code == 127
         assert "not found" in stderr
 
-    def test_generic_error_returns_1(self, tmp_path: Path):
+    async def test_generic_error_returns_1(self, tmp_path: Path):
         """Should return 1 on generic exception."""
-        with patch("subprocess.run", side_effect=OSError("Permission denied")):
-            code, _stdout, stderr = run_check_command(tmp_path, ["some_cmd"], "test")
+        with patch(
+            "asyncio.create_subprocess_exec",
+            side_effect=OSError("Permission denied"),
+        ):
+            code, _stdout, stderr = await run_check_command(
+                tmp_path, ["some_cmd"], "test"
+            )
 
         assert code == 1
         assert "error" in stderr.lower()
 
-    def test_failure_returns_nonzero(self, tmp_path: Path):
+    async def test_failure_returns_nonzero(self, tmp_path: Path):
         """Should return non-zero exit code on command failure."""
-        code, _stdout, _stderr = run_check_command(
+        code, _stdout, _stderr = await run_check_command(
             tmp_path, ["python", "-c", "import sys; sys.exit(42)"], "python"
         )
 
         assert code == 42
+
+    async def test_does_not_block_event_loop(self, tmp_path: Path):
+        """Should let other tasks run while the command executes."""
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(ticker())
+        await run_check_command(tmp_path, ["sleep", "0.3"], "sleep")
+        task.cancel()
+
+        assert ticks >= 5
+
+    async def test_cancellation_kills_process(self, tmp_path: Path):
+        """Should kill the command when the awaiting task is cancelled."""
+        marker = tmp_path / "done"
+        script = f"import time; time.sleep(1); open({str(marker)!r}, 'w')"
+        task = asyncio.create_task(
+            run_check_command(tmp_path, ["python", "-c", script], "python")
+        )
+        await asyncio.sleep(0.2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        await asyncio.sleep(1.2)
+        assert not marker.exists()
+
+    async def test_limits_concurrency(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Should run at most PI_LINT_CONCURRENCY commands at once."""
+        monkeypatch.setenv(LINT_CONCURRENCY_ENV, "1")
+        cmd = ["python", "-c", "import time; time.sleep(0.2)"]
+
+        start = time.monotonic()
+        await asyncio.gather(
+            run_check_command(tmp_path, cmd, "python"),
+            run_check_command(tmp_path, cmd, "python"),
+        )
+
+        assert time.monotonic() - start >= 0.4
@@ -1,7 +1,7 @@
 """Tests for π.utils module (directory functions)."""
 
 from π.config import get_logs_dir
-from π.utils import get_project_root
+from π.utils import clear_project_root_cache, find_git_root, get_project_root
 
 
 class TestGetProjectRoot:
@@ -36,6 +36,64 @@ class TestGetProjectRoot:
         (tmp_path / ".git").mkdir()
         assert get_project_root(tmp_path) == tmp_path
 
+    def test_subdirectory_uses_git_root(self, monkeypatch, tmp_path):
+        """Should walk up to the git work tree from an unmarked subdirectory."""
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        subdir = tmp_path / "src" / "pkg"
+        subdir.mkdir(parents=True)
+        monkeypatch.chdir(subdir)
+        assert get_project_root() == tmp_path
+
+    def test_memoized_until_cleared(self, tmp_path):
+        """Should reuse the detected root until the cache is cleared."""
+        subdir = tmp_path / "sub"
+        subdir.mkdir()
+        assert get_project_root(subdir) == subdir
+
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        assert get_project_root(subdir) == subdir
+
+        clear_project_root_cache(subdir)
+        assert get_project_root(subdir) == tmp_path.resolve()
+
+
+class TestFindGitRoot:
+    """Tests for find_git_root function."""
+
+    @staticmethod
+    def _init_git_dir(path):
+        path.mkdir(parents=True)
+        (path / "HEAD").write_text("ref: refs/heads/main\n")
+
+    def test_finds_git_directory(self, tmp_path):
+        """Should return the directory containing .git."""
+        self._init_git_dir(tmp_path / "repo" / ".git")
+        nested = tmp_path / "repo" / "a" / "b"
+        nested.mkdir(parents=True)
+        assert find_git_root(nested) == (tmp_path / "repo").resolve()
+
+    def test_follows_worktree_gitdir_file(self, tmp_path):
+        """Should treat a .git file pointing at a git dir as a work tree."""
+        self._init_git_dir(tmp_path / "repo" / ".git" / "worktrees" / "wt")
+        worktree = tmp_path / "wt"
+        worktree.mkdir()
+        (worktree / ".git").write_text("gitdir: ../repo/.git/worktrees/wt\n")
+        assert find_git_root(worktree) == worktree.resolve()
+
+    def test_ignores_broken_gitdir_file(self, tmp_path):
+        """Should skip .git files whose gitdir does not exist."""
+        self._init_git_dir(tmp_path / ".git")
+        submodule = tmp_path / "sub"
+        submodule.mkdir()
+        (submodule / ".git").write_text("gitdir: ../.git/modules/missing\n")
+        assert find_git_root(submodule) == tmp_path.resolve()
+
+    def test_outside_repository(self, tmp_path):
+        """Should return None when no ancestor is a git work tree."""
+        assert find_git_root(tmp_path) is None
+
 
 class TestGetLogsDir:
     """Tests for get_logs_dir function."""
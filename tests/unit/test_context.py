@@ -11,6 +11,7 @@ class TestWorkflowContext:
         """Should have empty defaults."""
         ctx = WorkflowContext()
         assert ctx.session_ids == {}
+        assert ctx.sub_session_ids == {}
         assert ctx.doc_paths == {}
         assert ctx.objective is None
         assert ctx.observer is None
@@ -1,9 +1,16 @@
 """Tests for π.workflow.observer module."""
 
+import json
+import time
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
-from π.workflow.observer import CompositeObserver, LoggingObserver
+from π.workflow.blobs import BlobStore
+from π.workflow.observer import (
+    CompositeObserver,
+    EventLogObserver,
+    LoggingObserver,
+)
 
 
 class TestLoggingObserver:
@@ -25,6 +32,7 @@ class TestLoggingObserver:
         observer = LoggingObserver(log_path)
         observer.on_tool_start("TestTool", {"key": "value"})
 
+        observer.flush()
         content = log_path.read_text()
         assert "TOOL_START: TestTool" in content
 
@@ -34,6 +42,7 @@ class TestLoggingObserver:
         observer = LoggingObserver(log_path)
         observer.on_tool_end("TestTool", "result", is_error=False)
 
+        observer.flush()
         content = log_path.read_text()
         assert "TOOL_END: TestTool [OK]" in content
 
@@ -43,6 +52,7 @@ class TestLoggingObserver:
         observer = LoggingObserver(log_path)
         observer.on_tool_end("TestTool", "error", is_error=True)
 
+        observer.flush()
         content = log_path.read_text()
         assert "TOOL_END: TestTool [ERROR]" in content
 
@@ -52,6 +62,7 @@ class TestLoggingObserver:
         observer = LoggingObserver(log_path)
         observer.on_text("Test text output")
 
+        observer.flush()
         content = log_path.read_text()
         assert "TEXT:" in content
         assert "Test text output" in content
@@ -62,6 +73,7 @@ class TestLoggingObserver:
         observer = LoggingObserver(log_path)
         observer.on_thinking("Thinking about the problem")
 
+        observer.flush()
         content = log_path.read_text()
         assert "THINKING:" in content
 
@@ -71,6 +83,7 @@ class TestLoggingObserver:
         observer = LoggingObserver(log_path)
         observer.on_complete(turns=5, cost=0.01, duration_ms=1000)
 
+        observer.flush()
         content = log_path.read_text()
         assert "COMPLETE" in content
         assert "Turns: 5" in content
@@ -82,6 +95,7 @@ class TestLoggingObserver:
         observer = LoggingObserver(log_path)
         observer.on_system("init", {"version": "1.0"})
 
+        observer.flush()
         content = log_path.read_text()
         assert "SYSTEM_INIT:" in content
 
@@ -91,6 +105,7 @@ class TestLoggingObserver:
         observer = LoggingObserver(log_path)
         observer.on_text("Test", agent_id="stage:research")
 
+        observer.flush()
         content = log_path.read_text()
         assert "[stage:research]" in content
 
@@ -177,11 +192,16 @@ class TestDispatchMessage:
         message.num_turns = 5
         message.total_cost_usd = 0.01
         message.duration_ms = 1000
+        message.usage = {"input_tokens": 10, "output_tokens": 5}
 
         dispatch_message(message, observer, agent_id="orchestrator")
 
         observer.on_complete.assert_called_once_with(
-            turns=5, cost=0.01, duration_ms=1000, agent_id="orchestrator"
+            turns=5,
+            cost=0.01,
+            duration_ms=1000,
+            agent_id="orchestrator",
+            usage={"input_tokens": 10, "output_tokens": 5},
         )
 
     def test_dispatch_result_message_null_cost(self):
@@ -195,11 +215,12 @@ class TestDispatchMessage:
         message.num_turns = 3
         message.total_cost_usd = None
         message.duration_ms = 500
+        message.usage = None
 
         dispatch_message(message, observer)
 
         observer.on_complete.assert_called_once_with(
-            turns=3, cost=0.0, duration_ms=500, agent_id="orchestrator"
+            turns=3, cost=0.0, duration_ms=500, agent_id="orchestrator", usage=None
         )
 
     def test_dispatch_system_message(self):
@@ -265,6 +286,7 @@ class TestDispatchMessage:
 
         observer = MagicMock()
         tool_block = MagicMock(spec=ToolUseBlock)
+        tool_block.id = "tool-read"
         tool_block.name = "Read"
         tool_block.input = {"file_path": "/tmp/test.py"}
 
@@ -301,6 +323,7 @@ class TestDispatchMessage:
             result="File contents here",
             is_error=False,
             agent_id="orchestrator",
+            duration_ms=None,
         )
 
     def test_dispatch_tool_result_list(self):
@@ -325,8 +348,65 @@ class TestDispatchMessage:
             result="Result from list",
             is_error=True,
             agent_id="orchestrator",
+            duration_ms=None,
+        )
+
+
+class TestToolCallCorrelation:
+    """Tests for matching tool results to their tool_use blocks."""
+
+    def test_result_reports_name_duration_and_agent(self):
+        """Should report the started tool's name, agent and elapsed time."""
+        from claude_agent_sdk.types import (
+            AssistantMessage,
+            ToolResultBlock,
+            ToolUseBlock,
+            UserMessage,
+        )
+
+        from π.workflow.observer import dispatch_message
+
+        observer = MagicMock()
+        start = AssistantMessage(
+            content=[ToolUseBlock(id="toolu_1", name="Grep", input={})],
+            model="claude",
+        )
+        result = UserMessage(
+            content=[ToolResultBlock(tool_use_id="toolu_1", content="3 matches")]
+        )
+
+        with patch("π.workflow.observer.time.monotonic", side_effect=[10.0, 10.25]):
+            dispatch_message(start, observer, agent_id="stage:research")
+            dispatch_message(result, observer)
+
+        observer.on_tool_end.assert_called_once_with(
+            name="Grep",
+            result="3 matches",
+            is_error=False,
+            agent_id="stage:research",
+            duration_ms=250.0,
         )
 
+    def test_in_flight_calls_are_bounded(self):
+        """Should evict the oldest calls whose results never arrive."""
+        from π.workflow import observer as observer_module
+
+        with patch.object(observer_module, "_MAX_IN_FLIGHT", 2):
+            for i in range(3):
+                observer_module._start_tool(f"toolu_{i}", "Bash", "orchestrator")
+
+            assert list(observer_module._in_flight) == ["toolu_1", "toolu_2"]
+            observer_module.clear_in_flight_tools()
+            assert not observer_module._in_flight
+
+    def test_logging_observer_writes_duration(self, tmp_path: Path):
+        """Should include the tool duration in the TOOL_END line."""
+        observer = LoggingObserver(tmp_path / "run.log")
+        observer.on_tool_end("Bash", None, is_error=False, duration_ms=1530.0)
+        observer.close()
+
+        assert "TOOL_END: Bash [OK 1.53s]" in (tmp_path / "run.log").read_text()
+
 
 class TestLoggingObserverOnSystem:
     """Tests for LoggingObserver.on_system method."""
@@ -341,6 +421,7 @@ class TestLoggingObserverOnSystem:
             {"compact_metadata": {"trigger": "max_tokens", "pre_tokens": 50000}},
         )
 
+        observer.flush()
         content = log_path.read_text()
         assert "SYSTEM_COMPACT" in content
         assert "trigger=max_tokens" in content
@@ -353,5 +434,158 @@ class TestLoggingObserverOnSystem:
 
         observer.on_system("custom_event", {"key": "value"})
 
+        observer.flush()
         content = log_path.read_text()
         assert "SYSTEM_CUSTOM_EVENT:" in content
+
+
+class TestLoggingObserverWriter:
+    """Tests for the buffered LoggingObserver writer."""
+
+    def test_close_drains_queue(self, tmp_path: Path):
+        """Should write every queued event before closing."""
+        log_path = tmp_path / "test.log"
+        observer = LoggingObserver(log_path)
+        for i in range(1000):
+            observer.on_text(f"line {i}")
+
+        observer.close()
+        content = log_path.read_text()
+        assert "line 0" in content
+        assert "line 999" in content
+
+    def test_events_after_close_ignored(self, tmp_path: Path):
+        """Should drop events after close instead of raising."""
+        log_path = tmp_path / "test.log"
+        observer = LoggingObserver(log_path)
+        observer.close()
+
+        observer.on_text("late")
+        observer.flush()
+        observer.close()
+        assert "late" not in log_path.read_text()
+
+    def test_flushes_on_interval(self, tmp_path: Path):
+        """Should flush to disk without an explicit flush call."""
+        log_path = tmp_path / "test.log"
+        observer = LoggingObserver(log_path, flush_interval=0.01)
+        observer.on_text("periodic")
+
+        deadline = time.monotonic() + 5
+        while "periodic" not in log_path.read_text():
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        observer.close()
+
+    def test_flushes_on_orchestrator_complete(self, tmp_path: Path):
+        """Should flush after the orchestrator completes."""
+        log_path = tmp_path / "test.log"
+        observer = LoggingObserver(log_path, flush_interval=3600)
+        observer.on_text("before complete")
+        observer.on_complete(turns=1, cost=0.0, duration_ms=1)
+
+        deadline = time.monotonic() + 5
+        while "COMPLETE" not in log_path.read_text():
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        content = log_path.read_text()
+        assert "before complete" in content
+        assert content.endswith("=" * 80 + "\n")
+        observer.close()
+
+    def test_spills_large_tool_input_to_blobs(self, tmp_path: Path):
+        """Should log a blob reference instead of large input strings."""
+        log_path = tmp_path / "test.log"
+        blobs = BlobStore(tmp_path / "blobs", threshold=100)
+        observer = LoggingObserver(log_path, blobs=blobs)
+        content = "x = 1\n" * 1000
+        observer.on_tool_start("Write", {"file_path": "/a.py", "content": content})
+        observer.on_text(content)
+
+        observer.close()
+        log = log_path.read_text()
+        assert log.count("x = 1") == 1000
+        assert '"content": "<blob sha256:' in log
+        assert blobs.spilled == 1
+
+    def test_survives_failing_entry(self, tmp_path: Path):
+        """A spill that raises should drop its entry, not kill the writer."""
+        log_path = tmp_path / "test.log"
+        blobs = BlobStore(tmp_path / "blobs", threshold=100)
+        observer = LoggingObserver(log_path, blobs=blobs)
+
+        with patch.object(blobs, "spill", side_effect=OSError("disk full")):
+            observer.on_tool_start("Write", {"content": "x" * 1000})
+            observer.flush()
+        observer.on_text("after failure")
+        observer.flush()
+        observer.close()
+
+        assert "after failure" in log_path.read_text()
+        assert observer._writer._file.closed
+
+    def test_serializes_tool_input(self, tmp_path: Path):
+        """Should JSON-format tool input on the writer thread."""
+        log_path = tmp_path / "test.log"
+        observer = LoggingObserver(log_path)
+        observer.on_tool_start("Read", {"path": Path("/tmp/x"), "n": 1})
+
+        observer.close()
+        content = log_path.read_text()
+        assert '"path": "/tmp/x"' in content
+        assert '"n": 1' in content
+
+
+class TestEventLogObserver:
+    """Tests for the JSONL EventLogObserver."""
+
+    def test_writes_one_record_per_event(self, tmp_path: Path):
+        """Should write run_start, each event and run_end as JSON lines."""
+        log_path = tmp_path / "run.jsonl"
+        observer = EventLogObserver(log_path, objective="ship it", driver="pipeline")
+        observer.on_tool_start("Read", {"path": "/x"}, agent_id="stage:research")
+        observer.on_tool_end(
+            "Read", "héllo", False, agent_id="stage:research", duration_ms=12.5
+        )
+        observer.on_text("done")
+        observer.on_complete(
+            turns=3, cost=0.25, duration_ms=900, usage={"input_tokens": 10}
+        )
+        observer.close()
+
+        records = [json.loads(line) for line in log_path.read_text().splitlines()]
+        assert [r["event"] for r in records] == [
+            "run_start",
+            "tool_start",
+            "tool_end",
+            "text",
+            "complete",
+            "run_end",
+        ]
+        assert records[0]["objective"] == "ship it"
+        assert records[0]["driver"] == "pipeline"
+        assert records[1]["input_bytes"] == len('{"path": "/x"}')
+        assert records[2] | {"ts": 0} == {
+            "ts": 0,
+            "event": "tool_end",
+            "agent_id": "stage:research",
+            "tool": "Read",
+            "is_error": False,
+            "duration_ms": 12.5,
+            "result_bytes": 6,
+        }
+        assert records[4]["usage"] == {"input_tokens": 10}
+        assert records[4]["cost_usd"] == 0.25
+
+    def test_records_sizes_not_payloads(self, tmp_path: Path):
+        """Should keep payload text out of the log."""
+        log_path = tmp_path / "run.jsonl"
+        observer = EventLogObserver(log_path)
+        observer.on_thinking("secret reasoning")
+        observer.on_system("init", {"session_id": "s1"})
+        observer.close()
+
+        content = log_path.read_text()
+        assert "secret reasoning" not in content
+        assert '"bytes":16' in content
+        assert '"subtype":"init"' in content
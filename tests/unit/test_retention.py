@@ -0,0 +1,142 @@
+"""Tests for π.retention module."""
+
+import gzip
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from π.retention import (
+    MAX_AGE_ENV,
+    MAX_SIZE_ENV,
+    RetentionPolicy,
+    prune_logs,
+    start_log_retention,
+)
+
+DAY = 24 * 3600
+NOW = 1_800_000_000.0
+
+
+def _run(logs_dir: Path, key: str, *, age_days: float, size: int = 100) -> list[Path]:
+    """Create a run's text log, event log and trace with the given age."""
+    files = [
+        logs_dir / f"{key}.log",
+        logs_dir / f"{key}.jsonl",
+        logs_dir / f"{key}.trace.json",
+    ]
+    mtime = NOW - age_days * DAY
+    for path in files:
+        path.write_text("x" * size, encoding="utf-8")
+        os.utime(path, (mtime, mtime))
+    return files
+
+
+class TestRetentionPolicy:
+    """Tests for RetentionPolicy.from_env."""
+
+    def test_defaults(self, monkeypatch: pytest.MonkeyPatch):
+        """Should default to 7 days, 500 MB and compression after a day."""
+        monkeypatch.delenv(MAX_AGE_ENV, raising=False)
+        monkeypatch.delenv(MAX_SIZE_ENV, raising=False)
+        assert RetentionPolicy.from_env() == RetentionPolicy()
+
+    def test_arguments_override_environment(self, monkeypatch: pytest.MonkeyPatch):
+        """CLI values should win over the environment; 0 disables a limit."""
+        monkeypatch.setenv(MAX_AGE_ENV, "30")
+        monkeypatch.setenv(MAX_SIZE_ENV, "not a number")
+
+        policy = RetentionPolicy.from_env(max_age_days=2, compress_after_days=0)
+        assert policy.max_age_s == 2 * DAY
+        assert policy.max_bytes == 500 * 1024 * 1024
+        assert policy.compress_after_s is None
+
+
+class TestPruneLogs:
+    """Tests for prune_logs function."""
+
+    def test_deletes_expired_runs(self, tmp_path: Path):
+        """Should delete every file of runs past the maximum age."""
+        old = _run(tmp_path, "2026-01-01-10:00:00", age_days=10)
+        new = _run(tmp_path, "2026-01-09-10:00:00", age_days=0.1)
+
+        result = prune_logs(tmp_path, RetentionPolicy(), now=NOW)
+
+        assert result.removed == 3
+        assert not any(p.exists() for p in old)
+        assert all(p.exists() for p in new)
+
+    def test_compresses_older_runs(self, tmp_path: Path):
+        """Should gzip runs past the compression age, keeping their mtime."""
+        files = _run(tmp_path, "2026-01-05-10:00:00", age_days=2)
+
+        result = prune_logs(tmp_path, RetentionPolicy(), now=NOW)
+
+        assert result.compressed == 3
+        for path in files:
+            packed = path.with_name(f"{path.name}.gz")
+            assert not path.exists()
+            assert gzip.decompress(packed.read_bytes()) == b"x" * 100
+            assert packed.stat().st_mtime == pytest.approx(NOW - 2 * DAY)
+        assert prune_logs(tmp_path, RetentionPolicy(), now=NOW).compressed == 0
+
+    def test_enforces_size_budget_oldest_first(self, tmp_path: Path):
+        """Should delete the oldest runs until the directory fits."""
+        oldest = _run(tmp_path, "a", age_days=0.3, size=1000)
+        middle = _run(tmp_path, "b", age_days=0.2, size=1000)
+        newest = _run(tmp_path, "c", age_days=0.1, size=1000)
+
+        prune_logs(tmp_path, RetentionPolicy(max_bytes=6500), now=NOW)
+
+        assert not any(p.exists() for p in oldest)
+        assert all(p.exists() for p in middle + newest)
+
+    def test_never_touches_current_run(self, tmp_path: Path):
+        """Should leave the current run alone even when over every limit."""
+        current = _run(tmp_path, "2026-01-01-10:00:00", age_days=30)
+
+        policy = RetentionPolicy(max_bytes=1)
+        prune_logs(tmp_path, policy, keep=current[0], now=NOW)
+
+        assert all(p.exists() for p in current)
+
+    def test_expires_blobs_by_age(self, tmp_path: Path):
+        """Should delete blobs no run referenced within the maximum age."""
+        blobs = tmp_path / "blobs" / "ab"
+        blobs.mkdir(parents=True)
+        old, recent = blobs / "ab01", blobs / "ab02"
+        for path, age_days in ((old, 10), (recent, 1)):
+            path.write_text("payload", encoding="utf-8")
+            os.utime(path, (NOW - age_days * DAY,) * 2)
+
+        prune_logs(tmp_path, RetentionPolicy(), now=NOW)
+
+        assert not old.exists()
+        assert recent.exists()
+        assert recent.read_text() == "payload"
+
+    def test_ignores_subdirectories_and_removes_stale_tmp(self, tmp_path: Path):
+        """Should skip directories and clean up interrupted compressions."""
+        (tmp_path / "blobs").mkdir()
+        stale = tmp_path / "a.log.gz.123.tmp"
+        stale.write_text("partial", encoding="utf-8")
+        os.utime(stale, (NOW - DAY, NOW - DAY))
+
+        prune_logs(tmp_path, RetentionPolicy(), now=NOW)
+
+        assert (tmp_path / "blobs").is_dir()
+        assert not stale.exists()
+
+
+def test_start_log_retention_runs_in_background(tmp_path: Path):
+    """Should prune on a daemon thread."""
+    old = _run(tmp_path, "old", age_days=0)
+    for path in old:
+        os.utime(path, (time.time() - 30 * DAY,) * 2)
+
+    thread = start_log_retention(tmp_path, RetentionPolicy())
+    thread.join(timeout=5)
+
+    assert thread.daemon
+    assert not any(p.exists() for p in old)
@@ -0,0 +1,160 @@
+"""Tests for π.worktrees module."""
+
+import asyncio
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from π.worktrees import WorktreePool, branch_name
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """A git repository with one commit and an ignored build directory."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q")
+    _git(repo, "config", "user.email", "test@example.com")
+    _git(repo, "config", "user.name", "Test")
+    (repo / "app.py").write_text("x = 1\n")
+    (repo / ".gitignore").write_text("build/\n.π/\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "initial")
+    return repo
+
+
+@pytest.fixture
+async def pool(repo: Path):
+    """A started two-worktree pool, closed after the test."""
+    pool = WorktreePool(repo, root=repo / ".π" / "worktrees", size=2)
+    await pool.start()
+    yield pool
+    await pool.close()
+
+
+class TestBranchName:
+    """Tests for branch_name function."""
+
+    def test_sanitizes_labels(self):
+        """Should replace characters git rejects and drop empty parts."""
+        assert branch_name("2026-01-01-12:00:00", "fix bug #3", "") == (
+            "pi/2026-01-01-12-00-00/fix-bug-3"
+        )
+
+
+class TestWorktreePool:
+    """Tests for WorktreePool class."""
+
+    async def test_hands_out_separate_worktrees(self, pool: WorktreePool):
+        """Concurrent workflows should get different checkouts of the base."""
+        async with pool.acquire() as a, pool.acquire() as b:
+            assert a != b
+            (a / "app.py").write_text("x = 2\n")
+            assert (b / "app.py").read_text() == "x = 1\n"
+
+    async def test_waits_for_free_worktree(self, pool: WorktreePool):
+        """A third workflow should wait until one of two is released."""
+
+        async def third() -> Path:
+            async with pool.acquire() as path:
+                return path
+
+        async with pool.acquire(), pool.acquire():
+            waiting = asyncio.ensure_future(third())
+            await asyncio.sleep(0.05)
+            assert not waiting.done()
+        assert (await waiting).exists()
+
+    async def test_commits_survive_on_branch(self, repo: Path, pool: WorktreePool):
+        """Commits should stay on the workflow's branch after recycling."""
+        async with pool.acquire(branch="pi/batch/1") as path:
+            (path / "new.py").write_text("y = 1\n")
+            _git(path, "add", "new.py")
+            _git(path, "commit", "-q", "-m", "add new")
+
+        assert _git(repo, "log", "-1", "--format=%s", "pi/batch/1") == "add new"
+        assert not (path / "new.py").exists()
+        assert _git(path, "rev-parse", "HEAD") == pool.base_commit
+
+    async def test_recycle_keeps_ignored_files(self, pool: WorktreePool):
+        """Release should drop edits and untracked files but keep ignored ones."""
+        async with pool.acquire() as path:
+            (path / "app.py").write_text("x = 2\n")
+            (path / "scratch.py").write_text("")
+            (path / "build").mkdir()
+            (path / "build" / "out.o").write_text("")
+
+        assert (path / "app.py").read_text() == "x = 1\n"
+        assert not (path / "scratch.py").exists()
+        assert (path / "build" / "out.o").exists()
+
+    async def test_replaces_broken_worktree(self, repo: Path, pool: WorktreePool):
+        """A worktree that can't be reset should be replaced."""
+        async with pool.acquire() as path:
+            _git(repo, "worktree", "remove", "--force", str(path))
+
+        async with pool.acquire() as a, pool.acquire() as b:
+            assert path not in {a, b}
+            assert (a / "app.py").exists()
+            assert (b / "app.py").exists()
+
+    async def test_failed_replacement_keeps_slot(self, repo: Path, pool: WorktreePool):
+        """A slot whose replacement can't be created should be retried."""
+        add = pool._add
+        with patch.object(pool, "_add", side_effect=RuntimeError("disk full")):
+            async with pool.acquire() as path:
+                _git(repo, "worktree", "remove", "--force", str(path))
+
+            with pytest.raises(RuntimeError, match="disk full"):
+                async with pool.acquire(), pool.acquire():
+                    pass
+
+        with patch.object(pool, "_add", side_effect=add):
+            async with pool.acquire() as a, pool.acquire() as b:
+                assert (a / "app.py").exists()
+                assert (b / "app.py").exists()
+
+    async def test_failed_start_removes_created(self, repo: Path):
+        """start() should remove the worktrees it made before failing."""
+        pool = WorktreePool(repo, root=repo / ".π" / "worktrees", size=3)
+        add = pool._add
+        calls = 0
+
+        async def flaky_add() -> Path:
+            nonlocal calls
+            calls += 1
+            if calls == 3:
+                raise RuntimeError("git worktree failed")
+            return await add()
+
+        with (
+            patch.object(pool, "_add", side_effect=flaky_add),
+            pytest.raises(RuntimeError, match="worktree failed"),
+        ):
+            await pool.start()
+
+        assert not (repo / ".π" / "worktrees").exists()
+        assert _git(repo, "worktree", "list").count("\n") == 0
+
+    async def test_close_removes_worktrees(self, repo: Path):
+        """close() should remove the worktrees and their git metadata."""
+        pool = WorktreePool(repo, root=repo / ".π" / "worktrees", size=2)
+        await pool.start()
+        await pool.close()
+
+        assert not (repo / ".π" / "worktrees").exists()
+        assert _git(repo, "worktree", "list").count("\n") == 0
+
+    async def test_start_outside_git_raises(self, tmp_path: Path):
+        """Should raise RuntimeError when the repository is not a git repo."""
+        pool = WorktreePool(tmp_path, root=tmp_path / "worktrees", size=1)
+        with pytest.raises(RuntimeError, match="rev-parse"):
+            await pool.start()
@@ -0,0 +1,82 @@
+"""Tests for π.workflow.blobs module."""
+
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+
+from π.workflow.blobs import BLOB_THRESHOLD_ENV, BlobStore, blob_ref, blob_threshold
+
+
+class TestBlobThreshold:
+    """Tests for blob_threshold function."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"), [(None, 4096), ("0", 0), ("100", 100), ("x", 4096)]
+    )
+    def test_reads_environment(
+        self, monkeypatch: pytest.MonkeyPatch, value: str | None, expected: int
+    ):
+        """Should read PI_LOG_BLOB_THRESHOLD, defaulting on bad values."""
+        if value is None:
+            monkeypatch.delenv(BLOB_THRESHOLD_ENV, raising=False)
+        else:
+            monkeypatch.setenv(BLOB_THRESHOLD_ENV, value)
+        assert blob_threshold() == expected
+
+
+class TestBlobStore:
+    """Tests for BlobStore class."""
+
+    def test_spills_large_strings_once(self, tmp_path: Path):
+        """Should store large strings by hash and reference them."""
+        store = BlobStore(tmp_path / "blobs", threshold=10)
+        content = "print('hello')\n" * 10
+        digest = hashlib.sha256(content.encode()).hexdigest()
+
+        first = store.spill({"file_path": "/x.py", "content": content})
+        second = store.spill({"file_path": "/y.py", "content": content})
+
+        ref = blob_ref(digest, len(content))
+        assert first == {"file_path": "/x.py", "content": ref}
+        assert second["content"] == ref
+        assert store.path_for(digest).read_text() == content
+        assert store.spilled == 2
+        assert store.bytes_spilled == len(content)
+
+    def test_walks_nested_payloads(self, tmp_path: Path):
+        """Should spill strings inside nested lists and dicts."""
+        store = BlobStore(tmp_path / "blobs", threshold=4)
+        payload = {"edits": [{"old_string": "a" * 5, "new_string": "b"}], "n": 1}
+
+        spilled = store.spill(payload)
+
+        assert spilled["edits"][0]["old_string"].startswith("<blob sha256:")
+        assert spilled["edits"][0]["new_string"] == "b"
+        assert spilled["n"] == 1
+
+    def test_threshold_counts_utf8_bytes(self, tmp_path: Path):
+        """Should compare the encoded size, not the character count."""
+        store = BlobStore(tmp_path / "blobs", threshold=8)
+        assert store.spill("ééé") == "ééé"
+        assert store.spill("ééééé").endswith(" 10 bytes>")
+
+    def test_zero_threshold_disables(self, tmp_path: Path):
+        """Should leave payloads alone when the threshold is 0."""
+        store = BlobStore(tmp_path / "blobs", threshold=0)
+        assert store.spill("x" * 100_000) == "x" * 100_000
+        assert not (tmp_path / "blobs").exists()
+
+    def test_refreshes_existing_blob_mtime(self, tmp_path: Path):
+        """Should touch blobs written by earlier runs so retention keeps them."""
+        BlobStore(tmp_path, threshold=1).spill("shared")
+        digest = hashlib.sha256(b"shared").hexdigest()
+        path = BlobStore(tmp_path).path_for(digest)
+        os.utime(path, (0, 0))
+
+        store = BlobStore(tmp_path, threshold=1)
+        store.spill("shared")
+
+        assert path.stat().st_mtime > 0
+        assert store.bytes_spilled == 0
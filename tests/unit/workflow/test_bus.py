@@ -0,0 +1,134 @@
+"""Tests for π.workflow.bus module."""
+
+import logging
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from π.workflow.bus import ObserverBus
+
+
+class _Recorder:
+    """Observer recording (method, thread name) pairs."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str]] = []
+
+    def on_text(self, text: str, *, agent_id: str = "orchestrator") -> None:
+        self.calls.append((text, threading.current_thread().name))
+
+
+class _Failing:
+    """Observer raising on every event."""
+
+    def on_text(self, text: str, *, agent_id: str = "orchestrator") -> None:
+        raise RuntimeError("display broke")
+
+
+class _Blocked:
+    """Observer that waits until released."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+
+    def on_text(self, text: str, *, agent_id: str = "orchestrator") -> None:
+        self.release.wait()
+
+
+class TestObserverBus:
+    """Tests for ObserverBus class."""
+
+    def test_delivers_events_in_order(self):
+        """Should deliver every event, in order, with its arguments."""
+        obs = MagicMock()
+        bus = ObserverBus([obs])
+
+        bus.on_tool_start("Read", {"file_path": "/a"}, agent_id="stage:research")
+        bus.on_tool_end("Read", "ok", False, duration_ms=1.5)
+        bus.on_complete(3, 0.1, 1000, usage={"input_tokens": 1})
+        bus.close()
+
+        assert [c[0] for c in obs.method_calls] == [
+            "on_tool_start",
+            "on_tool_end",
+            "on_complete",
+        ]
+        obs.on_tool_start.assert_called_once_with(
+            "Read", {"file_path": "/a"}, agent_id="stage:research"
+        )
+        obs.on_tool_end.assert_called_once_with(
+            "Read", "ok", False, agent_id="orchestrator", duration_ms=1.5
+        )
+
+    def test_runs_observers_off_thread_and_inline(self):
+        """Should call queued observers on their thread, inline ones directly."""
+        queued, inline = _Recorder(), _Recorder()
+        bus = ObserverBus([queued], inline=[inline])
+
+        bus.on_text("hi")
+        bus.flush()
+
+        assert queued.calls == [("hi", "π-observer-_Recorder-1")]
+        assert inline.calls == [("hi", threading.current_thread().name)]
+        bus.close()
+
+    def test_isolates_failures(self, caplog: pytest.LogCaptureFixture):
+        """Should keep delivering to others when one observer raises."""
+        good = _Recorder()
+        bus = ObserverBus([_Failing(), good], inline=[_Failing()])
+
+        with caplog.at_level(logging.ERROR):
+            bus.on_text("a")
+            bus.on_text("b")
+            bus.close()
+
+        assert [text for text, _ in good.calls] == ["a", "b"]
+        failing = [s for s in bus.stats() if s.name.startswith("_Failing")]
+        assert [s.errors for s in failing] == [2, 2]
+        # One traceback per observer, not per event
+        assert len(caplog.records) == 2
+
+    def test_reports_lagging_observer_without_blocking(
+        self, caplog: pytest.LogCaptureFixture
+    ):
+        """Should warn about a backed-up observer and drop past the limit."""
+        blocked = _Blocked()
+        bus = ObserverBus([blocked], lag_threshold=3, max_pending=5)
+
+        with caplog.at_level(logging.WARNING):
+            for i in range(10):
+                bus.on_text(str(i))
+
+        assert bus.lagging() == ["_Blocked"]
+        stats = bus.stats()[0]
+        assert stats.dropped >= 4
+        assert stats.max_pending == 5
+        assert "falling behind" in caplog.text
+
+        blocked.release.set()
+        bus.close()
+        assert stats.events + stats.dropped == 10
+
+    def test_measures_handling_time(self):
+        """Should accumulate per-observer handling time."""
+        bus = ObserverBus([_Recorder()])
+        for _ in range(3):
+            bus.on_text("x")
+        bus.close()
+
+        stats = bus.stats()[0]
+        assert stats.events == 3
+        assert stats.busy_s >= stats.max_handle_s > 0
+        assert stats.mean_handle_ms == pytest.approx(stats.busy_s * 1000 / 3)
+
+    def test_ignores_events_after_close(self):
+        """Should drop events published after close."""
+        obs = _Recorder()
+        bus = ObserverBus([obs])
+        bus.close()
+
+        bus.on_text("late")
+
+        assert obs.calls == []
+        assert bus.stats()[0].events == 0
@@ -0,0 +1,151 @@
+"""Tests for π.workflow.metrics module."""
+
+import json
+from pathlib import Path
+
+from π.workflow.metrics import (
+    METRICS_JSON,
+    METRICS_TEXTFILE,
+    MetricsObserver,
+    ToolLatency,
+    ToolLatencyObserver,
+)
+
+USAGE = {
+    "input_tokens": 1200,
+    "output_tokens": 800,
+    "cache_read_input_tokens": 20_000,
+}
+
+
+class TestToolLatencyObserver:
+    """Tests for ToolLatencyObserver class."""
+
+    def test_aggregates_percentiles_per_agent(self):
+        """Should report p50/p95/max per tool, separately per agent."""
+        observer = ToolLatencyObserver()
+        for ms in range(1, 21):
+            observer.on_tool_end("Read", None, False, duration_ms=float(ms))
+        observer.on_tool_end(
+            "Read", None, True, agent_id="stage:research", duration_ms=500.0
+        )
+
+        summary = observer.summary()
+
+        assert summary["orchestrator"]["Read"] == ToolLatency(
+            calls=20, errors=0, total_ms=210.0, p50_ms=10.0, p95_ms=19.0, max_ms=20.0
+        )
+        assert summary["stage:research"]["Read"] == ToolLatency(
+            calls=1, errors=1, total_ms=500.0, p50_ms=500.0, p95_ms=500.0, max_ms=500.0
+        )
+
+    def test_orders_tools_by_total_time(self):
+        """Should list the tools that took the most time first."""
+        observer = ToolLatencyObserver()
+        observer.on_tool_end("Read", None, False, duration_ms=5.0)
+        observer.on_tool_end("Bash", None, False, duration_ms=900.0)
+        observer.on_tool_end("Read", None, False, duration_ms=5.0)
+
+        assert list(observer.summary()["orchestrator"]) == ["Bash", "Read"]
+
+    def test_counts_untimed_calls(self):
+        """Should count calls without a duration but not sample them."""
+        observer = ToolLatencyObserver()
+        observer.on_tool_end("toolu_1", None, False)
+
+        stats = observer.summary()["orchestrator"]["toolu_1"]
+
+        assert stats.calls == 1
+        assert stats.max_ms == 0.0
+
+    def test_render_empty(self):
+        """Should render nothing before any tool ran."""
+        assert ToolLatencyObserver().render() is None
+
+    def test_render_table(self):
+        """Should render one row per agent and tool."""
+        observer = ToolLatencyObserver()
+        observer.on_tool_end("Bash", None, False, duration_ms=1500.0)
+        observer.on_tool_end("Read", None, False, agent_id="stage:plan", duration_ms=3)
+
+        table = observer.render()
+
+        assert table is not None
+        assert table.row_count == 2
+
+
+class TestMetricsObserver:
+    """Tests for MetricsObserver class."""
+
+    def test_aggregates_sessions_per_agent(self):
+        """Should total turns, cost and tokens per agent_id."""
+        observer = MetricsObserver()
+        for _ in range(2):
+            observer.on_complete(
+                3, 0.1, 45_000, agent_id="stage:research_codebase", usage=USAGE
+            )
+        observer.on_complete(8, 0.4, 90_000)
+
+        research = observer.agents["stage:research_codebase"]
+
+        assert (research.sessions, research.turns) == (2, 6)
+        assert research.cost_usd == 0.2
+        assert research.tokens == {
+            "input": 2400,
+            "output": 1600,
+            "cache_read": 40_000,
+            "cache_creation": 0,
+        }
+        assert research.duration_seconds.counts[4] == 2  # 30s < 45s <= 60s
+        assert observer.agents["orchestrator"].session_tokens.count == 0
+
+    def test_skips_pipeline_total(self):
+        """Should not record the pipeline's total of its stage sessions."""
+        observer = MetricsObserver(driver="pipeline")
+        observer.on_complete(3, 0.1, 45_000, agent_id="stage:research_codebase")
+        observer.on_complete(3, 0.1, 50_000)
+
+        assert list(observer.agents) == ["stage:research_codebase"]
+
+    def test_write_accumulates_across_runs(self, tmp_path: Path):
+        """Should merge each run into the totals already exported."""
+        for _ in range(2):
+            observer = MetricsObserver()
+            observer.on_complete(3, 0.1, 45_000, agent_id="stage:plan", usage=USAGE)
+            observer.write(tmp_path)
+
+        exported = json.loads((tmp_path / METRICS_JSON).read_text())
+
+        assert exported["runs"] == 2
+        assert exported["agents"]["stage:plan"]["sessions"] == 2
+        assert exported["agents"]["stage:plan"]["duration_seconds"]["sum"] == 90.0
+
+    def test_writes_openmetrics_textfile(self, tmp_path: Path):
+        """Should expose counters and cumulative histogram buckets."""
+        observer = MetricsObserver()
+        observer.on_complete(3, 0.1, 45_000, agent_id='stage:"x"', usage=USAGE)
+        observer.write(tmp_path)
+
+        lines = (tmp_path / METRICS_TEXTFILE).read_text().splitlines()
+
+        assert lines[-1] == "# EOF"
+        assert "pi_runs_total 1" in lines
+        assert 'pi_agent_sessions_total{agent="stage:\\"x\\""} 1' in lines
+        assert (
+            'pi_agent_tokens_total{agent="stage:\\"x\\"",type="cache_read"} 20000'
+            in lines
+        )
+        assert (
+            'pi_agent_session_duration_seconds_bucket{agent="stage:\\"x\\"",'
+            'le="+Inf"} 1'
+        ) in lines
+        assert "# TYPE pi_agent_session_cost_usd histogram" in lines
+
+    def test_ignores_unreadable_previous_export(self, tmp_path: Path):
+        """Should start fresh totals if the JSON file is corrupt."""
+        (tmp_path / METRICS_JSON).write_text("{not json")
+        observer = MetricsObserver()
+        observer.on_complete(1, 0.0, 1000)
+        observer.write(tmp_path)
+
+        assert json.loads((tmp_path / METRICS_JSON).read_text())["runs"] == 1
@@ -0,0 +1,227 @@
+"""Tests for π.workflow.pipeline module."""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from π.core.enums import Command
+from π.workflow.pipeline import _head_commit, needs_implementation, run_pipeline
+
+pytestmark = pytest.mark.no_api
+
+
+@pytest.fixture
+def docs(tmp_path: Path) -> dict[str, str]:
+    """Create research and plan documents."""
+    research = tmp_path / "research.md"
+    research.write_text("# Research")
+    plan = tmp_path / "plan.md"
+    plan.write_text("# Plan")
+    return {"research": str(research), "plan": str(plan)}
+
+
+def _stage_sessions(docs: dict[str, str], **overrides):
+    """Build a fake run_claude_session keyed by command."""
+    responses = {
+        Command.RESEARCH_CODEBASE: (
+            "Found it.\nNEEDS_IMPLEMENTATION: yes",
+            "s-research",
+            docs["research"],
+            [],
+        ),
+        Command.CREATE_PLAN: ("Plan written", "s-plan", docs["plan"], []),
+        Command.REVIEW_PLAN: ("Looks good", "s-review", docs["plan"], []),
+        Command.ITERATE_PLAN: ("Updated", "s-iterate", docs["plan"], []),
+        Command.IMPLEMENT_PLAN: ("Implemented", "s-impl", None, ["src/a.py"]),
+        Command.COMMIT: ("Committed", "s-commit", None, []),
+    }
+    responses.update(overrides)
+    calls: list[Command] = []
+
+    async def fake(**kwargs):
+        cmd = kwargs["tool_command"]
+        calls.append(cmd)
+        response = responses[cmd]
+        if callable(response):
+            return response()
+        return response
+
+    return fake, calls
+
+
+class TestNeedsImplementation:
+    """Tests for the early-exit rule."""
+
+    @pytest.mark.parametrize(
+        ("summary", "expected"),
+        [
+            ("NEEDS_IMPLEMENTATION: no", False),
+            ("NEEDS_IMPLEMENTATION: `yes`", True),
+            ("needs_implementation: NO", False),
+            ("No verdict given", True),
+            ("NEEDS_IMPLEMENTATION: yes\nNEEDS_IMPLEMENTATION: no", False),
+        ],
+    )
+    def test_parses_verdict(self, summary: str, expected: bool):
+        """Should use the last verdict and default to True."""
+        assert needs_implementation(summary) is expected
+
+
+class TestHeadCommit:
+    """Tests for _head_commit function."""
+
+    def test_timeout_returns_none(self, tmp_path: Path):
+        """A hung git should give up after the timeout instead of blocking."""
+        hung = subprocess.TimeoutExpired(["git", "rev-parse", "HEAD"], 10)
+        with patch("π.workflow.pipeline.subprocess.run", side_effect=hung) as run:
+            assert _head_commit(tmp_path) is None
+
+        assert run.call_args.kwargs["timeout"] > 0
+
+
+class TestRunPipeline:
+    """Tests for run_pipeline driver."""
+
+    @pytest.fixture(autouse=True)
+    def head_commits(self):
+        """Simulate a new commit created by commit_changes."""
+        with patch(
+            "π.workflow.pipeline._head_commit", side_effect=["aaa111", "bbb222"]
+        ) as mock:
+            yield mock
+
+    @pytest.mark.asyncio
+    async def test_full_run(
+        self, mock_run_claude_session, fresh_workflow_context, docs
+    ):
+        """Should run every stage and fill WorkflowOutput from tool results."""
+        fake, calls = _stage_sessions(docs)
+        mock_run_claude_session.side_effect = fake
+
+        output = await run_pipeline("add feature")
+
+        assert calls == [
+            Command.RESEARCH_CODEBASE,
+            Command.CREATE_PLAN,
+            Command.REVIEW_PLAN,
+            Command.IMPLEMENT_PLAN,
+            Command.COMMIT,
+        ]
+        assert output.status == "complete"
+        assert output.research_doc_path == docs["research"]
+        assert output.plan_doc_path == docs["plan"]
+        assert output.review_approved is True
+        assert output.files_changed == ["src/a.py"]
+        assert output.commit_hash == "bbb222"
+
+    @pytest.mark.asyncio
+    async def test_early_exit_when_no_changes_needed(
+        self, mock_run_claude_session, fresh_workflow_context, docs
+    ):
+        """Should stop after research when it reports no implementation."""
+        fake, calls = _stage_sessions(
+            docs,
+            **{
+                Command.RESEARCH_CODEBASE: (
+                    "Already done.\nNEEDS_IMPLEMENTATION: no",
+                    "s",
+                    docs["research"],
+                    [],
+                )
+            },
+        )
+        mock_run_claude_session.side_effect = fake
+
+        output = await run_pipeline("explain auth")
+
+        assert calls == [Command.RESEARCH_CODEBASE]
+        assert output.status == "no_changes_needed"
+        assert output.needs_implementation is False
+
+    @pytest.mark.asyncio
+    async def test_iterates_until_review_approves(
+        self, mock_run_claude_session, fresh_workflow_context, docs
+    ):
+        """Should iterate on review feedback and count iterations."""
+        reviews = iter([
+            ("Found an issue", "s", docs["plan"], []),
+            ("Looks good", "s", docs["plan"], []),
+        ])
+        fake, calls = _stage_sessions(
+            docs, **{Command.REVIEW_PLAN: lambda: next(reviews)}
+        )
+        mock_run_claude_session.side_effect = fake
+
+        output = await run_pipeline("add feature")
+
+        assert calls.count(Command.ITERATE_PLAN) == 1
+        assert output.review_iteration_count == 1
+        assert output.review_approved is True
+
+    @pytest.mark.asyncio
+    async def test_caps_review_iterations(
+        self, mock_run_claude_session, fresh_workflow_context, docs
+    ):
+        """Should implement anyway after max_iterations rejected reviews."""
+        fake, calls = _stage_sessions(
+            docs, **{Command.REVIEW_PLAN: ("Needs a fix", "s", docs["plan"], [])}
+        )
+        mock_run_claude_session.side_effect = fake
+
+        output = await run_pipeline("add feature", max_iterations=2)
+
+        assert calls.count(Command.ITERATE_PLAN) == 2
+        assert calls.count(Command.REVIEW_PLAN) == 3
+        assert output.review_approved is False
+        assert Command.IMPLEMENT_PLAN in calls
+
+    @pytest.mark.asyncio
+    async def test_skips_commit_without_changes(
+        self, mock_run_claude_session, fresh_workflow_context, docs
+    ):
+        """Should not commit when implementation changed no files."""
+        fake, calls = _stage_sessions(
+            docs, **{Command.IMPLEMENT_PLAN: ("Nothing to do", "s", None, [])}
+        )
+        mock_run_claude_session.side_effect = fake
+
+        output = await run_pipeline("add feature")
+
+        assert Command.COMMIT not in calls
+        assert output.commit_hash is None
+        assert output.status == "complete"
+
+    @pytest.mark.asyncio
+    async def test_stage_failure_returns_failed_status(
+        self, mock_run_claude_session, fresh_workflow_context, docs
+    ):
+        """Should report status=failed when a stage raises."""
+
+        def boom():
+            raise RuntimeError("Agent execution failed")
+
+        fake, _ = _stage_sessions(docs, **{Command.CREATE_PLAN: boom})
+        mock_run_claude_session.side_effect = fake
+
+        output = await run_pipeline("add feature")
+
+        assert output.status == "failed"
+        assert "Agent execution failed" in output.summary
+
+    @pytest.mark.asyncio
+    async def test_reports_steps_to_observer(
+        self, mock_run_claude_session, fresh_workflow_context, docs
+    ):
+        """Should report each step as an orchestrator tool call."""
+        fake, _ = _stage_sessions(docs)
+        mock_run_claude_session.side_effect = fake
+        observer = MagicMock()
+
+        await run_pipeline("add feature", observer=observer)
+
+        names = [c.args[0] for c in observer.on_tool_start.call_args_list]
+        assert names[0] == "mcp__workflow__research_codebase"
+        assert names[-1] == "mcp__workflow__commit_changes"
+        observer.on_complete.assert_called_once()
@@ -1,10 +1,13 @@
 """Tests for π.workflow.tools module."""
 
+import asyncio
 import json
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from π.core.enums import Command
 from π.workflow.tools import (
     commit_changes,
     create_plan,
@@ -41,6 +44,117 @@ class TestResearchCodebase:
         assert content["summary"] == "Research summary"
 
 
+class TestResearchFanout:
+    """Tests for research_codebase sub_queries fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_runs_one_session_per_sub_query(
+        self, mock_run_claude_session, fresh_workflow_context, tmp_path: Path
+    ):
+        """Should run a session per sub-query and merge their documents."""
+        docs = {}
+        for name in ("auth", "db"):
+            docs[name] = tmp_path / f"{name}.md"
+            docs[name].write_text(f"# {name} findings")
+
+        async def fake_session(**kwargs):
+            name = "auth" if "auth" in kwargs["query"] else "db"
+            return (f"{name} summary", f"sess-{name}", str(docs[name]), [])
+
+        mock_run_claude_session.side_effect = fake_session
+
+        result = await research_codebase.handler({
+            "query": "map the backend",
+            "sub_queries": ["auth flow", "db layer"],
+        })
+
+        assert mock_run_claude_session.call_count == 2
+        agent_ids = {c.kwargs["agent_id"] for c in mock_run_claude_session.mock_calls}
+        assert len(agent_ids) == 2
+
+        content = json.loads(result["content"][0]["text"])
+        merged = Path(content["doc_path"])
+        assert merged.parent == tmp_path
+        assert "# auth findings" in merged.read_text(encoding="utf-8")
+        assert "# db findings" in merged.read_text(encoding="utf-8")
+        assert "auth summary" in content["summary"]
+
+        sub_sessions = fresh_workflow_context.sub_session_ids
+        assert sub_sessions[Command.RESEARCH_CODEBASE] == {
+            "auth flow": "sess-auth",
+            "db layer": "sess-db",
+        }
+
+    @pytest.mark.asyncio
+    async def test_respects_concurrency_limit(
+        self, mock_run_claude_session, fresh_workflow_context, tmp_path: Path
+    ):
+        """Should never run more sessions at once than max_concurrency."""
+        running = 0
+        peak = 0
+
+        async def fake_session(**_kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return ("summary", "sess", None, [])
+
+        mock_run_claude_session.side_effect = fake_session
+
+        with patch("π.workflow.tools.get_project_root", return_value=tmp_path):
+            await research_codebase.handler({
+                "query": "survey",
+                "sub_queries": ["a", "b", "c", "d"],
+                "max_concurrency": 2,
+            })
+
+        assert mock_run_claude_session.call_count == 4
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_partial_failure_still_merges(
+        self, mock_run_claude_session, fresh_workflow_context, tmp_path: Path
+    ):
+        """Should merge successful sub-queries and note failures."""
+
+        async def fake_session(**kwargs):
+            if "broken" in kwargs["query"]:
+                raise RuntimeError("boom")
+            return ("ok summary", "sess", None, [])
+
+        mock_run_claude_session.side_effect = fake_session
+
+        with patch("π.workflow.tools.get_project_root", return_value=tmp_path):
+            result = await research_codebase.handler({
+                "query": "survey",
+                "sub_queries": ["fine", "broken"],
+            })
+
+        content = json.loads(result["content"][0]["text"])
+        merged = Path(content["doc_path"]).read_text(encoding="utf-8")
+        assert "ok summary" in merged
+        assert "Research failed: boom" in merged
+
+    @pytest.mark.asyncio
+    async def test_all_failures_raise(
+        self, mock_run_claude_session, fresh_workflow_context
+    ):
+        """Should raise when every sub-query session fails."""
+
+        async def fake_session(**_kwargs):
+            raise RuntimeError("boom")
+
+        mock_run_claude_session.side_effect = fake_session
+
+        with pytest.raises(RuntimeError, match="All research sub-queries failed"):
+            await research_codebase.handler({
+                "query": "survey",
+                "sub_queries": ["a", "b"],
+            })
+
+
 class TestCreatePlan:
     """Tests for create_plan tool."""
 
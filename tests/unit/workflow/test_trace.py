@@ -0,0 +1,137 @@
+"""Tests for π.workflow.trace module."""
+
+import contextvars
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from π.hooks.timing import hook_span
+from π.workflow.context import reset_workflow_ctx
+from π.workflow.state import ArtifactEvent, emit_artifact_event
+from π.workflow.trace import TraceObserver, _lanes, _Span
+
+
+def _clock(*times: float):
+    return patch("π.workflow.trace.time.monotonic", side_effect=times)
+
+
+def _spans(trace: dict) -> dict[str, list[tuple[str, int, int]]]:
+    """Map thread names to their (name, ts, dur) spans."""
+    names = {
+        e["tid"]: e["args"]["name"]
+        for e in trace["traceEvents"]
+        if e["ph"] == "M" and e["name"] == "thread_name"
+    }
+    spans: dict[str, list[tuple[str, int, int]]] = {}
+    for e in trace["traceEvents"]:
+        if e["ph"] == "X":
+            spans.setdefault(names[e["tid"]], []).append((e["name"], e["ts"], e["dur"]))
+    return spans
+
+
+class TestTraceObserver:
+    """Tests for TraceObserver class."""
+
+    def test_records_nested_agent_spans(self, tmp_path: Path):
+        """Should record model turns, tool calls and sessions per agent."""
+        with _clock(0.0):
+            tracer = TraceObserver()
+        agent = "stage:research_codebase"
+        with _clock(1.0, 3.0, 4.5, 5.0, 6.0, 7.0):
+            tracer.on_system("init", {"session_id": "s1"}, agent_id=agent)
+            tracer.on_tool_start("Grep", {}, agent_id=agent)
+            tracer.on_tool_end("Grep", None, False, agent_id=agent, duration_ms=1500)
+            tracer.on_text("done", agent_id=agent)
+            tracer.on_complete(2, 0.1, 5000, agent_id=agent)
+            path = tracer.close(tmp_path / "run.trace.json")
+
+        spans = _spans(json.loads(path.read_text()))
+
+        assert spans["orchestrator"] == [("run", 0, 7_000_000)]
+        assert spans[agent] == [
+            ("session", 1_000_000, 5_000_000),
+            ("model", 1_000_000, 2_000_000),
+            ("Grep", 3_000_000, 1_500_000),
+            ("model", 4_500_000, 500_000),
+        ]
+
+    def test_places_hooks_on_their_session_track(self):
+        """Should put hook spans on the track of the agent running the session."""
+        tracer = TraceObserver()
+        tracer.on_system("init", {"session_id": "s1"}, agent_id="stage:implement")
+        with hook_span("check_bash_command", "s1"):
+            pass
+        with hook_span("lint", "unknown"):
+            pass
+        tracer.close(Path("/dev/null"))
+
+        spans = _spans(tracer.to_chrome_trace())
+
+        assert [name for name, _, _ in spans["stage:implement"]] == [
+            "check_bash_command"
+        ]
+        assert [name for name, _, _ in spans["hooks"]] == ["lint"]
+
+    def test_records_stage_events(self):
+        """Should turn stage_start/stage_end artifact events into spans."""
+        with _clock(0.0):
+            tracer = TraceObserver()
+        with _clock(1.0, 4.0, 5.0):
+            emit_artifact_event(ArtifactEvent("stage_start", stage="create_plan"))
+            emit_artifact_event(ArtifactEvent("stage_end", stage="create_plan"))
+            tracer.close(Path("/dev/null"))
+
+        assert _spans(tracer.to_chrome_trace())["stages"] == [
+            ("create_plan", 1_000_000, 3_000_000)
+        ]
+
+    def test_ignores_other_workflows_events(self):
+        """Should keep only the stage events and hooks of its own workflow."""
+
+        def other_workflow() -> None:
+            reset_workflow_ctx()
+            emit_artifact_event(ArtifactEvent("stage_start", stage="create_plan"))
+            emit_artifact_event(ArtifactEvent("stage_end", stage="create_plan"))
+            with hook_span("lint", "other-session"):
+                pass
+
+        reset_workflow_ctx()
+        tracer = TraceObserver()
+        contextvars.copy_context().run(other_workflow)
+        emit_artifact_event(ArtifactEvent("stage_end", stage="commit", elapsed=1.0))
+        tracer.close(Path("/dev/null"))
+
+        assert [(s.name, s.category) for s in tracer.spans] == [
+            ("commit", "stage"),
+            ("run", "run"),
+        ]
+
+    def test_close_unsubscribes(self):
+        """Should stop recording artifact events once closed."""
+        tracer = TraceObserver()
+        tracer.close(Path("/dev/null"))
+        emit_artifact_event(ArtifactEvent("stage_end", stage="commit", elapsed=1.0))
+
+        assert [span.category for span in tracer.spans] == ["run"]
+
+
+class TestLanes:
+    """Tests for _lanes function."""
+
+    def test_overlapping_spans_get_extra_lanes(self):
+        """Should keep nesting per lane when parallel tool calls overlap."""
+        spans = [
+            _Span("session", "session", "a", 0, 10),
+            _Span("Read", "tool", "a", 1, 4),
+            _Span("Grep", "tool", "a", 2, 6),
+            _Span("Bash", "tool", "a", 6, 8),
+            _Span("run", "run", "orchestrator", 0, 10),
+        ]
+
+        lanes = [(label, [s.name for s in placed]) for label, placed in _lanes(spans)]
+
+        assert lanes == [
+            ("orchestrator", ["run"]),
+            ("a", ["session", "Read", "Bash"]),
+            ("a (2)", ["Grep"]),
+        ]
@@ -0,0 +1,279 @@
+"""Content-addressed cache of stage session results.
+
+Rerunning an objective on an unchanged tree would otherwise repeat the full
+research stage. Results of document-producing stages are stored under
+`.π/cache/stages`, keyed by command, normalized query, input document hash
+and repository state, and returned without starting a session.
+
+Only fresh sessions are cached: resumed sessions depend on conversation
+state, and implement/commit stages have side effects.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from π.config import get_cache_dir
+from π.core.enums import Command
+from π.utils import get_project_root
+
+logger = logging.getLogger(__name__)
+
+# Stages whose results depend only on their inputs and the repository state
+CACHEABLE_COMMANDS = frozenset({
+    Command.RESEARCH_CODEBASE,
+    Command.CREATE_PLAN,
+    Command.REVIEW_PLAN,
+})
+
+DEFAULT_MAX_AGE_S = 7 * 24 * 3600
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+# Paths written by π itself; excluded so stage output doesn't change the key
+_STATE_EXCLUDES = (":(exclude)thoughts", ":(exclude).π")
+
+# Module-level switch (config, not workflow state); see --no-cache
+_enabled = True
+_caches: dict[Path, StageCache] = {}
+
+
+@dataclass
+class CachedStage:
+    """A cached stage session result."""
+
+    result: str
+    session_id: str
+    doc_path: str | None = None
+    files_changed: list[str] = field(default_factory=list)
+    doc_sha: str | None = None
+
+
+def _sha256_file(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _git(root: Path, *args: str) -> bytes | None:
+    try:
+        return subprocess.run(
+            ["git", *args],
+            cwd=root,
+            capture_output=True,
+            check=True,
+            timeout=10,
+        ).stdout
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+        return None
+
+
+def repo_state_hash(root: Path) -> str | None:
+    """Hash the repository state: HEAD tree plus uncommitted changes.
+
+    Covers tracked modifications (diff against HEAD) and untracked files,
+    excluding π's own output directories.
+
+    Args:
+        root: Repository working directory.
+
+    Returns:
+        Hex digest, or None if root is not a git repository with a HEAD.
+    """
+    tree = _git(root, "rev-parse", "HEAD^{tree}")
+    if tree is None:
+        return None
+
+    digest = hashlib.sha256(tree)
+    digest.update(
+        _git(root, "diff", "HEAD", "--binary", "--", ".", *_STATE_EXCLUDES) or b""
+    )
+    untracked = _git(
+        root,
+        "ls-files",
+        "--others",
+        "--exclude-standard",
+        "-z",
+        "--",
+        ".",
+        *_STATE_EXCLUDES,
+    )
+    for name in filter(None, (untracked or b"").split(b"\0")):
+        digest.update(name)
+        digest.update((_sha256_file(root / os.fsdecode(name)) or "").encode())
+    return digest.hexdigest()
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query for cache keying (case and whitespace insensitive)."""
+    return " ".join(query.split()).lower()
+
+
+class StageCache:
+    """On-disk stage result cache with age and size eviction.
+
+    Entries are JSON files named by key; file mtime tracks last use so size
+    eviction drops least recently used entries first.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        *,
+        root: Path,
+        max_age_s: float = DEFAULT_MAX_AGE_S,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """Initialize the cache and evict expired entries.
+
+        Args:
+            cache_dir: Directory holding cache entries.
+            root: Repository root used to compute the repository state.
+            max_age_s: Evict entries unused for longer than this.
+            max_bytes: Evict least recently used entries above this total size.
+        """
+        self.cache_dir = cache_dir
+        self.root = root
+        self.max_age_s = max_age_s
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.evict()
+
+    def key_for(
+        self,
+        command: Command,
+        query: str,
+        document: Path | None = None,
+    ) -> str | None:
+        """Build the cache key for a stage invocation.
+
+        Returns:
+            Hex key, or None if the repository state can't be determined.
+        """
+        state = repo_state_hash(self.root)
+        if state is None:
+            return None
+        doc_sha = _sha256_file(document) if document else None
+        parts = [command.value, normalize_query(query), doc_sha or "", state]
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str, *, label: str = "") -> CachedStage | None:
+        """Return a cached result, or None on miss or stale document."""
+        path = self._path(key)
+        entry: CachedStage | None = None
+        try:
+            entry = CachedStage(**json.loads(path.read_text(encoding="utf-8")))
+        except FileNotFoundError:
+            pass
+        except (OSError, TypeError, ValueError):
+            logger.debug("Discarding unreadable cache entry: %s", path.name)
+            path.unlink(missing_ok=True)
+
+        # The cached document must still exist with the content it had
+        if (
+            entry
+            and entry.doc_path
+            and _sha256_file(Path(entry.doc_path)) != entry.doc_sha
+        ):
+            path.unlink(missing_ok=True)
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            path.touch()
+        logger.debug(
+            "Stage cache %s for %s (hit rate %.0f%%: %d/%d)",
+            "hit" if entry else "miss",
+            label,
+            self.hit_rate * 100,
+            self.hits,
+            self.hits + self.misses,
+        )
+        return entry
+
+    def put(self, key: str, entry: CachedStage) -> None:
+        """Store a result (recording the document hash) and enforce limits."""
+        if entry.doc_path:
+            entry.doc_sha = _sha256_file(Path(entry.doc_path))
+        tmp = self._path(key).with_suffix(".tmp")
+        tmp.write_text(json.dumps(asdict(entry)), encoding="utf-8")
+        tmp.replace(self._path(key))
+        self.evict()
+
+    def evict(self) -> int:
+        """Remove expired entries, then oldest entries above the size limit.
+
+        Returns:
+            Number of entries removed.
+        """
+        now = time.time()
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        removed = 0
+        total = sum(size for _, size, _ in entries)
+        for mtime, size, path in sorted(entries):
+            if now - mtime <= self.max_age_s and total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        if removed:
+            logger.debug("Evicted %d stage cache entries", removed)
+        return removed
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def set_stage_cache_enabled(enabled: bool) -> None:
+    """Enable or disable the stage cache for this process (--no-cache)."""
+    global _enabled  # noqa: PLW0603
+    _enabled = enabled
+
+
+def get_stage_cache(
+    root: Path | None = None, *, worktree: Path | None = None
+) -> StageCache | None:
+    """Get the stage cache for a project root.
+
+    Args:
+        root: Project root path. Defaults to detected project root.
+        worktree: Worktree of the project the stages run in. Its state keys
+            the entries, which are still stored under the project root.
+
+    Returns:
+        StageCache, or None if caching is disabled.
+    """
+    if not _enabled:
+        return None
+    root = root or get_project_root()
+    state_root = worktree or root
+    if state_root not in _caches:
+        _caches[state_root] = StageCache(
+            get_cache_dir(root) / "stages", root=state_root
+        )
+    return _caches[state_root]
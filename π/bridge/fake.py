@@ -0,0 +1,524 @@
+"""Offline fake of the Claude CLI for load tests and benchmarks.
+
+FakeTransport implements the SDK's Transport interface. Instead of driving
+a CLI subprocess it replays a scripted or recorded stream of stream-json
+messages for each prompt it is sent, with configurable latency. Like the
+CLI, it:
+
+- answers the SDK's initialize request and registers its hook callbacks,
+- calls PreToolUse, PostToolUse and Stop hooks around scripted tool uses,
+  tool results and the final result (or, for recordings, the recorded
+  `hook_callback` entries in their original positions), and
+- runs `mcp__<server>__<tool>` uses against the SDK's in-process MCP
+  servers, emitting their result in place of a scripted one.
+
+ClaudeSDKClient, π's hooks, the workflow MCP tools (and the stage sessions
+they start) and the observers all run for real; only the model is fake.
+
+Usage:
+    script = FakeScript(
+        streams={"/1_research_codebase": research_stream},
+        default=orchestrator_stream,
+        latency_s=0.01,
+    )
+    set_client_factory(script.client_factory())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+import json
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient, Transport
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+    from π.bridge.pool import ClientFactory
+
+logger = logging.getLogger(__name__)
+
+FAKE_MODEL = "claude-fake"
+MCP_PROTOCOL_VERSION = "2024-11-05"
+
+# A session's stream-json messages, as the CLI writes them to stdout
+type Stream = list[dict[str, Any]]
+
+
+def init_message(session_id: str) -> dict[str, Any]:
+    """System init message that opens a session."""
+    return {
+        "type": "system",
+        "subtype": "init",
+        "session_id": session_id,
+        "model": FAKE_MODEL,
+        "tools": [],
+    }
+
+
+def text_message(text: str) -> dict[str, Any]:
+    """Assistant message with a single text block."""
+    return _assistant({"type": "text", "text": text})
+
+
+def tool_use_message(tool_use_id: str, name: str, input: dict) -> dict[str, Any]:
+    """Assistant message with a single tool use."""
+    return _assistant({
+        "type": "tool_use",
+        "id": tool_use_id,
+        "name": name,
+        "input": input,
+    })
+
+
+def tool_result_message(
+    tool_use_id: str, content: str | list, *, is_error: bool = False
+) -> dict[str, Any]:
+    """User message carrying a tool result back to the model."""
+    return {
+        "type": "user",
+        "message": {
+            "role": "user",
+            "content": [
+                {
+                    "type": "tool_result",
+                    "tool_use_id": tool_use_id,
+                    "content": content,
+                    "is_error": is_error,
+                }
+            ],
+        },
+        "parent_tool_use_id": None,
+    }
+
+
+def result_message(
+    session_id: str,
+    *,
+    result: str = "",
+    num_turns: int = 1,
+    cost_usd: float = 0.0,
+    duration_ms: int = 0,
+    usage: dict | None = None,
+    structured_output: object = None,
+    is_error: bool = False,
+) -> dict[str, Any]:
+    """Result message that ends a session's response."""
+    message = {
+        "type": "result",
+        "subtype": "error_during_execution" if is_error else "success",
+        "duration_ms": duration_ms,
+        "duration_api_ms": duration_ms,
+        "is_error": is_error,
+        "num_turns": num_turns,
+        "session_id": session_id,
+        "total_cost_usd": cost_usd,
+        "usage": usage or {},
+        "result": result,
+    }
+    if structured_output is not None:
+        message["structured_output"] = structured_output
+    return message
+
+
+def _assistant(block: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "type": "assistant",
+        "message": {"role": "assistant", "model": FAKE_MODEL, "content": [block]},
+        "parent_tool_use_id": None,
+    }
+
+
+def load_stream(path: Path) -> Stream:
+    """Read a recorded stream (one stream-json message per line)."""
+    with path.open(encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+@dataclass
+class FakeStats:
+    """Counters across all transports of a script."""
+
+    connects: int = 0
+    sessions: int = 0
+    messages: int = 0
+    hook_calls: int = 0
+    mcp_calls: int = 0
+    # perf_counter() of the first and latest replayed message
+    first_at: float = 0.0
+    last_at: float = 0.0
+
+    @property
+    def elapsed_s(self) -> float:
+        """Seconds from the first to the latest replayed message."""
+        return self.last_at - self.first_at
+
+    @property
+    def messages_per_s(self) -> float:
+        """Replay throughput in messages per second."""
+        return self.messages / self.elapsed_s if self.elapsed_s else 0.0
+
+
+@dataclass
+class FakeScript:
+    """Streams replayed by fake clients, chosen by prompt.
+
+    A prompt gets the next of the sequences recorded for exactly that
+    prompt, else the stream keyed by exactly that prompt, else the stream of
+    the first key it contains (such as a stage slash command), otherwise the
+    default stream.
+
+    Attributes:
+        streams: Prompt substring -> stream.
+        sequences: Exact prompt -> streams replayed in order, one per session
+            sent that prompt (the last one repeats once they run out).
+        default: Stream for prompts no key matches.
+        latency_s: Delay before each replayed message.
+        connect_s: Delay of connect(), standing in for CLI startup.
+        synthesize_hooks: Call hooks around tool uses and results; False
+            for streams that carry their recorded hook callbacks.
+    """
+
+    streams: dict[str, Stream] = field(default_factory=dict)
+    sequences: dict[str, list[Stream]] = field(default_factory=dict)
+    default: Stream | None = None
+    latency_s: float = 0.0
+    connect_s: float = 0.0
+    synthesize_hooks: bool = True
+    stats: FakeStats = field(default_factory=FakeStats)
+    # Sessions served per sequence prompt
+    _served: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+
+    def stream_for(self, prompt: str) -> Stream:
+        """Get the stream to replay for a prompt.
+
+        Raises:
+            LookupError: If no key matches and there is no default.
+        """
+        if sequence := self.sequences.get(prompt):
+            served = self._served.get(prompt, 0)
+            self._served[prompt] = served + 1
+            return sequence[min(served, len(sequence) - 1)]
+        if (stream := self.streams.get(prompt)) is not None:
+            return stream
+        for key, stream in self.streams.items():
+            if key in prompt:
+                return stream
+        if self.default is None:
+            raise LookupError(f"No fake stream for prompt: {prompt[:80]!r}")
+        return self.default
+
+    def client_factory(self) -> ClientFactory:
+        """Client factory for π.bridge.pool.set_client_factory."""
+
+        def create(options: ClaudeAgentOptions) -> ClaudeSDKClient:
+            return ClaudeSDKClient(
+                options=options, transport=FakeTransport(self, options)
+            )
+
+        return create
+
+
+class FakeTransport(Transport):
+    """SDK transport that replays a FakeScript instead of running the CLI."""
+
+    def __init__(
+        self, script: FakeScript, options: ClaudeAgentOptions | None = None
+    ) -> None:
+        """Initialize the transport.
+
+        Args:
+            script: Streams and latency to replay.
+            options: Client options; SDK MCP servers and cwd are read from it.
+        """
+        self.script = script
+        servers = options.mcp_servers if options else None
+        self._sdk_servers = {
+            name
+            for name, config in (servers.items() if isinstance(servers, dict) else ())
+            if isinstance(config, dict) and config.get("type") == "sdk"
+        }
+        self._cwd = str(options.cwd) if options and options.cwd else ""
+        self._out: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+        # Hook event -> (matcher, callback ids), from the initialize request
+        self._hooks: dict[str, list[tuple[str | None, list[str]]]] = {}
+        self._pending: dict[str, asyncio.Future[dict[str, Any]]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._ids = itertools.count()
+        # SDK MCP servers that completed the initialize handshake
+        self._mcp_sessions: set[str] = set()
+        self._session_id = "fake"
+        self._ready = False
+
+    async def connect(self) -> None:
+        """Simulate CLI startup."""
+        if self.script.connect_s:
+            await asyncio.sleep(self.script.connect_s)
+        self.script.stats.connects += 1
+        self._ready = True
+
+    async def write(self, data: str) -> None:
+        """Handle messages the SDK writes to the CLI's stdin."""
+        for line in data.splitlines():
+            if not line.strip():
+                continue
+            message = json.loads(line)
+            match message.get("type"):
+                case "control_request":
+                    self._answer(message["request_id"], message["request"])
+                case "control_response":
+                    self._resolve(message["response"])
+                case "user":
+                    task = asyncio.create_task(self._replay(message))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+
+    async def read_messages(self) -> AsyncIterator[dict[str, Any]]:
+        """Yield replayed messages and control requests until closed."""
+        while (message := await self._out.get()) is not None:
+            yield message
+
+    async def close(self) -> None:
+        """Stop replaying and end the message stream."""
+        self._ready = False
+        for task in list(self._tasks):
+            task.cancel()
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        self._out.put_nowait(None)
+
+    def is_ready(self) -> bool:
+        """Whether connect() has completed and close() has not."""
+        return self._ready
+
+    async def end_input(self) -> None:
+        """No-op: replays are driven by prompts, not by stdin EOF."""
+
+    def _answer(self, request_id: str, request: dict[str, Any]) -> None:
+        """Reply to an SDK control request (initialize, interrupt, ...)."""
+        response: dict[str, Any] = {}
+        if request.get("subtype") == "initialize":
+            for event, matchers in (request.get("hooks") or {}).items():
+                self._hooks[event] = [
+                    (m.get("matcher"), m["hookCallbackIds"]) for m in matchers
+                ]
+            response = {"commands": [], "output_style": "default"}
+        self._out.put_nowait({
+            "type": "control_response",
+            "response": {
+                "subtype": "success",
+                "request_id": request_id,
+                "response": response,
+            },
+        })
+
+    def _resolve(self, response: dict[str, Any]) -> None:
+        """Complete a control request this transport sent to the SDK."""
+        future = self._pending.pop(response.get("request_id", ""), None)
+        if future is None or future.done():
+            return
+        if response.get("subtype") == "error":
+            future.set_exception(RuntimeError(response.get("error", "unknown")))
+        else:
+            future.set_result(response.get("response") or {})
+
+    async def _request(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Send a control request to the SDK and wait for its response."""
+        request_id = f"fake_req_{next(self._ids)}"
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        await self._out.put({
+            "type": "control_request",
+            "request_id": request_id,
+            "request": request,
+        })
+        return await future
+
+    async def _emit(self, message: dict[str, Any]) -> None:
+        self._session_id = message.get("session_id", self._session_id)
+        stats = self.script.stats
+        stats.last_at = time.perf_counter()
+        if not stats.messages:
+            stats.first_at = stats.last_at
+        stats.messages += 1
+        await self._out.put(message)
+
+    async def _replay(self, prompt_message: dict[str, Any]) -> None:
+        """Replay the stream for one prompt, running hooks and MCP tools."""
+        content = prompt_message["message"]["content"]
+        prompt = content if isinstance(content, str) else json.dumps(content)
+        try:
+            stream = self.script.stream_for(prompt)
+        except LookupError as e:
+            logger.warning("%s", e)
+            stream = [result_message(self._session_id, result=str(e), is_error=True)]
+        self.script.stats.sessions += 1
+
+        # tool_use_id -> (name, input) of scripted tool uses
+        tools: dict[str, tuple[str, dict]] = {}
+        # Tool uses answered by an in-process MCP server
+        answered: set[str] = set()
+        for message in stream:
+            if self.script.latency_s:
+                await asyncio.sleep(self.script.latency_s)
+            kind = message.get("type")
+            if kind == "assistant":
+                await self._emit(message)
+                for block in message["message"]["content"]:
+                    if block.get("type") == "tool_use":
+                        tools[block["id"]] = (block["name"], block["input"])
+                        await self._use_tool(block, answered)
+            elif kind == "user":
+                if filtered := await self._tool_results(message, tools, answered):
+                    await self._emit(filtered)
+            elif kind == "hook_callback":
+                await self._callback(
+                    message["callback_id"], message["input"], message["tool_use_id"]
+                )
+            else:
+                if kind == "result":
+                    await self._run_hooks("Stop", None, {"stop_hook_active": False})
+                await self._emit(message)
+
+    async def _use_tool(self, block: dict[str, Any], answered: set[str]) -> None:
+        """Run PreToolUse hooks and, for SDK MCP tools, the tool itself."""
+        tool_use_id, name, tool_input = block["id"], block["name"], block["input"]
+        fields = {"tool_name": name, "tool_input": tool_input}
+        await self._run_hooks("PreToolUse", name, fields, tool_use_id=tool_use_id)
+
+        server, _, tool = name.removeprefix("mcp__").partition("__")
+        if not name.startswith("mcp__") or server not in self._sdk_servers:
+            return
+        content, is_error = await self._call_mcp(server, tool, tool_input)
+        answered.add(tool_use_id)
+        await self._run_hooks(
+            "PostToolUse",
+            name,
+            {**fields, "tool_response": content},
+            tool_use_id=tool_use_id,
+        )
+        await self._emit(tool_result_message(tool_use_id, content, is_error=is_error))
+
+    async def _tool_results(
+        self,
+        message: dict[str, Any],
+        tools: dict[str, tuple[str, dict]],
+        answered: set[str],
+    ) -> dict[str, Any] | None:
+        """Run PostToolUse hooks for scripted results; drop answered ones."""
+        content = message["message"]["content"]
+        if not isinstance(content, list):
+            return message
+        kept = []
+        for block in content:
+            tool_use_id = block.get("tool_use_id")
+            if block.get("type") != "tool_result":
+                kept.append(block)
+            elif tool_use_id not in answered:
+                name, tool_input = tools.get(tool_use_id, ("", {}))
+                fields = {
+                    "tool_name": name,
+                    "tool_input": tool_input,
+                    "tool_response": block.get("content"),
+                }
+                await self._run_hooks(
+                    "PostToolUse", name, fields, tool_use_id=tool_use_id
+                )
+                kept.append(block)
+        if not kept:
+            return None
+        return {**message, "message": {**message["message"], "content": kept}}
+
+    async def _call_mcp(
+        self, server: str, tool: str, arguments: dict
+    ) -> tuple[list | str, bool]:
+        """Call a tool on an in-process SDK MCP server."""
+        self.script.stats.mcp_calls += 1
+        if server not in self._mcp_sessions:
+            # Same handshake the CLI's MCP client performs before any call
+            await self._mcp(
+                server,
+                "initialize",
+                {
+                    "protocolVersion": MCP_PROTOCOL_VERSION,
+                    "capabilities": {},
+                    "clientInfo": {"name": "π-fake", "version": "0"},
+                },
+            )
+            await self._mcp(server, "notifications/initialized")
+            self._mcp_sessions.add(server)
+        reply = await self._mcp(
+            server, "tools/call", {"name": tool, "arguments": arguments}
+        )
+        if error := reply.get("error"):
+            return str(error.get("message", error)), True
+        result = reply.get("result") or {}
+        return result.get("content", []), bool(result.get("isError"))
+
+    async def _mcp(
+        self, server: str, method: str, params: dict | None = None
+    ) -> dict[str, Any]:
+        """Send a JSON-RPC message to an SDK MCP server; returns its reply."""
+        message: dict[str, Any] = {"jsonrpc": "2.0", "method": method}
+        if not method.startswith("notifications/"):
+            message["id"] = next(self._ids)
+        if params is not None:
+            message["params"] = params
+        response = await self._request({
+            "subtype": "mcp_message",
+            "server_name": server,
+            "message": message,
+        })
+        return response.get("mcp_response") or {}
+
+    async def _run_hooks(
+        self,
+        event: str,
+        tool_name: str | None,
+        fields: dict[str, Any],
+        *,
+        tool_use_id: str | None = None,
+    ) -> None:
+        """Call the SDK's callbacks for a hook event whose matcher applies."""
+        if not self.script.synthesize_hooks:
+            return
+        for matcher, callback_ids in self._hooks.get(event, ()):
+            if (
+                matcher
+                and matcher != "*"
+                and tool_name is not None
+                and not re.fullmatch(matcher, tool_name)
+            ):
+                continue
+            for callback_id in callback_ids:
+                hook_input = {
+                    "session_id": self._session_id,
+                    "transcript_path": "",
+                    "cwd": self._cwd,
+                    "hook_event_name": event,
+                    **fields,
+                }
+                await self._callback(callback_id, hook_input, tool_use_id)
+
+    async def _callback(
+        self, callback_id: str, hook_input: dict[str, Any], tool_use_id: str | None
+    ) -> None:
+        """Invoke one SDK hook callback."""
+        self.script.stats.hook_calls += 1
+        # A failing hook is reported to the CLI, which carries on
+        with contextlib.suppress(RuntimeError):
+            await self._request({
+                "subtype": "hook_callback",
+                "callback_id": callback_id,
+                "input": hook_input,
+                "tool_use_id": tool_use_id,
+            })
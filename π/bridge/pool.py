@@ -0,0 +1,411 @@
+"""Warm pool of pre-connected Claude SDK clients.
+
+Connecting a ClaudeSDKClient spawns the CLI subprocess, performs the MCP
+handshake and loads settings before any tokens flow. The pool keeps a few
+already-connected clients per option set so stage sessions start immediately,
+and spawns replacements in the background as clients are handed out. Option
+sets are keyed by value, and sets left unused (idle clients expired, or
+beyond the most recently used max_option_sets) are dropped with their
+clients, so one-off option sets don't leave CLI processes behind.
+
+Clients are single-use: a client that ran a session holds that conversation,
+so it is disconnected on release rather than returned to the pool.
+
+All SDK clients (pooled stage clients and the orchestrator's) are built by
+create_client(); set_client_factory() swaps in another transport, such as
+the offline fake in π.bridge.fake.
+
+The SDK requires connect() and disconnect() to run in the same task (the
+client owns an anyio task group), so each pooled client lives in a dedicated
+owner task that connects it, waits for release, and disconnects it. The owner
+also disconnects when cancelled, as asyncio.run() does to leftover tasks when
+a workflow's loop shuts down without close_client_pool().
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import logging
+import time
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass
+from enum import Enum
+from os import getenv
+from pathlib import PurePath
+from typing import TYPE_CHECKING
+
+from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Hashable
+
+    type ClientFactory = Callable[[ClaudeAgentOptions], ClaudeSDKClient]
+
+logger = logging.getLogger(__name__)
+
+# Environment variable controlling warm clients kept per option set (0 disables)
+POOL_SIZE_ENV = "PI_CLIENT_POOL_SIZE"
+DEFAULT_POOL_SIZE = 1
+
+# Idle clients older than this are evicted instead of handed out
+DEFAULT_MAX_IDLE_S = 300.0
+
+# Option sets kept warm; the least recently used are evicted beyond this
+DEFAULT_MAX_OPTION_SETS = 8
+
+
+@dataclass
+class PoolStats:
+    """Hit/miss counters for the client pool.
+
+    Attributes:
+        hits: Sessions served by a pre-spawned client.
+        misses: Sessions that had to connect a client on demand.
+        evictions: Idle or unhealthy clients discarded.
+        saved_s: Connect latency avoided by hits, in seconds.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    saved_s: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of acquisitions served from the pool."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+# Builds every SDK client; None connects to the Claude CLI
+_client_factory: ClientFactory | None = None
+
+
+def set_client_factory(factory: ClientFactory | None) -> None:
+    """Build all new SDK clients with factory (None restores the CLI)."""
+    global _client_factory  # noqa: PLW0603
+    _client_factory = factory
+
+
+def create_client(options: ClaudeAgentOptions) -> ClaudeSDKClient:
+    """Create an unconnected SDK client using the configured factory."""
+    if _client_factory is not None:
+        return _client_factory(options)
+    return ClaudeSDKClient(options=options)
+
+
+def options_fingerprint(options: ClaudeAgentOptions) -> Hashable:
+    """Return a stable key under which equal option sets share clients.
+
+    Plain data (strings, numbers, paths, containers, dataclasses) is keyed
+    by value. Other objects, such as hook callbacks and in-process MCP
+    servers, are keyed by identity; the pool holds the options while their
+    key is in use, so those ids can't be reused meanwhile.
+    """
+    return _freeze(options)
+
+
+def _freeze(value: object) -> Hashable:
+    if value is None or isinstance(value, (str, int, float, bytes, Enum, PurePath)):
+        return value
+    if isinstance(value, Mapping):
+        return frozenset((_freeze(k), _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return (
+            type(value),
+            tuple(
+                (f.name, _freeze(getattr(value, f.name)))
+                for f in dataclasses.fields(value)
+            ),
+        )
+    return (type(value), id(value))
+
+
+class _PooledClient:
+    """A client connected and disconnected by its own owner task."""
+
+    def __init__(self, client: ClaudeSDKClient) -> None:
+        self.client = client
+        self.ready = asyncio.Event()
+        self.error: BaseException | None = None
+        self.connect_s = 0.0
+        self.idle_since = time.monotonic()
+        self._release = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        start = time.monotonic()
+        try:
+            await self.client.connect()
+        except Exception as e:
+            self.error = e
+            self.ready.set()
+            return
+        self.connect_s = time.monotonic() - start
+        self.idle_since = time.monotonic()
+        self.ready.set()
+
+        try:
+            await self._release.wait()
+        finally:
+            try:
+                await self.client.disconnect()
+            except Exception:
+                logger.debug("Pooled client disconnect failed", exc_info=True)
+
+    @property
+    def healthy(self) -> bool:
+        """Whether the client is connecting or connected without error."""
+        return self.error is None and not self._task.done()
+
+    async def wait_ready(self) -> None:
+        """Wait for the connect to finish, closing the client if cancelled."""
+        try:
+            await self.ready.wait()
+        except BaseException:
+            await self.close()
+            raise
+
+    def release(self) -> None:
+        """Signal the owner task to disconnect, without waiting for it."""
+        self._release.set()
+
+    def idle_for(self, now: float) -> float:
+        """Seconds the client has been connected and unused."""
+        return now - self.idle_since if self.ready.is_set() else 0.0
+
+    async def close(self) -> None:
+        """Signal the owner task to disconnect and wait for it."""
+        self._release.set()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+
+
+class ClientPool:
+    """Bounded pool of warm ClaudeSDKClient instances keyed by option set.
+
+    Options are keyed by options_fingerprint(), so equal option sets share
+    clients even when built separately.
+
+    Usage:
+        pool = ClientPool(size=1)
+        pool.warm(options)
+        async with pool.acquire(options, label="stage:research") as client:
+            await client.query(...)
+        await pool.aclose()
+    """
+
+    def __init__(
+        self,
+        *,
+        size: int = DEFAULT_POOL_SIZE,
+        max_idle_s: float = DEFAULT_MAX_IDLE_S,
+        max_option_sets: int = DEFAULT_MAX_OPTION_SETS,
+        client_factory: ClientFactory | None = None,
+    ) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            size: Warm clients to keep per option set (0 disables pre-spawning).
+            max_idle_s: Evict idle clients older than this many seconds.
+            max_option_sets: Keep warm clients for at most this many of the
+                most recently used option sets.
+            client_factory: Builds a client for options (default:
+                create_client).
+        """
+        self.size = max(size, 0)
+        self.max_idle_s = max_idle_s
+        self.max_option_sets = max(max_option_sets, 1)
+        self.stats = PoolStats()
+        self._client_factory = client_factory
+        self._idle: dict[Hashable, deque[_PooledClient]] = {}
+        # Least recently used first; holds options alive while keyed
+        self._options: dict[Hashable, ClaudeAgentOptions] = {}
+
+    def _spawn(self, options: ClaudeAgentOptions) -> _PooledClient:
+        factory = self._client_factory or create_client
+        return _PooledClient(factory(options))
+
+    def warm(self, options: ClaudeAgentOptions) -> None:
+        """Top up warm clients for an option set in the background.
+
+        Must be called from a running event loop.
+        """
+        self._warm(options_fingerprint(options), options)
+
+    def _warm(self, key: Hashable, options: ClaudeAgentOptions) -> None:
+        # Mark the option set most recently used
+        self._options.pop(key, None)
+        self._options[key] = options
+        idle = self._idle.setdefault(key, deque())
+        while len(idle) < self.size:
+            idle.append(self._spawn(options))
+
+    def _evict(self) -> list[_PooledClient]:
+        """Remove idle-expired and unhealthy clients, then unused option sets.
+
+        An option set is dropped once it has no idle clients, or when more
+        than max_option_sets are kept (least recently used first).
+        """
+        now = time.monotonic()
+        evicted: list[_PooledClient] = []
+        for key, idle in list(self._idle.items()):
+            stale = [
+                entry
+                for entry in idle
+                if not entry.healthy or entry.idle_for(now) > self.max_idle_s
+            ]
+            for entry in stale:
+                idle.remove(entry)
+            evicted.extend(stale)
+            if not idle:
+                del self._idle[key]
+                self._options.pop(key, None)
+        while len(self._options) > self.max_option_sets:
+            key = next(iter(self._options))
+            del self._options[key]
+            evicted.extend(self._idle.pop(key, ()))
+        self.stats.evictions += len(evicted)
+        return evicted
+
+    @contextlib.asynccontextmanager
+    async def acquire(
+        self,
+        options: ClaudeAgentOptions,
+        *,
+        label: str = "",
+    ) -> AsyncIterator[ClaudeSDKClient]:
+        """Check out a connected client, disconnecting it on exit.
+
+        Args:
+            options: Agent options the client must be connected with.
+            label: Caller label for debug logging (e.g. agent_id).
+
+        Yields:
+            A connected ClaudeSDKClient.
+
+        Raises:
+            Exception: Whatever the SDK raised while connecting.
+        """
+        key = options_fingerprint(options)
+        for entry in self._evict():
+            await entry.close()
+
+        entry: _PooledClient | None = None
+        if idle := self._idle.get(key):
+            entry = idle.popleft()
+            waited_start = time.monotonic()
+            await entry.wait_ready()
+            if entry.error is not None:
+                # Warm client failed to connect; retry on demand below
+                self.stats.evictions += 1
+                await entry.close()
+                entry = None
+            else:
+                waited = time.monotonic() - waited_start
+                saved = max(entry.connect_s - waited, 0.0)
+                self.stats.hits += 1
+                self.stats.saved_s += saved
+                logger.debug("Client pool hit for %s (saved %.2fs)", label, saved)
+
+        if entry is None:
+            entry = self._spawn(options)
+            await entry.wait_ready()
+            self.stats.misses += 1
+            logger.debug(
+                "Client pool miss for %s (connect %.2fs)", label, entry.connect_s
+            )
+
+        # Replace the checked-out client before the session starts
+        self._warm(key, options)
+
+        try:
+            if entry.error is not None:
+                raise entry.error
+            yield entry.client
+        finally:
+            await entry.close()
+
+    def release_idle(self) -> None:
+        """Tell all idle clients to disconnect, without waiting.
+
+        For a pool whose event loop is not running: the clients disconnect
+        when their loop next runs.
+        """
+        for idle in self._idle.values():
+            for entry in idle:
+                entry.release()
+        self._idle.clear()
+        self._options.clear()
+
+    async def aclose(self) -> None:
+        """Disconnect all idle clients and log final counters."""
+        entries = [entry for idle in self._idle.values() for entry in idle]
+        self._idle.clear()
+        self._options.clear()
+        for entry in entries:
+            await entry.close()
+        logger.debug(
+            "Client pool closed: hits=%d, misses=%d, hit_rate=%.0f%%, "
+            "evictions=%d, saved=%.2fs",
+            self.stats.hits,
+            self.stats.misses,
+            self.stats.hit_rate * 100,
+            self.stats.evictions,
+            self.stats.saved_s,
+        )
+
+
+# Module-level pool, bound to the event loop that created it
+_pool: ClientPool | None = None
+_pool_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _pool_size_from_env() -> int:
+    try:
+        return int(getenv(POOL_SIZE_ENV, str(DEFAULT_POOL_SIZE)))
+    except ValueError:
+        logger.warning("Invalid %s, using %d", POOL_SIZE_ENV, DEFAULT_POOL_SIZE)
+        return DEFAULT_POOL_SIZE
+
+
+def _retire_pool(pool: ClientPool, loop: asyncio.AbstractEventLoop) -> None:
+    """Close a pool left behind by another event loop."""
+    if loop.is_closed():
+        # asyncio.run() cancelled the owner tasks, which disconnected
+        return
+    if loop.is_running():
+        asyncio.run_coroutine_threadsafe(pool.aclose(), loop)
+    else:
+        pool.release_idle()
+
+
+def get_client_pool() -> ClientPool:
+    """Get the client pool for the running event loop, creating it if needed.
+
+    A pool left behind by another event loop is closed first.
+    """
+    global _pool, _pool_loop  # noqa: PLW0603
+    loop = asyncio.get_running_loop()
+    if _pool is None or _pool_loop is not loop:
+        if _pool is not None and _pool_loop is not None:
+            _retire_pool(_pool, _pool_loop)
+        _pool = ClientPool(size=_pool_size_from_env())
+        _pool_loop = loop
+    return _pool
+
+
+async def close_client_pool() -> None:
+    """Close the module-level pool (call once per workflow run)."""
+    global _pool, _pool_loop  # noqa: PLW0603
+    if _pool is not None:
+        await _pool.aclose()
+    _pool = None
+    _pool_loop = None
@@ -0,0 +1,236 @@
+"""Record SDK sessions of a real run for deterministic replay.
+
+SessionRecorder wraps the CLI transport of every client in a run and
+writes each session's stream-json messages, including the CLI's hook
+callback requests, to a gzipped JSONL file: a header line, then one line
+per session keyed by its prompt.
+
+load_recording() turns the file back into a FakeScript. Replayed at full
+speed, the orchestrator loop, stage sessions, dispatch_message, observers,
+WriteTracker and hooks all process the recorded workload again, so
+observer, logging and display throughput can be measured on every change.
+
+Usage:
+    recorder = SessionRecorder(path, objective=objective, driver="orchestrator")
+    set_client_factory(recorder.client_factory())
+    ...
+    recorder.close()
+
+    recording = load_recording(path)
+    set_client_factory(recording.script.client_factory())
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient, Transport
+
+# The SDK's CLI transport is not exported, but wrapping it is the only way
+# to observe the raw stream-json messages, hook callbacks included
+from claude_agent_sdk._internal.transport.subprocess_cli import (  # noqa: PLC2701
+    SubprocessCLITransport,
+)
+
+from π.bridge.fake import FakeScript
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+    from π.bridge.fake import Stream
+    from π.bridge.pool import ClientFactory
+
+logger = logging.getLogger(__name__)
+
+RECORDING_FORMAT = "π-recording"
+RECORDING_VERSION = 1
+
+# CLI control messages that are protocol plumbing, not part of the workload
+# (MCP tool calls are re-derived from tool uses on replay)
+_SKIPPED_TYPES = {"control_response", "control_cancel_request", "keep_alive"}
+
+
+def _dumps(message: dict[str, Any]) -> str:
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+@dataclass(slots=True)
+class Recording:
+    """A recorded run, ready to replay."""
+
+    objective: str
+    driver: str
+    script: FakeScript
+
+    @property
+    def messages(self) -> int:
+        """Recorded messages across all sessions."""
+        return sum(
+            len(stream)
+            for sequence in self.script.sequences.values()
+            for stream in sequence
+        )
+
+
+class SessionRecorder:
+    """Writes every session of a run to a recording file.
+
+    Sessions are written when they end, so concurrent stage sessions never
+    interleave in the file.
+    """
+
+    def __init__(self, path: Path, *, objective: str, driver: str) -> None:
+        """Open the recording and write its header.
+
+        Args:
+            path: Recording file (gzipped JSONL).
+            objective: The run's objective, replayed as the orchestrator prompt.
+            driver: Workflow driver of the run.
+        """
+        self.path = path
+        self.sessions = 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = gzip.open(path, "wt", encoding="utf-8", compresslevel=6)  # noqa: SIM115
+        self._file.write(
+            _dumps({
+                "format": RECORDING_FORMAT,
+                "version": RECORDING_VERSION,
+                "objective": objective,
+                "driver": driver,
+            })
+            + "\n"
+        )
+
+    def write_session(self, prompt: str, messages: Stream) -> None:
+        """Append one session's prompt and messages."""
+        if self._file.closed:
+            return
+        self._file.write(_dumps({"prompt": prompt, "messages": messages}) + "\n")
+        self.sessions += 1
+
+    def close(self) -> None:
+        """Finish the recording file."""
+        if not self._file.closed:
+            self._file.close()
+            logger.debug("Recorded %d sessions to %s", self.sessions, self.path)
+
+    def client_factory(self) -> ClientFactory:
+        """Client factory for π.bridge.pool.set_client_factory."""
+
+        def create(options: ClaudeAgentOptions) -> ClaudeSDKClient:
+            transport = RecordingTransport(
+                SubprocessCLITransport(prompt=_no_prompt(), options=options), self
+            )
+            return ClaudeSDKClient(options=options, transport=transport)
+
+        return create
+
+
+async def _no_prompt() -> AsyncIterator[dict[str, Any]]:
+    """Empty prompt stream: prompts are written by ClaudeSDKClient.query()."""
+    for message in ():
+        yield message
+
+
+class RecordingTransport(Transport):
+    """Transport that records the messages of the CLI transport it wraps."""
+
+    def __init__(self, inner: Transport, recorder: SessionRecorder) -> None:
+        self._inner = inner
+        self._recorder = recorder
+        self._prompt: str | None = None
+        self._messages: Stream = []
+
+    async def connect(self) -> None:
+        """Connect the wrapped transport."""
+        await self._inner.connect()
+
+    async def write(self, data: str) -> None:
+        """Forward to the CLI, noting prompts that start a session."""
+        for line in data.splitlines():
+            if not line.strip():
+                continue
+            message = json.loads(line)
+            if message.get("type") == "user":
+                content = message["message"]["content"]
+                self._finish()
+                self._prompt = (
+                    content if isinstance(content, str) else json.dumps(content)
+                )
+        await self._inner.write(data)
+
+    async def read_messages(self) -> AsyncIterator[dict[str, Any]]:
+        """Yield the CLI's messages, recording each session's."""
+        async for message in self._inner.read_messages():
+            self._record(message)
+            yield message
+
+    async def close(self) -> None:
+        """Write any unfinished session and close the wrapped transport."""
+        self._finish()
+        await self._inner.close()
+
+    def is_ready(self) -> bool:
+        """Whether the wrapped transport is ready."""
+        return self._inner.is_ready()
+
+    async def end_input(self) -> None:
+        """End the wrapped transport's input."""
+        await self._inner.end_input()
+
+    def _record(self, message: dict[str, Any]) -> None:
+        kind = message.get("type")
+        if self._prompt is None or kind in _SKIPPED_TYPES:
+            return
+        if kind == "control_request":
+            request = message.get("request", {})
+            if request.get("subtype") == "hook_callback":
+                self._messages.append({
+                    "type": "hook_callback",
+                    "callback_id": request.get("callback_id"),
+                    "tool_use_id": request.get("tool_use_id"),
+                    "input": request.get("input", {}),
+                })
+            return
+        self._messages.append(message)
+        if kind == "result":
+            self._finish()
+
+    def _finish(self) -> None:
+        """Write the current session, if any."""
+        if self._prompt is not None:
+            self._recorder.write_session(self._prompt, self._messages)
+        self._prompt = None
+        self._messages = []
+
+
+def load_recording(path: Path) -> Recording:
+    """Read a recording into a FakeScript that replays it at full speed.
+
+    Raises:
+        ValueError: If the file is not a recording of a supported version.
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        header = json.loads(f.readline() or "{}")
+        if header.get("format") != RECORDING_FORMAT:
+            raise ValueError(f"Not a π recording: {path}")
+        if header.get("version") != RECORDING_VERSION:
+            raise ValueError(
+                f"Unsupported recording version {header.get('version')}: {path}"
+            )
+        # A prompt sent again (a retried or repeated stage) replays in order
+        sequences: dict[str, list[Stream]] = {}
+        for line in f:
+            if line.strip():
+                session = json.loads(line)
+                sequences.setdefault(session["prompt"], []).append(session["messages"])
+    return Recording(
+        objective=header["objective"],
+        driver=header.get("driver", "orchestrator"),
+        script=FakeScript(sequences=sequences, synthesize_hooks=False),
+    )
@@ -6,12 +6,12 @@ No context access - all inputs are explicit parameters.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
 from claude_agent_sdk.types import (
     AssistantMessage,
     ResultMessage,
@@ -20,12 +20,21 @@ from claude_agent_sdk.types import (
     ToolUseBlock,
 )
 
-from π.config import COMMAND_MAP, get_stage_agent_options
+from π.bridge.cache import (
+    CACHEABLE_COMMANDS,
+    CachedStage,
+    StageCache,
+    get_stage_cache,
+)
+from π.bridge.pool import get_client_pool
+from π.config import get_command_map, get_stage_agent_options
 from π.core.enums import Command, DocType
 from π.utils import get_project_root
 from π.workflow.observer import dispatch_message
 
 if TYPE_CHECKING:
+    from claude_agent_sdk import ClaudeAgentOptions
+
     from π.workflow.observer import WorkflowObserver
 
 logger = logging.getLogger(__name__)
@@ -48,20 +57,35 @@ _PLANNING_COMMANDS = frozenset({
     Command.ITERATE_PLAN,
 })
 
-# Module-level options cache (config, not workflow state)
-_cached_options: ClaudeAgentOptions | None = None
+# Module-level options cache per working directory (config, not workflow state)
+_cached_options: dict[Path, ClaudeAgentOptions] = {}
 
 
-def _get_default_options() -> ClaudeAgentOptions:
+def _get_default_options(cwd: Path | None = None) -> ClaudeAgentOptions:
     """Get or create cached options for stage agents.
 
     Stage agents use STAGE_AGENT_TOOLS (no AskUserQuestion) so questions
     pass through to the orchestrator instead of blocking.
+
+    Args:
+        cwd: Working directory for the agents. Defaults to project root.
     """
-    global _cached_options  # noqa: PLW0603
-    if _cached_options is None:
-        _cached_options = get_stage_agent_options(cwd=get_project_root())
-    return _cached_options
+    cwd = cwd or get_project_root()
+    if cwd not in _cached_options:
+        _cached_options[cwd] = get_stage_agent_options(cwd=cwd)
+    return _cached_options[cwd]
+
+
+def prewarm_stage_clients(cwd: Path | None = None) -> None:
+    """Start connecting stage agent clients in the background.
+
+    Call early in a workflow so the first stage session finds a warm client.
+    Must be called from a running event loop.
+
+    Args:
+        cwd: Working directory of the workflow. Defaults to project root.
+    """
+    get_client_pool().warm(_get_default_options(cwd))
 
 
 @dataclass
@@ -69,6 +93,8 @@ class WriteTracker:
     """Tracks file writes during a single SDK session."""
 
     command: Command
+    # Directory relative writes resolve against (None: project root)
+    root: Path | None = None
     doc_writes: list[str] = field(default_factory=list)
     all_writes: list[str] = field(default_factory=list)
 
@@ -85,9 +111,10 @@ class WriteTracker:
 
     def get_doc_path(self) -> str | None:
         """Get the last tracked doc path that exists on disk."""
+        root = self.root or get_project_root()
         for p in reversed(self.doc_writes):
             path = Path(p)
-            full_path = path if path.is_absolute() else get_project_root() / p
+            full_path = path if path.is_absolute() else root / p
             if full_path.exists():
                 return str(full_path)
         return None
@@ -97,6 +124,67 @@ class WriteTracker:
         return list(self.all_writes)
 
 
+def _build_command(
+    tool_command: Command,
+    query: str,
+    document: Path | None,
+    session_id: str | None,
+) -> str:
+    """Build the prompt for a stage session.
+
+    Fresh sessions invoke the stage's slash command; resumed sessions send
+    the query as a follow-up.
+
+    Raises:
+        ValueError: If tool_command is not in the command map.
+    """
+    command = get_command_map().get(tool_command)
+    if not command:
+        raise ValueError(f"Invalid tool command: {tool_command}")
+
+    # Add document path if provided
+    if document:
+        command += f" {document}"
+
+    command += f" {query}"
+
+    # Handle session resumption
+    if session_id:
+        logger.debug("Resuming session: %s", session_id)
+        if tool_command in _PLANNING_COMMANDS:
+            command = (
+                f"Based on this feedback, continue with your planning task "
+                f"(write or update the plan document, do NOT implement): {query}"
+            )
+        else:
+            command = query
+
+    return command
+
+
+async def _stage_cache_key(
+    tool_command: Command,
+    query: str,
+    document: Path | None,
+    *,
+    resuming: bool,
+    cwd: Path | None = None,
+) -> tuple[StageCache | None, str | None]:
+    """Resolve the stage cache and key for a session, if cacheable.
+
+    Resumed sessions depend on conversation state and are never cached.
+    Sessions in a worktree are keyed on the worktree's state, which is
+    hashed with git subprocesses on a worker thread.
+    """
+    if resuming or tool_command not in CACHEABLE_COMMANDS:
+        return None, None
+    cache = get_stage_cache(worktree=cwd)
+    if cache is None:
+        return None, None
+    key = await asyncio.to_thread(cache.key_for, tool_command, query, document)
+    return cache, key
+
+
 def _process_message(
     message: AssistantMessage,
     tracker: WriteTracker,
@@ -122,6 +210,8 @@ async def run_claude_session(
     observer: WorkflowObserver | None = None,
     session_id: str | None = None,
     document: Path | None = None,
+    agent_id: str | None = None,
+    cwd: Path | None = None,
     tool_command: Command,
     query: str,
 ) -> tuple[str, str, str | None, list[str]]:
@@ -136,48 +226,44 @@ async def run_claude_session(
         document: Optional document path to include.
         options: Optional agent options override (for testing).
         observer: Optional observer to log stage agent events.
+        agent_id: Optional observer agent_id override (defaults to
+            "stage:<command>"); distinguishes concurrent sessions.
+        cwd: Optional working directory (a workflow's worktree); defaults
+            to the project root.
 
     Returns:
         Tuple of (result content, new session_id, doc_path or None, files_changed).
 
     Raises:
-        ValueError: If tool_command is not in COMMAND_MAP.
+        ValueError: If tool_command is not in the command map.
         RuntimeError: If agent execution fails.
     """
-    tracker = WriteTracker(command=tool_command)
-    agent_id = f"stage:{tool_command.value}"
-
-    # Build command string from slash command
-    command = COMMAND_MAP.get(tool_command)
-    if not command:
-        raise ValueError(f"Invalid tool command: {tool_command}")
-
-    # Add document path if provided
-    if document:
-        command += f" {document}"
-
-    command += f" {query}"
-
-    # Handle session resumption
-    if session_id:
-        logger.debug("Resuming session: %s", session_id)
-        if tool_command in _PLANNING_COMMANDS:
-            command = (
-                f"Based on this feedback, continue with your planning task "
-                f"(write or update the plan document, do NOT implement): {query}"
-            )
-        else:
-            command = query
+    tracker = WriteTracker(command=tool_command, root=cwd)
+    agent_id = agent_id or f"stage:{tool_command.value}"
 
+    command = _build_command(tool_command, query, document, session_id)
     logger.debug("Executing command: %s", command[:200])
 
+    # Fresh sessions of read-only stages can be served from the stage cache
+    cache, cache_key = await _stage_cache_key(
+        tool_command, query, document, resuming=bool(session_id), cwd=cwd
+    )
+    if cache and cache_key and (cached := cache.get(cache_key, label=agent_id)):
+        return (
+            cached.result,
+            cached.session_id,
+            cached.doc_path,
+            list(cached.files_changed),
+        )
+
     # Execute session
-    effective_options = options or _get_default_options()
+    effective_options = options or _get_default_options(cwd)
     result_content = ""
     new_session_id = ""
     last_text = ""
 
-    async with ClaudeSDKClient(options=effective_options) as client:
+    pool = get_client_pool()
+    async with pool.acquire(effective_options, label=agent_id) as client:
         try:
             await client.query(command, session_id=session_id or "default")
 
@@ -213,4 +299,15 @@ async def run_claude_session(
         len(files_changed),
     )
 
+    if cache and cache_key and result_content:
+        cache.put(
+            cache_key,
+            CachedStage(
+                result=result_content,
+                session_id=new_session_id,
+                doc_path=doc_path,
+                files_changed=files_changed,
+            ),
+        )
+
     return (result_content or last_text, new_session_id, doc_path, files_changed)
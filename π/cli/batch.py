@@ -0,0 +1,396 @@
+"""`π batch`: run many objectives concurrently.
+
+Objectives are read from a JSONL file or stdin, one per line: an object
+with an "objective" and an optional "id", or a bare JSON string. A fixed
+number of workers pull them from a queue. Each workflow runs with its own
+WorkflowContext, text log, event log and trace, while the client pool, the
+stage and lint caches, the lint scheduler and the checker daemons are
+shared by all of them.
+
+Whenever more than one workflow runs at once, each runs in its own git
+worktree from a WorktreePool, on a branch named after the batch and the
+objective's id, so concurrent implement and commit stages never share a
+checkout or a git index. --shared-checkout runs them all in the current
+checkout instead, which is only safe when the objectives do not edit files.
+
+Results are written to a JSONL file as workflows finish: one "result" line
+per objective with its WorkflowOutput (or error), cost, turns, duration and
+branch, then a "summary" line with throughput and cost totals.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from dataclasses import dataclass, field
+from os import getenv
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from rich.table import Table
+
+from π.bridge.session import prewarm_stage_clients
+from π.cli.main import DRIVERS
+from π.cli.runner import finish_run, run_workflow, start_run
+from π.config import get_worktrees_dir
+from π.console import console
+from π.utils import get_project_root
+from π.worktrees import WorktreePool, branch_name
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import TextIO
+
+    from π.cli.runner import WorkflowRun
+
+logger = logging.getLogger(__name__)
+
+# Environment variable for the default number of concurrent workflows
+BATCH_WORKERS_ENV = "PI_BATCH_WORKERS"
+DEFAULT_WORKERS = 4
+BATCHES_DIR_NAME = "batches"
+
+
+@dataclass(frozen=True, slots=True)
+class BatchJob:
+    """One objective of a batch."""
+
+    id: str
+    objective: str
+
+
+def read_jobs(lines: Iterable[str]) -> list[BatchJob]:
+    """Parse objectives from JSONL lines (blank lines are skipped).
+
+    Raises:
+        ValueError: If a line is not an objective object or string.
+    """
+    jobs: list[BatchJob] = []
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError as e:
+            raise ValueError(f"Line {number}: invalid JSON: {e}") from e
+        if isinstance(data, str):
+            data = {"objective": data}
+        objective = data.get("objective") if isinstance(data, dict) else None
+        if not isinstance(objective, str) or not objective.strip():
+            raise ValueError(f"Line {number}: missing objective")
+        jobs.append(BatchJob(id=str(data.get("id", number)), objective=objective))
+    return jobs
+
+
+@dataclass
+class BatchSummary:
+    """Throughput and cost totals of a batch."""
+
+    workers: int
+    objectives: int = 0
+    errors: int = 0
+    statuses: dict[str, int] = field(default_factory=dict)
+    cost_usd: float = 0.0
+    turns: int = 0
+    wall_s: float = 0.0
+    # Sum of workflow durations
+    busy_s: float = 0.0
+
+    @property
+    def per_hour(self) -> float:
+        """Objectives completed per hour of wall time."""
+        return self.objectives / self.wall_s * 3600 if self.wall_s else 0.0
+
+    @property
+    def concurrency(self) -> float:
+        """Mean number of workflows in flight."""
+        return self.busy_s / self.wall_s if self.wall_s else 0.0
+
+    def add(self, status: str, run: WorkflowRun | None) -> None:
+        """Count one finished objective."""
+        self.objectives += 1
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        if run is None:
+            self.errors += 1
+            return
+        self.cost_usd += run.cost_usd
+        self.turns += run.turns
+        self.busy_s += run.duration_s
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable summary."""
+        return {
+            "type": "summary",
+            "workers": self.workers,
+            "objectives": self.objectives,
+            "errors": self.errors,
+            "statuses": self.statuses,
+            "cost_usd": self.cost_usd,
+            "turns": self.turns,
+            "wall_s": self.wall_s,
+            "busy_s": self.busy_s,
+            "objectives_per_hour": self.per_hour,
+            "concurrency": self.concurrency,
+        }
+
+
+def _result_record(
+    job: BatchJob,
+    run: WorkflowRun | None,
+    error: str | None,
+    branch: str | None = None,
+) -> dict[str, Any]:
+    output = run.output if run else None
+    if output is None and error is None:
+        error = "No structured output"
+    return {
+        "type": "result",
+        "id": job.id,
+        "objective": job.objective,
+        "status": output.status if output else "error",
+        "output": output.model_dump(mode="json") if output else None,
+        "error": error,
+        "cost_usd": run.cost_usd if run else 0.0,
+        "turns": run.turns if run else 0,
+        "duration_s": run.duration_s if run else 0.0,
+        "log_path": str(run.log_path) if run else None,
+        "branch": branch,
+    }
+
+
+def _use_worktrees(worktrees: bool | None, concurrency: int) -> bool:
+    """Decide whether workflows get worktrees, warning on a shared checkout."""
+    if worktrees is None:
+        return concurrency > 1
+    if not worktrees and concurrency > 1:
+        logger.warning(
+            "Running %d workflows in one checkout; concurrent edits and commits "
+            "will conflict",
+            concurrency,
+        )
+    return worktrees
+
+
+async def run_batch(
+    jobs: list[BatchJob],
+    *,
+    workers: int = DEFAULT_WORKERS,
+    output: Path | None = None,
+    driver: str = "orchestrator",
+    verbose: bool = False,
+    use_cache: bool = True,
+    worktrees: bool | None = None,
+) -> tuple[BatchSummary, Path]:
+    """Run objectives concurrently and write their results.
+
+    Args:
+        jobs: Objectives to run, in queue order.
+        workers: Maximum workflows in flight.
+        output: Results file (default: .π/logs/batches/<timestamp>.jsonl).
+        driver: "orchestrator" (LLM agent) or "pipeline" (deterministic).
+        verbose: If True, enable debug logging to console.
+        use_cache: If False, bypass the stage result and lint verdict caches.
+        worktrees: If True, run each workflow in its own git worktree, on a
+            branch of its own. If None (default), do so when more than one
+            workflow runs at once. False shares the current checkout, which
+            concurrent workflows that edit and commit will corrupt.
+
+    Returns:
+        The batch summary and the results file path.
+    """
+    batch_log = start_run(verbose=verbose, use_cache=use_cache, retention=None)
+    if output is None:
+        output = batch_log.parent / BATCHES_DIR_NAME / f"{batch_log.stem}.jsonl"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    summary = BatchSummary(workers=max(workers, 1))
+    queue: asyncio.Queue[tuple[int, BatchJob]] = asyncio.Queue()
+    for item in enumerate(jobs, 1):
+        queue.put_nowait(item)
+
+    concurrency = min(summary.workers, len(jobs))
+    worktree_pool = None
+    if _use_worktrees(worktrees, concurrency):
+        worktree_pool = WorktreePool(
+            get_project_root(), root=get_worktrees_dir(), size=concurrency
+        )
+
+    async def run_job(job: BatchJob, log_path: Path, branch: str | None) -> WorkflowRun:
+        if worktree_pool is None:
+            return await run_workflow(job.objective, log_path=log_path, driver=driver)
+        async with worktree_pool.acquire(branch=branch) as cwd:
+            prewarm_stage_clients(cwd)
+            return await run_workflow(
+                job.objective, log_path=log_path, driver=driver, cwd=cwd
+            )
+
+    async def worker(results: TextIO) -> None:
+        while not queue.empty():
+            index, job = queue.get_nowait()
+            # Same run group as the batch log, so retention keeps them together
+            log_path = batch_log.with_name(f"{batch_log.stem}.{index:04d}.log")
+            branch = branch_name(batch_log.stem, job.id) if worktree_pool else None
+            run, error = None, None
+            try:
+                run = await run_job(job, log_path, branch)
+            except Exception as e:
+                logger.exception("Workflow %s failed", job.id)
+                error = f"{type(e).__name__}: {e}"
+            record = _result_record(job, run, error, branch)
+            results.write(json.dumps(record) + "\n")
+            results.flush()
+            summary.add(record["status"], run)
+            console.print(
+                f"[muted]{summary.objectives}/{len(jobs)}[/muted] {job.id}: "
+                f"[{'error' if run is None else 'success'}]{record['status']}"
+                f"[/] [muted]${record['cost_usd']:.4f} "
+                f"{record['duration_s']:.1f}s[/muted]"
+            )
+
+    start = time.perf_counter()
+    try:
+        if worktree_pool is None:
+            prewarm_stage_clients()
+        else:
+            await worktree_pool.start()
+        with output.open("w", encoding="utf-8") as results:
+            # Each worker is its own task, so its WorkflowContext is its own
+            await asyncio.gather(*(worker(results) for _ in range(concurrency)))
+            summary.wall_s = time.perf_counter() - start
+            results.write(json.dumps(summary.to_dict()) + "\n")
+    finally:
+        if worktree_pool is not None:
+            await worktree_pool.close()
+        await finish_run()
+    return summary, output
+
+
+def render_batch_summary(summary: BatchSummary) -> Table:
+    """Render the batch totals as a Rich table."""
+    table = Table(title="Batch", title_justify="left", show_header=False)
+    table.add_column("Label", style="bold")
+    table.add_column("Value")
+    table.add_row("Objectives", str(summary.objectives))
+    for status, count in sorted(summary.statuses.items()):
+        table.add_row(f"  {status}", str(count))
+    table.add_row("Workers", str(summary.workers))
+    table.add_row("Wall time", f"{summary.wall_s:.1f}s")
+    table.add_row("Throughput", f"{summary.per_hour:.1f} objectives/h")
+    table.add_row("Concurrency", f"{summary.concurrency:.1f}")
+    table.add_row("Cost", f"${summary.cost_usd:.4f}")
+    if summary.objectives:
+        table.add_row(
+            "Cost per objective", f"${summary.cost_usd / summary.objectives:.4f}"
+        )
+    table.add_row("Turns", str(summary.turns))
+    return table
+
+
+def _default_workers() -> int:
+    try:
+        return max(int(getenv(BATCH_WORKERS_ENV, str(DEFAULT_WORKERS))), 1)
+    except ValueError:
+        logger.warning("Invalid %s, using %d", BATCH_WORKERS_ENV, DEFAULT_WORKERS)
+        return DEFAULT_WORKERS
+
+
+def create_batch_parser() -> argparse.ArgumentParser:
+    """Create the argument parser for `π batch`."""
+    parser = argparse.ArgumentParser(
+        prog="π batch",
+        description="Run many objectives concurrently and write their results "
+        "as JSONL.",
+    )
+    parser.add_argument(
+        "file",
+        nargs="?",
+        type=Path,
+        help='JSONL objectives: {"objective": ..., "id": ...} or a JSON string '
+        "per line (default: stdin)",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        metavar="N",
+        help=f"Workflows in flight (default: ${BATCH_WORKERS_ENV} or "
+        f"{DEFAULT_WORKERS})",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        metavar="FILE",
+        help="Results JSONL (default: .π/logs/batches/<timestamp>.jsonl)",
+    )
+    parser.add_argument(
+        "--driver",
+        choices=DRIVERS,
+        default="orchestrator",
+        help="Drive stages with the LLM orchestrator or a deterministic pipeline",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always run stage sessions and linters instead of reusing cached results",
+    )
+    checkout = parser.add_mutually_exclusive_group()
+    checkout.add_argument(
+        "--worktrees",
+        action="store_true",
+        default=None,
+        help="Run each objective in its own git worktree (under .π/worktrees), "
+        "committing to a branch of its own (default with more than one worker)",
+    )
+    checkout.add_argument(
+        "--shared-checkout",
+        dest="worktrees",
+        action="store_false",
+        help="Run every objective in the current checkout; unsafe with more "
+        "than one worker unless the objectives do not edit files",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Enable debug logging to console",
+    )
+    return parser
+
+
+def batch_main(argv: list[str]) -> None:
+    """Run `π batch` with the given arguments."""
+    parser = create_batch_parser()
+    args = parser.parse_args(argv)
+    try:
+        if args.file and str(args.file) != "-":
+            with args.file.open(encoding="utf-8") as f:
+                jobs = read_jobs(f)
+        else:
+            jobs = read_jobs(sys.stdin)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    if not jobs:
+        console.print("[muted]No objectives to run.[/muted]")
+        return
+
+    from dotenv import load_dotenv  # noqa: PLC0415
+
+    load_dotenv()
+    summary, output = asyncio.run(
+        run_batch(
+            jobs,
+            workers=args.workers or _default_workers(),
+            output=args.output,
+            driver=args.driver,
+            verbose=args.verbose,
+            use_cache=not args.no_cache,
+            worktrees=args.worktrees,
+        )
+    )
+    console.print(render_batch_summary(summary))
+    console.print(f"[dim]Results:[/dim] {output}")
@@ -100,6 +100,7 @@ class LiveObserver:
         is_error: bool,
         *,
         agent_id: str = "orchestrator",
+        duration_ms: float | None = None,  # noqa: ARG002
     ) -> None:
         """Handle tool end event.
 
@@ -137,6 +138,7 @@ class LiveObserver:
         duration_ms: int,
         *,
         agent_id: str = "orchestrator",
+        usage: dict | None = None,  # noqa: ARG002
     ) -> None:
         """Handle workflow completion event.
 
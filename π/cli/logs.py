@@ -0,0 +1,311 @@
+"""`π logs`: summarize JSONL event logs across runs.
+
+Event logs (written by EventLogObserver next to each text log) are read
+one line at a time, so hundreds of runs can be summarized without loading
+whole files. The report covers stage durations, tool counts and error
+rates, and cost.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from rich.table import Table
+
+from π.console import console
+from π.workflow.metrics import is_pipeline_total, percentile
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+EVENT_LOG_SUFFIX = ".jsonl"
+# Event logs of older runs are gzipped by log retention
+EVENT_LOG_SUFFIXES = (EVENT_LOG_SUFFIX, f"{EVENT_LOG_SUFFIX}.gz")
+
+
+@dataclass
+class AgentStats:
+    """Completed sessions of one agent (fan-out sessions share a stage)."""
+
+    sessions: int = 0
+    turns: int = 0
+    cost_usd: float = 0.0
+    durations_ms: list[float] = field(default_factory=list)
+
+
+@dataclass
+class ToolStats:
+    """Calls of one tool across agents."""
+
+    calls: int = 0
+    errors: int = 0
+    durations_ms: list[float] = field(default_factory=list)
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of calls that failed."""
+        return self.errors / self.calls if self.calls else 0.0
+
+
+@dataclass
+class LogSummary:
+    """Totals over a set of event logs."""
+
+    files: int = 0
+    runs: int = 0
+    invalid_lines: int = 0
+    cost_usd: float = 0.0
+    agents: dict[str, AgentStats] = field(default_factory=dict)
+    tools: dict[str, ToolStats] = field(default_factory=dict)
+
+    @property
+    def tool_calls(self) -> int:
+        """Completed tool calls."""
+        return sum(stats.calls for stats in self.tools.values())
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of all tool calls that failed."""
+        calls = self.tool_calls
+        errors = sum(stats.errors for stats in self.tools.values())
+        return errors / calls if calls else 0.0
+
+    def to_dict(self) -> dict:
+        """Summary as plain data (durations reduced to percentiles)."""
+        return {
+            "files": self.files,
+            "runs": self.runs,
+            "invalid_lines": self.invalid_lines,
+            "cost_usd": round(self.cost_usd, 6),
+            "tool_calls": self.tool_calls,
+            "error_rate": self.error_rate,
+            "agents": {
+                agent: {
+                    "sessions": stats.sessions,
+                    "turns": stats.turns,
+                    "cost_usd": round(stats.cost_usd, 6),
+                    **_duration_stats(stats.durations_ms),
+                }
+                for agent, stats in self.agents.items()
+            },
+            "tools": {
+                tool: {
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "error_rate": stats.error_rate,
+                    **_duration_stats(stats.durations_ms),
+                }
+                for tool, stats in self.tools.items()
+            },
+        }
+
+
+def _duration_stats(durations_ms: list[float]) -> dict[str, float]:
+    ordered = sorted(durations_ms)
+    if not ordered:
+        return {"total_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+    return {
+        "total_ms": sum(ordered),
+        "p50_ms": percentile(ordered, 0.5),
+        "p95_ms": percentile(ordered, 0.95),
+        "max_ms": ordered[-1],
+    }
+
+
+def find_event_logs(paths: Iterable[Path], *, last: int | None = None) -> list[Path]:
+    """Expand directories to their event logs, oldest first.
+
+    Args:
+        paths: Event log files or directories containing them.
+        last: Keep only the newest N logs.
+
+    Returns:
+        Event log paths ordered by name (log names start with a timestamp).
+    """
+    found: list[Path] = []
+    for path in paths:
+        if path.is_dir():
+            found.extend(
+                p for suffix in EVENT_LOG_SUFFIXES for p in path.glob(f"*{suffix}")
+            )
+        else:
+            found.append(path)
+    found.sort(key=lambda p: p.name)
+    return found[-last:] if last else found
+
+
+def iter_events(path: Path, summary: LogSummary | None = None) -> Iterator[dict]:
+    """Stream the records of an event log, skipping malformed lines.
+
+    Args:
+        path: JSONL event log (optionally gzipped).
+        summary: Optional summary whose invalid_lines count is updated.
+    """
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            if isinstance(record, dict):
+                yield record
+            elif summary is not None:
+                summary.invalid_lines += 1
+
+
+def summarize(paths: Iterable[Path]) -> LogSummary:
+    """Summarize event logs.
+
+    Fan-out sessions (agent_id "stage:<command>#<n>") count toward their
+    stage. Under the pipeline driver the orchestrator's completion repeats
+    its stages' cost, so it is left out of the total.
+
+    Args:
+        paths: Event log files.
+
+    Returns:
+        Totals over all records.
+    """
+    summary = LogSummary()
+    for path in paths:
+        summary.files += 1
+        driver = "orchestrator"
+        for record in iter_events(path, summary):
+            _add_record(summary, record, driver)
+            if record.get("event") == "run_start":
+                driver = record.get("driver") or "orchestrator"
+    return summary
+
+
+def _add_record(summary: LogSummary, record: dict, driver: str) -> None:
+    event = record.get("event")
+    if event == "run_start":
+        summary.runs += 1
+    elif event == "tool_end":
+        stats = summary.tools.setdefault(str(record.get("tool")), ToolStats())
+        stats.calls += 1
+        stats.errors += bool(record.get("is_error"))
+        if (duration := record.get("duration_ms")) is not None:
+            stats.durations_ms.append(duration)
+    elif event == "complete":
+        agent_id = str(record.get("agent_id", "orchestrator"))
+        if is_pipeline_total(agent_id, driver):
+            return
+        stats = summary.agents.setdefault(agent_id.partition("#")[0], AgentStats())
+        cost = record.get("cost_usd") or 0.0
+        stats.sessions += 1
+        stats.turns += record.get("turns") or 0
+        stats.cost_usd += cost
+        stats.durations_ms.append(record.get("duration_ms") or 0)
+        summary.cost_usd += cost
+
+
+def _seconds(ms: float) -> str:
+    return f"{ms / 1000:.1f}s"
+
+
+def render_summary(summary: LogSummary) -> list[Table]:
+    """Render the summary as Rich tables (runs, stages, tools)."""
+    totals = Table(title="Runs", title_justify="left", show_header=False)
+    totals.add_column("Label", style="bold")
+    totals.add_column("Value")
+    totals.add_row("Logs", str(summary.files))
+    totals.add_row("Runs", str(summary.runs))
+    totals.add_row("Cost", f"${summary.cost_usd:.4f}")
+    if summary.runs:
+        totals.add_row("Cost per run", f"${summary.cost_usd / summary.runs:.4f}")
+    totals.add_row("Tool calls", str(summary.tool_calls))
+    totals.add_row("Tool error rate", f"{summary.error_rate:.1%}")
+    if summary.invalid_lines:
+        totals.add_row("Invalid lines", str(summary.invalid_lines))
+
+    stages = Table(title="Stages", title_justify="left")
+    stages.add_column("Agent", style="bold")
+    for column in ("Sessions", "Turns", "Cost", "p50", "p95", "Max", "Total"):
+        stages.add_column(column, justify="right")
+    for agent, stats in sorted(summary.agents.items()):
+        durations = _duration_stats(stats.durations_ms)
+        stages.add_row(
+            agent,
+            str(stats.sessions),
+            str(stats.turns),
+            f"${stats.cost_usd:.4f}",
+            _seconds(durations["p50_ms"]),
+            _seconds(durations["p95_ms"]),
+            _seconds(durations["max_ms"]),
+            _seconds(durations["total_ms"]),
+        )
+
+    tools = Table(title="Tools", title_justify="left")
+    tools.add_column("Tool", style="bold")
+    for column in ("Calls", "Errors", "Error rate", "p50", "p95", "Max"):
+        tools.add_column(column, justify="right")
+    for tool, stats in sorted(summary.tools.items(), key=lambda item: -item[1].calls):
+        durations = _duration_stats(stats.durations_ms)
+        tools.add_row(
+            tool,
+            str(stats.calls),
+            str(stats.errors),
+            f"{stats.error_rate:.1%}",
+            _seconds(durations["p50_ms"]),
+            _seconds(durations["p95_ms"]),
+            _seconds(durations["max_ms"]),
+        )
+    return [totals, stages, tools]
+
+
+def create_logs_parser() -> argparse.ArgumentParser:
+    """Create the argument parser for `π logs`."""
+    parser = argparse.ArgumentParser(
+        prog="π logs",
+        description="Summarize JSONL event logs: stage durations, tool counts, "
+        "error rates and cost.",
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        type=Path,
+        help="Event logs or directories of them (default: .π/logs)",
+    )
+    parser.add_argument(
+        "-n",
+        "--last",
+        type=int,
+        metavar="N",
+        help="Only summarize the newest N logs",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the summary as JSON",
+    )
+    return parser
+
+
+def logs_main(argv: list[str]) -> None:
+    """Run `π logs` with the given arguments."""
+    args = create_logs_parser().parse_args(argv)
+    if args.paths:
+        paths = args.paths
+    else:
+        from π.config import get_logs_dir  # noqa: PLC0415
+
+        paths = [get_logs_dir()]
+
+    summary = summarize(find_event_logs(paths, last=args.last))
+    if args.json:
+        print(json.dumps(summary.to_dict(), indent=2))
+        return
+    if not summary.files:
+        console.print("[muted]No event logs found.[/muted]")
+        return
+    for table in render_summary(summary):
+        console.print(table)
@@ -3,34 +3,34 @@
 Demonstrates how to use custom MCP tools (research, plan, implement, etc.)
 with the Claude SDK client. Structured output ensures the orchestrator must
 call tools to fill required fields (can't hallucinate file paths, etc.).
+
+This module only parses arguments: the SDK, Rich, the MCP server and the
+command map are imported (from π.cli.runner) once a workflow starts, so
+`π --help` and `π --version` stay fast for preflight scripts.
 """
 
+from __future__ import annotations
+
 import argparse
-import asyncio
 import logging
 import sys
-from importlib.metadata import version as get_version
-
-from claude_agent_sdk import ClaudeSDKClient
-from claude_agent_sdk.types import ResultMessage
-from dotenv import load_dotenv
-
-from π.cli.display import LiveObserver
-from π.config import get_logs_dir, get_orchestrator_options, setup_logging
-from π.console import console
-from π.utils import get_project_root, prevent_sleep, speak
-from π.workflow import (
-    CompositeObserver,
-    LoggingObserver,
-    WorkflowOutput,
-    dispatch_message,
-    get_workflow_ctx,
-    reset_workflow_ctx,
-)
-from π.workflow.tools import WORKFLOW_TOOLS, workflow_server
+from pathlib import Path
+
+from π.utils import prevent_sleep, speak
 
 logger = logging.getLogger(__name__)
-VERSION = get_version("pi-rpi")
+DISTRIBUTION = "pi-rpi"
+
+
+def get_version() -> str:
+    """Installed version of π (reads package metadata on each call)."""
+    from importlib.metadata import version  # noqa: PLC0415
+
+    return version(DISTRIBUTION)
+
+
+# Workflow drivers: LLM orchestrator agent or deterministic Python pipeline
+DRIVERS = ("orchestrator", "pipeline")
 
 
 def _create_parser() -> argparse.ArgumentParser:
@@ -38,121 +38,110 @@ def _create_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="π",
         description="Autonomous Research → Plan → Review → Implement workflow.",
+        epilog="Run `π logs --help` to summarize past runs' event logs and "
+        "`π batch --help` to run many objectives concurrently.",
     )
     parser.add_argument("objective", nargs="?", help="The objective for the agent")
+    parser.add_argument(
+        "-V", "--version", action="store_true", help="Show the version and exit"
+    )
     parser.add_argument(
         "-v",
         "--verbose",
         action="store_true",
         help="Enable debug logging to console",
     )
-    return parser
-
-
-async def run(objective: str, *, verbose: bool = False) -> WorkflowOutput | None:
-    """Run the Claude agent with workflow MCP tools.
-
-    The orchestrator uses structured output to ensure it must call tools
-    to satisfy required fields. Tools provide ground truth for file paths,
-    commit hashes, and other verifiable data.
-
-    Args:
-        objective: The workflow objective/goal to execute.
-        verbose: If True, enable debug logging to console.
-
-    Returns:
-        WorkflowOutput if structured output was received, None otherwise.
-    """
-    # Set up logging infrastructure
-    logs_dir = get_logs_dir()
-    log_path = setup_logging(logs_dir, verbose=verbose)
-
-    # Initialize fresh context with objective
-    reset_workflow_ctx()
-    ctx = get_workflow_ctx()
-    ctx.objective = objective
-
-    # Get orchestrator options and extend with MCP workflow tools
-    options = get_orchestrator_options(cwd=get_project_root())
-    options.mcp_servers = {"workflow": workflow_server}
-    options.allowed_tools += WORKFLOW_TOOLS
-
-    # Enable structured output - forces schema compliance
-    # The orchestrator MUST call tools to fill required fields
-    options.output_format = {
-        "type": "json_schema",
-        "schema": WorkflowOutput.model_json_schema(),
-    }
-
-    # Create observers: Live display + File logging
-    system_prompt = str(options.system_prompt) if options.system_prompt else None
-    log_observer = LoggingObserver(
-        log_path,
-        system_prompt=system_prompt,
-        objective=objective,
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always run stage sessions and linters instead of reusing cached results",
+    )
+    parser.add_argument(
+        "--driver",
+        choices=DRIVERS,
+        default="orchestrator",
+        help="Drive stages with the LLM orchestrator or a deterministic pipeline",
+    )
+    replay = parser.add_mutually_exclusive_group()
+    replay.add_argument(
+        "--record",
+        type=Path,
+        metavar="FILE",
+        help="Record every SDK session of the run to FILE for --replay",
+    )
+    replay.add_argument(
+        "--replay",
+        type=Path,
+        metavar="FILE",
+        help="Replay a --record'ed run at full speed without calling Claude "
+        "(the objective and driver come from FILE)",
     )
-    live_observer = LiveObserver()
-    observer = CompositeObserver([live_observer, log_observer])
-
-    # Store observer in context for stage agents to use
-    ctx.observer = observer
-
-    workflow_result: WorkflowOutput | None = None
-
-    async with ClaudeSDKClient(options=options) as client:
-        await client.query(objective)
-        with live_observer:  # Only LiveObserver needs context manager for Rich
-            async for message in client.receive_response():
-                dispatch_message(message, observer)
-
-                # Capture structured output from ResultMessage
-                if isinstance(message, ResultMessage) and message.structured_output:
-                    try:
-                        workflow_result = WorkflowOutput.model_validate(
-                            message.structured_output
-                        )
-                        logger.info(
-                            "Structured output received: status=%s, commit=%s",
-                            workflow_result.status,
-                            workflow_result.commit_hash,
-                        )
-                    except Exception as e:
-                        logger.warning("Failed to validate structured output: %s", e)
-
-    # Log final context state
-    ctx = get_workflow_ctx()
-    if ctx.session_ids or ctx.doc_paths:
-        live_observer.console.print("\n[dim]Session IDs:[/dim]", ctx.session_ids)
-        live_observer.console.print("[dim]Doc Paths:[/dim]", ctx.doc_paths)
-
-    # Log structured output summary
-    if workflow_result:
-        live_observer.console.print("\n[bold]Workflow Output:[/bold]")
-        live_observer.console.print(f"  Status: {workflow_result.status}")
-        live_observer.console.print(f"  Research: {workflow_result.research_doc_path}")
-        if workflow_result.plan_doc_path:
-            live_observer.console.print(f"  Plan: {workflow_result.plan_doc_path}")
-        if workflow_result.commit_hash:
-            live_observer.console.print(f"  Commit: {workflow_result.commit_hash}")
-        live_observer.console.print(f"  Summary: {workflow_result.summary}")
-
-    # Show log path
-    logging.shutdown()  # Ensure all handlers flushed
-    if log_path.exists():
-        live_observer.console.print(f"\n[dim]Debug log:[/dim] {log_path}")
-
-    return workflow_result
+    retention = parser.add_argument_group("log retention (0 disables a limit)")
+    retention.add_argument(
+        "--log-max-age",
+        type=float,
+        metavar="DAYS",
+        help="Delete run logs older than DAYS (default: $PI_LOG_MAX_AGE_DAYS or 7)",
+    )
+    retention.add_argument(
+        "--log-max-size",
+        type=float,
+        metavar="MB",
+        help="Delete the oldest run logs above MB in total "
+        "(default: $PI_LOG_MAX_MB or 500)",
+    )
+    retention.add_argument(
+        "--log-compress-after",
+        type=float,
+        metavar="DAYS",
+        help="Gzip run logs older than DAYS "
+        "(default: $PI_LOG_COMPRESS_AFTER_DAYS or 1)",
+    )
+    return parser
 
 
 @prevent_sleep
 def main(argv: list[str] | None = None) -> None:
-    """Run the π agent with the given OBJECTIVE."""
-    load_dotenv()
+    """Run the π agent with the given OBJECTIVE (or `π logs|batch ...`)."""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["logs"]:
+        from π.cli.logs import logs_main  # noqa: PLC0415
+
+        logs_main(argv[1:])
+        return
+    if argv[:1] == ["batch"]:
+        from π.cli.batch import batch_main  # noqa: PLC0415
+
+        batch_main(argv[1:])
+        speak("batch complete")
+        return
+
     parser = _create_parser()
     args = parser.parse_args(argv)
+    if args.version:
+        print(f"π {get_version()}")
+        return
+
+    # Deferred so --help/--version don't pay for them
+    import asyncio  # noqa: PLC0415
 
-    logger.info(f"π (v{VERSION})")
-    console.print(f"[heading]π[/heading] [muted](v{VERSION})[/muted]")
+    from dotenv import load_dotenv  # noqa: PLC0415
+
+    from π.cli.runner import run  # noqa: PLC0415
+    from π.console import console  # noqa: PLC0415
+    from π.retention import RetentionPolicy  # noqa: PLC0415
+
+    load_dotenv()
+    version = get_version()
+    logger.info(f"π (v{version})")
+    console.print(f"[heading]π[/heading] [muted](v{version})[/muted]")
+
+    recording = None
+    if args.replay:
+        from π.bridge.recording import load_recording  # noqa: PLC0415
+
+        recording = load_recording(args.replay)
+        args.objective, args.driver = recording.objective, recording.driver
 
     # Use positional arg if provided, otherwise try stdin if piped
     if args.objective:
@@ -169,7 +158,21 @@ def main(argv: list[str] | None = None) -> None:
         parser.print_help()
         return
 
-    asyncio.run(run(objective, verbose=args.verbose))
+    asyncio.run(
+        run(
+            objective,
+            verbose=args.verbose,
+            use_cache=not args.no_cache,
+            driver=args.driver,
+            retention=RetentionPolicy.from_env(
+                max_age_days=args.log_max_age,
+                max_mb=args.log_max_size,
+                compress_after_days=args.log_compress_after,
+            ),
+            record=args.record,
+            replay=recording,
+        )
+    )
     speak("workflow complete")
 
 
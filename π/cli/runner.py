@@ -0,0 +1,403 @@
+"""Workflow runner behind the π CLI.
+
+Wires the orchestrator agent (or the deterministic pipeline), observers,
+log retention and caches together for one run. Imported by π.cli.main only
+when a workflow actually starts, so `π --help` and `π --version` never load
+the SDK, the MCP server or the command map.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from claude_agent_sdk.types import ResultMessage
+
+from π.bridge.cache import set_stage_cache_enabled
+from π.bridge.pool import close_client_pool, create_client, set_client_factory
+from π.bridge.recording import SessionRecorder
+from π.bridge.session import prewarm_stage_clients
+from π.cli.display import LiveObserver
+from π.config import (
+    get_logs_dir,
+    get_metrics_dir,
+    get_orchestrator_options,
+    setup_logging,
+)
+from π.hooks.cache import set_lint_cache_enabled
+from π.hooks.daemons import close_checker_daemons
+from π.hooks.scheduler import close_lint_scheduler
+from π.retention import BLOBS_DIR_NAME, RetentionPolicy, start_log_retention
+from π.utils import get_project_root
+from π.workflow import (
+    BlobStore,
+    EventLogObserver,
+    LoggingObserver,
+    MetricsObserver,
+    ObserverBus,
+    ToolLatencyObserver,
+    TraceObserver,
+    WorkflowObserver,
+    WorkflowOutput,
+    dispatch_message,
+    get_workflow_ctx,
+    reset_workflow_ctx,
+)
+from π.workflow.observer import clear_in_flight_tools
+from π.workflow.pipeline import run_pipeline
+from π.workflow.tools import WORKFLOW_TOOLS, workflow_server
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from claude_agent_sdk import ClaudeAgentOptions
+    from rich.console import Console
+    from rich.table import Table
+
+    from π.bridge.recording import Recording
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_structured_output(data: object) -> WorkflowOutput | None:
+    """Validate the orchestrator's structured output.
+
+    Args:
+        data: The structured_output payload from the final ResultMessage.
+
+    Returns:
+        WorkflowOutput if valid, None otherwise.
+    """
+    try:
+        workflow_result = WorkflowOutput.model_validate(data)
+    except Exception as e:
+        logger.warning("Failed to validate structured output: %s", e)
+        return None
+    logger.info(
+        "Structured output received: status=%s, commit=%s",
+        workflow_result.status,
+        workflow_result.commit_hash,
+    )
+    return workflow_result
+
+
+def _get_workflow_options(cwd: Path | None = None) -> ClaudeAgentOptions:
+    """Build orchestrator options with MCP workflow tools and structured output.
+
+    Args:
+        cwd: Working directory for the orchestrator. Defaults to project root.
+    """
+    options = get_orchestrator_options(cwd=cwd or get_project_root())
+    options.mcp_servers = {"workflow": workflow_server}
+    options.allowed_tools += WORKFLOW_TOOLS
+
+    # Enable structured output - forces schema compliance
+    # The orchestrator MUST call tools to fill required fields
+    options.output_format = {
+        "type": "json_schema",
+        "schema": WorkflowOutput.model_json_schema(),
+    }
+    return options
+
+
+async def _run_orchestrator(
+    objective: str,
+    options: ClaudeAgentOptions,
+    observer: WorkflowObserver,
+) -> WorkflowOutput | None:
+    """Drive the workflow with the orchestrator agent.
+
+    Returns:
+        WorkflowOutput if structured output was received, None otherwise.
+    """
+    workflow_result: WorkflowOutput | None = None
+    async with create_client(options) as client:
+        await client.query(objective)
+        async for message in client.receive_response():
+            dispatch_message(message, observer)
+
+            # Capture structured output from ResultMessage
+            if isinstance(message, ResultMessage) and message.structured_output:
+                workflow_result = _parse_structured_output(message.structured_output)
+    return workflow_result
+
+
+def _print_run_summary(
+    out: Console,
+    workflow_result: WorkflowOutput | None,
+    latency_table: Table | None,
+) -> None:
+    """Print session IDs, doc paths, structured output and tool latencies."""
+    # Log final context state
+    ctx = get_workflow_ctx()
+    if ctx.session_ids or ctx.doc_paths:
+        out.print("\n[dim]Session IDs:[/dim]", ctx.session_ids)
+        if ctx.sub_session_ids:
+            out.print("[dim]Sub-session IDs:[/dim]", ctx.sub_session_ids)
+        out.print("[dim]Doc Paths:[/dim]", ctx.doc_paths)
+
+    # Log structured output summary
+    if workflow_result:
+        out.print("\n[bold]Workflow Output:[/bold]")
+        out.print(f"  Status: {workflow_result.status}")
+        out.print(f"  Research: {workflow_result.research_doc_path}")
+        if workflow_result.plan_doc_path:
+            out.print(f"  Plan: {workflow_result.plan_doc_path}")
+        if workflow_result.commit_hash:
+            out.print(f"  Commit: {workflow_result.commit_hash}")
+        out.print(f"  Summary: {workflow_result.summary}")
+
+    # Show which tools dominated each agent's wall time
+    if latency_table:
+        out.print()
+        out.print(latency_table)
+
+
+def _start_transport(
+    objective: str,
+    driver: str,
+    *,
+    record: Path | None,
+    replay: Recording | None,
+) -> SessionRecorder | None:
+    """Route SDK clients to a replayed recording or through a recorder."""
+    if replay is not None:
+        set_client_factory(replay.script.client_factory())
+    elif record is not None:
+        recorder = SessionRecorder(record, objective=objective, driver=driver)
+        set_client_factory(recorder.client_factory())
+        return recorder
+    return None
+
+
+def _stop_transport(recorder: SessionRecorder | None) -> None:
+    """Restore the CLI transport and finish the recording, if any."""
+    set_client_factory(None)
+    if recorder is not None:
+        recorder.close()
+
+
+def _print_transport_summary(
+    out: Console, recorder: SessionRecorder | None, replay: Recording | None
+) -> None:
+    """Print the recording path or the replay throughput."""
+    if recorder is not None:
+        out.print(
+            f"[dim]Recording:[/dim] {recorder.path} ({recorder.sessions} sessions)"
+        )
+    if replay is not None:
+        stats = replay.script.stats
+        out.print(
+            f"[dim]Replay:[/dim] {stats.sessions} sessions, "
+            f"{stats.messages} messages in {stats.elapsed_s:.2f}s "
+            f"({stats.messages_per_s:,.0f} messages/s)"
+        )
+
+
+@dataclass(slots=True)
+class WorkflowRun:
+    """Output and accounting of one workflow."""
+
+    output: WorkflowOutput | None
+    log_path: Path
+    trace_path: Path
+    duration_s: float
+    cost_usd: float = 0.0
+    turns: int = 0
+    latency_table: Table | None = None
+
+
+def _workflow_totals(metrics: MetricsObserver) -> tuple[float, int]:
+    """Cost and turns of a workflow from its session metrics."""
+    agents = metrics.agents.values()
+    return sum(a.cost_usd for a in agents), sum(a.turns for a in agents)
+
+
+def start_run(
+    *, verbose: bool, use_cache: bool, retention: RetentionPolicy | None
+) -> Path:
+    """Set up process-wide logging, log retention and caches for a run.
+
+    Args:
+        verbose: If True, enable debug logging to console.
+        use_cache: If False, bypass the stage result and lint verdict caches.
+        retention: Log retention policy (defaults to the environment's).
+
+    Returns:
+        Path to the run's text log.
+    """
+    logs_dir = get_logs_dir()
+    log_path = setup_logging(logs_dir, verbose=verbose)
+    # Prune old runs' logs in the background (never delays the first turn)
+    start_log_retention(
+        logs_dir, retention or RetentionPolicy.from_env(), keep=log_path
+    )
+    set_stage_cache_enabled(use_cache)
+    set_lint_cache_enabled(use_cache)
+    return log_path
+
+
+async def finish_run() -> None:
+    """Close the client pool, lint scheduler and checker daemons."""
+    await close_client_pool()
+    await close_lint_scheduler()
+    await close_checker_daemons()
+    clear_in_flight_tools()
+
+
+async def run_workflow(
+    objective: str,
+    *,
+    log_path: Path,
+    driver: str = "orchestrator",
+    live: LiveObserver | None = None,
+    cwd: Path | None = None,
+) -> WorkflowRun:
+    """Run one workflow with its own context and observers.
+
+    Replaces the calling task's WorkflowContext, so concurrent workflows
+    must each run in their own task. Process-wide state set up by
+    start_run() (client pool, caches, lint scheduler) is shared.
+
+    Args:
+        objective: The workflow objective/goal to execute.
+        log_path: Text log of this workflow; its event log and trace are
+            written next to it.
+        driver: "orchestrator" (LLM agent) or "pipeline" (deterministic).
+        live: Live display to show the workflow in the terminal.
+        cwd: Working directory of the workflow's agents (e.g. a worktree
+            from a WorktreePool). Defaults to project root.
+
+    Returns:
+        The workflow's output, log paths, duration, cost and tool latencies.
+    """
+    # Initialize fresh context with objective
+    reset_workflow_ctx()
+    ctx = get_workflow_ctx()
+    ctx.objective = objective
+    ctx.cwd = cwd
+
+    options = _get_workflow_options(cwd) if driver == "orchestrator" else None
+
+    # Create observers: Live display + File logging
+    system_prompt = (
+        str(options.system_prompt) if options and options.system_prompt else None
+    )
+    log_observer = LoggingObserver(
+        log_path,
+        system_prompt=system_prompt,
+        objective=objective,
+        blobs=BlobStore(log_path.parent / BLOBS_DIR_NAME),
+    )
+    event_log = EventLogObserver(
+        log_path.with_suffix(".jsonl"), objective=objective, driver=driver
+    )
+    latency_observer = ToolLatencyObserver()
+    metrics_observer = MetricsObserver(driver=driver)
+    tracer = TraceObserver()
+    observers: list[WorkflowObserver] = [
+        log_observer,
+        event_log,
+        latency_observer,
+        metrics_observer,
+    ]
+    # Each observer gets its own delivery thread, so a failing or slow one
+    # never stalls the message loop. The tracer timestamps events on receipt,
+    # and the live display is driven from the loop while Rich Live runs, so
+    # no queued event reaches it after the `with live` block stops it
+    observer = ObserverBus(
+        observers, inline=[tracer] if live is None else [live, tracer]
+    )
+
+    # Store observer in context for stage agents to use
+    ctx.observer = observer
+
+    start = time.perf_counter()
+    try:
+        # Only LiveObserver needs context manager for Rich
+        with live if live is not None else contextlib.nullcontext():
+            if options is None:
+                output = await run_pipeline(objective, observer=observer)
+            else:
+                output = await _run_orchestrator(objective, options, observer)
+    finally:
+        observer.close()
+        log_observer.close()
+        event_log.close()
+        metrics_observer.write(get_metrics_dir())
+        trace_path = tracer.close(log_path.with_suffix(".trace.json"))
+
+    cost_usd, turns = _workflow_totals(metrics_observer)
+    return WorkflowRun(
+        output=output,
+        log_path=log_path,
+        trace_path=trace_path,
+        duration_s=time.perf_counter() - start,
+        cost_usd=cost_usd,
+        turns=turns,
+        latency_table=latency_observer.render(),
+    )
+
+
+async def run(
+    objective: str,
+    *,
+    verbose: bool = False,
+    use_cache: bool = True,
+    driver: str = "orchestrator",
+    retention: RetentionPolicy | None = None,
+    record: Path | None = None,
+    replay: Recording | None = None,
+) -> WorkflowOutput | None:
+    """Run the Claude agent with workflow MCP tools.
+
+    The orchestrator uses structured output to ensure it must call tools
+    to satisfy required fields. Tools provide ground truth for file paths,
+    commit hashes, and other verifiable data. The pipeline driver calls the
+    same tools from a Python state machine, without orchestrator turns.
+
+    Args:
+        objective: The workflow objective/goal to execute.
+        verbose: If True, enable debug logging to console.
+        use_cache: If False, bypass the stage result and lint verdict caches.
+        driver: "orchestrator" (LLM agent) or "pipeline" (deterministic).
+        retention: Log retention policy (defaults to the environment's).
+        record: Record every SDK session of the run to this file.
+        replay: Replay a recorded run at full speed instead of calling Claude.
+
+    Returns:
+        WorkflowOutput if structured output was received, None otherwise.
+    """
+    # Recording and replay need every stage session to reach the transport
+    log_path = start_run(
+        verbose=verbose,
+        use_cache=use_cache and not (record or replay),
+        retention=retention,
+    )
+    recorder = _start_transport(objective, driver, record=record, replay=replay)
+    live_observer = LiveObserver()
+
+    # Connect stage agent clients while the first stage is being prepared
+    prewarm_stage_clients()
+
+    try:
+        result = await run_workflow(
+            objective, log_path=log_path, driver=driver, live=live_observer
+        )
+    finally:
+        await finish_run()
+        _stop_transport(recorder)
+
+    _print_run_summary(live_observer.console, result.output, result.latency_table)
+
+    # Show log path
+    logging.shutdown()  # Ensure all handlers flushed
+    if log_path.exists():
+        live_observer.console.print(f"\n[dim]Debug log:[/dim] {log_path}")
+    live_observer.console.print(f"[dim]Trace:[/dim] {result.trace_path}")
+    _print_transport_summary(live_observer.console, recorder, replay)
+
+    return result.output
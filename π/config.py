@@ -8,20 +8,36 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
+from functools import cache
+from os import getenv
 from pathlib import Path
 
 from claude_agent_sdk import ClaudeAgentOptions, HookMatcher
 
 from π.core.enums import Command
-from π.hooks import check_bash_command, check_file_format
+from π.hooks import (
+    await_pending_lint,
+    check_bash_command,
+    check_file_format,
+    flush_lint_checks,
+)
+from π.hooks.timing import timed_hook
 from π.utils import get_project_root
 
 logger = logging.getLogger(__name__)
 
 # Default logs directory (relative to project root)
 LOGS_DIR_NAME = ".π/logs"
+CACHE_DIR_NAME = ".π/cache"
+METRICS_DIR_NAME = ".π/metrics"
+WORKTREES_DIR_NAME = ".π/worktrees"
+# Export directory for run metrics (e.g., a node exporter textfile directory)
+METRICS_DIR_ENV = "PI_METRICS_DIR"
 PI_GITIGNORE_ENTRY = ".π/\n"
 
+# Stop hook timeout: flushing queued lints may run project-wide checkers
+STOP_HOOK_TIMEOUT_S = 180
+
 # Project root for command discovery
 PROJECT_ROOT = Path(__file__).parent.parent
 
@@ -115,8 +131,17 @@ def build_command_map(
     return command_map
 
 
-# Module-level command map (built once at import time)
-COMMAND_MAP: dict[Command, str] = build_command_map()
+@cache
+def get_command_map() -> dict[Command, str]:
+    """Get the command map, built from .claude/commands on first use."""
+    return build_command_map()
+
+
+def __getattr__(name: str) -> object:
+    # COMMAND_MAP is resolved lazily so importing π.config never globs
+    if name == "COMMAND_MAP":
+        return get_command_map()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def _get_base_options(*, cwd: Path | None = None) -> ClaudeAgentOptions:
@@ -132,10 +157,21 @@ def _get_base_options(*, cwd: Path | None = None) -> ClaudeAgentOptions:
     return ClaudeAgentOptions(
         hooks={
             "PostToolUse": [
-                HookMatcher(matcher="Write|Edit", hooks=[check_file_format]),
+                HookMatcher(
+                    matcher="Write|Edit", hooks=[timed_hook(check_file_format)]
+                ),
             ],
             "PreToolUse": [
-                HookMatcher(matcher="Bash", hooks=[check_bash_command]),
+                HookMatcher(matcher="Bash", hooks=[timed_hook(check_bash_command)]),
+                HookMatcher(
+                    matcher="Write|Edit", hooks=[timed_hook(await_pending_lint)]
+                ),
+            ],
+            "Stop": [
+                HookMatcher(
+                    hooks=[timed_hook(flush_lint_checks)],
+                    timeout=STOP_HOOK_TIMEOUT_S,
+                ),
             ],
         },
         permission_mode="acceptEdits",
@@ -215,6 +251,60 @@ def get_logs_dir(root: Path | None = None) -> Path:
     return logs_dir
 
 
+def get_cache_dir(root: Path | None = None) -> Path:
+    """Get the persistent cache directory, creating it if necessary.
+
+    Also adds `.π/` to the root .gitignore if not already present.
+
+    Args:
+        root: Project root path. Defaults to detected project root.
+
+    Returns:
+        Path to the cache directory.
+    """
+    root = root or get_project_root()
+    cache_dir = root / CACHE_DIR_NAME
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_gitignore(root)
+    return cache_dir
+
+
+def get_worktrees_dir(root: Path | None = None) -> Path:
+    """Get the directory holding π's git worktrees.
+
+    Also adds `.π/` to the root .gitignore if not already present. The
+    directory is created by the worktree pool.
+
+    Args:
+        root: Project root path. Defaults to detected project root.
+
+    Returns:
+        Path to the worktrees directory.
+    """
+    root = root or get_project_root()
+    _ensure_gitignore(root)
+    return root / WORKTREES_DIR_NAME
+
+
+def get_metrics_dir(root: Path | None = None) -> Path:
+    """Get the run metrics export directory.
+
+    Uses PI_METRICS_DIR if set, otherwise `.π/metrics` under the project
+    root. The directory is created by the metrics writer.
+
+    Args:
+        root: Project root path. Defaults to detected project root.
+
+    Returns:
+        Path to the metrics directory.
+    """
+    if configured := getenv(METRICS_DIR_ENV):
+        return Path(configured).expanduser()
+    root = root or get_project_root()
+    _ensure_gitignore(root)
+    return root / METRICS_DIR_NAME
+
+
 def setup_logging(log_dir: Path, *, verbose: bool = False) -> Path:
     """Configure file logging for workflow.
 
@@ -15,13 +15,21 @@ Hook Flow:
 
 Public API:
     check_file_format: PostToolUse hook for code quality checks
+    await_pending_lint: PreToolUse hook keeping edits from racing lint fixes
+    flush_lint_checks: Stop hook reporting queued lint failures
     check_bash_command: PreToolUse hook for dangerous command blocking
 """
 
 # Import checkers to register them in the registry
 from π.hooks import checkers as _checkers
-from π.hooks.linting import check_file_format
+from π.hooks.linting import await_pending_lint, check_file_format, flush_lint_checks
 from π.hooks.safety import check_bash_command
 
 # Re-export public API (include _checkers for side-effect registration)
-__all__ = ["_checkers", "check_bash_command", "check_file_format"]
+__all__ = [
+    "_checkers",
+    "await_pending_lint",
+    "check_bash_command",
+    "check_file_format",
+    "flush_lint_checks",
+]
@@ -0,0 +1,261 @@
+"""On-disk cache of lint verdicts.
+
+Agents often rewrite a file with identical content, and each write would
+otherwise relaunch ruff/eslint/cargo. Verdicts are stored under
+`.π/cache/lint`, keyed by checker command, checked file content and the
+hashes of the configuration files that affect the result.
+
+Package-scoped checkers (cargo check -p, go vet ./pkg) see every source file
+of the package, so their keys include the package's sources (and, for Rust,
+its local path dependencies), not just the edited file. Those are keyed by
+(path, mtime_ns, size) rather than content, so they are stat-ed, not read and
+hashed, on every edit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from π.utils import get_project_root
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_AGE_S = 7 * 24 * 3600
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+
+# Lints run on every edit; scan for eviction only every this many writes
+_EVICT_EVERY = 64
+
+# Directories never scanned for project sources
+_SKIP_DIRS = frozenset({"node_modules", "target", "vendor", "__pycache__"})
+
+# Module-level switch (config, not workflow state); see --no-cache
+_enabled = True
+_caches: dict[Path, LintCache] = {}
+
+
+@dataclass
+class LintVerdict:
+    """A cached checker result."""
+
+    exit_code: int
+    output: str = ""
+
+
+def _sha256_file(path: Path) -> str:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return ""
+
+
+def _stat_stamp(path: Path) -> str:
+    try:
+        stat = path.stat()
+    except OSError:
+        return ""
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def find_config_files(start: Path, names: Iterable[str]) -> list[Path]:
+    """Find configuration files in start and its ancestors.
+
+    Args:
+        start: Directory to search upward from.
+        names: Configuration file names to look for.
+
+    Returns:
+        Existing configuration files, nearest first.
+    """
+    names = list(names)
+    found: list[Path] = []
+    for directory in (start, *start.parents):
+        found.extend(directory / name for name in names if (directory / name).is_file())
+    return found
+
+
+def project_sources(root: Path, extensions: Iterable[str]) -> list[Path]:
+    """List source files under root with the given extensions.
+
+    Skips hidden directories and build/dependency directories.
+    """
+    suffixes = tuple(extensions)
+    sources: list[Path] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(
+            d for d in dirnames if not d.startswith(".") and d not in _SKIP_DIRS
+        )
+        sources.extend(
+            Path(dirpath) / name
+            for name in sorted(filenames)
+            if name.endswith(suffixes)
+        )
+    return sources
+
+
+class LintCache:
+    """On-disk lint verdict cache with age and size eviction.
+
+    Entries are JSON files named by key; file mtime tracks last use so size
+    eviction drops least recently used entries first.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        *,
+        max_age_s: float = DEFAULT_MAX_AGE_S,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """Initialize the cache and evict expired entries.
+
+        Args:
+            cache_dir: Directory holding cache entries.
+            max_age_s: Evict entries unused for longer than this.
+            max_bytes: Evict least recently used entries above this total size.
+        """
+        self.cache_dir = cache_dir
+        self.max_age_s = max_age_s
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._puts = 0
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.evict()
+
+    def key_for(
+        self,
+        cmd: list[str],
+        paths: Iterable[Path],
+        inputs: Iterable[Path] = (),
+        sources: Iterable[Path] = (),
+    ) -> str:
+        """Build the cache key for running cmd against paths.
+
+        Reads and hashes files; call off the event loop.
+
+        Args:
+            cmd: Checker command line (identifies the checker and its flags).
+            paths: Files being checked.
+            inputs: Other files that affect the verdict (configs), by content.
+            sources: Project sources that affect the verdict, by
+                (mtime_ns, size).
+
+        Returns:
+            Hex key.
+        """
+        digest = hashlib.sha256("\0".join(cmd).encode())
+        for item in (*paths, *inputs):
+            digest.update(f"\0{item}\0{_sha256_file(item)}".encode())
+        for item in sources:
+            digest.update(f"\0{item}\0{_stat_stamp(item)}".encode())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str, *, label: str = "") -> LintVerdict | None:
+        """Return a cached verdict, or None on miss."""
+        path = self._path(key)
+        entry: LintVerdict | None = None
+        try:
+            entry = LintVerdict(**json.loads(path.read_text(encoding="utf-8")))
+        except FileNotFoundError:
+            pass
+        except (OSError, TypeError, ValueError):
+            logger.debug("Discarding unreadable lint cache entry: %s", path.name)
+            path.unlink(missing_ok=True)
+
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            path.touch()
+        logger.debug(
+            "Lint cache %s for %s (hit rate %.0f%%: %d/%d)",
+            "hit" if entry else "miss",
+            label,
+            self.hit_rate * 100,
+            self.hits,
+            self.hits + self.misses,
+        )
+        return entry
+
+    def put(self, key: str, verdict: LintVerdict) -> None:
+        """Store a verdict, enforcing limits every few writes."""
+        tmp = self._path(key).with_suffix(".tmp")
+        tmp.write_text(json.dumps(asdict(verdict)), encoding="utf-8")
+        tmp.replace(self._path(key))
+        self._puts += 1
+        if self._puts % _EVICT_EVERY == 0:
+            self.evict()
+
+    def evict(self) -> int:
+        """Remove expired entries, then oldest entries above the size limit.
+
+        Returns:
+            Number of entries removed.
+        """
+        now = time.time()
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        removed = 0
+        total = sum(size for _, size, _ in entries)
+        for mtime, size, path in sorted(entries):
+            if now - mtime <= self.max_age_s and total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        if removed:
+            logger.debug("Evicted %d lint cache entries", removed)
+        return removed
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def set_lint_cache_enabled(enabled: bool) -> None:
+    """Enable or disable the lint cache for this process (--no-cache)."""
+    global _enabled  # noqa: PLW0603
+    _enabled = enabled
+
+
+def get_lint_cache(root: Path | None = None) -> LintCache | None:
+    """Get the lint cache for a project root.
+
+    Args:
+        root: Project root path. Defaults to detected project root.
+
+    Returns:
+        LintCache, or None if caching is disabled.
+    """
+    if not _enabled:
+        return None
+    # Deferred: π.config imports π.hooks
+    from π.config import get_cache_dir  # noqa: PLC0415
+
+    root = root or get_project_root()
+    if root not in _caches:
+        _caches[root] = LintCache(get_cache_dir(root) / "lint")
+    return _caches[root]
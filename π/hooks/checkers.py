@@ -1,14 +1,29 @@
 """Language-specific code quality checkers."""
 
+import asyncio
+import logging
+import os
 import shutil
-from collections.abc import Callable
-from dataclasses import dataclass
+import time
+import tomllib
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from π.console import console
-from π.hooks.registry import language_checker
+from π.hooks.cache import (
+    LintCache,
+    LintVerdict,
+    find_config_files,
+    get_lint_cache,
+    project_sources,
+)
+from π.hooks.daemons import daemons_enabled, register_eslint_d, ruff_server_check
+from π.hooks.registry import batch_checker, language_checker
 from π.hooks.utils import compact_path, find_project_root, run_check_command
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class CheckerConfig:
@@ -17,66 +32,179 @@ class CheckerConfig:
     emoji: str
     language: str
     project_markers: list[str]
-    get_command: Callable[[Path, Path | None], tuple[list[str], str] | None]
+    # Builds one command checking all given files (same project root)
+    get_command: Callable[[list[Path], Path | None], tuple[list[str], str] | None]
+    # Files affecting the verdict, searched from each file's directory upward
+    config_files: list[str] = field(default_factory=list)
+    # Set for package-scoped checkers: lists the sources besides the checked
+    # files that the command's verdict depends on, given the command and its
+    # working dir, or returns None when the command spans the whole project
+    # (whose verdict is not cached, as any edit would invalidate it)
+    get_sources: Callable[[list[str], Path], list[Path] | None] | None = None
+    # Long-lived backend tried before the one-shot command; returns None to
+    # fall back (see π.hooks.daemons)
+    run_daemon: (
+        Callable[[list[Path], list[str]], Awaitable[tuple[int, str, str] | None]] | None
+    ) = None
+
+
+def _cache_key(
+    cache: LintCache,
+    cmd: list[str],
+    paths: list[Path],
+    config: CheckerConfig,
+    cwd: Path,
+) -> str | None:
+    """Key a check on the checked files, their configs and package sources.
+
+    Walks the package for package-scoped checkers; call off the event loop.
 
+    Returns:
+        The key, or None if the check is not cacheable.
+    """
+    inputs = list(
+        dict.fromkeys(
+            config_file
+            for path in paths
+            for config_file in find_config_files(path.parent, config.config_files)
+        )
+    )
+    sources: list[Path] | None = []
+    if config.get_sources and (sources := config.get_sources(cmd, cwd)) is None:
+        return None
+    return cache.key_for(cmd, paths, inputs, sources)
 
-def _run_checker(path: Path, config: CheckerConfig) -> int:
-    """Run a checker with the given configuration.
 
-    Args:
-        path: File path to check
-        config: Checker configuration
+def _describe(paths: list[Path]) -> str:
+    if len(paths) <= 3:
+        return ", ".join(compact_path(path) for path in paths)
+    return f"{len(paths)} files"
+
+
+async def _run_check(
+    paths: list[Path], config: CheckerConfig, cmd: list[str], name: str, cwd: Path
+) -> LintVerdict:
+    """Run a check via the checker's daemon, falling back to the command."""
+    result = await config.run_daemon(paths, cmd) if config.run_daemon else None
+    exit_code, stdout, stderr = result or await run_check_command(
+        cwd=cwd, cmd=cmd, name=name
+    )
+    return LintVerdict(exit_code=exit_code, output=stderr or stdout)
+
+
+async def _check_group(
+    paths: list[Path], config: CheckerConfig, project_root: Path | None
+) -> int:
+    """Check files sharing a project root with a single command.
 
     Returns:
         Exit code (0=success, 2=failure)
     """
-    project_root = None
-    if config.project_markers:
-        project_root = find_project_root(path.parent, config.project_markers)
-        if not project_root:
-            markers = ", ".join(config.project_markers)
-            console.print(f"⚠️  No {markers} found for {compact_path(path)}")
-            return 0
-
     console.print(
-        f"{config.emoji} Running {config.language} checks for {compact_path(path)}..."
+        f"{config.emoji} Running {config.language} checks for {_describe(paths)}..."
     )
 
-    cmd_result = config.get_command(path, project_root)
+    cmd_result = config.get_command(paths, project_root)
     if cmd_result is None:
         return 0
 
     cmd, name = cmd_result
-    cwd = project_root or path.parent
-
-    exit_code, stdout, stderr = run_check_command(cwd=cwd, cmd=cmd, name=name)
-
-    if exit_code != 0:
-        output = stderr or stdout
-        if output:
-            console.print(output, end="")
+    cwd = project_root or paths[0].parent
+
+    cache = get_lint_cache()
+    verdict = None
+    key = None
+    if cache:
+        key = await asyncio.to_thread(_cache_key, cache, cmd, paths, config, cwd)
+    if cache and key:
+        verdict = cache.get(key, label=f"{name} {_describe(paths)}")
+
+    if verdict is None:
+        start = time.monotonic()
+        verdict = await _run_check(paths, config, cmd, name, cwd)
+        elapsed = time.monotonic() - start
+        logger.debug("%s for %s took %.2fs", name, _describe(paths), elapsed)
+        # Key on post-run content: fixers (ruff --fix) may rewrite files
+        if cache and key and verdict.exit_code not in {124, 127}:
+            key = await asyncio.to_thread(_cache_key, cache, cmd, paths, config, cwd)
+            if key:
+                cache.put(key, verdict)
+        detail = f"{name}, {elapsed:.2f}s"
+    else:
+        detail = "cached"
+
+    if verdict.exit_code != 0:
+        if verdict.output:
+            console.print(verdict.output, end="")
+        console.print(f"❌ {config.language} checks failed ({detail})")
         return 2
 
-    console.print(f"✅ {config.language} checks passed")
+    console.print(f"✅ {config.language} checks passed ({detail})")
     return 0
 
 
+async def _run_checker(paths: list[Path], config: CheckerConfig) -> int:
+    """Run a checker with the given configuration.
+
+    Files are grouped by project root and each group is checked with one
+    command invocation.
+
+    Args:
+        paths: File paths to check
+        config: Checker configuration
+
+    Returns:
+        Exit code (0=success, 2=failure)
+    """
+    groups: dict[Path | None, list[Path]] = {}
+    for path in dict.fromkeys(paths):
+        project_root = None
+        if config.project_markers:
+            project_root = find_project_root(path.parent, config.project_markers)
+            if not project_root:
+                markers = ", ".join(config.project_markers)
+                console.print(f"⚠️  No {markers} found for {compact_path(path)}")
+                continue
+        groups.setdefault(project_root, []).append(path)
+
+    exit_code = 0
+    for project_root, group in groups.items():
+        exit_code = max(exit_code, await _check_group(group, config, project_root))
+    return exit_code
+
+
 # --- Command builders ---
 
 
 def _python_command(
-    path: Path, _project_root: Path | None
+    paths: list[Path], _project_root: Path | None
 ) -> tuple[list[str], str] | None:
+    files = [str(path) for path in paths]
     if shutil.which("uvx"):
-        return ["uvx", "ruff", "check", "--fix", str(path)], "ruff"
+        return ["uvx", "ruff", "check", "--fix", *files], "ruff"
     if shutil.which("ruff"):
-        return ["ruff", "check", "--fix", str(path)], "ruff"
+        return ["ruff", "check", "--fix", *files], "ruff"
     console.print("⚠️  Ruff not found")
     return None
 
 
+async def _python_daemon(
+    paths: list[Path], cmd: list[str]
+) -> tuple[int, str, str] | None:
+    # Same launcher as the one-shot command: "uvx ruff ..." or "ruff ..."
+    server_cmd = [*cmd[: cmd.index("check")], "server"]
+    exit_code, outputs = 0, []
+    for path in paths:
+        result = await ruff_server_check(server_cmd, path)
+        if result is None:
+            return None
+        exit_code = max(exit_code, result[0])
+        outputs.append(result[1])
+    return exit_code, "".join(outputs), ""
+
+
 def _typescript_command(
-    path: Path,
+    paths: list[Path],
     project_root: Path | None,
 ) -> tuple[list[str], str] | None:
     if not project_root:
@@ -93,25 +221,120 @@ def _typescript_command(
         console.print("⚠️  No ESLint configuration found")
         return None
 
-    relative_path = path.relative_to(project_root)
-    return ["npx", "eslint", str(relative_path)], "eslint"
+    files = [str(path.relative_to(project_root)) for path in paths]
+
+    # Prefer the eslint_d daemon, then the local binary; npx resolves per call
+    bin_dir = str(project_root / "node_modules" / ".bin")
+    if daemons_enabled() and (
+        eslint_d := shutil.which("eslint_d", path=bin_dir) or shutil.which("eslint_d")
+    ):
+        register_eslint_d(eslint_d, project_root)
+        return [eslint_d, *files], "eslint_d"
+    if eslint := shutil.which("eslint", path=bin_dir):
+        return [eslint, *files], "eslint"
+    return ["npx", "eslint", *files], "eslint"
+
+
+def _read_manifest(manifest: Path) -> dict:
+    try:
+        return tomllib.loads(manifest.read_text(encoding="utf-8"))
+    except (OSError, tomllib.TOMLDecodeError):
+        return {}
+
+
+def _cargo_workspace_root(crate_dir: Path) -> Path:
+    """Return the nearest directory declaring [workspace], else crate_dir."""
+    for directory in (crate_dir, *crate_dir.parents):
+        manifest = directory / "Cargo.toml"
+        if manifest.is_file() and "workspace" in _read_manifest(manifest):
+            return directory
+    return crate_dir
+
+
+def _local_crates(crate_dir: Path) -> list[Path]:
+    """Return crate_dir and the crates it depends on by path, transitively."""
+    workspace = _cargo_workspace_root(crate_dir)
+    workspace_deps = (
+        _read_manifest(workspace / "Cargo.toml")
+        .get("workspace", {})
+        .get("dependencies", {})
+    )
+    crates: dict[Path, None] = {}
+    pending = [crate_dir]
+    while pending:
+        crate = pending.pop()
+        if crate in crates:
+            continue
+        crates[crate] = None
+        manifest = _read_manifest(crate / "Cargo.toml")
+        for table in ("dependencies", "dev-dependencies", "build-dependencies"):
+            for name, dep in manifest.get(table, {}).items():
+                spec, base = dep, crate
+                if isinstance(dep, dict) and dep.get("workspace"):
+                    spec, base = workspace_deps.get(name), workspace
+                if isinstance(spec, dict) and isinstance(path := spec.get("path"), str):
+                    pending.append(Path(os.path.normpath(base / path)))
+    return list(crates)
+
+
+def _rust_sources(cmd: list[str], cwd: Path) -> list[Path] | None:
+    # `cargo check -p` (run in the crate's dir) depends on the crate and its
+    # local path dependencies; plain `cargo check` spans the workspace
+    if "-p" not in cmd:
+        return None
+    sources: list[Path] = []
+    for crate in _local_crates(cwd):
+        sources.append(crate / "Cargo.toml")
+        sources.extend(project_sources(crate, [".rs"]))
+    return sources
+
+
+def _rust_command(
+    _paths: list[Path], project_root: Path | None
+) -> tuple[list[str], str]:
+    # project_root is the nearest Cargo.toml: check only the owning crate
+    package = (
+        _read_manifest(project_root / "Cargo.toml").get("package", {})
+        if project_root
+        else {}
+    )
+    if isinstance(name := package.get("name"), str):
+        return ["cargo", "check", "-p", name], f"cargo check -p {name}"
+    return ["cargo", "check"], "cargo check"
 
 
-def _rust_command(_path: Path, _project_root: Path | None) -> tuple[list[str], str]:
-    return ["cargo", "check"], "cargo check"
+def _go_package(path: Path, project_root: Path | None) -> str:
+    """Return the package pattern for a file within its module."""
+    if project_root and path.parent.is_relative_to(project_root):
+        package_dir = path.parent.relative_to(project_root).as_posix()
+        return "." if package_dir == "." else f"./{package_dir}"
+    return "./..."
 
 
-def _go_command(_path: Path, _project_root: Path | None) -> tuple[list[str], str]:
+def _go_command(paths: list[Path], project_root: Path | None) -> tuple[list[str], str]:
+    # Check only the edited files' package directories within the module
+    targets = list(dict.fromkeys(_go_package(path, project_root) for path in paths))
+    label = " ".join(targets)
     if shutil.which("golangci-lint"):
-        return ["golangci-lint", "run", "./..."], "golangci-lint"
-    return ["go", "vet", "./..."], "go vet"
+        return ["golangci-lint", "run", *targets], f"golangci-lint run {label}"
+    return ["go", "vet", *targets], f"go vet {label}"
+
+
+def _go_sources(cmd: list[str], cwd: Path) -> list[Path] | None:
+    # Package targets are directories relative to the module root (cwd)
+    targets = [arg for arg in cmd if arg.startswith(".")]
+    if "./..." in targets:
+        return None
+    return [path for target in targets for path in sorted((cwd / target).glob("*.go"))]
 
 
 # --- Checker configurations ---
 
 _PYTHON = CheckerConfig(
     get_command=_python_command,
+    run_daemon=_python_daemon,
     project_markers=[],
+    config_files=["pyproject.toml", "ruff.toml", ".ruff.toml"],
     language="Python",
     emoji="🐍",
 )
@@ -119,6 +342,15 @@ _PYTHON = CheckerConfig(
 _TYPESCRIPT = CheckerConfig(
     project_markers=["package.json"],
     get_command=_typescript_command,
+    config_files=[
+        "package.json",
+        "tsconfig.json",
+        "eslint.config.mjs",
+        "eslint.config.js",
+        ".eslintrc.json",
+        ".eslintrc.js",
+        ".eslintrc.cjs",
+    ],
     language="TypeScript/JS",
     emoji="📦",
 )
@@ -126,6 +358,8 @@ _TYPESCRIPT = CheckerConfig(
 _RUST = CheckerConfig(
     project_markers=["Cargo.toml"],
     get_command=_rust_command,
+    config_files=["Cargo.toml", "Cargo.lock"],
+    get_sources=_rust_sources,
     language="Rust",
     emoji="🦀",
 )
@@ -133,6 +367,8 @@ _RUST = CheckerConfig(
 _GO = CheckerConfig(
     project_markers=["go.mod"],
     get_command=_go_command,
+    config_files=["go.mod", "go.sum", ".golangci.yml", ".golangci.yaml"],
+    get_sources=_go_sources,
     language="Go",
     emoji="🔵",
 )
@@ -142,24 +378,48 @@ _GO = CheckerConfig(
 
 
 @language_checker([".py", ".pyx"])
-def check_python(path: Path, _tool_name: str | None = None) -> int:
+async def check_python(path: Path, _tool_name: str | None = None) -> int:
     """Run Python checks using ruff."""
-    return _run_checker(path, _PYTHON)
+    return await _run_checker([path], _PYTHON)
+
+
+@batch_checker(check_python)
+async def check_python_batch(paths: list[Path]) -> int:
+    """Run Python checks on several files with one ruff invocation."""
+    return await _run_checker(paths, _PYTHON)
 
 
 @language_checker([".ts", ".tsx", ".js", ".jsx"])
-def check_typescript(path: Path, _tool_name: str | None = None) -> int:
+async def check_typescript(path: Path, _tool_name: str | None = None) -> int:
     """Run TypeScript/JavaScript checks using ESLint."""
-    return _run_checker(path, _TYPESCRIPT)
+    return await _run_checker([path], _TYPESCRIPT)
+
+
+@batch_checker(check_typescript)
+async def check_typescript_batch(paths: list[Path]) -> int:
+    """Run ESLint once per project for several files."""
+    return await _run_checker(paths, _TYPESCRIPT)
 
 
 @language_checker([".rs"])
-def check_rust(path: Path, _tool_name: str | None = None) -> int:
-    """Run Rust checks using cargo check."""
-    return _run_checker(path, _RUST)
+async def check_rust(path: Path, _tool_name: str | None = None) -> int:
+    """Run Rust checks using cargo check on the owning crate."""
+    return await _run_checker([path], _RUST)
+
+
+@batch_checker(check_rust)
+async def check_rust_batch(paths: list[Path]) -> int:
+    """Run cargo check once per owning crate for several files."""
+    return await _run_checker(paths, _RUST)
 
 
 @language_checker([".go"])
-def check_go(path: Path, _tool_name: str | None = None) -> int:
-    """Run Go checks using golangci-lint (preferred) or go vet (fallback)."""
-    return _run_checker(path, _GO)
+async def check_go(path: Path, _tool_name: str | None = None) -> int:
+    """Run Go checks on the owning package with golangci-lint or go vet."""
+    return await _run_checker([path], _GO)
+
+
+@batch_checker(check_go)
+async def check_go_batch(paths: list[Path]) -> int:
+    """Run Go checks once per module over the edited files' packages."""
+    return await _run_checker(paths, _GO)
@@ -0,0 +1,279 @@
+"""Argument-level dangerous command rules over parsed shell commands.
+
+Rules see each simple command from π.hooks.shell with its argv, redirects
+and the directory earlier `cd`s moved to, so they can tell `rm -rf ./build`
+from `cd / && rm -rf .` and ignore quoted prose. Rules are registered per
+program name with @command_rule; pipeline rules look across stages.
+"""
+
+from __future__ import annotations
+
+import posixpath
+from itertools import pairwise
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from π.hooks.shell import SHELLS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from π.hooks.shell import SimpleCommand
+
+    type CommandRule = Callable[[SimpleCommand, str], str | None]
+
+# Directories whose removal or takeover wrecks the machine
+_SYSTEM_DIRS = frozenset({
+    "/",
+    "/bin",
+    "/boot",
+    "/dev",
+    "/etc",
+    "/home",
+    "/lib",
+    "/lib64",
+    "/opt",
+    "/proc",
+    "/root",
+    "/sbin",
+    "/srv",
+    "/sys",
+    "/usr",
+    "/var",
+})
+_CRITICAL_FILES = frozenset({"passwd", "shadow", "sudoers", "hosts"})
+_DISK_DEVICES = (
+    "/dev/sd",
+    "/dev/hd",
+    "/dev/vd",
+    "/dev/nvme",
+    "/dev/disk",
+    "/dev/mmcblk",
+)
+_FETCHERS = frozenset({"curl", "wget"})
+_HOME_FORMS = ("~", "$HOME", "${HOME}")
+_TRUNCATING = (">", ">|", "&>")
+_DUPLICATING = (">&", "<&")
+
+# Rules by program name; "" holds rules for every command
+_command_rules: dict[str, list[CommandRule]] = {}
+
+
+def command_rule(*programs: str) -> Callable[[CommandRule], CommandRule]:
+    """Register a rule for commands running one of programs (all if none).
+
+    A rule takes the command and the absolute starting directory, and
+    returns a reason to block it or None.
+    """
+
+    def register(rule: CommandRule) -> CommandRule:
+        for program in programs or ("",):
+            _command_rules.setdefault(program, []).append(rule)
+        return rule
+
+    return register
+
+
+def _expand_home(path: str) -> str:
+    for form in _HOME_FORMS:
+        if path == form or path.startswith(f"{form}/"):
+            return str(Path.home()) + path[len(form) :]
+    return path
+
+
+def resolve_path(cmd: SimpleCommand, path: str, start: str) -> str | None:
+    """Resolve a path argument to an absolute path, if it can be known.
+
+    Args:
+        cmd: Command the argument belongs to (for its cd directory).
+        path: Path as written; `~` and `$HOME` are expanded.
+        start: Absolute directory the command line starts in.
+
+    Returns:
+        Normalized absolute path, or None if it depends on unknown state.
+    """
+    path = _expand_home(path)
+    if "$" in path or "`" in path:
+        return None
+    if not path.startswith("/"):
+        if cmd.cwd is None:
+            return None
+        # cmd.cwd is itself relative to start (or absolute after `cd /x`)
+        path = posixpath.join(start, _expand_home(cmd.cwd), path)
+    normalized = posixpath.normpath(path)
+    # POSIX keeps a leading //, which names the same root here
+    return "/" + normalized.lstrip("/")
+
+
+def _is_protected(cmd: SimpleCommand, path: str, start: str) -> bool:
+    """Check whether path is the root, the home directory or a system dir.
+
+    Globs of a protected directory's contents (`/*`, `~/*`) count too.
+    """
+    if path in ("*", ".*"):
+        return True
+    directory, name = posixpath.split(path)
+    if name in ("*", ".*") and directory:
+        path = directory
+    resolved = resolve_path(cmd, path, start)
+    return resolved is not None and (
+        resolved in _SYSTEM_DIRS or resolved == str(Path.home())
+    )
+
+
+def _split_args(args: tuple[str, ...]) -> tuple[list[str], list[str]]:
+    """Split arguments into options and operands (`--` ends options)."""
+    options: list[str] = []
+    operands: list[str] = []
+    for i, arg in enumerate(args):
+        if arg == "--":
+            operands.extend(args[i + 1 :])
+            break
+        (options if arg.startswith("-") and arg != "-" else operands).append(arg)
+    return options, operands
+
+
+def _has_flag(options: list[str], short: str, long: str) -> bool:
+    return any(
+        opt == long or (not opt.startswith("--") and short in opt) for opt in options
+    )
+
+
+@command_rule("rm")
+def _rm(cmd: SimpleCommand, start: str) -> str | None:
+    _, targets = _split_args(cmd.argv[1:])
+    if any(_is_protected(cmd, target, start) for target in targets):
+        return "Dangerous rm"
+    return None
+
+
+@command_rule("find")
+def _find_delete(cmd: SimpleCommand, start: str) -> str | None:
+    args = cmd.argv[1:]
+    roots = []
+    for arg in args:
+        if arg.startswith(("-", "(", "!")):
+            break
+        roots.append(arg)
+    deletes = "-delete" in args or any(
+        arg in ("-exec", "-execdir") and posixpath.basename(nxt) == "rm"
+        for arg, nxt in pairwise(args)
+    )
+    if deletes and any(_is_protected(cmd, root, start) for root in roots):
+        return "Dangerous find delete"
+    return None
+
+
+@command_rule("dd")
+def _dd(cmd: SimpleCommand, start: str) -> str | None:  # noqa: ARG001
+    if any(arg.startswith("of=/dev/") for arg in cmd.argv[1:]):
+        return "Direct disk write"
+    return None
+
+
+@command_rule("fdisk", "sfdisk", "parted", "wipefs")
+def _partition(cmd: SimpleCommand, start: str) -> str | None:  # noqa: ARG001
+    if any(arg.startswith("/dev/") for arg in cmd.argv[1:]):
+        return "Disk partitioning"
+    return None
+
+
+@command_rule("chmod")
+def _chmod(cmd: SimpleCommand, start: str) -> str | None:
+    _, operands = _split_args(cmd.argv[1:])
+    if operands[:1] in (["777"], ["0777"], ["a+rwx"]) and any(
+        _is_protected(cmd, target, start) for target in operands[1:]
+    ):
+        return "Recursive chmod 777 on root"
+    return None
+
+
+@command_rule("chown")
+def _chown(cmd: SimpleCommand, start: str) -> str | None:
+    options, operands = _split_args(cmd.argv[1:])
+    if _has_flag(options, "R", "--recursive") and any(
+        _is_protected(cmd, target, start) for target in operands[1:]
+    ):
+        return "Recursive chown on root"
+    return None
+
+
+@command_rule("truncate")
+def _truncate(cmd: SimpleCommand, start: str) -> str | None:
+    _, operands = _split_args(cmd.argv[1:])
+    for target in operands:
+        resolved = resolve_path(cmd, target, start)
+        if resolved and resolved.startswith(("/etc/", "/var/", "/usr/")):
+            return "Truncating system file"
+    return None
+
+
+@command_rule()
+def _mkfs(cmd: SimpleCommand, start: str) -> str | None:  # noqa: ARG001
+    if cmd.program == "mkfs" or cmd.program.startswith(("mkfs.", "mke2fs")):
+        return "File system formatting"
+    return None
+
+
+@command_rule()
+def _recursive_function(cmd: SimpleCommand, start: str) -> str | None:  # noqa: ARG001
+    # :(){ :|:& };: — a one-line function that spawns itself
+    if cmd.function is not None and cmd.program == cmd.function:
+        return "Fork bomb"
+    return None
+
+
+@command_rule()
+def _write_redirects(cmd: SimpleCommand, start: str) -> str | None:
+    for redirect in cmd.redirects:
+        operator = redirect.operator.lstrip("0123456789")
+        if ">" not in operator or operator in _DUPLICATING:
+            continue
+        target = resolve_path(cmd, redirect.target, start)
+        if target is None:
+            continue
+        if target.startswith(_DISK_DEVICES):
+            return "Direct write to disk device"
+        if target.startswith("/etc/"):
+            if posixpath.basename(target) in _CRITICAL_FILES:
+                return "Overwriting critical system file"
+            if operator in _TRUNCATING:
+                return "Truncating /etc file"
+    return None
+
+
+def check_command(cmd: SimpleCommand, start: str) -> str | None:
+    """Run the registered rules for a simple command.
+
+    Args:
+        cmd: Parsed simple command.
+        start: Absolute directory the command line starts in.
+
+    Returns:
+        Reason of the first matching rule, or None if none matched.
+    """
+    for rule in (*_command_rules.get(cmd.program, ()), *_command_rules.get("", ())):
+        if reason := rule(cmd, start):
+            return reason
+    return None
+
+
+def check_pipeline(stages: tuple[SimpleCommand, ...], start: str) -> str | None:
+    """Run rules across a pipeline, then for each of its commands.
+
+    Args:
+        stages: Commands of one pipeline in order.
+        start: Absolute directory the command line starts in.
+
+    Returns:
+        Reason of the first matching rule, or None if none matched.
+    """
+    fetched = False
+    for cmd in stages:
+        shell_runs_fetch = cmd.program in SHELLS and _FETCHERS & set(cmd.substituted)
+        if (fetched and cmd.program in SHELLS) or shell_runs_fetch:
+            return "Piping curl/wget to shell"
+        fetched = fetched or cmd.program in _FETCHERS
+        if reason := check_command(cmd, start):
+            return reason
+    return None
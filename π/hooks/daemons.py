@@ -0,0 +1,396 @@
+"""Long-lived checker backends shared across edits in a workflow.
+
+Launching `uvx ruff check` or `npx eslint` per edit pays tool resolution
+and process startup every time, which dominates hook latency in implement
+stages that touch many files. Backends here start on first use, serve every
+later check over a pipe, and are shut down with the workflow:
+
+- ruff: `ruff server` spoken to over LSP (stdio). Fixes come from the
+  `source.fixAll.ruff` code action and are written back to the file, then
+  remaining diagnostics are pulled, matching `ruff check --fix`.
+- eslint: `eslint_d`, when installed, keeps its own Node daemon; it is
+  stopped at shutdown.
+
+Any backend failure returns None so callers fall back to the one-shot
+command. Set PI_LINT_DAEMONS=0 to always use one-shot commands.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import time
+from os import getenv
+from typing import TYPE_CHECKING, Any
+
+from π.hooks.utils import run_check_command
+from π.utils import get_project_root
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Environment variable disabling checker daemons ("0" = one-shot commands only)
+DAEMONS_ENV = "PI_LINT_DAEMONS"
+
+REQUEST_TIMEOUT_S = 30.0
+_SHUTDOWN_TIMEOUT_S = 2.0
+
+# Module-level backends, bound to the event loop that created them
+_ruff_servers: dict[Path, RuffServer] = {}
+_eslint_d: dict[Path, str] = {}
+_daemon_loop: asyncio.AbstractEventLoop | None = None
+
+
+def daemons_enabled() -> bool:
+    """Whether checker daemons are enabled (PI_LINT_DAEMONS)."""
+    return getenv(DAEMONS_ENV, "1") != "0"
+
+
+def _apply_edits(text: str, edits: list[dict]) -> str:
+    """Apply LSP TextEdits (UTF-32 positions) to text."""
+    lines = text.splitlines(keepends=True)
+    starts = [0]
+    for line in lines:
+        starts.append(starts[-1] + len(line))
+
+    def offset(position: dict) -> int:
+        line = position["line"]
+        if line >= len(lines):
+            return len(text)
+        return starts[line] + position["character"]
+
+    spans = sorted(
+        (
+            (offset(e["range"]["start"]), offset(e["range"]["end"]), e["newText"])
+            for e in edits
+        ),
+        reverse=True,
+    )
+    for start, end, new_text in spans:
+        text = text[:start] + new_text + text[end:]
+    return text
+
+
+def _workspace_edits(actions: list[dict] | None, uri: str) -> list[dict]:
+    """Collect TextEdits for uri from code action WorkspaceEdits."""
+    edits: list[dict] = []
+    for action in actions or []:
+        edit = action.get("edit") or {}
+        edits.extend((edit.get("changes") or {}).get(uri, []))
+        for change in edit.get("documentChanges") or []:
+            if change.get("textDocument", {}).get("uri") == uri:
+                edits.extend(change.get("edits", []))
+    return edits
+
+
+def _format_diagnostics(path: Path, items: list[dict]) -> str:
+    """Render pulled diagnostics like `ruff check` output."""
+    lines = []
+    for item in items:
+        start = item["range"]["start"]
+        code = f"{item['code']} " if item.get("code") else ""
+        lines.append(
+            f"{path}:{start['line'] + 1}:{start['character'] + 1}: "
+            f"{code}{item['message']}"
+        )
+    noun = "error" if len(items) == 1 else "errors"
+    lines.append(f"Found {len(items)} {noun}.")
+    return "\n".join(lines) + "\n"
+
+
+class RuffServer:
+    """Minimal LSP client for a `ruff server` process.
+
+    Usage:
+        server = RuffServer(["ruff", "server"], root)
+        if await server.start():
+            result = await server.check(path)
+        await server.close()
+    """
+
+    def __init__(self, cmd: list[str], root: Path) -> None:
+        """Initialize an unstarted server.
+
+        Args:
+            cmd: Command that runs the ruff language server over stdio.
+            root: Workspace root (settings are resolved within it).
+        """
+        self.cmd = cmd
+        self.root = root
+        self._proc: asyncio.subprocess.Process | None = None
+        self._reader: asyncio.Task[None] | None = None
+        self._pending: dict[int, asyncio.Future[Any]] = {}
+        self._next_id = 0
+        self._started: bool | None = None
+        self._start_lock = asyncio.Lock()
+        self._check_lock = asyncio.Lock()
+
+    @property
+    def alive(self) -> bool:
+        """Whether the server process is running and initialized."""
+        return (
+            bool(self._started)
+            and self._proc is not None
+            and (self._proc.returncode is None)
+        )
+
+    async def start(self) -> bool:
+        """Start and initialize the server once; later calls reuse the result.
+
+        Returns:
+            True if the server is ready to serve checks.
+        """
+        async with self._start_lock:
+            if self._started is None:
+                start = time.monotonic()
+                try:
+                    await self._initialize()
+                    self._started = True
+                    logger.debug(
+                        "Started %s in %.2fs",
+                        " ".join(self.cmd),
+                        time.monotonic() - start,
+                    )
+                except Exception:
+                    logger.debug("Failed to start %s", self.cmd, exc_info=True)
+                    self._started = False
+                    await self._terminate()
+            return self.alive
+
+    async def _initialize(self) -> None:
+        self._proc = await asyncio.create_subprocess_exec(
+            *self.cmd,
+            cwd=self.root,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        self._reader = asyncio.create_task(self._read_loop())
+        result = await self._request(
+            "initialize",
+            {
+                "processId": None,
+                "rootUri": self.root.as_uri(),
+                "workspaceFolders": [
+                    {"uri": self.root.as_uri(), "name": self.root.name}
+                ],
+                "capabilities": {
+                    "general": {"positionEncodings": ["utf-32"]},
+                    "textDocument": {
+                        "codeAction": {
+                            "codeActionLiteralSupport": {
+                                "codeActionKind": {"valueSet": ["source.fixAll.ruff"]}
+                            }
+                        },
+                        "diagnostic": {},
+                    },
+                },
+            },
+        )
+        encoding = result.get("capabilities", {}).get("positionEncoding", "utf-16")
+        if encoding != "utf-32":
+            msg = f"unsupported position encoding: {encoding}"
+            raise RuntimeError(msg)
+        self._notify("initialized", {})
+
+    def _send(self, message: dict) -> None:
+        if self._proc is None or self._proc.stdin is None:
+            msg = "ruff server is not running"
+            raise ConnectionError(msg)
+        body = json.dumps({"jsonrpc": "2.0", **message}).encode()
+        self._proc.stdin.write(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+
+    def _notify(self, method: str, params: dict) -> None:
+        self._send({"method": method, "params": params})
+
+    async def _request(self, method: str, params: dict | None) -> Any:
+        self._next_id += 1
+        request_id = self._next_id
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            self._send({"id": request_id, "method": method, "params": params})
+            return await asyncio.wait_for(future, REQUEST_TIMEOUT_S)
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def _read_message(self) -> dict:
+        if self._proc is None or self._proc.stdout is None:
+            raise EOFError
+        length = 0
+        while line := (await self._proc.stdout.readline()).strip():
+            name, _, value = line.decode().partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        if not length:
+            raise EOFError
+        return json.loads(await self._proc.stdout.readexactly(length))
+
+    async def _read_loop(self) -> None:
+        try:
+            while True:
+                message = await self._read_message()
+                if "method" not in message:
+                    future = self._pending.get(message.get("id", -1))
+                    if future and not future.done():
+                        if "error" in message:
+                            future.set_exception(RuntimeError(message["error"]))
+                        else:
+                            future.set_result(message.get("result"))
+                elif "id" in message:
+                    # Server requests (configuration, progress): answer empty
+                    items = (message.get("params") or {}).get("items")
+                    result = [None] * len(items) if items else None
+                    self._send({"id": message["id"], "result": result})
+        except (EOFError, asyncio.IncompleteReadError, ValueError, OSError) as e:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError(f"ruff server exited: {e}"))
+
+    async def check(self, path: Path) -> tuple[int, str, str] | None:
+        """Fix and lint a file, like `ruff check --fix <path>`.
+
+        Args:
+            path: Python file to check (fixes are written back to it).
+
+        Returns:
+            Tuple of (exit_code, stdout, stderr), or None if the server
+            failed and the caller should fall back to the one-shot command.
+        """
+        if not await self.start():
+            return None
+        async with self._check_lock:
+            try:
+                return await self._check(path)
+            except Exception:
+                logger.debug("ruff server check failed for %s", path, exc_info=True)
+                await self._terminate()
+                return None
+
+    async def _check(self, path: Path) -> tuple[int, str, str]:
+        text = path.read_text(encoding="utf-8")
+        uri = path.resolve().as_uri()
+        self._notify(
+            "textDocument/didOpen",
+            {
+                "textDocument": {
+                    "uri": uri,
+                    "languageId": "python",
+                    "version": 1,
+                    "text": text,
+                }
+            },
+        )
+        try:
+            actions = await self._request(
+                "textDocument/codeAction",
+                {
+                    "textDocument": {"uri": uri},
+                    "range": {
+                        "start": {"line": 0, "character": 0},
+                        "end": {"line": text.count("\n") + 1, "character": 0},
+                    },
+                    "context": {"diagnostics": [], "only": ["source.fixAll.ruff"]},
+                },
+            )
+            fixed = _apply_edits(text, _workspace_edits(actions, uri))
+            if fixed != text:
+                path.write_text(fixed, encoding="utf-8")
+                self._notify(
+                    "textDocument/didChange",
+                    {
+                        "textDocument": {"uri": uri, "version": 2},
+                        "contentChanges": [{"text": fixed}],
+                    },
+                )
+            report = await self._request(
+                "textDocument/diagnostic", {"textDocument": {"uri": uri}}
+            )
+        finally:
+            self._notify("textDocument/didClose", {"textDocument": {"uri": uri}})
+
+        items = (report or {}).get("items", [])
+        if not items:
+            return (0, "All checks passed!\n", "")
+        return (1, _format_diagnostics(path, items), "")
+
+    async def _terminate(self) -> None:
+        self._started = False
+        proc, self._proc = self._proc, None
+        if proc is not None and proc.returncode is None:
+            with contextlib.suppress(ProcessLookupError):
+                proc.kill()
+            await proc.wait()
+        if self._reader is not None:
+            self._reader.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._reader
+
+    async def close(self) -> None:
+        """Shut the server down gracefully, killing it if unresponsive."""
+        if self.alive and self._proc is not None:
+            try:
+                await asyncio.wait_for(
+                    self._request("shutdown", None), _SHUTDOWN_TIMEOUT_S
+                )
+                self._notify("exit", {})
+                await asyncio.wait_for(self._proc.wait(), _SHUTDOWN_TIMEOUT_S)
+            except Exception:
+                logger.debug("ruff server did not shut down cleanly", exc_info=True)
+        await self._terminate()
+
+
+def _bind_loop() -> None:
+    """Drop backends created on a different (finished) event loop."""
+    global _daemon_loop  # noqa: PLW0603
+    loop = asyncio.get_running_loop()
+    if _daemon_loop is not loop:
+        _ruff_servers.clear()
+        _eslint_d.clear()
+        _daemon_loop = loop
+
+
+async def ruff_server_check(cmd: list[str], path: Path) -> tuple[int, str, str] | None:
+    """Check a file with the workflow's shared ruff server.
+
+    Args:
+        cmd: Command that runs `ruff server` (e.g. ["uvx", "ruff", "server"]).
+        path: Python file to check.
+
+    Returns:
+        Tuple of (exit_code, stdout, stderr), or None to fall back to the
+        one-shot command (daemons disabled, file outside the project root,
+        or server failure).
+    """
+    if not daemons_enabled():
+        return None
+    root = get_project_root()
+    if not path.resolve().is_relative_to(root.resolve()):
+        return None
+    _bind_loop()
+    server = _ruff_servers.setdefault(root, RuffServer(cmd, root))
+    return await server.check(path)
+
+
+def register_eslint_d(executable: str, project_root: Path) -> None:
+    """Record an eslint_d daemon to stop at shutdown."""
+    _bind_loop()
+    _eslint_d[project_root] = executable
+
+
+async def close_checker_daemons() -> None:
+    """Shut down all checker daemons (call once per workflow run)."""
+    global _daemon_loop  # noqa: PLW0603
+    for server in list(_ruff_servers.values()):
+        await server.close()
+    for root, executable in list(_eslint_d.items()):
+        await run_check_command(
+            cwd=root, cmd=[executable, "stop"], name="eslint_d stop", timeout=10
+        )
+    _ruff_servers.clear()
+    _eslint_d.clear()
+    _daemon_loop = None
@@ -1,4 +1,10 @@
-"""PostToolUse hook for code quality checks after file modifications."""
+"""PostToolUse hook for code quality checks after file modifications.
+
+Edits are linted through the debounced scheduler (π.hooks.scheduler): the
+PostToolUse hook queues the file and reports its earlier failures, the Stop hook
+flushes the queue before the turn ends, and a PreToolUse hook keeps edits
+from racing an in-flight fixer on the same file.
+"""
 
 from pathlib import Path
 
@@ -6,19 +12,27 @@ from claude_agent_sdk.types import HookContext, HookInput, HookJSONOutput
 
 from π.console import console
 from π.hooks.registry import get_checker
-from π.hooks.result import Block, HookResult, PassThrough, to_post_hook_output
+from π.hooks.result import (
+    Block,
+    HookResult,
+    PassThrough,
+    to_post_hook_output,
+    to_stop_hook_output,
+)
+from π.hooks.scheduler import (
+    LintFailure,
+    get_lint_scheduler,
+    lint_debounce_s,
+    run_checker,
+)
 from π.hooks.utils import compact_path
 
 
-def _check_edit(tool_name: str | None, tool_input: dict) -> HookResult:
-    """Check if file modification passes quality checks.
-
-    Args:
-        tool_name: Name of the tool that triggered the hook.
-        tool_input: Input parameters from the tool.
+def _edit_target(tool_name: str | None, tool_input: dict) -> Path | PassThrough:
+    """Resolve the file an Edit/Write produced, if it can be checked.
 
     Returns:
-        PassThrough if checks pass or don't apply, Block if checks fail.
+        The file path, or PassThrough explaining why no check applies.
     """
     # Only check files modified by Edit or Write tools
     if tool_name not in ("Edit", "Write"):
@@ -32,23 +46,76 @@ def _check_edit(tool_name: str | None, tool_input: dict) -> HookResult:
     if not path.exists():
         return PassThrough(reason="file_not_found")
 
-    suffix = path.suffix.lower()
-    checker = get_checker(suffix)
+    if not get_checker(path.suffix.lower()):
+        return PassThrough(reason="no_checker_for_extension")
+
+    return path
+
+
+def _failure_block(failures: list[LintFailure]) -> Block:
+    failed = dict.fromkeys(f.path.name for f in failures if f.error is None)
+    crashed = dict.fromkeys(
+        f"{f.path.name} ({f.error})" for f in failures if f.error is not None
+    )
+    reasons = []
+    if failed:
+        reasons.append(f"Code quality checks failed for {', '.join(failed)}")
+    if crashed:
+        reasons.append(f"Code quality checks crashed for {', '.join(crashed)}")
+    return Block(reason="; ".join(reasons))
+
+
+async def _check_edit(tool_name: str | None, tool_input: dict) -> HookResult:
+    """Check if file modification passes quality checks.
+
+    Args:
+        tool_name: Name of the tool that triggered the hook.
+        tool_input: Input parameters from the tool.
+
+    Returns:
+        PassThrough if checks pass or don't apply, Block if checks fail.
+    """
+    path = _edit_target(tool_name, tool_input)
+    if isinstance(path, PassThrough):
+        return path
+
+    checker = get_checker(path.suffix.lower())
     if not checker:
         return PassThrough(reason="no_checker_for_extension")
 
     console.print(f"🔍 Checking {compact_path(path)} (triggered by {tool_name})")
 
-    # Run the checker
-    exit_code = checker(path, tool_name)
-
-    # If checks failed (exit code 2), block the operation
-    if exit_code == 2:
-        return Block(reason=f"Code quality checks failed for {path.name}")
+    # Failing (exit code 2) or crashing checks block the operation
+    if failure := await run_checker(checker, path, tool_name):
+        return _failure_block([failure])
 
     return PassThrough(reason="checks_passed")
 
 
+def _schedule_edit(
+    tool_name: str | None, tool_input: dict, session_id: str
+) -> HookResult:
+    """Queue an edited file for a debounced check.
+
+    Failures of other files wait for the Stop hook, so they are never
+    attached to an unrelated edit.
+
+    Returns:
+        Block reporting a failed earlier check of this file, else PassThrough.
+    """
+    scheduler = get_lint_scheduler()
+    path = _edit_target(tool_name, tool_input)
+    if isinstance(path, PassThrough):
+        return path
+
+    # Taken before schedule(), which supersedes the file's failures
+    failures = scheduler.take_failures(session_id, [path])
+    scheduler.schedule(session_id, path, tool_name)
+    if failures:
+        return _failure_block(failures)
+    return PassThrough(reason="check_scheduled")
+
+
 async def check_file_format(
     input_data: HookInput, _tool_use_id: str | None, _context: HookContext
 ) -> HookJSONOutput:
@@ -59,5 +126,39 @@ async def check_file_format(
     tool_name = input_data.get("tool_name")
     tool_input = input_data.get("tool_input", {})
 
-    result = _check_edit(tool_name, tool_input)
+    if lint_debounce_s() > 0:
+        session_id = input_data.get("session_id", "")
+        result = _schedule_edit(tool_name, tool_input, session_id)
+    else:
+        result = await _check_edit(tool_name, tool_input)
     return to_post_hook_output(result)
+
+
+async def await_pending_lint(
+    input_data: HookInput, _tool_use_id: str | None, _context: HookContext
+) -> HookJSONOutput:
+    """PreToolUse hook: Wait for an in-flight lint of the file being edited.
+
+    Fixers (ruff --fix) rewrite files, so an edit must not race them.
+
+    Trigger: Fires before Edit or Write
+    """
+    file_path = input_data.get("tool_input", {}).get("file_path")
+    if file_path:
+        session_id = input_data.get("session_id", "")
+        await get_lint_scheduler().wait_for(session_id, Path(file_path))
+    return {}
+
+
+async def flush_lint_checks(
+    input_data: HookInput, _tool_use_id: str | None, _context: HookContext
+) -> HookJSONOutput:
+    """Stop hook: Lint queued files and report failures before the turn ends.
+
+    Trigger: Fires when the agent finishes responding
+    """
+    session_id = input_data.get("session_id", "")
+    failures = await get_lint_scheduler().flush(session_id)
+    if failures:
+        return to_stop_hook_output(_failure_block(failures))
+    return to_stop_hook_output(PassThrough(reason="checks_passed"))
@@ -1,6 +1,6 @@
 """Language checker registry system."""
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import Protocol, TypeVar
 
@@ -8,8 +8,10 @@ from typing import Protocol, TypeVar
 class CheckerFunc(Protocol):
     """Protocol for language checker functions with optional tool_name."""
 
-    def __call__(self, path: Path, _tool_name: str | None = None) -> int:
-        """Check a file for issues.
+    def __call__(
+        self, path: Path, _tool_name: str | None = None
+    ) -> int | Awaitable[int]:
+        """Check a file for issues (sync or async).
 
         Args:
             path: Path to the file to check.
@@ -21,11 +23,30 @@ class CheckerFunc(Protocol):
         ...
 
 
+class BatchCheckerFunc(Protocol):
+    """Protocol for checkers that check several files in one invocation."""
+
+    def __call__(self, paths: list[Path]) -> Awaitable[int]:
+        """Check files for issues.
+
+        Args:
+            paths: Paths to the files to check (same language).
+
+        Returns:
+            Exit code (0 = pass, 2 = issues found in any file).
+        """
+        ...
+
+
 _F = TypeVar("_F", bound=CheckerFunc)
+_B = TypeVar("_B", bound=BatchCheckerFunc)
 
 # Global registry of language checkers by file extension
 _registry: dict[str, CheckerFunc] = {}
 
+# Optional batch implementations, keyed by the per-file checker
+_batch_registry: dict[CheckerFunc, BatchCheckerFunc] = {}
+
 
 def language_checker(
     extensions: list[str],
@@ -57,3 +78,32 @@ def get_checker(extension: str) -> CheckerFunc | None:
         Checker function if registered, None otherwise
     """
     return _registry.get(extension.lower())
+
+
+def batch_checker(checker: CheckerFunc) -> Callable[[_B], _B]:
+    """Decorator to register a batch implementation of a language checker.
+
+    Args:
+        checker: The registered per-file checker this batch function replaces
+
+    Returns:
+        Decorator function
+    """
+
+    def decorator(func: _B) -> _B:
+        _batch_registry[checker] = func
+        return func
+
+    return decorator
+
+
+def get_batch_checker(checker: CheckerFunc) -> BatchCheckerFunc | None:
+    """Get the batch implementation of a checker.
+
+    Args:
+        checker: Per-file checker function
+
+    Returns:
+        Batch checker function if registered, None otherwise
+    """
+    return _batch_registry.get(checker)
@@ -65,3 +65,17 @@ def to_post_hook_output(result: HookResult, *, file_name: str = "") -> HookJSONO
             "hookEventName": "PostToolUse",
         },
     }
+
+
+def to_stop_hook_output(result: HookResult) -> HookJSONOutput:
+    """Convert HookResult to Stop hook output format.
+
+    Args:
+        result: PassThrough or Block result.
+
+    Returns:
+        Empty dict to let the agent stop, or block decision to make it continue.
+    """
+    if isinstance(result, PassThrough):
+        return {}
+    return {"decision": "block", "reason": result.reason}
@@ -0,0 +1,380 @@
+"""Dangerous command rules and the precompiled matcher behind the Bash hook.
+
+Every Bash call is checked against the rule set, and organizations may add
+thousands of rules of their own, so rules are compiled once into a single
+regex searched in one pass:
+
+- regex rules are indexed by their leading literal text (`rm`, `mkfs.`)
+  in a character trie, so a command position only tries the rules whose
+  prefix it starts with; rules without a literal prefix are plain branches
+- literal rules (case-insensitive substrings) form their own trie
+
+Extra rules are loaded from a TOML file named by PI_SAFETY_RULES:
+
+    [[rules]]
+    pattern = 'terraform\\s+destroy'
+    reason = "Terraform destroy"
+
+    [[rules]]
+    literal = "kubectl delete namespace"
+    reason = "Namespace deletion"
+
+Patterns are combined into one regex, so they may not use backreferences.
+
+The Bash hook matches these rules against the words of each simple command
+it parsed (π.hooks.shell). DEFAULT_RULES only apply to command lines the
+parser rejects; parsed commands get argument-level rules instead.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import tomllib
+from dataclasses import dataclass
+from os import getenv
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+# Environment variable naming a TOML file with extra rules
+RULES_ENV = "PI_SAFETY_RULES"
+
+# Verdicts remembered for repeated identical commands
+DEFAULT_VERDICT_CACHE_SIZE = 4096
+
+# Privilege escalation prefixes stripped before matching
+_PRIVILEGE_PREFIX = re.compile(r"^(sudo|doas|pkexec)\s+")
+
+# Characters that stand for themselves when unescaped in a pattern
+_PLAIN_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 _-/=:,@%~'\"!<>#&;`"
+)
+_QUANTIFIERS = frozenset("?*+{")
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+_GLOBAL_FLAGS = re.compile(r"^\(\?([aiLmsux]+)\)")
+
+
+@dataclass(frozen=True)
+class SafetyRule:
+    """A dangerous command rule.
+
+    Exactly one of pattern (regex, case-sensitive) or literal
+    (case-insensitive substring) is set.
+    """
+
+    reason: str
+    pattern: str = ""
+    literal: str = ""
+
+
+DEFAULT_RULES: tuple[SafetyRule, ...] = (
+    # Destructive file operations
+    SafetyRule(
+        "Dangerous rm",
+        pattern=r"rm\s+(-[a-zA-Z]*f[a-zA-Z]*\s+)*(/\s*$|/\s+|~\s*$|~\s+|\*)",
+    ),
+    # Piping remote content to shell
+    SafetyRule("Piping curl/wget to shell", pattern=r"(curl|wget).*\|.*(ba)?sh"),
+    # Direct disk operations
+    SafetyRule("Direct disk write", pattern=r"dd\s+.*of=/dev/"),
+    SafetyRule("File system formatting", pattern=r"mkfs\.\w+"),
+    SafetyRule("Disk partitioning", pattern=r"fdisk\s+/dev/"),
+    SafetyRule("Direct write to disk device", pattern=r">\s*/dev/sd[a-z]"),
+    # Fork bomb patterns
+    SafetyRule("Fork bomb", pattern=r":\(\)\s*\{.*:\|:.*\}"),
+    SafetyRule("Potential fork bomb", pattern=r"\..*\|.*&"),
+    # Catastrophic permission/ownership on root
+    SafetyRule(
+        "Recursive chmod 777 on root",
+        pattern=r"chmod\s+(-[a-zA-Z]*R[a-zA-Z]*\s+)*(777|a\+rwx)\s+/\s*$",
+    ),
+    SafetyRule(
+        "Recursive chown on root",
+        pattern=r"chown\s+(-[a-zA-Z]*R[a-zA-Z]*\s+)+\S+\s+/\s*$",
+    ),
+    # File truncation of critical paths
+    SafetyRule("Truncating /etc file", pattern=r":>\s*/etc/"),
+    SafetyRule("Truncating system file", pattern=r"truncate\s+.*(/etc/|/var/|/usr/)"),
+    # Overwriting critical system files
+    SafetyRule(
+        "Overwriting critical system file",
+        pattern=r">\s*/etc/(passwd|shadow|sudoers|hosts)",
+    ),
+    SafetyRule("Formatting a Windows drive", literal="format c:"),
+    SafetyRule("Dangerous rm", literal="rm -rf *"),
+    SafetyRule("Fork bomb", literal=":(){ :|:& };:"),
+)
+
+
+def _literal_prefix(pattern: str) -> tuple[str, str]:
+    """Split a pattern into its leading literal text and the remaining regex.
+
+    Returns ("", pattern) when the pattern has no usable literal prefix,
+    including patterns with a top-level alternation.
+    """
+    prefix: list[str] = []
+    ends: list[int] = []  # source index after each prefix character
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char in _PLAIN_CHARS:
+            prefix.append(char)
+            i += 1
+        elif char == "\\" and i + 1 < len(pattern) and not pattern[i + 1].isalnum():
+            prefix.append(pattern[i + 1])
+            i += 2
+        else:
+            break
+        ends.append(i)
+
+    # A quantifier applies to the last literal character, so it isn't fixed
+    if prefix and i < len(pattern) and pattern[i] in _QUANTIFIERS:
+        prefix.pop()
+        ends.pop()
+    if not prefix or _has_top_level_alternation(pattern):
+        return "", pattern
+    return "".join(prefix), pattern[ends[-1] :]
+
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    depth = 0
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            i += 2
+            continue
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+            # A leading ] (or ^]) is a literal member of the class
+            if pattern[i + 1 : i + 2] == "]":
+                i += 1
+            elif pattern[i + 1 : i + 3] == "^]":
+                i += 2
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return True
+        i += 1
+    return False
+
+
+def _scoped_flags(pattern: str) -> str:
+    """Turn leading global flags into a scoped group so patterns combine."""
+    if match := _GLOBAL_FLAGS.match(pattern):
+        return f"(?{match[1]}:{pattern[match.end() :]})"
+    return pattern
+
+
+def _trie_regex(entries: Iterable[tuple[str, str]]) -> str:
+    """Build a regex matching any prefix followed by one of its tails.
+
+    Args:
+        entries: (literal prefix, regex tail) pairs; an empty tail means the
+            prefix alone is a match.
+
+    Returns:
+        Regex source, or "" if there are no entries.
+    """
+    trie: dict[str, dict] = {}
+    for prefix, tail in entries:
+        node = trie
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node.setdefault("", []).append(tail)
+
+    def build(node: dict) -> str:
+        tails: list[str] = node.get("", [])
+        # Only existence matters: a complete prefix makes the subtree moot
+        if "" in tails:
+            return ""
+        branches = [f"(?:{tail})" for tail in tails]
+        branches.extend(
+            re.escape(char) + build(child)
+            for char, child in sorted(node.items())
+            if char
+        )
+        return branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+
+    return build(trie) if trie else ""
+
+
+def _validate(rule: SafetyRule) -> None:
+    """Raise ValueError if a rule cannot be compiled into the matcher."""
+    if bool(rule.pattern) == bool(rule.literal):
+        msg = f"Rule {rule.reason!r} needs exactly one of pattern or literal"
+        raise ValueError(msg)
+    if rule.pattern:
+        if _BACKREFERENCE.search(rule.pattern):
+            msg = f"Rule {rule.reason!r} uses a backreference"
+            raise ValueError(msg)
+        try:
+            re.compile(rule.pattern)
+        except re.error as e:
+            msg = f"Rule {rule.reason!r} has an invalid pattern: {e}"
+            raise ValueError(msg) from e
+
+
+class CommandMatcher:
+    """Single-pass matcher for a dangerous command rule set.
+
+    Usage:
+        matcher = CommandMatcher(DEFAULT_RULES)
+        rule = matcher.match("sudo rm -rf /")   # SafetyRule or None
+    """
+
+    def __init__(
+        self,
+        rules: Iterable[SafetyRule],
+        *,
+        cache_size: int = DEFAULT_VERDICT_CACHE_SIZE,
+    ) -> None:
+        """Compile the rule set.
+
+        Args:
+            rules: Rules to match, in priority order for reporting.
+            cache_size: Number of command verdicts to remember.
+
+        Raises:
+            ValueError: If a rule is malformed.
+        """
+        self.rules = tuple(rules)
+        for rule in self.rules:
+            _validate(rule)
+        self.cache_size = cache_size
+        self._verdicts: dict[str, SafetyRule | None] = {}
+
+        indexed: list[tuple[str, str]] = []
+        unindexed: list[str] = []
+        for rule in self.rules:
+            if rule.pattern:
+                prefix, tail = _literal_prefix(rule.pattern)
+                if prefix:
+                    indexed.append((prefix, tail))
+                else:
+                    unindexed.append(f"(?:{_scoped_flags(rule.pattern)})")
+        literals = _trie_regex(
+            (rule.literal.lower(), "") for rule in self.rules if rule.literal
+        )
+
+        branches = [*unindexed]
+        if indexed:
+            branches.append(_trie_regex(indexed))
+        if literals:
+            branches.append(f"(?i:{literals})")
+        try:
+            # (?!) never matches: an empty rule set allows everything
+            self._combined = re.compile("|".join(branches) or "(?!)")
+        except re.error as e:
+            # e.g. two rules defining the same named group
+            msg = f"Rules cannot be combined: {e}"
+            raise ValueError(msg) from e
+
+    def match(self, cmd: str) -> SafetyRule | None:
+        """Return the first rule matching cmd, or None if it is allowed.
+
+        Rules see the command with surrounding whitespace and a leading
+        sudo/doas/pkexec stripped.
+        """
+        try:
+            return self._verdicts[cmd]
+        except KeyError:
+            pass
+
+        normalized = _PRIVILEGE_PREFIX.sub("", cmd.strip())
+        rule = self._identify(normalized) if self._combined.search(normalized) else None
+
+        if len(self._verdicts) >= self.cache_size:
+            # Evict the oldest verdict (dicts preserve insertion order)
+            del self._verdicts[next(iter(self._verdicts))]
+        self._verdicts[cmd] = rule
+        return rule
+
+    def _identify(self, normalized: str) -> SafetyRule | None:
+        """Find which rule matched (only runs for blocked commands)."""
+        lowered = normalized.lower()
+        for rule in self.rules:
+            if rule.pattern and re.search(rule.pattern, normalized):
+                return rule
+            if rule.literal and rule.literal.lower() in lowered:
+                return rule
+        return None
+
+
+def load_rules(path: Path) -> list[SafetyRule]:
+    """Load rules from a TOML rules file.
+
+    Args:
+        path: File with a `[[rules]]` array of tables.
+
+    Returns:
+        Rules in file order.
+
+    Raises:
+        ValueError: If the file is unreadable or a rule is malformed.
+    """
+    try:
+        data = tomllib.loads(path.read_text(encoding="utf-8"))
+    except (OSError, tomllib.TOMLDecodeError) as e:
+        msg = f"Cannot read safety rules from {path}: {e}"
+        raise ValueError(msg) from e
+
+    rules: list[SafetyRule] = []
+    for index, entry in enumerate(data.get("rules", [])):
+        if not isinstance(entry, dict) or set(entry) - {"pattern", "literal", "reason"}:
+            msg = f"{path}: rule {index} must be a table of pattern/literal/reason"
+            raise ValueError(msg)
+        rule = SafetyRule(
+            reason=str(
+                entry.get("reason") or entry.get("pattern") or entry.get("literal")
+            ),
+            pattern=str(entry.get("pattern", "")),
+            literal=str(entry.get("literal", "")),
+        )
+        _validate(rule)
+        rules.append(rule)
+    return rules
+
+
+# Module-level matchers (config, not workflow state); built on first use
+_matchers: dict[bool, CommandMatcher] = {}
+
+
+def get_command_matcher(*, include_defaults: bool = True) -> CommandMatcher:
+    """Get the matcher for the rules in any PI_SAFETY_RULES file.
+
+    An invalid rules file is logged and ignored.
+
+    Args:
+        include_defaults: Also match DEFAULT_RULES. The Bash hook leaves them
+            out for commands it could parse, which argument-level rules
+            (π.hooks.command_rules) cover more precisely.
+
+    Returns:
+        Compiled matcher, shared until reset_command_matcher().
+    """
+    if include_defaults not in _matchers:
+        defaults = DEFAULT_RULES if include_defaults else ()
+        matcher = None
+        if rules_file := getenv(RULES_ENV):
+            try:
+                matcher = CommandMatcher([*defaults, *load_rules(Path(rules_file))])
+            except ValueError:
+                logger.exception("Ignoring invalid safety rules file %s", rules_file)
+        _matchers[include_defaults] = matcher or CommandMatcher(defaults)
+    return _matchers[include_defaults]
+
+
+def reset_command_matcher() -> None:
+    """Forget the module-level matchers so rules are reloaded on next use."""
+    _matchers.clear()
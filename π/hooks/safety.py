@@ -1,65 +1,70 @@
 """Safety checks for blocking dangerous operations."""
 
-import re
+from pathlib import Path
 
 from claude_agent_sdk.types import HookContext, HookInput, HookJSONOutput
 
 from π.console import console
+from π.hooks.command_rules import check_pipeline
 from π.hooks.result import Block, HookResult, PassThrough, to_pre_hook_output
+from π.hooks.rules import get_command_matcher
+from π.hooks.shell import ShellSyntaxError, parse_command
 
 
-def is_dangerous_command(cmd: str) -> bool:
+def dangerous_command_reason(cmd: str, cwd: str | None = None) -> str | None:
+    """Explain why a bash command is dangerous, if it is.
+
+    The command is parsed into simple commands (π.hooks.shell); each gets
+    the argument-level rules and any PI_SAFETY_RULES text rules. Commands
+    the parser cannot tokenize are matched against all text rules, default
+    ones included, as a raw string instead.
+
+    Args:
+        cmd: The bash command string to check
+        cwd: Directory the command runs in. Defaults to the process CWD.
+
+    Returns:
+        Reason of the first matching rule, or None if the command is allowed
+    """
+    try:
+        parsed = parse_command(cmd)
+    except ShellSyntaxError:
+        rule = get_command_matcher().match(cmd)
+        return rule.reason if rule else None
+
+    matcher = get_command_matcher(include_defaults=False)
+    start = cwd or str(Path.cwd())
+    for pipeline in parsed.pipelines:
+        if reason := check_pipeline(pipeline, start):
+            return reason
+        for command in pipeline:
+            if rule := matcher.match(command.text):
+                return rule.reason
+    return None
+
+
+def is_dangerous_command(cmd: str, cwd: str | None = None) -> bool:
     """Check if a bash command is potentially dangerous.
 
     Args:
         cmd: The bash command string to check
+        cwd: Directory the command runs in. Defaults to the process CWD.
 
     Returns:
-        True if the command matches a dangerous pattern
+        True if the command matches a dangerous command rule
     """
-    # Strip common privilege escalation prefixes for pattern matching
-    normalized_cmd = re.sub(r"^(sudo|doas|pkexec)\s+", "", cmd.strip())
-
-    dangerous_patterns = [
-        # Destructive file operations
-        (r"rm\s+(-[a-zA-Z]*f[a-zA-Z]*\s+)*(/\s*$|/\s+|~\s*$|~\s+|\*)", "Dangerous rm"),
-        # Piping remote content to shell
-        (r"(curl|wget).*\|.*(ba)?sh", "Piping curl/wget to shell"),
-        # Direct disk operations
-        (r"dd\s+.*of=/dev/", "Direct disk write"),
-        (r"mkfs\.\w+", "File system formatting"),
-        (r"fdisk\s+/dev/", "Disk partitioning"),
-        (r">\s*/dev/sd[a-z]", "Direct write to disk device"),
-        # Fork bomb patterns
-        (r":\(\)\s*\{.*:\|:.*\}", "Fork bomb"),
-        (r"\..*\|.*&", "Potential fork bomb"),
-        # Catastrophic permission/ownership on root
-        (
-            r"chmod\s+(-[a-zA-Z]*R[a-zA-Z]*\s+)*(777|a\+rwx)\s+/\s*$",
-            "Recursive chmod 777 on root",
-        ),
-        (r"chown\s+(-[a-zA-Z]*R[a-zA-Z]*\s+)+\S+\s+/\s*$", "Recursive chown on root"),
-        # File truncation of critical paths
-        (r":>\s*/etc/", "Truncating /etc file"),
-        (r"truncate\s+.*(/etc/|/var/|/usr/)", "Truncating system file"),
-        # Overwriting critical system files
-        (r">\s*/etc/(passwd|shadow|sudoers|hosts)", "Overwriting critical system file"),
-    ]
-
-    for pattern, _ in dangerous_patterns:
-        if re.search(pattern, normalized_cmd):
-            return True
-
-    simple_patterns = ["format c:", "rm -rf *", ":(){ :|:& };:"]
-    return any(pattern in cmd.lower() for pattern in simple_patterns)
-
-
-def _check_bash_safety(tool_name: str | None, tool_input: dict) -> HookResult:
+    return dangerous_command_reason(cmd, cwd) is not None
+
+
+def _check_bash_safety(
+    tool_name: str | None, tool_input: dict, cwd: str | None = None
+) -> HookResult:
     """Check if bash command is safe to execute.
 
     Args:
         tool_name: Name of the tool that triggered the hook.
         tool_input: Input parameters from the tool.
+        cwd: Directory the command runs in.
 
     Returns:
         PassThrough if command is safe, Block if dangerous.
@@ -69,9 +74,12 @@ def _check_bash_safety(tool_name: str | None, tool_input: dict) -> HookResult:
 
     command = tool_input.get("command", "")
 
-    if is_dangerous_command(command):
+    reason = dangerous_command_reason(command, cwd)
+    if reason is not None:
         console.print(f"🚫 Blocked dangerous command: {command}")
-        return Block(reason="Command blocked: Potentially dangerous operation")
+        return Block(
+            reason=f"Command blocked: Potentially dangerous operation ({reason})"
+        )
 
     return PassThrough(reason="command_safe")
 
@@ -83,14 +91,19 @@ async def check_bash_command(
 
     Trigger: Fires before Bash tool executes
 
-    Blocked patterns (with sudo/doas/pkexec prefix handling):
-        - rm -rf on / ~ or *
+    Commands are parsed first, so chains (`cd / && rm -rf .`), subshells,
+    `bash -c` strings and sudo/env wrappers are checked per command, and
+    quoted text is not mistaken for a command.
+
+    Blocked patterns:
+        - rm -rf on /, ~, system directories or *
         - curl/wget piped to shell
         - dd/mkfs/fdisk disk operations
         - Direct writes to /dev/sd*
         - Fork bombs (:(){ :|:& };:)
         - chmod 777 / or chown -R on root
         - Truncation/overwrite of /etc files
+        - Extra rules from the PI_SAFETY_RULES file (see π.hooks.rules)
     """
     if "tool_input" not in input_data or "tool_name" not in input_data:
         return {}
@@ -98,5 +111,5 @@ async def check_bash_command(
     tool_input = input_data["tool_input"]
     tool_name = input_data["tool_name"]
 
-    result = _check_bash_safety(tool_name, tool_input)
+    result = _check_bash_safety(tool_name, tool_input, input_data.get("cwd"))
     return to_pre_hook_output(result)
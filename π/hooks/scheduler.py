@@ -0,0 +1,310 @@
+"""Debounced, batched lint scheduling per agent session.
+
+An implement stage often issues a burst of Edits to the same file, and the
+PostToolUse hook used to lint after every one. The scheduler instead queues
+edited files per session and lints them once the session has been quiet for
+a debounce interval:
+
+- repeated edits of a file collapse into one check (last writer wins)
+- files queued together are checked with one linter invocation per
+  language and project (see registry.batch_checker)
+
+A file's failure is fed back to the agent on its next PostToolUse hook for
+that file, and the Stop hook flushes anything still queued so all failures
+are reported before the turn ends. A linter that crashes reports its files
+as errored, never as clean. Set PI_LINT_DEBOUNCE_S=0 to lint synchronously
+after each edit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import inspect
+import logging
+from dataclasses import dataclass, field
+from os import getenv
+from typing import TYPE_CHECKING
+
+from π.hooks.registry import get_batch_checker, get_checker
+from π.hooks.timing import hook_span
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from π.hooks.registry import CheckerFunc
+
+logger = logging.getLogger(__name__)
+
+# Environment variable for the quiet period before queued files are linted
+DEBOUNCE_ENV = "PI_LINT_DEBOUNCE_S"
+DEFAULT_DEBOUNCE_S = 1.0
+
+
+def lint_debounce_s() -> float:
+    """Get the lint debounce interval (0 = lint synchronously per edit)."""
+    try:
+        return max(float(getenv(DEBOUNCE_ENV, str(DEFAULT_DEBOUNCE_S))), 0.0)
+    except ValueError:
+        return DEFAULT_DEBOUNCE_S
+
+
+@dataclass(frozen=True, slots=True)
+class LintFailure:
+    """A file whose check failed, or whose linter crashed (error is set)."""
+
+    path: Path
+    error: str | None = None
+
+
+def _crashed(paths: Iterable[Path], e: Exception) -> list[LintFailure]:
+    error = f"{type(e).__name__}: {e}"
+    return [LintFailure(path, error) for path in paths]
+
+
+async def run_checker(
+    checker: CheckerFunc, path: Path, tool_name: str | None
+) -> LintFailure | None:
+    """Check one file; sync and async checkers both work.
+
+    Returns:
+        The failure if the check failed or the checker crashed, else None.
+    """
+    try:
+        exit_code = checker(path, tool_name)
+        if inspect.isawaitable(exit_code):
+            exit_code = await exit_code
+    except Exception as e:
+        logger.exception("Checker crashed for %s", path)
+        return _crashed([path], e)[0]
+    return LintFailure(path) if exit_code == 2 else None
+
+
+async def lint_files(files: dict[Path, str | None]) -> list[LintFailure]:
+    """Lint files with one invocation per checker where supported.
+
+    Args:
+        files: Files to check, mapped to the tool that last wrote them.
+
+    Returns:
+        Files whose checks failed or whose checker crashed.
+    """
+    groups: dict[CheckerFunc, list[Path]] = {}
+    for path in files:
+        if path.exists() and (checker := get_checker(path.suffix)):
+            groups.setdefault(checker, []).append(path)
+
+    failed: list[LintFailure] = []
+    for checker, paths in groups.items():
+        if (batch := get_batch_checker(checker)) and len(paths) > 1:
+            try:
+                if await batch(paths) == 2:
+                    failed.extend(LintFailure(path) for path in paths)
+            except Exception as e:
+                logger.exception("Batch checker crashed for %d files", len(paths))
+                failed.extend(_crashed(paths, e))
+            continue
+        for path in paths:
+            if failure := await run_checker(checker, path, files[path]):
+                failed.append(failure)
+    return failed
+
+
+@dataclass
+class _SessionLints:
+    """Lint state for one agent session."""
+
+    pending: dict[Path, str | None] = field(default_factory=dict)
+    running: set[Path] = field(default_factory=set)
+    failures: list[LintFailure] = field(default_factory=list)
+    timer: asyncio.Task[None] | None = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    tasks: set[asyncio.Task[None]] = field(default_factory=set)
+
+
+class LintScheduler:
+    """Debounces and batches lint runs per agent session.
+
+    Usage:
+        scheduler = LintScheduler(debounce_s=1.0)
+        scheduler.schedule(session_id, path, "Edit")
+        failures = scheduler.take_failures(session_id, [path])  # next edit
+        failures = await scheduler.flush(session_id)     # on Stop
+        await scheduler.aclose()
+    """
+
+    def __init__(self, *, debounce_s: float = DEFAULT_DEBOUNCE_S) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            debounce_s: Quiet period after the last edit before linting.
+        """
+        self.debounce_s = debounce_s
+        self.scheduled = 0
+        self.checked = 0
+        self._sessions: dict[str, _SessionLints] = {}
+
+    def _session(self, session_id: str) -> _SessionLints:
+        return self._sessions.setdefault(session_id, _SessionLints())
+
+    def schedule(self, session_id: str, path: Path, tool_name: str | None) -> None:
+        """Queue a file for linting and restart the session's debounce timer.
+
+        Must be called from a running event loop.
+        """
+        session = self._session(session_id)
+        self.scheduled += 1
+        # A new edit supersedes any unreported failure for the same file
+        session.failures = [f for f in session.failures if f.path != path]
+        session.pending.pop(path, None)
+        session.pending[path] = tool_name
+
+        if session.timer is not None:
+            session.timer.cancel()
+        session.timer = asyncio.create_task(self._fire_after_debounce(session_id))
+
+    async def _fire_after_debounce(self, session_id: str) -> None:
+        await asyncio.sleep(self.debounce_s)
+        session = self._session(session_id)
+        session.timer = None
+        # Run detached so a later schedule() can't cancel an in-flight lint
+        task = asyncio.create_task(self._run_pending(session_id))
+        session.tasks.add(task)
+        task.add_done_callback(session.tasks.discard)
+
+    async def _run_pending(self, session_id: str) -> None:
+        session = self._session(session_id)
+        async with session.lock:
+            files, session.pending = session.pending, {}
+            if not files:
+                return
+            session.running = set(files)
+            try:
+                with hook_span("lint", session_id, files=str(len(files))):
+                    failed = await lint_files(files)
+            except Exception as e:
+                logger.exception("Scheduled lint failed for %d files", len(files))
+                failed = _crashed(files, e)
+            finally:
+                session.running = set()
+
+            self.checked += len(files)
+            logger.debug(
+                "Linted %d files for session %s (%d edits scheduled, %d checked)",
+                len(files),
+                session_id,
+                self.scheduled,
+                self.checked,
+            )
+            # Files edited again since are queued for a fresh check
+            reported = {f.path for f in session.failures}
+            session.failures.extend(
+                failure
+                for failure in failed
+                if failure.path not in session.pending and failure.path not in reported
+            )
+
+    def take_failures(
+        self, session_id: str, paths: Iterable[Path] | None = None
+    ) -> list[LintFailure]:
+        """Return and clear failures not yet reported to the agent.
+
+        Args:
+            session_id: Agent session.
+            paths: Only take failures of these files (default: all).
+        """
+        session = self._sessions.get(session_id)
+        if session is None:
+            return []
+        if paths is None:
+            failures, session.failures = session.failures, []
+            return failures
+        wanted = set(paths)
+        failures = [f for f in session.failures if f.path in wanted]
+        session.failures = [f for f in session.failures if f.path not in wanted]
+        return failures
+
+    async def wait_for(self, session_id: str, path: Path) -> None:
+        """Wait until an in-flight lint of path (which may fix it) finishes."""
+        session = self._sessions.get(session_id)
+        if session is not None and path in session.running:
+            async with session.lock:
+                pass
+
+    async def flush(self, session_id: str) -> list[LintFailure]:
+        """Lint queued files now and return all unreported failures."""
+        session = self._sessions.get(session_id)
+        if session is None:
+            return []
+        if session.timer is not None:
+            session.timer.cancel()
+            session.timer = None
+        await self._run_pending(session_id)
+        return self.take_failures(session_id)
+
+    def cancel(self) -> list[asyncio.Task]:
+        """Cancel timers and in-flight lints for all sessions, without waiting.
+
+        Returns:
+            The cancelled tasks.
+        """
+        tasks = [
+            task
+            for session in self._sessions.values()
+            for task in (session.timer, *session.tasks)
+            if task is not None
+        ]
+        for task in tasks:
+            task.cancel()
+        return tasks
+
+    async def aclose(self) -> None:
+        """Cancel timers and in-flight lints for all sessions."""
+        tasks = self.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._sessions.clear()
+
+
+# Module-level scheduler, bound to the event loop that created it
+_scheduler: LintScheduler | None = None
+_scheduler_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _retire_scheduler(
+    scheduler: LintScheduler, loop: asyncio.AbstractEventLoop
+) -> None:
+    """Close a scheduler left behind by another event loop."""
+    if loop.is_closed():
+        # asyncio.run() already cancelled its tasks
+        return
+    if loop.is_running():
+        asyncio.run_coroutine_threadsafe(scheduler.aclose(), loop)
+    else:
+        scheduler.cancel()
+
+
+def get_lint_scheduler() -> LintScheduler:
+    """Get the lint scheduler for the running event loop, creating it if needed.
+
+    A scheduler left behind by another event loop is closed first.
+    """
+    global _scheduler, _scheduler_loop  # noqa: PLW0603
+    loop = asyncio.get_running_loop()
+    if _scheduler is None or _scheduler_loop is not loop:
+        if _scheduler is not None and _scheduler_loop is not None:
+            _retire_scheduler(_scheduler, _scheduler_loop)
+        _scheduler = LintScheduler(debounce_s=lint_debounce_s())
+        _scheduler_loop = loop
+    return _scheduler
+
+
+async def close_lint_scheduler() -> None:
+    """Close the module-level scheduler (call once per workflow run)."""
+    global _scheduler, _scheduler_loop  # noqa: PLW0603
+    if _scheduler is not None:
+        await _scheduler.aclose()
+    _scheduler = None
+    _scheduler_loop = None
@@ -0,0 +1,693 @@
+"""Shell command parsing for the Bash safety hook.
+
+Splits a command line into the simple commands it would run, the way a
+POSIX shell tokenizes it: pipelines, `&&`/`||`/`;` lists, subshells, brace
+groups, command and process substitutions, `bash -c` strings, and
+`sudo`/`env`/`nohup`-style wrappers are all unwrapped. Quoted text stays
+inside its argument, and heredoc bodies are skipped, so prose never looks
+like a command.
+
+Each simple command remembers the directory a preceding `cd` moved to, so
+rules can resolve `cd / && rm -rf .`. Parsing is best-effort: it does not
+expand variables or globs, and raises ShellSyntaxError for input it cannot
+tokenize (the caller then falls back to matching the raw string).
+
+Parsed forms are memoized per command string; see parse_command().
+"""
+
+from __future__ import annotations
+
+import posixpath
+import re
+from dataclasses import dataclass, field
+
+# Parsed commands remembered for repeated identical command strings
+DEFAULT_PARSE_CACHE_SIZE = 1024
+
+# Programs that run the command given in their arguments
+_WRAPPER_OPTIONS_WITH_VALUE: dict[str, frozenset[str]] = {
+    "sudo": frozenset({"-u", "-g", "-C", "-D", "-h", "-p", "-r", "-t", "-U", "-T"}),
+    "doas": frozenset({"-u", "-C"}),
+    "pkexec": frozenset({"--user"}),
+    "env": frozenset({"-u", "-C", "-S", "--unset", "--chdir", "--split-string"}),
+    "nice": frozenset({"-n", "--adjustment"}),
+    "nohup": frozenset(),
+    "time": frozenset({"-f", "-o", "--format", "--output"}),
+    "command": frozenset(),
+    "exec": frozenset({"-a"}),
+    "timeout": frozenset({"-s", "-k", "--signal", "--kill-after"}),
+    "stdbuf": frozenset({"-i", "-o", "-e"}),
+    "ionice": frozenset({"-c", "-n", "-p", "--class", "--classdata"}),
+    "xargs": frozenset({"-a", "-d", "-E", "-I", "-L", "-n", "-P", "-s"}),
+}
+# Wrappers whose first operand is not the command (timeout DURATION cmd)
+_WRAPPER_LEADING_OPERANDS = {"timeout": 1}
+SHELLS = frozenset({"sh", "bash", "zsh", "dash", "ksh"})
+
+_PLAIN_RUN = re.compile(r"[^\s'\"\\$`;&|()<>]+")
+_WORD_ENDS = frozenset(" \t\n;&|()<>")
+_SPACE = re.compile(r"\s")
+_BLANKS = re.compile(r"[^\S\n]+")
+_ASSIGNMENT = re.compile(r"[A-Za-z_][A-Za-z0-9_]*=")
+# Everything but words; # only reaches here at a word start, so it's a comment
+_LEXEME = re.compile(
+    r"(?P<blank>[^\S\n]+)"
+    r"|(?P<newline>\n)"
+    r"|(?P<continuation>\\\n)"
+    r"|(?P<comment>#[^\n]*)"
+    r"|(?P<procsub>[<>]\()"
+    r"|(?P<redirect>\d*(?:&>>|&>|>>|>\||>&|<<<|(?P<heredoc><<-|<<)|<&|<>|>|<))"
+    r"|(?P<op>&&|\|\||;;|\|&|[;|&()])"
+)
+_SEPARATORS = frozenset({";", "&", "&&", "||", "\n"})
+# Reserved words that introduce a command without being one
+_PREFIX_KEYWORDS = frozenset({
+    "if",
+    "then",
+    "else",
+    "elif",
+    "do",
+    "while",
+    "until",
+    "!",
+    "time",
+})
+_END_KEYWORDS = frozenset({"fi", "done", "esac"})
+_COMPOUND_WORDS = (
+    _PREFIX_KEYWORDS | _END_KEYWORDS | {"{", "for", "select", "case", "function"}
+)
+
+
+class ShellSyntaxError(ValueError):
+    """Raised when a command line cannot be tokenized."""
+
+
+@dataclass(frozen=True, slots=True)
+class Redirect:
+    """An I/O redirection, e.g. `2>` (operator with fd) to `/dev/null`."""
+
+    operator: str
+    target: str
+
+
+@dataclass(frozen=True, slots=True)
+class SimpleCommand:
+    """One program invocation after unwrapping wrappers.
+
+    Attributes:
+        argv: Program and arguments with quotes removed.
+        redirects: Redirections applied to the command.
+        cwd: Directory moved to by earlier `cd`s, relative to the starting
+            directory ("." when unchanged), or None if unknown (`cd -`).
+        function: Name of the enclosing function definition, if any.
+        substituted: Programs run by substitutions in the arguments.
+    """
+
+    argv: tuple[str, ...]
+    redirects: tuple[Redirect, ...] = ()
+    cwd: str | None = "."
+    function: str | None = None
+    substituted: tuple[str, ...] = ()
+    # Program name without its directory (`/bin/rm` → `rm`)
+    program: str = field(init=False, repr=False, compare=False)
+    # Words joined by spaces, leaving out arguments containing whitespace:
+    # those only come from quoting and are data, so text rules skip them
+    text: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        program = posixpath.basename(self.argv[0]) if self.argv else ""
+        text = " ".join(word for word in self.argv if _SPACE.search(word) is None)
+        object.__setattr__(self, "program", program)
+        object.__setattr__(self, "text", text)
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedCommand:
+    """A command line split into pipelines of simple commands."""
+
+    pipelines: tuple[tuple[SimpleCommand, ...], ...]
+
+    @property
+    def commands(self) -> tuple[SimpleCommand, ...]:
+        """All simple commands in execution order."""
+        return tuple(cmd for pipeline in self.pipelines for cmd in pipeline)
+
+
+@dataclass(slots=True)
+class _Word:
+    text: str
+    substitutions: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _Op:
+    op: str
+
+
+@dataclass(slots=True)
+class _Redir:
+    op: str
+
+
+type _Token = _Word | _Op | _Redir
+
+
+def _closing_paren(s: str, i: int) -> int:
+    """Return the index of the `)` closing the `(` just before index i.
+
+    Heredoc bodies inside the parentheses are skipped, so prose in them
+    can't close (or open) a level.
+    """
+    depth = 1
+    heredocs: list[tuple[str, bool]] = []
+    while i < len(s):
+        char = s[i]
+        if char == "\\":
+            i += 2
+            continue
+        if char == "\n" and heredocs:
+            i = _skip_heredocs(s, i + 1, heredocs)
+            continue
+        if s.startswith("<<", i) and not s.startswith("<<<", i):
+            strip_tabs = s.startswith("<<-", i)
+            i += 3 if strip_tabs else 2
+            if blank := _BLANKS.match(s, i):
+                i = blank.end()
+            delimiter, i = _scan_word(s, i)
+            heredocs.append((delimiter.text, strip_tabs))
+            continue
+        if char == "'":
+            end = s.find("'", i + 1)
+            if end < 0:
+                break
+            i = end
+        elif char == '"':
+            i = _closing_double_quote(s, i + 1)
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    msg = "unbalanced parenthesis"
+    raise ShellSyntaxError(msg)
+
+
+def _closing_double_quote(s: str, i: int) -> int:
+    """Return the index of the `"` closing a double quote opened before i."""
+    while i < len(s):
+        char = s[i]
+        if char == "\\":
+            i += 2
+            continue
+        if char == '"':
+            return i
+        if s.startswith("$(", i):
+            i = _closing_paren(s, i + 2)
+        i += 1
+    msg = "unterminated double quote"
+    raise ShellSyntaxError(msg)
+
+
+def _closing_backtick(s: str, i: int) -> int:
+    while i < len(s):
+        if s[i] == "\\":
+            i += 2
+            continue
+        if s[i] == "`":
+            return i
+        i += 1
+    msg = "unterminated backquote"
+    raise ShellSyntaxError(msg)
+
+
+def _scan_dollar(s: str, i: int, word: _Word) -> int:
+    """Scan a `$` expansion at s[i]; return the index after it."""
+    if s.startswith("$((", i):
+        end = _closing_paren(s, i + 2)
+        word.text += s[i : end + 1]
+        return end + 1
+    if s.startswith("$(", i):
+        end = _closing_paren(s, i + 2)
+        word.substitutions.append(s[i + 2 : end])
+        word.text += s[i : end + 1]
+        return end + 1
+    if s.startswith("${", i):
+        end = s.find("}", i)
+        if end < 0:
+            msg = "unterminated parameter expansion"
+            raise ShellSyntaxError(msg)
+        word.text += s[i : end + 1]
+        return end + 1
+    word.text += "$"
+    return i + 1
+
+
+def _scan_double_quoted(s: str, i: int, word: _Word) -> int:
+    """Scan double-quoted text starting after the opening quote."""
+    while i < len(s):
+        char = s[i]
+        if char == '"':
+            return i + 1
+        if char == "\\" and i + 1 < len(s):
+            nxt = s[i + 1]
+            if nxt != "\n":
+                word.text += nxt if nxt in '$`"\\' else "\\" + nxt
+            i += 2
+        elif char == "$":
+            i = _scan_dollar(s, i, word)
+        elif char == "`":
+            end = _closing_backtick(s, i + 1)
+            word.substitutions.append(s[i + 1 : end])
+            word.text += s[i : end + 1]
+            i = end + 1
+        else:
+            word.text += char
+            i += 1
+    msg = "unterminated double quote"
+    raise ShellSyntaxError(msg)
+
+
+def _scan_ansi_c_quoted(s: str, i: int, word: _Word) -> int:
+    """Scan $'...' text starting after the opening quote (escapes kept)."""
+    end = i
+    while end < len(s) and s[end] != "'":
+        end += 2 if s[end] == "\\" else 1
+    if end >= len(s):
+        msg = "unterminated ANSI-C quote"
+        raise ShellSyntaxError(msg)
+    word.text += s[i:end]
+    return end + 1
+
+
+def _scan_word(s: str, i: int) -> tuple[_Word, int]:
+    """Scan one word starting at s[i]; return it and the index after it."""
+    # Fast path: most words are a single unquoted run
+    run = _PLAIN_RUN.match(s, i)
+    if run and (run.end() == len(s) or s[run.end()] in _WORD_ENDS):
+        return _Word(run.group()), run.end()
+    word = _Word("")
+    while i < len(s):
+        char = s[i]
+        if run := _PLAIN_RUN.match(s, i):
+            word.text += run.group()
+            i = run.end()
+        elif char == "'":
+            end = s.find("'", i + 1)
+            if end < 0:
+                msg = "unterminated single quote"
+                raise ShellSyntaxError(msg)
+            word.text += s[i + 1 : end]
+            i = end + 1
+        elif char == '"':
+            i = _scan_double_quoted(s, i + 1, word)
+        elif char == "\\":
+            if i + 1 < len(s) and s[i + 1] != "\n":
+                word.text += s[i + 1]
+            i += 2
+        elif s.startswith("$'", i):
+            i = _scan_ansi_c_quoted(s, i + 2, word)
+        elif char == "$":
+            i = _scan_dollar(s, i, word)
+        elif char == "`":
+            end = _closing_backtick(s, i + 1)
+            word.substitutions.append(s[i + 1 : end])
+            word.text += s[i : end + 1]
+            i = end + 1
+        else:
+            break
+    return word, i
+
+
+def _skip_heredocs(s: str, i: int, delimiters: list[tuple[str, bool]]) -> int:
+    """Skip heredoc bodies that start at index i (just after a newline)."""
+    for delimiter, strip_tabs in delimiters:
+        while i < len(s):
+            end = s.find("\n", i)
+            line = s[i:] if end < 0 else s[i:end]
+            i = len(s) if end < 0 else end + 1
+            if (line.lstrip("\t") if strip_tabs else line) == delimiter:
+                break
+    delimiters.clear()
+    return i
+
+
+def _tokenize(s: str) -> list[_Token]:
+    """Split a command line into words, operators and redirections."""
+    tokens: list[_Token] = []
+    heredocs: list[tuple[str, bool]] = []
+    i = 0
+    while i < len(s):
+        lexeme = _LEXEME.match(s, i)
+        kind = lexeme.lastgroup if lexeme else None
+        if kind is None:
+            word, end = _scan_word(s, i)
+            if end == i:
+                msg = f"unexpected character {s[i]!r}"
+                raise ShellSyntaxError(msg)
+            tokens.append(word)
+            i = end
+            continue
+
+        i = lexeme.end()
+        if kind == "newline":
+            tokens.append(_Op("\n"))
+            if heredocs:
+                i = _skip_heredocs(s, i, heredocs)
+        elif kind == "op":
+            tokens.append(_Op(lexeme.group()))
+        elif kind == "procsub":
+            # Process substitution: <(cmd) or >(cmd)
+            end = _closing_paren(s, i)
+            tokens.append(_Word(s[i - 2 : end + 1], [s[i:end]]))
+            i = end + 1
+        elif kind == "redirect":
+            tokens.append(_Redir(lexeme.group()))
+            if lexeme.group("heredoc"):
+                if blank := _BLANKS.match(s, i):
+                    i = blank.end()
+                delimiter, i = _scan_word(s, i)
+                heredocs.append((delimiter.text, lexeme.group("heredoc") == "<<-"))
+                tokens.append(_Word(delimiter.text))
+        # Blanks, line continuations and comments produce no token
+    return tokens
+
+
+class _Parser:
+    """Recursive descent over tokens, collecting pipelines."""
+
+    def __init__(self, tokens: list[_Token], depth: int) -> None:
+        self.tokens = tokens
+        self.pos = 0
+        self.depth = depth
+        self.pipelines: list[tuple[SimpleCommand, ...]] = []
+
+    def _peek(self) -> _Token | None:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _at_op(self, *ops: str) -> bool:
+        token = self._peek()
+        return isinstance(token, _Op) and token.op in ops
+
+    def _at_word(self, *words: str) -> bool:
+        token = self._peek()
+        return isinstance(token, _Word) and token.text in words
+
+    def parse_list(
+        self, cwd: str | None, function: str | None, closers: tuple[str, ...] = ()
+    ) -> str | None:
+        """Parse pipelines until a closer; return the final directory."""
+        while (token := self._peek()) is not None:
+            if self._at_op(*closers) or self._at_word(*closers):
+                return cwd
+            if self._at_op(*_SEPARATORS):
+                self.pos += 1
+                continue
+            start = self.pos
+            cwd = self._parse_pipeline(cwd, function)
+            # A stray operator (`echo a )`, `;;`) stops every parse step
+            if self.pos == start:
+                msg = f"unexpected {getattr(token, 'op', token)!r}"
+                raise ShellSyntaxError(msg)
+        if closers:
+            msg = f"expected {' or '.join(closers)}"
+            raise ShellSyntaxError(msg)
+        return cwd
+
+    def _parse_pipeline(self, cwd: str | None, function: str | None) -> str | None:
+        stages: list[SimpleCommand] = []
+        new_cwd = cwd
+        while True:
+            new_cwd = self._parse_command(cwd, function, stages)
+            if not self._at_op("|", "|&"):
+                break
+            self.pos += 1
+        if stages:
+            self.pipelines.append(tuple(stages))
+        # Pipeline stages run in subshells, so only a lone cd moves the shell
+        return new_cwd if len(stages) <= 1 else cwd
+
+    def _expect_op(self, op: str) -> None:
+        if not self._at_op(op):
+            msg = f"expected {op!r}"
+            raise ShellSyntaxError(msg)
+        self.pos += 1
+
+    def _parse_command(
+        self, cwd: str | None, function: str | None, stages: list[SimpleCommand]
+    ) -> str | None:
+        token = self._peek()
+        if isinstance(token, _Op) and token.op == "(":
+            self.pos += 1
+            self.parse_list(cwd, function, (")",))
+            self._expect_op(")")
+            return cwd
+        if isinstance(token, _Word) and token.text in _COMPOUND_WORDS:
+            self.pos += 1
+            return self._parse_compound(token.text, cwd, function, stages)
+        return self._parse_simple(cwd, function, stages)
+
+    def _parse_compound(
+        self,
+        keyword: str,
+        cwd: str | None,
+        function: str | None,
+        stages: list[SimpleCommand],
+    ) -> str | None:
+        """Parse the rest of a command introduced by a reserved word."""
+        if keyword in _PREFIX_KEYWORDS:
+            return self._parse_command(cwd, function, stages)
+        if keyword == "{":
+            cwd = self.parse_list(cwd, function, ("}",))
+            self.pos += 1
+        elif keyword == "case":
+            self._parse_case(cwd, function)
+        elif keyword == "function" and isinstance(name := self._peek(), _Word):
+            self.pos += 1
+            if self._at_op("("):
+                self._expect_op("(")
+                self._expect_op(")")
+            self._parse_function_body(cwd, name.text, stages)
+        elif keyword in ("for", "select"):
+            self._skip_until_separator()
+        return cwd
+
+    def _parse_simple(
+        self, cwd: str | None, function: str | None, stages: list[SimpleCommand]
+    ) -> str | None:
+        words: list[_Word] = []
+        redirects: list[Redirect] = []
+        while (token := self._peek()) is not None:
+            if isinstance(token, _Word):
+                words.append(token)
+                self.pos += 1
+            elif isinstance(token, _Redir):
+                self.pos += 1
+                target = self._peek()
+                if not isinstance(target, _Word):
+                    msg = f"missing target for {token.op!r}"
+                    raise ShellSyntaxError(msg)
+                redirects.append(Redirect(token.op, target.text))
+                if target.substitutions:
+                    self._parse_substitutions(target.substitutions, cwd)
+                self.pos += 1
+            elif token.op == "(" and len(words) == 1 and not redirects:
+                # Function definition: name () compound-command
+                self._expect_op("(")
+                self._expect_op(")")
+                return self._parse_function_body(cwd, words[0].text, stages)
+            else:
+                break
+
+        substituted: list[str] = []
+        for word in words:
+            for inner in word.substitutions:
+                substituted.extend(self._parse_substitutions([inner], cwd))
+        argv = [word.text for word in words]
+        while argv and _ASSIGNMENT.match(argv[0]):
+            argv.pop(0)
+        if not argv and not redirects:
+            return cwd
+        return self._add_command(
+            argv, redirects, cwd, function, tuple(substituted), stages
+        )
+
+    def _parse_function_body(
+        self, cwd: str | None, name: str, stages: list[SimpleCommand]
+    ) -> str | None:
+        while self._at_op("\n"):
+            self.pos += 1
+        self._parse_command(cwd, name, stages)
+        return cwd
+
+    def _skip_until_separator(self) -> None:
+        while self._peek() is not None and not self._at_op(*_SEPARATORS):
+            self.pos += 1
+
+    def _parse_case(self, cwd: str | None, function: str | None) -> None:
+        """Parse `WORD in pattern) list ;; ... esac` after `case`."""
+        while self._peek() is not None and not self._at_word("in"):
+            self.pos += 1
+        self.pos += 1
+        while self._peek() is not None:
+            while self._at_op("\n", ";"):
+                self.pos += 1
+            if self._at_word("esac"):
+                self.pos += 1
+                return
+            # Pattern list up to the closing parenthesis
+            while self._peek() is not None and not self._at_op(")"):
+                self.pos += 1
+            self.pos += 1
+            self.parse_list(cwd, function, (";;", "esac"))
+            if self._at_op(";;"):
+                self.pos += 1
+        msg = "expected esac"
+        raise ShellSyntaxError(msg)
+
+    def _parse_substitutions(self, sources: list[str], cwd: str | None) -> list[str]:
+        """Parse substitution bodies; return the programs they run."""
+        programs: list[str] = []
+        for source in sources:
+            inner = _parse(source, cwd, self.depth + 1)
+            self.pipelines.extend(inner.pipelines)
+            programs.extend(cmd.program for cmd in inner.commands)
+        return programs
+
+    def _add_command(
+        self,
+        argv: list[str],
+        redirects: list[Redirect],
+        cwd: str | None,
+        function: str | None,
+        substituted: tuple[str, ...],
+        stages: list[SimpleCommand],
+    ) -> str | None:
+        argv, cwd = _unwrap(argv, cwd)
+        program = posixpath.basename(argv[0]) if argv else ""
+
+        # Strings run by a nested shell are commands too
+        script = _script_argument(program, argv)
+        if script is not None:
+            inner = _parse(script, cwd, self.depth + 1)
+            self.pipelines.extend(inner.pipelines)
+            substituted += tuple(cmd.program for cmd in inner.commands)
+
+        stages.append(
+            SimpleCommand(
+                argv=tuple(argv),
+                redirects=tuple(redirects),
+                cwd=cwd,
+                function=function,
+                substituted=substituted,
+            )
+        )
+        if program in ("cd", "pushd"):
+            return _chdir(cwd, _first_operand(argv[1:]))
+        return cwd
+
+
+def _first_operand(args: list[str]) -> str | None:
+    for arg in args:
+        if arg == "--" or not arg.startswith("-") or arg == "-":
+            return arg if arg != "--" else None
+    return None
+
+
+def _chdir(cwd: str | None, target: str | None) -> str | None:
+    """Directory after `cd target` from cwd (see SimpleCommand.cwd)."""
+    if target is None or target in ("~", "$HOME", "${HOME}"):
+        return "~"
+    if target == "-" or "$" in target.split("/", 1)[-1] or "`" in target:
+        return None
+    if target.startswith(("/", "~/", "$HOME/", "${HOME}/")):
+        return target
+    if cwd is None:
+        return None
+    return posixpath.normpath(posixpath.join(cwd, target))
+
+
+def _unwrap(argv: list[str], cwd: str | None) -> tuple[list[str], str | None]:
+    """Strip wrappers like `sudo -u x`, `env A=1`, `nohup` from argv."""
+    while argv:
+        program = posixpath.basename(argv[0])
+        with_value = _WRAPPER_OPTIONS_WITH_VALUE.get(program)
+        if with_value is None:
+            break
+        if program == "command" and len(argv) > 1 and argv[1] in ("-v", "-V"):
+            break
+        i = 1
+        while i < len(argv):
+            arg = argv[i]
+            if arg == "--":
+                i += 1
+                break
+            if program == "env" and _ASSIGNMENT.match(arg):
+                i += 1
+            elif arg.startswith("-") and arg != "-":
+                if program == "env" and arg in ("-C", "--chdir") and i + 1 < len(argv):
+                    cwd = _chdir(cwd, argv[i + 1])
+                i += 2 if arg in with_value else 1
+            else:
+                break
+        i += _WRAPPER_LEADING_OPERANDS.get(program, 0)
+        argv = argv[i:]
+    return argv, cwd
+
+
+def _script_argument(program: str, argv: list[str]) -> str | None:
+    """Return the script string run by `bash -c` or `eval`, if any."""
+    if program == "eval":
+        return " ".join(argv[1:])
+    if program in SHELLS:
+        for i, arg in enumerate(argv[1:-1], start=1):
+            if (
+                arg.startswith("-")
+                and "c" in arg.lstrip("-")
+                and not arg.startswith("--")
+            ):
+                return argv[i + 1]
+    return None
+
+
+# Substitutions and `bash -c` strings nest; deeper input is rejected
+_MAX_DEPTH = 8
+
+
+def _parse(source: str, cwd: str | None, depth: int) -> ParsedCommand:
+    if depth > _MAX_DEPTH:
+        msg = "commands nested too deeply"
+        raise ShellSyntaxError(msg)
+    parser = _Parser(_tokenize(source), depth)
+    parser.parse_list(cwd, None)
+    return ParsedCommand(pipelines=tuple(parser.pipelines))
+
+
+_parse_cache: dict[str, ParsedCommand] = {}
+
+
+def parse_command(cmd: str) -> ParsedCommand:
+    """Parse a command line into pipelines of simple commands.
+
+    Results are memoized (up to DEFAULT_PARSE_CACHE_SIZE command strings).
+
+    Args:
+        cmd: Command line as given to the Bash tool.
+
+    Returns:
+        ParsedCommand with every simple command the line would run.
+
+    Raises:
+        ShellSyntaxError: If the command line cannot be tokenized.
+    """
+    try:
+        return _parse_cache[cmd]
+    except KeyError:
+        pass
+    parsed = _parse(cmd, ".", 0)
+    if len(_parse_cache) >= DEFAULT_PARSE_CACHE_SIZE:
+        # Evict the oldest entry (dicts preserve insertion order)
+        del _parse_cache[next(iter(_parse_cache))]
+    _parse_cache[cmd] = parsed
+    return parsed
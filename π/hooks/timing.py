@@ -0,0 +1,86 @@
+"""Timing of hook callbacks and the lint work they schedule.
+
+Hooks run inside the π process, outside any observer's view. Each timed
+hook (and each scheduled lint batch) is reported to subscribers as a
+HookSpan carrying the SDK session_id, so a trace can place it under the
+agent and tool call it belongs to. Nothing is recorded without subscribers.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterator
+
+    from claude_agent_sdk.types import HookContext, HookInput, HookJSONOutput
+
+    type HookCallback = Callable[
+        [HookInput, str | None, HookContext], Awaitable[HookJSONOutput]
+    ]
+
+
+@dataclass(frozen=True, slots=True)
+class HookSpan:
+    """A timed hook call or lint run (times from time.monotonic)."""
+
+    name: str
+    session_id: str
+    start: float
+    end: float
+    args: dict[str, str] = field(default_factory=dict)
+
+
+type HookSpanListener = Callable[[HookSpan], None]
+_span_listeners: list[HookSpanListener] = []
+
+
+def subscribe_to_hook_spans(listener: HookSpanListener) -> Callable[[], None]:
+    """Subscribe to hook spans.
+
+    Args:
+        listener: Callback function that receives HookSpan objects.
+
+    Returns:
+        Unsubscribe function to remove the listener.
+    """
+    _span_listeners.append(listener)
+    return lambda: _span_listeners.remove(listener)
+
+
+@contextlib.contextmanager
+def hook_span(name: str, session_id: str, **args: str) -> Iterator[None]:
+    """Report the time spent in the block as a HookSpan."""
+    if not _span_listeners:
+        yield
+        return
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        span = HookSpan(name, session_id, start, time.monotonic(), args)
+        for listener in _span_listeners:
+            listener(span)
+
+
+@functools.cache
+def timed_hook(hook: HookCallback) -> HookCallback:
+    """Wrap a hook callback so each call is reported as a HookSpan.
+
+    Wrappers are cached per hook, so option sets built separately share
+    their pooled clients (see π.bridge.pool.options_fingerprint).
+    """
+
+    @functools.wraps(hook)
+    async def timed(
+        input_data: HookInput, tool_use_id: str | None, context: HookContext
+    ) -> HookJSONOutput:
+        args = {"tool_use_id": tool_use_id} if tool_use_id else {}
+        with hook_span(hook.__name__, input_data.get("session_id", ""), **args):
+            return await hook(input_data, tool_use_id, context)
+
+    return timed
@@ -1,12 +1,25 @@
 """Utility functions for hook operations."""
 
-import subprocess
+import asyncio
+import contextlib
+import os
+import signal
+import weakref
+from os import getenv
 from pathlib import Path
 
 from π.utils import get_project_root
 
 _home_dir = Path.home()
 
+# Environment variable limiting concurrent check commands across sessions
+LINT_CONCURRENCY_ENV = "PI_LINT_CONCURRENCY"
+DEFAULT_LINT_CONCURRENCY = 4
+
+_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
 
 def compact_path(path: Path | str) -> str:
     """Format a file path for readable console output.
@@ -64,7 +77,32 @@ def find_project_root(start_path: Path, marker_files: list[str]) -> Path | None:
     return None
 
 
-def run_check_command(
+def _lint_concurrency() -> int:
+    try:
+        return max(int(getenv(LINT_CONCURRENCY_ENV, str(DEFAULT_LINT_CONCURRENCY))), 1)
+    except ValueError:
+        return DEFAULT_LINT_CONCURRENCY
+
+
+def _check_semaphore() -> asyncio.Semaphore:
+    """Get the check command limiter for the running event loop."""
+    loop = asyncio.get_running_loop()
+    if loop not in _semaphores:
+        _semaphores[loop] = asyncio.Semaphore(_lint_concurrency())
+    return _semaphores[loop]
+
+
+async def _kill(proc: asyncio.subprocess.Process) -> None:
+    """Kill a check process and its children, then reap it."""
+    with contextlib.suppress(ProcessLookupError, PermissionError):
+        if hasattr(os, "killpg"):
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    await proc.wait()
+
+
+async def run_check_command(
     cwd: Path,
     cmd: list[str],
     name: str,
@@ -73,6 +111,10 @@ def run_check_command(
 ) -> tuple[int, str, str]:
     """Run a check command and return raw results for processing.
 
+    Runs without blocking the event loop, limited to PI_LINT_CONCURRENCY
+    concurrent commands. On timeout or cancellation the command's whole
+    process group is killed.
+
     Args:
         cwd: Working directory to run command in
         cmd: Command and arguments as list
@@ -82,15 +124,31 @@ def run_check_command(
     Returns:
         Tuple of (exit_code, stdout, stderr)
     """
-    try:
-        result = subprocess.run(
-            cmd, check=False, cwd=cwd, capture_output=True, text=True, timeout=timeout
+    async with _check_semaphore():
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=cwd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=True,
+            )
+        except FileNotFoundError:
+            return (127, "", f"{name} not found")
+        except Exception as e:
+            return (1, "", f"{name} error: {e}")
+
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except TimeoutError:
+            await _kill(proc)
+            return (124, "", f"{name} timed out")
+        except asyncio.CancelledError:
+            await _kill(proc)
+            raise
+
+        return (
+            proc.returncode or 0,
+            stdout.decode(errors="replace"),
+            stderr.decode(errors="replace"),
         )
-        return (result.returncode, result.stdout, result.stderr)
-
-    except subprocess.TimeoutExpired:
-        return (124, "", f"{name} timed out")
-    except FileNotFoundError:
-        return (127, "", f"{name} not found")
-    except Exception as e:
-        return (1, "", f"{name} error: {e}")
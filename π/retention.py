@@ -0,0 +1,277 @@
+"""Retention of run logs in `.π/logs`.
+
+Every run adds a timestamped text log, JSONL event log and trace. Files of
+one run share the timestamp prefix and are handled as a group: groups past
+the compression age are gzipped in place, groups past the maximum age are
+deleted, and the oldest groups are deleted while the directory is over its
+size budget. The current run's group is never touched.
+
+Spilled payloads in `blobs/` (see π.workflow.blobs) are shared between
+runs; their mtime is refreshed whenever a run references them, so they
+expire by age and count toward the size budget like single-file runs.
+
+Pruning runs on a daemon thread started with the run, so it never delays
+the first agent turn.
+"""
+
+from __future__ import annotations
+
+import gzip
+import logging
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from os import getenv
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+BLOBS_DIR_NAME = "blobs"
+
+# Environment variables (0 disables the limit); CLI flags override them
+MAX_AGE_ENV = "PI_LOG_MAX_AGE_DAYS"
+MAX_SIZE_ENV = "PI_LOG_MAX_MB"
+COMPRESS_AFTER_ENV = "PI_LOG_COMPRESS_AFTER_DAYS"
+DEFAULT_MAX_AGE_DAYS = 7.0
+DEFAULT_MAX_MB = 500.0
+DEFAULT_COMPRESS_AFTER_DAYS = 1.0
+
+# Temporary files of interrupted compressions older than this are removed
+_STALE_TMP_S = 3600
+_DAY_S = 24 * 3600
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return max(float(getenv(name, str(default))), 0.0)
+    except ValueError:
+        logger.warning("Invalid %s, using %s", name, default)
+        return default
+
+
+@dataclass(frozen=True, slots=True)
+class RetentionPolicy:
+    """Limits for the logs directory (None disables a limit)."""
+
+    max_age_s: float | None = DEFAULT_MAX_AGE_DAYS * _DAY_S
+    max_bytes: int | None = int(DEFAULT_MAX_MB * 1024 * 1024)
+    compress_after_s: float | None = DEFAULT_COMPRESS_AFTER_DAYS * _DAY_S
+
+    @classmethod
+    def from_env(
+        cls,
+        *,
+        max_age_days: float | None = None,
+        max_mb: float | None = None,
+        compress_after_days: float | None = None,
+    ) -> RetentionPolicy:
+        """Build the policy from arguments, falling back to the environment.
+
+        Args:
+            max_age_days: Delete runs older than this (0 = keep forever).
+            max_mb: Delete oldest runs above this total size (0 = unbounded).
+            compress_after_days: Gzip runs older than this (0 = never).
+        """
+        if max_age_days is None:
+            max_age_days = _env_float(MAX_AGE_ENV, DEFAULT_MAX_AGE_DAYS)
+        if max_mb is None:
+            max_mb = _env_float(MAX_SIZE_ENV, DEFAULT_MAX_MB)
+        if compress_after_days is None:
+            compress_after_days = _env_float(
+                COMPRESS_AFTER_ENV, DEFAULT_COMPRESS_AFTER_DAYS
+            )
+        return cls(
+            max_age_s=max_age_days * _DAY_S if max_age_days > 0 else None,
+            max_bytes=int(max_mb * 1024 * 1024) if max_mb > 0 else None,
+            compress_after_s=(
+                compress_after_days * _DAY_S if compress_after_days > 0 else None
+            ),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PruneResult:
+    """What one pruning pass did."""
+
+    compressed: int = 0
+    removed: int = 0
+    bytes_freed: int = 0
+
+
+@dataclass(slots=True)
+class _RunFiles:
+    """Files of one run (same timestamp prefix)."""
+
+    files: list[Path]
+    mtime: float
+    size: int
+
+
+def run_key(path: Path) -> str:
+    """Group key of a log file: its name up to the first dot."""
+    return path.name.partition(".")[0]
+
+
+def _scan(logs_dir: Path, now: float) -> tuple[dict[str, _RunFiles], list[_RunFiles]]:
+    """Group log files by run; blobs are returned as one-file runs."""
+    runs: dict[str, _RunFiles] = {}
+    blobs: list[_RunFiles] = []
+    blobs_dir = logs_dir / BLOBS_DIR_NAME
+    paths = [*logs_dir.iterdir(), *blobs_dir.glob("*/*")]
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        if not path.is_file():
+            continue
+        if path.suffix == ".tmp":
+            if now - stat.st_mtime > _STALE_TMP_S:
+                path.unlink(missing_ok=True)
+            continue
+        if path.parent != logs_dir:
+            blobs.append(_RunFiles([path], stat.st_mtime, stat.st_size))
+            continue
+        run = runs.setdefault(run_key(path), _RunFiles([], 0.0, 0))
+        run.files.append(path)
+        run.mtime = max(run.mtime, stat.st_mtime)
+        run.size += stat.st_size
+    return runs, blobs
+
+
+def _compress(path: Path) -> int:
+    """Gzip a file in place, keeping its mtime; returns bytes saved."""
+    stat = path.stat()
+    target = path.with_name(f"{path.name}.gz")
+    tmp = path.with_name(f"{path.name}.gz.{os.getpid()}.tmp")
+    try:
+        with path.open("rb") as src, gzip.open(tmp, "wb", compresslevel=6) as dst:
+            shutil.copyfileobj(src, dst)
+        os.utime(tmp, (stat.st_atime, stat.st_mtime))
+        tmp.replace(target)
+    finally:
+        tmp.unlink(missing_ok=True)
+    path.unlink(missing_ok=True)
+    return stat.st_size - target.stat().st_size
+
+
+def _compress_run(run: _RunFiles) -> tuple[int, int]:
+    """Gzip a run's uncompressed files; returns (files, bytes saved)."""
+    count = total_saved = 0
+    for i, path in enumerate(run.files):
+        if path.suffix == ".gz":
+            continue
+        try:
+            saved = _compress(path)
+        except OSError:
+            logger.debug("Failed to compress %s", path, exc_info=True)
+            continue
+        run.files[i] = path.with_name(f"{path.name}.gz")
+        run.size -= saved
+        total_saved += saved
+        count += 1
+    return count, total_saved
+
+
+def _remove(run: _RunFiles) -> int:
+    for path in run.files:
+        path.unlink(missing_ok=True)
+    return len(run.files)
+
+
+def prune_logs(
+    logs_dir: Path,
+    policy: RetentionPolicy,
+    *,
+    keep: Path | None = None,
+    now: float | None = None,
+) -> PruneResult:
+    """Apply the retention policy to a logs directory.
+
+    Runs are deleted by age first, then compressed, then deleted oldest
+    first until the directory fits the size budget. Files that vanish
+    mid-pass (another π process pruning) are skipped.
+
+    Args:
+        logs_dir: Directory holding run logs.
+        policy: Limits to apply.
+        keep: A file of the current run; its run is never touched.
+        now: Current time (defaults to time.time()).
+
+    Returns:
+        Counts of compressed and removed files.
+    """
+    now = time.time() if now is None else now
+    runs, blobs = _scan(logs_dir, now)
+    if keep is not None:
+        runs.pop(run_key(keep), None)
+
+    compressed = removed = freed = 0
+    for key, run in sorted(runs.items(), key=lambda item: item[1].mtime):
+        age = now - run.mtime
+        if policy.max_age_s is not None and age > policy.max_age_s:
+            removed += _remove(run)
+            freed += run.size
+            del runs[key]
+        elif policy.compress_after_s is not None and age > policy.compress_after_s:
+            count, saved = _compress_run(run)
+            compressed += count
+            freed += saved
+
+    if policy.max_age_s is not None:
+        expired = [blob for blob in blobs if now - blob.mtime > policy.max_age_s]
+        for blob in expired:
+            removed += _remove(blob)
+            freed += blob.size
+        blobs = [blob for blob in blobs if now - blob.mtime <= policy.max_age_s]
+
+    if policy.max_bytes is not None:
+        candidates = [*runs.values(), *blobs]
+        total = sum(run.size for run in candidates)
+        for run in sorted(candidates, key=lambda r: r.mtime):
+            if total <= policy.max_bytes:
+                break
+            removed += _remove(run)
+            freed += run.size
+            total -= run.size
+
+    if compressed or removed:
+        logger.debug(
+            "Log retention: compressed %d, removed %d files (%d bytes freed)",
+            compressed,
+            removed,
+            freed,
+        )
+    return PruneResult(compressed=compressed, removed=removed, bytes_freed=freed)
+
+
+def start_log_retention(
+    logs_dir: Path, policy: RetentionPolicy, *, keep: Path | None = None
+) -> threading.Thread:
+    """Prune logs_dir on a background daemon thread.
+
+    Errors are logged, never raised.
+
+    Args:
+        logs_dir: Directory holding run logs.
+        policy: Limits to apply.
+        keep: A file of the current run; its run is never touched.
+
+    Returns:
+        The started thread (join it to wait for the pass to finish).
+    """
+
+    def run() -> None:
+        try:
+            prune_logs(logs_dir, policy, keep=keep)
+        except OSError:
+            logger.warning("Log retention failed for %s", logs_dir, exc_info=True)
+
+    thread = threading.Thread(target=run, name="π-log-retention", daemon=True)
+    thread.start()
+    return thread
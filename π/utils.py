@@ -1,7 +1,6 @@
 """Utility functions for the π CLI."""
 
 import logging
-import subprocess
 from collections.abc import Callable
 from functools import wraps
 from os import getenv, getpid, system
@@ -20,9 +19,69 @@ PROJECT_MARKERS = {
 }
 
 
+# Project roots by start directory; see clear_project_root_cache()
+_project_roots: dict[Path, Path] = {}
+
+
+def _is_git_dir(path: Path) -> bool:
+    """Check whether path looks like a git directory (has HEAD)."""
+    return (path / "HEAD").is_file()
+
+
+def _read_gitdir_file(git_file: Path) -> Path | None:
+    """Resolve a `.git` file (worktrees, submodules) to its git directory."""
+    try:
+        content = git_file.read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+    if not content.startswith("gitdir:"):
+        return None
+    gitdir = Path(content.removeprefix("gitdir:").strip())
+    return gitdir if gitdir.is_absolute() else git_file.parent / gitdir
+
+
+def find_git_root(start_path: Path) -> Path | None:
+    """Find the git work tree containing start_path without running git.
+
+    Walks upward for a `.git` directory, or a `.git` file pointing at the
+    git directory (linked worktrees and submodules), like
+    `git rev-parse --show-toplevel`.
+
+    Args:
+        start_path: Directory to search upward from.
+
+    Returns:
+        Work tree root, or None outside a git repository.
+    """
+    start = start_path.resolve()
+    for directory in (start, *start.parents):
+        dot_git = directory / ".git"
+        if dot_git.is_dir():
+            if _is_git_dir(dot_git):
+                return directory
+        elif dot_git.is_file():
+            gitdir = _read_gitdir_file(dot_git)
+            if gitdir is not None and _is_git_dir(gitdir):
+                return directory
+    return None
+
+
+def _detect_project_root(cwd: Path) -> Path:
+    """Detect project root: CWD if has markers, else git root, else CWD."""
+    # Check if CWD has project markers
+    if any((cwd / m).exists() for m in PROJECT_MARKERS):
+        return cwd
+
+    # Fallback: git root, then CWD
+    return find_git_root(cwd) or cwd
+
+
 def get_project_root(start_path: Path | None = None) -> Path:
     """Detect project root: CWD if has markers, else git root, else CWD.
 
+    Results are memoized per start directory; call clear_project_root_cache()
+    after creating or moving repositories.
+
     Args:
         start_path: Starting path for detection. Defaults to CWD.
 
@@ -30,26 +89,22 @@ def get_project_root(start_path: Path | None = None) -> Path:
         Detected project root path.
     """
     cwd = start_path or Path.cwd()
+    root = _project_roots.get(cwd)
+    if root is None:
+        root = _project_roots[cwd] = _detect_project_root(cwd)
+    return root
 
-    # Check if CWD has project markers
-    if any((cwd / m).exists() for m in PROJECT_MARKERS):
-        return cwd
 
-    # Fallback: git root
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--show-toplevel"],
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return Path(result.stdout.strip())
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        pass
-
-    # Final fallback: CWD
-    return cwd
+def clear_project_root_cache(start_path: Path | None = None) -> None:
+    """Forget memoized project roots.
+
+    Args:
+        start_path: Forget only this start directory. Defaults to all.
+    """
+    if start_path is None:
+        _project_roots.clear()
+    else:
+        _project_roots.pop(start_path, None)
 
 
 def prevent_sleep(func: Callable[..., Any]) -> Callable[..., Any]:
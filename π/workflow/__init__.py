@@ -3,18 +3,26 @@
 This package contains the core workflow components:
 - context: Workflow context management
 - state: UI state and artifact event system
-- observer: Observer protocol and implementations
+- observer: Observer protocol and implementations (text and JSONL logs)
+- bus: Fault-isolated observer bus with per-observer delivery threads
+- blobs: Content-addressed store for large logged payloads
+- metrics: Per-tool latency summary and run metrics export
+- trace: Chrome trace export of whole runs
 - output: Structured output model
 - tools: MCP workflow tools (import from π.workflow.tools to avoid circular imports)
 """
 
+from π.workflow.blobs import BlobStore
+from π.workflow.bus import ObserverBus, ObserverStats
 from π.workflow.context import (
     WorkflowContext,
     get_workflow_ctx,
     reset_workflow_ctx,
 )
+from π.workflow.metrics import MetricsObserver, ToolLatency, ToolLatencyObserver
 from π.workflow.observer import (
     CompositeObserver,
+    EventLogObserver,
     LoggingObserver,
     WorkflowObserver,
     dispatch_message,
@@ -30,12 +38,21 @@ from π.workflow.state import (
     set_live_display_active,
     subscribe_to_artifacts,
 )
+from π.workflow.trace import TraceObserver
 
 __all__ = [
     "ArtifactEvent",
     "ArtifactStatus",
+    "BlobStore",
     "CompositeObserver",
+    "EventLogObserver",
     "LoggingObserver",
+    "MetricsObserver",
+    "ObserverBus",
+    "ObserverStats",
+    "ToolLatency",
+    "ToolLatencyObserver",
+    "TraceObserver",
     "WorkflowContext",
     "WorkflowObserver",
     "WorkflowOutput",
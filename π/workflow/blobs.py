@@ -0,0 +1,120 @@
+"""Content-addressed store for large log payloads.
+
+Write and Edit tool inputs carry whole file bodies, and retries or rewrites
+log the same text again. LoggingObserver spills strings above a size
+threshold to `.π/logs/blobs/<sha[:2]>/<sha>` and logs a reference with the
+hash and size instead, so each payload is written (and escaped) once.
+
+The store is used from the log writer thread only. Blobs are written
+atomically, so concurrent runs sharing the directory at worst write the
+same content twice. Log retention expires blobs by their mtime, which is
+refreshed when a run references an existing blob.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from os import getenv
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Strings larger than this many bytes (UTF-8) are spilled; 0 disables
+BLOB_THRESHOLD_ENV = "PI_LOG_BLOB_THRESHOLD"
+DEFAULT_BLOB_THRESHOLD = 4096
+
+
+def blob_threshold() -> int:
+    """Get the blob spill threshold in bytes (0 = never spill)."""
+    try:
+        return max(int(getenv(BLOB_THRESHOLD_ENV, str(DEFAULT_BLOB_THRESHOLD))), 0)
+    except ValueError:
+        return DEFAULT_BLOB_THRESHOLD
+
+
+def blob_ref(digest: str, size: int) -> str:
+    """Text that stands in for a spilled payload in the log."""
+    return f"<blob sha256:{digest} {size} bytes>"
+
+
+class BlobStore:
+    """Content-addressed blob directory with a spill threshold.
+
+    Usage:
+        blobs = BlobStore(logs_dir / BLOBS_DIR_NAME)
+        observer = LoggingObserver(log_path, blobs=blobs)
+    """
+
+    def __init__(self, directory: Path, *, threshold: int | None = None) -> None:
+        """Initialize the store (the directory is created on first spill).
+
+        Args:
+            directory: Blob directory.
+            threshold: Spill strings above this many bytes (default from
+                PI_LOG_BLOB_THRESHOLD; 0 disables spilling).
+        """
+        self.directory = directory
+        self.threshold = blob_threshold() if threshold is None else threshold
+        # Digests known to be on disk (written or touched by this process)
+        self._stored: set[str] = set()
+        self.spilled = 0
+        self.bytes_spilled = 0
+
+    def path_for(self, digest: str) -> Path:
+        """Path of the blob with the given SHA-256 hex digest."""
+        return self.directory / digest[:2] / digest
+
+    def put(self, data: bytes) -> str:
+        """Store data if not already present; returns its SHA-256 hex digest.
+
+        Existing blobs get their mtime refreshed once per process, so log
+        retention can prune blobs no kept log refers to by age.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        if digest in self._stored:
+            return digest
+        path = self.path_for(digest)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{digest}.{os.getpid()}.tmp")
+            tmp.write_bytes(data)
+            tmp.replace(path)
+            self.bytes_spilled += len(data)
+        self._stored.add(digest)
+        return digest
+
+    def spill(self, value: object) -> object:
+        """Replace large strings in a log payload with blob references.
+
+        Dicts and lists are walked recursively; other values are returned
+        unchanged. Blob write errors leave the string in place.
+        """
+        if isinstance(value, str):
+            return self._spill_str(value)
+        if isinstance(value, dict):
+            return {key: self.spill(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.spill(item) for item in value]
+        return value
+
+    def _spill_str(self, value: str) -> str:
+        # UTF-8 is at most 4 bytes per character: skip encoding small strings
+        if not self.threshold or len(value) * 4 <= self.threshold:
+            return value
+        data = value.encode()
+        if len(data) <= self.threshold:
+            return value
+        try:
+            digest = self.put(data)
+        except OSError:
+            logger.debug("Failed to spill blob to %s", self.directory, exc_info=True)
+            return value
+        self.spilled += 1
+        return blob_ref(digest, len(data))
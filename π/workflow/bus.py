@@ -0,0 +1,313 @@
+"""Fault-isolated observer bus.
+
+CompositeObserver calls each observer in turn on the dispatching thread, so
+one failing observer aborts delivery to the rest and a slow one stalls the
+SDK message loop. ObserverBus gives each observer its own queue and daemon
+thread instead: publishing never blocks, failures are logged and counted
+per observer, and handling time is measured per observer.
+
+Observers that timestamp events on receipt (TraceObserver) can be attached
+inline; they run on the dispatching thread, still isolated and measured.
+
+An observer whose queue grows past lag_threshold is reported as falling
+behind; past max_pending its new events are dropped (and counted) rather
+than holding up dispatch_message.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from π.workflow.observer import WorkflowObserver
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LAG_THRESHOLD = 1_000
+DEFAULT_MAX_PENDING = 50_000
+
+# (observer method, positional args, keyword args)
+type _Event = tuple[str, tuple[Any, ...], dict[str, Any]]
+
+
+@dataclass(slots=True)
+class ObserverStats:
+    """Delivery statistics for one observer on the bus."""
+
+    name: str
+    events: int = 0
+    errors: int = 0
+    dropped: int = 0
+    busy_s: float = 0.0
+    max_handle_s: float = 0.0
+    # Highest queue depth seen when publishing
+    max_pending: int = 0
+
+    @property
+    def mean_handle_ms(self) -> float:
+        """Mean handling time per delivered event in milliseconds."""
+        return self.busy_s * 1000 / self.events if self.events else 0.0
+
+
+class _Channel:
+    """One observer with its stats and, unless inline, its delivery thread."""
+
+    def __init__(
+        self, observer: WorkflowObserver, name: str, *, inline: bool, max_pending: int
+    ) -> None:
+        self.observer = observer
+        self.stats = ObserverStats(name)
+        self.lagging = False
+        self._thread: threading.Thread | None = None
+        self._queue: queue.Queue[_Event | threading.Event | None] = queue.Queue(
+            maxsize=max_pending
+        )
+        if not inline:
+            self._thread = threading.Thread(
+                target=self._run, name=f"π-observer-{name}", daemon=True
+            )
+            self._thread.start()
+
+    @property
+    def inline(self) -> bool:
+        return self._thread is None
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def publish(self, event: _Event) -> bool:
+        """Deliver or queue an event; returns False if it was dropped."""
+        if self.inline:
+            self.deliver(event)
+            return True
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.stats.dropped += 1
+            return False
+        return True
+
+    def deliver(self, event: _Event) -> None:
+        """Call the observer, isolating and timing it."""
+        method, args, kwargs = event
+        start = time.perf_counter()
+        try:
+            getattr(self.observer, method)(*args, **kwargs)
+        except Exception:
+            self.stats.errors += 1
+            # Full traceback once; an observer failing on every event would
+            # otherwise flood the log
+            if self.stats.errors == 1:
+                logger.exception("Observer %s failed in %s", self.stats.name, method)
+            else:
+                logger.debug("Observer %s failed in %s", self.stats.name, method)
+        elapsed = time.perf_counter() - start
+        self.stats.events += 1
+        self.stats.busy_s += elapsed
+        self.stats.max_handle_s = max(self.stats.max_handle_s, elapsed)
+
+    def flush(self) -> None:
+        if self.inline:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def close(self, timeout: float) -> bool:
+        """Drain and stop the thread; returns False if it did not finish."""
+        if self._thread is None:
+            return True
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return False
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            if isinstance(item, threading.Event):
+                item.set()
+            else:
+                self.deliver(item)
+
+
+class ObserverBus:
+    """Delivers events to observers from per-observer background threads.
+
+    Implements WorkflowObserver, so it can be used wherever a
+    CompositeObserver is. Call flush() before reading an observer's state
+    and close() at the end of the run.
+
+    Usage:
+        bus = ObserverBus([live, log, metrics], inline=[tracer])
+        ctx.observer = bus
+        ...
+        bus.close()
+    """
+
+    def __init__(
+        self,
+        observers: list[WorkflowObserver],
+        *,
+        inline: list[WorkflowObserver] | None = None,
+        lag_threshold: int = DEFAULT_LAG_THRESHOLD,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ) -> None:
+        """Start a delivery thread per observer.
+
+        Args:
+            observers: Observers fed from background threads.
+            inline: Observers called on the dispatching thread.
+            lag_threshold: Queue depth at which an observer is reported as
+                falling behind.
+            max_pending: Queue depth above which an observer's new events
+                are dropped.
+        """
+        self.lag_threshold = lag_threshold
+        self._channels: list[_Channel] = []
+        names: set[str] = set()
+        for observer, is_inline in [
+            *((obs, True) for obs in inline or []),
+            *((obs, False) for obs in observers),
+        ]:
+            name = type(observer).__name__
+            if name in names:
+                name = f"{name}-{len(self._channels)}"
+            names.add(name)
+            self._channels.append(
+                _Channel(observer, name, inline=is_inline, max_pending=max_pending)
+            )
+        self._closed = False
+
+    def _publish(self, method: str, *args: Any, **kwargs: Any) -> None:
+        if self._closed:
+            return
+        event: _Event = (method, args, kwargs)
+        for channel in self._channels:
+            if not channel.publish(event) and channel.stats.dropped == 1:
+                logger.warning(
+                    "Observer %s queue is full; dropping events", channel.stats.name
+                )
+            if not channel.inline:
+                self._check_lag(channel)
+
+    def _check_lag(self, channel: _Channel) -> None:
+        pending = channel.pending
+        stats = channel.stats
+        stats.max_pending = max(stats.max_pending, pending)
+        if not channel.lagging and pending >= self.lag_threshold:
+            channel.lagging = True
+            logger.warning(
+                "Observer %s is falling behind: %d events queued (%.1f ms/event)",
+                stats.name,
+                pending,
+                stats.mean_handle_ms,
+            )
+        elif channel.lagging and pending < self.lag_threshold // 2:
+            channel.lagging = False
+
+    def stats(self) -> list[ObserverStats]:
+        """Delivery statistics per observer, in registration order."""
+        return [channel.stats for channel in self._channels]
+
+    def lagging(self) -> list[str]:
+        """Names of observers currently falling behind."""
+        return [c.stats.name for c in self._channels if c.lagging]
+
+    def flush(self) -> None:
+        """Block until every queued event has been delivered."""
+        for channel in self._channels:
+            channel.flush()
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Deliver queued events, stop the threads and log the statistics.
+
+        Args:
+            timeout: Seconds to wait for each observer to drain.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        for channel in self._channels:
+            if not channel.close(timeout):
+                logger.warning(
+                    "Observer %s did not drain within %.0fs (%d events queued)",
+                    channel.stats.name,
+                    timeout,
+                    channel.pending,
+                )
+        for stats in self.stats():
+            logger.debug(
+                "Observer %s: %d events, %.1f ms mean, %.1f ms max, "
+                "%d errors, %d dropped, %d max queued",
+                stats.name,
+                stats.events,
+                stats.mean_handle_ms,
+                stats.max_handle_s * 1000,
+                stats.errors,
+                stats.dropped,
+                stats.max_pending,
+            )
+
+    def on_tool_start(
+        self, name: str, input: dict, *, agent_id: str = "orchestrator"
+    ) -> None:
+        """Publish tool start to all observers."""
+        self._publish("on_tool_start", name, input, agent_id=agent_id)
+
+    def on_tool_end(
+        self,
+        name: str,
+        result: str | None,
+        is_error: bool,
+        *,
+        agent_id: str = "orchestrator",
+        duration_ms: float | None = None,
+    ) -> None:
+        """Publish tool end to all observers."""
+        self._publish(
+            "on_tool_end",
+            name,
+            result,
+            is_error,
+            agent_id=agent_id,
+            duration_ms=duration_ms,
+        )
+
+    def on_text(self, text: str, *, agent_id: str = "orchestrator") -> None:
+        """Publish text to all observers."""
+        self._publish("on_text", text, agent_id=agent_id)
+
+    def on_thinking(self, text: str, *, agent_id: str = "orchestrator") -> None:
+        """Publish thinking to all observers."""
+        self._publish("on_thinking", text, agent_id=agent_id)
+
+    def on_complete(
+        self,
+        turns: int,
+        cost: float,
+        duration_ms: int,
+        *,
+        agent_id: str = "orchestrator",
+        usage: dict | None = None,
+    ) -> None:
+        """Publish completion to all observers."""
+        self._publish(
+            "on_complete", turns, cost, duration_ms, agent_id=agent_id, usage=usage
+        )
+
+    def on_system(
+        self, subtype: str, data: dict, *, agent_id: str = "orchestrator"
+    ) -> None:
+        """Publish system message to all observers."""
+        self._publish("on_system", subtype, data, agent_id=agent_id)
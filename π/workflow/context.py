@@ -14,6 +14,8 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from π.core.enums import Command, DocType
     from π.workflow.observer import WorkflowObserver
 
@@ -24,15 +26,21 @@ class WorkflowContext:
 
     Attributes:
         session_ids: Maps Command enum to session IDs for resumption.
+        sub_session_ids: Maps Command enum to per-sub-query session IDs for
+            commands that fan out into concurrent sessions.
         doc_paths: Maps DocType enum to produced document paths.
         objective: The workflow objective/goal being executed.
         observer: Optional observer for logging stage agent events.
+        cwd: Working directory of the workflow's agents (its worktree), or
+            None for the project root.
     """
 
     session_ids: dict[Command, str] = field(default_factory=dict)
+    sub_session_ids: dict[Command, dict[str, str]] = field(default_factory=dict)
     doc_paths: dict[DocType, str] = field(default_factory=dict)
     objective: str | None = None
     observer: WorkflowObserver | None = None
+    cwd: Path | None = None
 
 
 _ctx: ContextVar[WorkflowContext | None] = ContextVar("mcp_workflow_ctx", default=None)
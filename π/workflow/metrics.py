@@ -0,0 +1,421 @@
+"""Tool latency and session metrics observers.
+
+ToolLatencyObserver collects the durations dispatch_message attaches to
+on_tool_end, so a run can show which tools dominate each agent's wall time.
+
+MetricsObserver aggregates session duration, cost, turns and tokens per
+agent_id from completion events and exports them after each run as an
+OpenMetrics textfile (for the node exporter textfile collector) and JSON.
+Counters and histograms accumulate across runs in the same directory.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import logging
+import math
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from rich.table import Table
+
+from π.workflow.observer import NullObserver
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+METRICS_TEXTFILE = "pi.prom"
+METRICS_JSON = "pi.json"
+
+# Histogram bucket upper bounds (+Inf is implicit)
+DURATION_BUCKETS_S = (1, 5, 15, 30, 60, 120, 300, 600, 1200, 1800, 3600)
+COST_BUCKETS_USD = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10)
+TOKEN_BUCKETS = (1e3, 1e4, 5e4, 1e5, 2.5e5, 5e5, 1e6, 2.5e6, 5e6)
+
+# ResultMessage.usage keys counted per token type
+_TOKEN_TYPES = {
+    "input_tokens": "input",
+    "output_tokens": "output",
+    "cache_read_input_tokens": "cache_read",
+    "cache_creation_input_tokens": "cache_creation",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ToolLatency:
+    """Latency statistics for one tool within one agent."""
+
+    calls: int
+    errors: int
+    total_ms: float
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+
+
+def percentile(ordered: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending, non-empty list."""
+    rank = max(math.ceil(fraction * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+class ToolLatencyObserver(NullObserver):
+    """Observer that aggregates per-tool latencies per agent_id.
+
+    Tool ends without a duration (their start was never seen) are counted
+    as calls but do not contribute latency samples.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty latency samples."""
+        # agent_id -> tool name -> durations in milliseconds
+        self._samples: dict[str, dict[str, list[float]]] = {}
+        self._calls: dict[tuple[str, str], int] = {}
+        self._errors: dict[tuple[str, str], int] = {}
+
+    def on_tool_end(
+        self,
+        name: str,
+        result: str | None,  # noqa: ARG002
+        is_error: bool,
+        *,
+        agent_id: str = "orchestrator",
+        duration_ms: float | None = None,
+    ) -> None:
+        """Record a tool call and its duration."""
+        key = (agent_id, name)
+        self._calls[key] = self._calls.get(key, 0) + 1
+        if is_error:
+            self._errors[key] = self._errors.get(key, 0) + 1
+        tools = self._samples.setdefault(agent_id, {})
+        samples = tools.setdefault(name, [])
+        if duration_ms is not None:
+            samples.append(duration_ms)
+
+    def summary(self) -> dict[str, dict[str, ToolLatency]]:
+        """Return latency statistics by agent_id, then tool name.
+
+        Tools within an agent are ordered by total time, slowest first.
+        Tools with no timed calls report zero latencies.
+        """
+        result: dict[str, dict[str, ToolLatency]] = {}
+        for agent_id, tools in self._samples.items():
+            stats: dict[str, ToolLatency] = {}
+            for name, samples in tools.items():
+                ordered = sorted(samples)
+                key = (agent_id, name)
+                stats[name] = ToolLatency(
+                    calls=self._calls[key],
+                    errors=self._errors.get(key, 0),
+                    total_ms=sum(ordered),
+                    p50_ms=percentile(ordered, 0.5) if ordered else 0.0,
+                    p95_ms=percentile(ordered, 0.95) if ordered else 0.0,
+                    max_ms=ordered[-1] if ordered else 0.0,
+                )
+            result[agent_id] = dict(
+                sorted(stats.items(), key=lambda item: -item[1].total_ms)
+            )
+        return result
+
+    def render(self) -> Table | None:
+        """Render the summary as a Rich table, or None if no tool ran."""
+        summary = self.summary()
+        if not summary:
+            return None
+
+        table = Table(title="Tool Latency", title_justify="left")
+        table.add_column("Agent", style="dim")
+        table.add_column("Tool", style="bold")
+        for column in ("Calls", "Errors", "p50", "p95", "Max", "Total"):
+            table.add_column(column, justify="right")
+        for agent_id, tools in summary.items():
+            for name, stats in tools.items():
+                table.add_row(
+                    agent_id,
+                    name,
+                    str(stats.calls),
+                    str(stats.errors) if stats.errors else "",
+                    _format_ms(stats.p50_ms),
+                    _format_ms(stats.p95_ms),
+                    _format_ms(stats.max_ms),
+                    _format_ms(stats.total_ms),
+                )
+        return table
+
+
+def _format_ms(ms: float) -> str:
+    return f"{ms / 1000:.1f}s" if ms >= 1000 else f"{ms:.0f}ms"
+
+
+@dataclass
+class _Histogram:
+    """Cumulative histogram with fixed bucket bounds."""
+
+    bounds: tuple[float, ...]
+    counts: list[int] = field(default_factory=list)
+    total: float = 0.0
+    count: int = 0
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            self.counts = [0] * (len(self.bounds) + 1)
+
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(self.bounds):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.total += value
+        self.count += 1
+
+    def merge(self, data: dict) -> None:
+        """Add counts from a previous export (ignored if bounds changed)."""
+        if tuple(data.get("bounds", ())) != self.bounds:
+            return
+        self.counts = [a + b for a, b in zip(self.counts, data["counts"], strict=True)]
+        self.total += data["sum"]
+        self.count += data["count"]
+
+    def to_dict(self) -> dict:
+        return {
+            "bounds": list(self.bounds),
+            "counts": self.counts,
+            "sum": self.total,
+            "count": self.count,
+        }
+
+
+@dataclass
+class _AgentMetrics:
+    """Aggregated completion metrics for one agent_id."""
+
+    sessions: int = 0
+    turns: int = 0
+    cost_usd: float = 0.0
+    tokens: dict[str, int] = field(default_factory=dict)
+    duration_seconds: _Histogram = field(
+        default_factory=lambda: _Histogram(DURATION_BUCKETS_S)
+    )
+    session_cost_usd: _Histogram = field(
+        default_factory=lambda: _Histogram(COST_BUCKETS_USD)
+    )
+    session_tokens: _Histogram = field(
+        default_factory=lambda: _Histogram(TOKEN_BUCKETS)
+    )
+
+    def merge(self, data: dict) -> None:
+        """Add the totals of a previous export."""
+        self.sessions += data.get("sessions", 0)
+        self.turns += data.get("turns", 0)
+        self.cost_usd += data.get("cost_usd", 0.0)
+        for kind, count in data.get("tokens", {}).items():
+            self.tokens[kind] = self.tokens.get(kind, 0) + count
+        for name in ("duration_seconds", "session_cost_usd", "session_tokens"):
+            if name in data:
+                getattr(self, name).merge(data[name])
+
+    def to_dict(self) -> dict:
+        return {
+            "sessions": self.sessions,
+            "turns": self.turns,
+            "cost_usd": self.cost_usd,
+            "tokens": self.tokens,
+            "duration_seconds": self.duration_seconds.to_dict(),
+            "session_cost_usd": self.session_cost_usd.to_dict(),
+            "session_tokens": self.session_tokens.to_dict(),
+        }
+
+
+def is_pipeline_total(agent_id: str, driver: str) -> bool:
+    """Whether a completion is the pipeline driver's total of its stages.
+
+    The pipeline driver runs no orchestrator session; its orchestrator
+    completion sums the stage sessions already reported, so counting it
+    too would double every cost and turn.
+    """
+    return driver == "pipeline" and agent_id == "orchestrator"
+
+
+class MetricsObserver(NullObserver):
+    """Observer that exports per-agent session metrics after each run.
+
+    Each completion event (one per agent session) adds to the agent's
+    session, turn, cost and token counters and to its duration, cost and
+    token histograms. write() merges them into the totals already in the
+    export directory, so scrapers see monotonic counters across runs.
+    Under the pipeline driver, the orchestrator completion only totals the
+    stage sessions and is not recorded, so summing every agent's series
+    gives the real cost.
+
+    Usage:
+        metrics = MetricsObserver(driver="orchestrator")
+        observer = CompositeObserver([live, log, metrics])
+        ...
+        metrics.write(get_metrics_dir())
+    """
+
+    def __init__(self, *, driver: str = "orchestrator") -> None:
+        """Initialize empty per-agent metrics for this run.
+
+        Args:
+            driver: Workflow driver ("orchestrator" or "pipeline").
+        """
+        self.driver = driver
+        self.agents: dict[str, _AgentMetrics] = {}
+
+    def on_complete(
+        self,
+        turns: int,
+        cost: float,
+        duration_ms: int,
+        *,
+        agent_id: str = "orchestrator",
+        usage: dict | None = None,
+    ) -> None:
+        """Record a completed agent session."""
+        if is_pipeline_total(agent_id, self.driver):
+            return
+        metrics = self.agents.setdefault(agent_id, _AgentMetrics())
+        metrics.sessions += 1
+        metrics.turns += turns
+        metrics.cost_usd += cost
+        metrics.duration_seconds.observe(duration_ms / 1000)
+        metrics.session_cost_usd.observe(cost)
+        if usage is None:
+            return
+        session_tokens = 0
+        for key, kind in _TOKEN_TYPES.items():
+            count = int(usage.get(key) or 0)
+            metrics.tokens[kind] = metrics.tokens.get(kind, 0) + count
+            session_tokens += count
+        metrics.session_tokens.observe(session_tokens)
+
+    def write(self, directory: Path) -> None:
+        """Merge this run into the exported totals in directory.
+
+        Writes METRICS_JSON and METRICS_TEXTFILE atomically under a lock,
+        so concurrent runs sharing the directory do not lose updates.
+        Export errors are logged, never raised.
+
+        Args:
+            directory: Export directory (e.g., a textfile collector dir).
+        """
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            with (directory / f"{METRICS_JSON}.lock").open("w") as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                self._write_locked(directory)
+        except OSError:
+            logger.warning("Failed to export metrics to %s", directory, exc_info=True)
+
+    def _write_locked(self, directory: Path) -> None:
+        json_path = directory / METRICS_JSON
+        try:
+            previous = json.loads(json_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            previous = {}
+        except ValueError:
+            logger.warning("Ignoring unreadable metrics file %s", json_path)
+            previous = {}
+
+        agents: dict[str, _AgentMetrics] = {}
+        for source in (previous.get("agents", {}), self._as_dicts()):
+            for agent_id, data in source.items():
+                agents.setdefault(agent_id, _AgentMetrics()).merge(data)
+        exported = {
+            "runs": previous.get("runs", 0) + 1,
+            "updated": time.time(),
+            "agents": {
+                agent_id: agents[agent_id].to_dict() for agent_id in sorted(agents)
+            },
+        }
+        _write_atomic(json_path, json.dumps(exported, indent=2) + "\n")
+        _write_atomic(directory / METRICS_TEXTFILE, render_openmetrics(exported))
+
+    def _as_dicts(self) -> dict[str, dict]:
+        return {agent_id: m.to_dict() for agent_id, m in self.agents.items()}
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(content, encoding="utf-8")
+    tmp.replace(path)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_openmetrics(exported: dict) -> str:
+    """Render exported metrics in the OpenMetrics text format.
+
+    Args:
+        exported: Totals as written to METRICS_JSON.
+
+    Returns:
+        Exposition text ending with the `# EOF` marker.
+    """
+    agents: dict[str, dict] = exported["agents"]
+    lines = [
+        "# TYPE pi_runs counter",
+        "# HELP pi_runs Workflow runs exported to this directory.",
+        f"pi_runs_total {exported['runs']}",
+        "# TYPE pi_last_run_timestamp_seconds gauge",
+        "# HELP pi_last_run_timestamp_seconds Time of the last exported run.",
+        f"pi_last_run_timestamp_seconds {exported['updated']:.3f}",
+    ]
+    counters = (
+        ("pi_agent_sessions", "sessions", "Agent sessions completed."),
+        ("pi_agent_turns", "turns", "Conversation turns across agent sessions."),
+        ("pi_agent_cost_usd", "cost_usd", "Agent session cost in USD."),
+    )
+    for name, key, help_text in counters:
+        lines += [f"# TYPE {name} counter", f"# HELP {name} {help_text}"]
+        lines.extend(
+            f'{name}_total{{agent="{_escape_label(agent_id)}"}} '
+            f"{_format_number(data[key])}"
+            for agent_id, data in agents.items()
+        )
+    lines += [
+        "# TYPE pi_agent_tokens counter",
+        "# HELP pi_agent_tokens Tokens used by agent sessions, by type.",
+    ]
+    lines.extend(
+        f'pi_agent_tokens_total{{agent="{_escape_label(agent_id)}",type="{kind}"}} '
+        f"{count}"
+        for agent_id, data in agents.items()
+        for kind, count in sorted(data["tokens"].items())
+    )
+    histograms = (
+        ("pi_agent_session_duration_seconds", "duration_seconds", "Session time."),
+        ("pi_agent_session_cost_usd", "session_cost_usd", "Session cost in USD."),
+        ("pi_agent_session_tokens", "session_tokens", "Tokens used per session."),
+    )
+    for name, key, help_text in histograms:
+        lines += [f"# TYPE {name} histogram", f"# HELP {name} {help_text}"]
+        for agent_id, data in agents.items():
+            lines.extend(_histogram_lines(name, _escape_label(agent_id), data[key]))
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def _histogram_lines(name: str, agent: str, data: dict) -> list[str]:
+    lines = []
+    cumulative = 0
+    bounds = [*(_format_number(float(b)) for b in data["bounds"]), "+Inf"]
+    for bound, count in zip(bounds, data["counts"], strict=True):
+        cumulative += count
+        lines.append(f'{name}_bucket{{agent="{agent}",le="{bound}"}} {cumulative}')
+    lines.append(f'{name}_count{{agent="{agent}"}} {data["count"]}')
+    lines.append(f'{name}_sum{{agent="{agent}"}} {_format_number(data["sum"])}')
+    return lines
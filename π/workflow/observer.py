@@ -6,7 +6,14 @@ visibility into orchestrator tool calls during workflow execution.
 
 from __future__ import annotations
 
+import atexit
+import contextlib
 import json
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Protocol
 
@@ -14,12 +21,24 @@ from claude_agent_sdk.types import (
     AssistantMessage,
     ResultMessage,
     SystemMessage,
+    ToolResultBlock,
+    UserMessage,
 )
 
 if TYPE_CHECKING:
     from pathlib import Path
 
-    from claude_agent_sdk.types import Message
+    from claude_agent_sdk.types import ContentBlock, Message
+
+    from π.workflow.blobs import BlobStore
+
+logger = logging.getLogger(__name__)
+
+# Calls whose result never arrives (interrupted sessions) are evicted oldest
+# first once this many are in flight
+_MAX_IN_FLIGHT = 4096
+# Longest a caller waits on the log writer thread in flush() and close()
+_WRITER_TIMEOUT_S = 10.0
 
 
 class WorkflowObserver(Protocol):
@@ -51,6 +70,7 @@ class WorkflowObserver(Protocol):
         is_error: bool,
         *,
         agent_id: str = "orchestrator",
+        duration_ms: float | None = None,
     ) -> None:
         """Called when a tool completes execution.
 
@@ -59,6 +79,7 @@ class WorkflowObserver(Protocol):
             result: The tool result (truncated for display).
             is_error: Whether the tool execution failed.
             agent_id: Identifier for the agent (orchestrator or stage agent).
+            duration_ms: Time since the tool started, if its start was seen.
         """
         ...
 
@@ -87,6 +108,7 @@ class WorkflowObserver(Protocol):
         duration_ms: int,
         *,
         agent_id: str = "orchestrator",
+        usage: dict | None = None,
     ) -> None:
         """Called when the workflow completes.
 
@@ -95,6 +117,8 @@ class WorkflowObserver(Protocol):
             cost: Total cost in USD.
             duration_ms: Total duration in milliseconds.
             agent_id: Identifier for the agent (orchestrator or stage agent).
+            usage: Token usage of the session (input_tokens, output_tokens,
+                cache_read_input_tokens, ...), if reported.
         """
         ...
 
@@ -111,11 +135,184 @@ class WorkflowObserver(Protocol):
         ...
 
 
+class NullObserver:
+    """Observer that ignores every event.
+
+    Subclass it and override only the events an observer needs.
+    """
+
+    def on_tool_start(
+        self, name: str, input: dict, *, agent_id: str = "orchestrator"
+    ) -> None:
+        """Ignore tool start events."""
+
+    def on_tool_end(
+        self,
+        name: str,
+        result: str | None,
+        is_error: bool,
+        *,
+        agent_id: str = "orchestrator",
+        duration_ms: float | None = None,
+    ) -> None:
+        """Ignore tool end events."""
+
+    def on_text(self, text: str, *, agent_id: str = "orchestrator") -> None:
+        """Ignore text events."""
+
+    def on_thinking(self, text: str, *, agent_id: str = "orchestrator") -> None:
+        """Ignore thinking events."""
+
+    def on_complete(
+        self,
+        turns: int,
+        cost: float,
+        duration_ms: int,
+        *,
+        agent_id: str = "orchestrator",
+        usage: dict | None = None,
+    ) -> None:
+        """Ignore completion events."""
+
+    def on_system(
+        self, subtype: str, data: dict, *, agent_id: str = "orchestrator"
+    ) -> None:
+        """Ignore system events."""
+
+
+class _LogWriter:
+    """Background writer owning a single append handle to a log file.
+
+    Entries are queued by the caller and formatted (including JSON
+    serialization of tool inputs) and written on a daemon thread, so large
+    payloads never stall the event loop. Writes are flushed to disk in
+    batches: every flush_interval seconds, on flush(), and on close().
+    An entry that fails to format or write is logged and dropped, so the
+    thread outlives it.
+    """
+
+    _BATCH_SIZE = 512
+
+    def __init__(self, path: Path, *, flush_interval: float) -> None:
+        self._file = path.open("a", encoding="utf-8")
+        self._flush_interval = flush_interval
+        self._queue: queue.SimpleQueue[
+            _LogEntry | _EventRecord | threading.Event | None
+        ] = queue.SimpleQueue()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="π-log-writer", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, entry: _LogEntry | _EventRecord) -> None:
+        """Queue an entry for writing (no-op after close)."""
+        if not self._closed:
+            self._queue.put(entry)
+
+    def flush(self, *, wait: bool = True) -> None:
+        """Flush queued entries to disk, optionally waiting for completion."""
+        if self._closed:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        if wait and not done.wait(_WRITER_TIMEOUT_S):
+            logger.warning("Timed out flushing %s", self._file.name)
+
+    def close(self) -> None:
+        """Drain the queue, flush and close the file handle."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(_WRITER_TIMEOUT_S)
+        if self._thread.is_alive():
+            logger.warning("Timed out closing %s", self._file.name)
+        atexit.unregister(self.close)
+
+    def _run(self) -> None:
+        last_flush = time.monotonic()
+        while True:
+            try:
+                batch = [self._queue.get(timeout=self._flush_interval)]
+            except queue.Empty:
+                self._flush()
+                last_flush = time.monotonic()
+                continue
+            with contextlib.suppress(queue.Empty):
+                while len(batch) < self._BATCH_SIZE:
+                    batch.append(self._queue.get_nowait())
+
+            for item in batch:
+                if item is None:
+                    self._flush()
+                    with contextlib.suppress(OSError):
+                        self._file.close()
+                    return
+                if isinstance(item, threading.Event):
+                    self._flush()
+                    last_flush = time.monotonic()
+                    item.set()
+                else:
+                    self._write(item)
+
+            if time.monotonic() - last_flush >= self._flush_interval:
+                self._flush()
+                last_flush = time.monotonic()
+
+    def _write(self, item: _LogEntry | _EventRecord) -> None:
+        try:
+            self._file.write(item.format())
+        except Exception:
+            logger.exception("Dropped log entry for %s", self._file.name)
+
+    def _flush(self) -> None:
+        try:
+            self._file.flush()
+        except OSError:
+            logger.exception("Failed to flush %s", self._file.name)
+
+
+@dataclass(slots=True)
+class _LogEntry:
+    """A queued log entry, formatted on the writer thread."""
+
+    timestamp: float
+    event: str
+    details: str | dict = ""
+    agent_id: str = "orchestrator"
+    raw: bool = False
+    # Spills large strings in details to blobs when set
+    blobs: BlobStore | None = None
+
+    def format(self) -> str:
+        """Render the entry as log text."""
+        if self.raw:
+            return self.event
+        time_str = datetime.fromtimestamp(self.timestamp).strftime("%H:%M:%S")
+        prefix = f"[{self.agent_id}] " if self.agent_id != "orchestrator" else ""
+        entry = f"[{time_str}] {prefix}{self.event}\n"
+        details = self.details
+        if self.blobs is not None:
+            details = self.blobs.spill(details)
+        if isinstance(details, dict):
+            details = json.dumps(details, indent=2, default=str)
+        if details:
+            entry += f"{details}\n"
+        return entry
+
+
 class LoggingObserver:
     """File-based logging observer for debugging.
 
     Writes detailed workflow events to a log file for post-mortem analysis.
     Captures tool calls, text output, thinking, and completion metrics.
+
+    Events are handed to a background writer with a single long-lived file
+    handle; call flush() or close() before reading the file. With a
+    BlobStore, large strings in tool inputs are written once to the store
+    and logged as references.
     """
 
     def __init__(
@@ -124,6 +321,8 @@ class LoggingObserver:
         *,
         objective: str | None = None,
         system_prompt: str | None = None,
+        flush_interval: float = 1.0,
+        blobs: BlobStore | None = None,
     ) -> None:
         """Initialize the logging observer.
 
@@ -131,12 +330,16 @@ class LoggingObserver:
             log_path: Path to the log file.
             objective: Optional workflow objective to include in header.
             system_prompt: Optional system prompt to include in header.
+            flush_interval: Seconds between periodic flushes to disk.
+            blobs: Optional store for tool payloads above its threshold.
         """
         self.log_path = log_path
+        self.blobs = blobs
         self.start_time = datetime.now()
         self.objective = objective
         self.system_prompt = system_prompt
         self._write_header()
+        self._writer = _LogWriter(log_path, flush_interval=flush_interval)
 
     def _write_header(self) -> None:
         """Write the log file header."""
@@ -159,30 +362,39 @@ class LoggingObserver:
         self.log_path.write_text("\n".join(header) + "\n")
 
     def _log(
-        self, event: str, details: str = "", *, agent_id: str = "orchestrator"
+        self,
+        event: str,
+        details: str | dict = "",
+        *,
+        agent_id: str = "orchestrator",
+        spill: bool = False,
     ) -> None:
-        """Append a log entry.
+        """Queue a log entry.
 
         Args:
             event: The event type/description.
-            details: Optional details to include.
+            details: Optional details; dicts are JSON-formatted by the writer.
             agent_id: Identifier for the agent source.
+            spill: Whether large strings in details may go to the blob store.
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        prefix = f"[{agent_id}] " if agent_id != "orchestrator" else ""
-        entry = f"[{timestamp}] {prefix}{event}\n"
-        if details:
-            entry += f"{details}\n"
+        blobs = self.blobs if spill else None
+        self._writer.submit(
+            _LogEntry(time.time(), event, details, agent_id, blobs=blobs)
+        )
+
+    def flush(self) -> None:
+        """Block until all queued events are written to disk."""
+        self._writer.flush()
 
-        with self.log_path.open("a") as f:
-            f.write(entry)
+    def close(self) -> None:
+        """Write remaining events and close the log file."""
+        self._writer.close()
 
     def on_tool_start(
         self, name: str, input: dict, *, agent_id: str = "orchestrator"
     ) -> None:
         """Log tool start event."""
-        input_json = json.dumps(input, indent=2, default=str)
-        self._log(f"TOOL_START: {name}", input_json, agent_id=agent_id)
+        self._log(f"TOOL_START: {name}", input, agent_id=agent_id, spill=True)
 
     def on_tool_end(
         self,
@@ -191,9 +403,12 @@ class LoggingObserver:
         is_error: bool,
         *,
         agent_id: str = "orchestrator",
+        duration_ms: float | None = None,
     ) -> None:
         """Log tool end event."""
         status = "ERROR" if is_error else "OK"
+        if duration_ms is not None:
+            status += f" {duration_ms / 1000:.2f}s"
         details = f"Result: {result}" if result else ""
         self._log(f"TOOL_END: {name} [{status}]", details, agent_id=agent_id)
 
@@ -212,16 +427,20 @@ class LoggingObserver:
         duration_ms: int,
         *,
         agent_id: str = "orchestrator",
+        usage: dict | None = None,
     ) -> None:
         """Log completion event with summary."""
         duration_s = duration_ms / 1000
         summary = f"Turns: {turns} | Cost: ${cost:.4f} | Duration: {duration_s:.1f}s"
+        if usage:
+            tokens = usage.get("input_tokens", 0) + usage.get("output_tokens", 0)
+            summary += f" | Tokens: {tokens:,}"
         self._log("COMPLETE", summary, agent_id=agent_id)
 
-        # Write footer only for orchestrator
+        # Write footer and flush only for orchestrator
         if agent_id == "orchestrator":
-            with self.log_path.open("a") as f:
-                f.write("=" * 80 + "\n")
+            self._writer.submit(_LogEntry(time.time(), "=" * 80 + "\n", raw=True))
+            self._writer.flush(wait=False)
 
     def on_system(
         self, subtype: str, data: dict, *, agent_id: str = "orchestrator"
@@ -229,11 +448,7 @@ class LoggingObserver:
         """Log system message event."""
         if subtype == "init":
             # Log key initialization fields
-            self._log(
-                "SYSTEM_INIT:",
-                json.dumps(data, indent=2, default=str),
-                agent_id=agent_id,
-            )
+            self._log("SYSTEM_INIT:", data, agent_id=agent_id)
         elif subtype == "compact_boundary":
             meta = data.get("compact_metadata", {})
             self._log(
@@ -242,11 +457,156 @@ class LoggingObserver:
                 agent_id=agent_id,
             )
         else:
-            self._log(
-                f"SYSTEM_{subtype.upper()}:",
-                json.dumps(data, indent=2, default=str),
-                agent_id=agent_id,
-            )
+            self._log(f"SYSTEM_{subtype.upper()}:", data, agent_id=agent_id)
+
+
+def _size(value: object) -> int:
+    """Size in bytes of a payload as text (JSON for structured values)."""
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        return len(value.encode())
+    return len(json.dumps(value, default=str).encode())
+
+
+@dataclass(slots=True)
+class _EventRecord:
+    """A queued JSONL event, serialized on the writer thread.
+
+    Payloads in sizes are recorded as their size in bytes, not their text.
+    """
+
+    fields: dict
+    sizes: dict[str, object] = field(default_factory=dict)
+
+    def format(self) -> str:
+        """Render the event as one JSON line."""
+        record = dict(self.fields)
+        for key, value in self.sizes.items():
+            record[key] = _size(value)
+        return json.dumps(record, default=str, separators=(",", ":")) + "\n"
+
+
+class EventLogObserver:
+    """Machine-readable JSONL event log, one record per observer event.
+
+    Every record has "ts" (Unix time), "event" and "agent_id", plus:
+
+    - run_start: objective, driver
+    - tool_start: tool, input_bytes
+    - tool_end: tool, is_error, result_bytes, duration_ms (null if unknown)
+    - text / thinking: bytes
+    - complete: turns, cost_usd, duration_ms, usage
+    - system: subtype, data_bytes
+    - run_end: (no extra fields)
+
+    Payloads are recorded by size only, so logs stay small enough to mine
+    across many runs (see `π logs`). Records go through the same background
+    writer as LoggingObserver.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        objective: str | None = None,
+        driver: str | None = None,
+        flush_interval: float = 1.0,
+    ) -> None:
+        """Initialize the event log observer.
+
+        Args:
+            path: Path to the JSONL file (appended to).
+            objective: Optional workflow objective for the run_start record.
+            driver: Optional workflow driver for the run_start record.
+            flush_interval: Seconds between periodic flushes to disk.
+        """
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._writer = _LogWriter(path, flush_interval=flush_interval)
+        self._record("run_start", objective=objective, driver=driver)
+
+    def _record(
+        self,
+        event: str,
+        *,
+        agent_id: str = "orchestrator",
+        sizes: dict[str, object] | None = None,
+        **fields: object,
+    ) -> None:
+        record = {"ts": time.time(), "event": event, "agent_id": agent_id, **fields}
+        self._writer.submit(_EventRecord(record, sizes or {}))
+
+    def flush(self) -> None:
+        """Block until all queued events are written to disk."""
+        self._writer.flush()
+
+    def close(self) -> None:
+        """Write the run_end record and close the file."""
+        self._record("run_end")
+        self._writer.close()
+
+    def on_tool_start(
+        self, name: str, input: dict, *, agent_id: str = "orchestrator"
+    ) -> None:
+        """Record tool start with its input size."""
+        self._record(
+            "tool_start", agent_id=agent_id, tool=name, sizes={"input_bytes": input}
+        )
+
+    def on_tool_end(
+        self,
+        name: str,
+        result: str | None,
+        is_error: bool,
+        *,
+        agent_id: str = "orchestrator",
+        duration_ms: float | None = None,
+    ) -> None:
+        """Record tool end with its outcome and duration."""
+        self._record(
+            "tool_end",
+            agent_id=agent_id,
+            tool=name,
+            is_error=is_error,
+            duration_ms=duration_ms,
+            sizes={"result_bytes": result},
+        )
+
+    def on_text(self, text: str, *, agent_id: str = "orchestrator") -> None:
+        """Record text output size."""
+        self._record("text", agent_id=agent_id, sizes={"bytes": text})
+
+    def on_thinking(self, text: str, *, agent_id: str = "orchestrator") -> None:
+        """Record thinking size."""
+        self._record("thinking", agent_id=agent_id, sizes={"bytes": text})
+
+    def on_complete(
+        self,
+        turns: int,
+        cost: float,
+        duration_ms: int,
+        *,
+        agent_id: str = "orchestrator",
+        usage: dict | None = None,
+    ) -> None:
+        """Record session completion metrics."""
+        self._record(
+            "complete",
+            agent_id=agent_id,
+            turns=turns,
+            cost_usd=cost,
+            duration_ms=duration_ms,
+            usage=usage,
+        )
+
+    def on_system(
+        self, subtype: str, data: dict, *, agent_id: str = "orchestrator"
+    ) -> None:
+        """Record system message subtype and size."""
+        self._record(
+            "system", agent_id=agent_id, subtype=subtype, sizes={"data_bytes": data}
+        )
 
 
 class CompositeObserver:
@@ -278,10 +638,13 @@ class CompositeObserver:
         is_error: bool,
         *,
         agent_id: str = "orchestrator",
+        duration_ms: float | None = None,
     ) -> None:
         """Dispatch tool end to all observers."""
         for obs in self.observers:
-            obs.on_tool_end(name, result, is_error, agent_id=agent_id)
+            obs.on_tool_end(
+                name, result, is_error, agent_id=agent_id, duration_ms=duration_ms
+            )
 
     def on_text(self, text: str, *, agent_id: str = "orchestrator") -> None:
         """Dispatch text to all observers."""
@@ -300,10 +663,11 @@ class CompositeObserver:
         duration_ms: int,
         *,
         agent_id: str = "orchestrator",
+        usage: dict | None = None,
     ) -> None:
         """Dispatch completion to all observers."""
         for obs in self.observers:
-            obs.on_complete(turns, cost, duration_ms, agent_id=agent_id)
+            obs.on_complete(turns, cost, duration_ms, agent_id=agent_id, usage=usage)
 
     def on_system(
         self, subtype: str, data: dict, *, agent_id: str = "orchestrator"
@@ -313,6 +677,30 @@ class CompositeObserver:
             obs.on_system(subtype, data, agent_id=agent_id)
 
 
+@dataclass(slots=True)
+class _ToolCall:
+    """A tool call awaiting its result."""
+
+    name: str
+    started: float
+    agent_id: str
+
+
+# tool_use_id -> call, across all agents (ids are unique per API call)
+_in_flight: dict[str, _ToolCall] = {}
+
+
+def _start_tool(tool_use_id: str, name: str, agent_id: str) -> None:
+    if len(_in_flight) >= _MAX_IN_FLIGHT:
+        del _in_flight[next(iter(_in_flight))]
+    _in_flight[tool_use_id] = _ToolCall(name, time.monotonic(), agent_id)
+
+
+def clear_in_flight_tools() -> None:
+    """Forget tool calls still awaiting results (e.g., between runs)."""
+    _in_flight.clear()
+
+
 def dispatch_message(
     message: Message,
     observer: WorkflowObserver,
@@ -334,7 +722,12 @@ def dispatch_message(
             cost=message.total_cost_usd or 0.0,
             duration_ms=message.duration_ms,
             agent_id=agent_id,
+            usage=message.usage,
         )
+    elif isinstance(message, UserMessage):
+        # Tool results come back to the model as user turns
+        if isinstance(message.content, list):
+            _dispatch_tool_results(message.content, observer, agent_id=agent_id)
     elif isinstance(message, SystemMessage):
         observer.on_system(
             subtype=message.subtype, data=message.data, agent_id=agent_id
@@ -357,32 +750,63 @@ def _dispatch_assistant_message(
     from claude_agent_sdk.types import (  # noqa: PLC0415
         TextBlock,
         ThinkingBlock,
-        ToolResultBlock,
         ToolUseBlock,
     )
 
     for block in message.content:
         if isinstance(block, ToolUseBlock):
+            _start_tool(block.id, block.name, agent_id)
             observer.on_tool_start(
                 name=block.name, input=block.input, agent_id=agent_id
             )
         elif isinstance(block, ToolResultBlock):
-            # Extract result text (may be string or list)
-            result_text = None
-            if isinstance(block.content, str):
-                result_text = block.content[:200] if block.content else None
-            elif isinstance(block.content, list) and block.content:
-                # Take first text item if list
-                first = block.content[0]
-                if isinstance(first, dict) and "text" in first:
-                    result_text = first["text"][:200]
-            observer.on_tool_end(
-                name=block.tool_use_id,
-                result=result_text,
-                is_error=block.is_error or False,
-                agent_id=agent_id,
-            )
+            _dispatch_tool_result(block, observer, agent_id=agent_id)
         elif isinstance(block, TextBlock):
             observer.on_text(text=block.text, agent_id=agent_id)
         elif isinstance(block, ThinkingBlock):
             observer.on_thinking(text=block.thinking, agent_id=agent_id)
+
+
+def _dispatch_tool_results(
+    content: list[ContentBlock],
+    observer: WorkflowObserver,
+    *,
+    agent_id: str = "orchestrator",
+) -> None:
+    """Dispatch the tool results among a user message's content blocks."""
+    for block in content:
+        if isinstance(block, ToolResultBlock):
+            _dispatch_tool_result(block, observer, agent_id=agent_id)
+
+
+def _dispatch_tool_result(
+    block: ToolResultBlock,
+    observer: WorkflowObserver,
+    *,
+    agent_id: str = "orchestrator",
+) -> None:
+    """Dispatch a tool result to on_tool_end with its call's name and duration.
+
+    Results whose start was not seen keep the tool_use_id as the name.
+    """
+    # Extract result text (may be string or list)
+    result_text = None
+    if isinstance(block.content, str):
+        result_text = block.content[:200] if block.content else None
+    elif isinstance(block.content, list) and block.content:
+        # Take first text item if list
+        first = block.content[0]
+        if isinstance(first, dict) and "text" in first:
+            result_text = first["text"][:200]
+
+    name, duration_ms = block.tool_use_id, None
+    if call := _in_flight.pop(block.tool_use_id, None):
+        name, agent_id = call.name, call.agent_id
+        duration_ms = (time.monotonic() - call.started) * 1000
+    observer.on_tool_end(
+        name=name,
+        result=result_text,
+        is_error=block.is_error or False,
+        agent_id=agent_id,
+        duration_ms=duration_ms,
+    )
@@ -0,0 +1,321 @@
+"""Deterministic pipeline driver for the π workflow.
+
+Alternative to the LLM orchestrator: a Python state machine that calls the
+MCP workflow tools directly in the fixed research → plan → review/iterate →
+implement → commit order, applying the early-exit and review loop rules
+itself. Removes every orchestrator model turn while producing the same
+WorkflowOutput.
+
+Import from π.workflow.pipeline (not π.workflow) to avoid circular imports.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import re
+import subprocess
+import time
+from typing import TYPE_CHECKING, Any
+
+from π.core.enums import DocType
+from π.utils import get_project_root
+from π.workflow.context import get_workflow_ctx
+from π.workflow.observer import CompositeObserver, NullObserver
+from π.workflow.output import WorkflowOutput
+from π.workflow.tools import (
+    commit_changes,
+    create_plan,
+    implement_plan,
+    iterate_plan,
+    research_codebase,
+    review_plan,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from claude_agent_sdk import SdkMcpTool
+
+    from π.workflow.observer import WorkflowObserver
+
+logger = logging.getLogger(__name__)
+
+# Review → iterate cycles before implementing the latest plan anyway
+DEFAULT_MAX_ITERATIONS = 2
+
+# Research is asked to end with this verdict line for the early-exit rule
+_VERDICT_INSTRUCTION = (
+    "\n\nEnd your summary with a single line `NEEDS_IMPLEMENTATION: yes` if code "
+    "changes are required to achieve the objective, or "
+    "`NEEDS_IMPLEMENTATION: no` if not."
+)
+_VERDICT_RE = re.compile(r"NEEDS_IMPLEMENTATION:\s*`?(yes|no)\b", re.IGNORECASE)
+# Longest wait for `git rev-parse HEAD` (e.g. on a locked or network repo)
+_GIT_TIMEOUT_S = 10.0
+
+
+class _StageTally(NullObserver):
+    """Observer that totals stage agent turns and cost for the summary."""
+
+    def __init__(self) -> None:
+        self.turns = 0
+        self.cost = 0.0
+
+    def on_complete(
+        self,
+        turns: int,
+        cost: float,
+        duration_ms: int,  # noqa: ARG002
+        *,
+        agent_id: str = "orchestrator",
+        usage: dict | None = None,  # noqa: ARG002
+    ) -> None:
+        """Accumulate stage agent turns and cost."""
+        if agent_id != "orchestrator":
+            self.turns += turns
+            self.cost += cost
+
+
+def needs_implementation(summary: str) -> bool:
+    """Apply the early-exit rule to a research summary.
+
+    Uses the last NEEDS_IMPLEMENTATION verdict in the summary; defaults to
+    True so a missing verdict never skips requested work.
+    """
+    verdicts = _VERDICT_RE.findall(summary)
+    return not verdicts or verdicts[-1].lower() == "yes"
+
+
+def _head_commit(cwd: Path | None = None) -> str | None:
+    """Return the HEAD commit hash of cwd (default: project root), or None."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=cwd or get_project_root(),
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=_GIT_TIMEOUT_S,
+        )
+    except subprocess.TimeoutExpired:
+        logger.warning("Timed out reading HEAD of %s", cwd or get_project_root())
+        return None
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+    return result.stdout.strip() or None
+
+
+class PipelineDriver:
+    """State machine that runs the workflow tools in a fixed order.
+
+    Each step calls an MCP tool handler directly and reports it to the
+    observer as an orchestrator tool call, so the live display and logs look
+    the same as an orchestrator run.
+    """
+
+    def __init__(
+        self,
+        objective: str,
+        *,
+        observer: WorkflowObserver | None = None,
+        max_iterations: int = DEFAULT_MAX_ITERATIONS,
+    ) -> None:
+        """Initialize the driver.
+
+        Args:
+            objective: The workflow objective/goal to execute.
+            observer: Optional observer for step and completion events.
+            max_iterations: Review → iterate cycles before implementing anyway.
+        """
+        self.objective = objective
+        self.observer = observer
+        self.max_iterations = max_iterations
+        self.steps = 0
+
+    async def _call(self, tool: SdkMcpTool[Any], args: dict) -> dict:
+        """Call a workflow tool and decode its JSON output."""
+        name = f"mcp__workflow__{tool.name}"
+        self.steps += 1
+        if self.observer:
+            self.observer.on_tool_start(name, args)
+        start = time.monotonic()
+        try:
+            response = await tool.handler(args)
+        except Exception as e:
+            if self.observer:
+                self.observer.on_tool_end(
+                    name,
+                    str(e)[:200],
+                    is_error=True,
+                    duration_ms=(time.monotonic() - start) * 1000,
+                )
+            raise
+        text = response["content"][0]["text"]
+        if self.observer:
+            self.observer.on_tool_end(
+                name,
+                text[:200],
+                is_error=False,
+                duration_ms=(time.monotonic() - start) * 1000,
+            )
+        return json.loads(text)
+
+    async def run(self) -> WorkflowOutput:
+        """Run the pipeline to completion.
+
+        Returns:
+            WorkflowOutput describing the run (status "failed" on errors).
+        """
+        ctx = get_workflow_ctx()
+        tally = _StageTally()
+        if ctx.observer:
+            ctx.observer = CompositeObserver([ctx.observer, tally])
+
+        start = time.monotonic()
+        try:
+            output = await self._run_steps()
+        except Exception as e:
+            logger.exception("Pipeline step failed")
+            output = WorkflowOutput(
+                research_doc_path=ctx.doc_paths.get(DocType.RESEARCH, ""),
+                research_summary="",
+                needs_implementation=False,
+                status="failed",
+                summary=f"Pipeline failed: {e}",
+            )
+
+        logger.info(
+            "Pipeline finished: status=%s, steps=%d, commit=%s",
+            output.status,
+            self.steps,
+            output.commit_hash,
+        )
+        if self.observer:
+            self.observer.on_complete(
+                turns=tally.turns,
+                cost=tally.cost,
+                duration_ms=int((time.monotonic() - start) * 1000),
+            )
+        return output
+
+    async def _run_steps(self) -> WorkflowOutput:
+        """Execute research → plan → review/iterate → implement → commit."""
+        research = await self._call(
+            research_codebase, {"query": self.objective + _VERDICT_INSTRUCTION}
+        )
+        research_doc = research.get("doc_path") or ""
+        summary = research.get("summary") or ""
+
+        if not research_doc:
+            return WorkflowOutput(
+                research_doc_path="",
+                research_summary=summary,
+                needs_implementation=False,
+                status="failed",
+                summary="Research did not produce a document",
+            )
+
+        if not needs_implementation(summary):
+            return WorkflowOutput(
+                research_doc_path=research_doc,
+                research_summary=summary,
+                needs_implementation=False,
+                status="no_changes_needed",
+                summary=summary,
+            )
+
+        plan = await self._call(
+            create_plan, {"query": self.objective, "research_path": research_doc}
+        )
+        plan_doc = plan.get("doc_path")
+        if not plan_doc:
+            return WorkflowOutput(
+                research_doc_path=research_doc,
+                research_summary=summary,
+                needs_implementation=True,
+                status="failed",
+                summary="Planning did not produce a plan document",
+            )
+
+        approved, iterations = await self._review_loop(plan_doc)
+
+        implemented = await self._call(
+            implement_plan, {"query": self.objective, "plan_path": plan_doc}
+        )
+        files_changed = implemented.get("files_changed") or []
+
+        # Commit only when files changed; HEAD before/after is ground truth
+        commit_hash = None
+        if files_changed:
+            cwd = get_workflow_ctx().cwd
+            head_before = await asyncio.to_thread(_head_commit, cwd)
+            await self._call(
+                commit_changes, {"query": f"Commit the changes for: {self.objective}"}
+            )
+            head_after = await asyncio.to_thread(_head_commit, cwd)
+            commit_hash = head_after if head_after != head_before else None
+
+        return WorkflowOutput(
+            research_doc_path=research_doc,
+            research_summary=summary,
+            needs_implementation=True,
+            plan_doc_path=plan_doc,
+            review_approved=approved,
+            review_iteration_count=iterations,
+            files_changed=files_changed,
+            commit_hash=commit_hash,
+            status="complete",
+            summary=implemented.get("result") or "Implementation complete",
+        )
+
+    async def _review_loop(self, plan_doc: str) -> tuple[bool, int]:
+        """Review the plan, iterating on feedback until approved or capped.
+
+        Returns:
+            Tuple of (approved, iteration count).
+        """
+        iterations = 0
+        while True:
+            review = await self._call(
+                review_plan, {"query": self.objective, "plan_path": plan_doc}
+            )
+            if review.get("approved"):
+                return True, iterations
+            if iterations >= self.max_iterations:
+                logger.info(
+                    "Plan not approved after %d iterations; implementing anyway",
+                    iterations,
+                )
+                return False, iterations
+
+            iterations += 1
+            await self._call(
+                iterate_plan,
+                {
+                    "query": self.objective,
+                    "plan_path": plan_doc,
+                    "feedback": review.get("feedback") or "",
+                },
+            )
+
+
+async def run_pipeline(
+    objective: str,
+    *,
+    observer: WorkflowObserver | None = None,
+    max_iterations: int = DEFAULT_MAX_ITERATIONS,
+) -> WorkflowOutput:
+    """Run the workflow with the deterministic pipeline driver.
+
+    Args:
+        objective: The workflow objective/goal to execute.
+        observer: Optional observer for step and completion events.
+        max_iterations: Review → iterate cycles before implementing anyway.
+
+    Returns:
+        WorkflowOutput for the run.
+    """
+    driver = PipelineDriver(objective, observer=observer, max_iterations=max_iterations)
+    return await driver.run()
@@ -16,8 +16,16 @@ Tool naming convention: mcp__workflow__{tool_name}
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
+import logging
+import re
+import time
+from datetime import datetime
+from os import getenv
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from claude_agent_sdk import create_sdk_mcp_server, tool
 
@@ -26,7 +34,178 @@ from π.bridge.session import (
     run_claude_session,
 )
 from π.core.enums import Command
+from π.utils import get_project_root
 from π.workflow.context import get_workflow_ctx
+from π.workflow.state import ArtifactEvent, emit_artifact_event
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    type ToolHandler = Callable[[dict], Awaitable[dict]]
+
+logger = logging.getLogger(__name__)
+
+# Concurrent research sessions when research_codebase fans out sub-queries
+RESEARCH_CONCURRENCY_ENV = "PI_RESEARCH_CONCURRENCY"
+DEFAULT_RESEARCH_CONCURRENCY = 3
+
+# Where merged research documents are written (relative to project root)
+RESEARCH_DIR = "thoughts/shared/research"
+
+# --- Research Fan-out ---
+
+
+def _research_concurrency(requested: int | None) -> int:
+    """Resolve the fan-out concurrency limit (tool arg > env > default)."""
+    if requested:
+        return max(requested, 1)
+    try:
+        return max(int(getenv(RESEARCH_CONCURRENCY_ENV, "")), 1)
+    except ValueError:
+        return DEFAULT_RESEARCH_CONCURRENCY
+
+
+def _slugify(text: str, *, max_len: int = 50) -> str:
+    """Build a filename-safe slug from free text."""
+    slug = re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+    return slug[:max_len].rstrip("-") or "research"
+
+
+def _write_merged_research(
+    query: str,
+    parts: list[tuple[str, str, str | None]],
+    root: Path | None = None,
+) -> str:
+    """Merge partial research documents into a single document.
+
+    Args:
+        query: The overall research query.
+        parts: (sub_query, summary, doc_path) for each sub-query session.
+        root: Directory to write into when no session produced a document.
+            Defaults to project root.
+
+    Returns:
+        Path to the merged research document.
+    """
+    doc_dirs = [Path(doc).parent for _, _, doc in parts if doc]
+    research_dir = (
+        doc_dirs[0] if doc_dirs else (root or get_project_root()) / RESEARCH_DIR
+    )
+    research_dir.mkdir(parents=True, exist_ok=True)
+
+    date = datetime.now().strftime("%Y-%m-%d")
+    merged_path = research_dir / f"{date}-{_slugify(query)}-merged.md"
+
+    sections = [
+        f"# Research: {query}",
+        "",
+        f"Merged from {len(parts)} concurrent research sessions.",
+    ]
+    for i, (sub_query, summary, doc_path) in enumerate(parts, start=1):
+        sections += ["", f"## {i}. {sub_query}", ""]
+        if doc_path and Path(doc_path).exists():
+            sections += [
+                f"Source: `{doc_path}`",
+                "",
+                Path(doc_path).read_text(encoding="utf-8"),
+            ]
+        else:
+            sections.append(summary)
+
+    merged_path.write_text("\n".join(sections).rstrip("\n") + "\n", encoding="utf-8")
+    return str(merged_path)
+
+
+async def _research_fanout(
+    query: str,
+    sub_queries: list[str],
+    *,
+    max_concurrency: int | None = None,
+) -> tuple[str, str]:
+    """Research sub-queries in concurrent stage sessions and merge the results.
+
+    Each sub-query gets its own session (resumed if the same sub-query was
+    researched before), bounded by a semaphore.
+
+    Args:
+        query: The overall research query (shared context for every session).
+        sub_queries: Independent areas to research concurrently.
+        max_concurrency: Optional concurrency limit override.
+
+    Returns:
+        Tuple of (merged summary, merged doc_path).
+
+    Raises:
+        RuntimeError: If every sub-query session failed.
+    """
+    cmd = Command.RESEARCH_CODEBASE
+    ctx = get_workflow_ctx()
+    sub_sessions = ctx.sub_session_ids.setdefault(cmd, {})
+    semaphore = asyncio.Semaphore(_research_concurrency(max_concurrency))
+
+    async def run_one(index: int, sub_query: str) -> tuple[str, str, str | None]:
+        async with semaphore:
+            result, session_id, doc_path, _ = await run_claude_session(
+                session_id=sub_sessions.get(sub_query),
+                agent_id=f"stage:{cmd.value}#{index}",
+                query=f"{query}\n\nFocus only on: {sub_query}",
+                observer=ctx.observer,
+                cwd=ctx.cwd,
+                tool_command=cmd,
+            )
+        sub_sessions[sub_query] = session_id
+        return result, session_id, doc_path
+
+    outcomes = await asyncio.gather(
+        *(run_one(i, sq) for i, sq in enumerate(sub_queries, start=1)),
+        return_exceptions=True,
+    )
+
+    parts: list[tuple[str, str, str | None]] = []
+    failures: list[BaseException] = []
+    for sub_query, outcome in zip(sub_queries, outcomes, strict=True):
+        if isinstance(outcome, BaseException):
+            logger.warning("Research sub-query failed (%s): %s", sub_query, outcome)
+            failures.append(outcome)
+            parts.append((sub_query, f"Research failed: {outcome}", None))
+        else:
+            result, _, doc_path = outcome
+            parts.append((sub_query, result, doc_path))
+
+    if len(failures) == len(sub_queries):
+        raise RuntimeError(f"All research sub-queries failed: {failures[0]}")
+
+    doc_path = _write_merged_research(query, parts, ctx.cwd)
+    summary = "\n\n".join(f"## {sq}\n{result}" for sq, result, _ in parts)
+    return summary, doc_path
+
+
+# --- Stage Events ---
+
+
+def _emits_stage_events(cmd: Command) -> Callable[[ToolHandler], ToolHandler]:
+    """Emit stage_start/stage_end artifact events around a tool handler."""
+
+    def decorate(handler: ToolHandler) -> ToolHandler:
+        @functools.wraps(handler)
+        async def wrapper(args: dict) -> dict:
+            emit_artifact_event(ArtifactEvent("stage_start", stage=cmd.value))
+            start = time.monotonic()
+            try:
+                return await handler(args)
+            finally:
+                emit_artifact_event(
+                    ArtifactEvent(
+                        "stage_end",
+                        stage=cmd.value,
+                        elapsed=time.monotonic() - start,
+                    )
+                )
+
+        return wrapper
+
+    return decorate
+
 
 # --- Tool Definitions ---
 
@@ -35,23 +214,50 @@ from π.workflow.context import get_workflow_ctx
     name="research_codebase",
     description="Research the codebase and document findings. Use this to explore "
     "and understand code structure, patterns, and implementations. "
+    "For broad objectives, pass independent areas as sub_queries to research "
+    "them concurrently; partial findings are merged into one document. "
     "Returns JSON with doc_path and summary for WorkflowOutput.",
-    input_schema={"query": str},
+    input_schema={
+        "type": "object",
+        "properties": {
+            "query": {"type": "string"},
+            "sub_queries": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Optional independent areas to research in "
+                "parallel sessions",
+            },
+            "max_concurrency": {
+                "type": "integer",
+                "description": "Optional limit on concurrent research sessions",
+            },
+        },
+        "required": ["query"],
+    },
 )
+@_emits_stage_events(Command.RESEARCH_CODEBASE)
 async def research_codebase(args: dict) -> dict:
-    """Research the codebase based on a query."""
+    """Research the codebase based on a query (optionally fanned out)."""
     cmd = Command.RESEARCH_CODEBASE
     ctx = get_workflow_ctx()
 
-    result, session_id, doc_path, _ = await run_claude_session(
-        session_id=ctx.session_ids.get(cmd),
-        observer=ctx.observer,
-        query=args["query"],
-        tool_command=cmd,
-    )
+    if sub_queries := [sq for sq in args.get("sub_queries") or [] if sq.strip()]:
+        result, doc_path = await _research_fanout(
+            args["query"],
+            sub_queries,
+            max_concurrency=args.get("max_concurrency"),
+        )
+    else:
+        result, session_id, doc_path, _ = await run_claude_session(
+            session_id=ctx.session_ids.get(cmd),
+            observer=ctx.observer,
+            cwd=ctx.cwd,
+            query=args["query"],
+            tool_command=cmd,
+        )
+        ctx.session_ids[cmd] = session_id
 
     # Update context
-    ctx.session_ids[cmd] = session_id
     if doc_path and (doc_type := COMMAND_DOC_TYPE.get(cmd)):
         ctx.doc_paths[doc_type] = doc_path
 
@@ -67,6 +273,7 @@ async def research_codebase(args: dict) -> dict:
     "Returns JSON with doc_path for WorkflowOutput.",
     input_schema={"query": str, "research_path": str},
 )
+@_emits_stage_events(Command.CREATE_PLAN)
 async def create_plan(args: dict) -> dict:
     """Create a plan based on a research document."""
     cmd = Command.CREATE_PLAN
@@ -78,6 +285,7 @@ async def create_plan(args: dict) -> dict:
         query=args["query"],
         tool_command=cmd,
         observer=ctx.observer,
+        cwd=ctx.cwd,
     )
 
     # Update context
@@ -97,6 +305,7 @@ async def create_plan(args: dict) -> dict:
     "Returns JSON with approved boolean for WorkflowOutput.",
     input_schema={"query": str, "plan_path": str},
 )
+@_emits_stage_events(Command.REVIEW_PLAN)
 async def review_plan(args: dict) -> dict:
     """Review a plan document."""
     cmd = Command.REVIEW_PLAN
@@ -106,6 +315,7 @@ async def review_plan(args: dict) -> dict:
         session_id=ctx.session_ids.get(cmd),
         document=Path(args["plan_path"]),
         observer=ctx.observer,
+        cwd=ctx.cwd,
         query=args["query"],
         tool_command=cmd,
     )
@@ -133,6 +343,7 @@ async def review_plan(args: dict) -> dict:
     "Returns JSON with updated doc_path for WorkflowOutput.",
     input_schema={"query": str, "plan_path": str, "feedback": str},
 )
+@_emits_stage_events(Command.ITERATE_PLAN)
 async def iterate_plan(args: dict) -> dict:
     """Iterate on a plan based on feedback."""
     cmd = Command.ITERATE_PLAN
@@ -147,6 +358,7 @@ async def iterate_plan(args: dict) -> dict:
         session_id=ctx.session_ids.get(cmd),
         document=Path(args["plan_path"]),
         observer=ctx.observer,
+        cwd=ctx.cwd,
         tool_command=cmd,
         query=full_query,
     )
@@ -168,6 +380,7 @@ async def iterate_plan(args: dict) -> dict:
     "Returns JSON with files_changed list for WorkflowOutput.",
     input_schema={"query": str, "plan_path": str},
 )
+@_emits_stage_events(Command.IMPLEMENT_PLAN)
 async def implement_plan(args: dict) -> dict:
     """Implement a plan by executing all phases."""
     cmd = Command.IMPLEMENT_PLAN
@@ -177,6 +390,7 @@ async def implement_plan(args: dict) -> dict:
         session_id=ctx.session_ids.get(cmd),
         document=Path(args["plan_path"]),
         observer=ctx.observer,
+        cwd=ctx.cwd,
         query=args["query"],
         tool_command=cmd,
     )
@@ -196,6 +410,7 @@ async def implement_plan(args: dict) -> dict:
     "Returns JSON with commit_hash for WorkflowOutput.",
     input_schema={"query": str},
 )
+@_emits_stage_events(Command.COMMIT)
 async def commit_changes(args: dict) -> dict:
     """Commit changes with context."""
     ctx = get_workflow_ctx()
@@ -204,6 +419,7 @@ async def commit_changes(args: dict) -> dict:
     result, session_id, _, _ = await run_claude_session(
         session_id=ctx.session_ids.get(cmd),
         observer=ctx.observer,
+        cwd=ctx.cwd,
         query=args["query"],
         tool_command=cmd,
     )
@@ -221,6 +437,7 @@ async def commit_changes(args: dict) -> dict:
     "Keeps project documentation in sync with code.",
     input_schema={"query": str, "git_diff": str},
 )
+@_emits_stage_events(Command.WRITE_CLAUDE_MD)
 async def write_claude_md(args: dict) -> dict:
     """Update CLAUDE.md based on changes."""
     cmd = Command.WRITE_CLAUDE_MD
@@ -235,6 +452,7 @@ async def write_claude_md(args: dict) -> dict:
     result, session_id, _, files_changed = await run_claude_session(
         session_id=ctx.session_ids.get(cmd),
         observer=ctx.observer,
+        cwd=ctx.cwd,
         tool_command=cmd,
         query=full_query,
     )
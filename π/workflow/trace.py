@@ -0,0 +1,310 @@
+"""Chrome trace export of workflow runs.
+
+TraceObserver turns observer events, stage/phase ArtifactEvents and hook
+spans into nested timeline spans and writes them as Chrome trace JSON,
+which chrome://tracing and ui.perfetto.dev open directly:
+
+    run (orchestrator)
+    └── mcp__workflow__<stage> tool call
+        └── session (stage:<command>)
+            ├── model turns
+            └── tool calls
+                └── hooks and lint runs
+
+Each agent_id gets its own track; stage/phase events get a "stages" track.
+Spans that overlap without nesting (parallel tool calls) move to an extra
+lane of their track, so every lane nests properly.
+
+Artifact events and hook spans are process-wide, so a tracer keeps only
+those of its own workflow (concurrent workflows under `π batch` each have
+a tracer): artifact events emitted in its WorkflowContext, and hook spans
+of sessions it saw start.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from π.hooks.timing import subscribe_to_hook_spans
+from π.workflow.context import get_workflow_ctx
+from π.workflow.observer import NullObserver
+from π.workflow.state import subscribe_to_artifacts
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from π.hooks.timing import HookSpan
+    from π.workflow.state import ArtifactEvent
+
+ORCHESTRATOR_TRACK = "orchestrator"
+STAGES_TRACK = "stages"
+# Hook spans from sessions no init message was seen for
+HOOKS_TRACK = "hooks"
+
+# Gaps shorter than this between agent events are not recorded as model time
+_MIN_MODEL_SPAN_S = 0.001
+
+
+@dataclass(slots=True)
+class _Span:
+    """A completed span (times from time.monotonic)."""
+
+    name: str
+    category: str
+    track: str
+    start: float
+    end: float
+    args: dict = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class _AgentState:
+    """Activity of one agent, for attributing idle gaps to the model."""
+
+    last_activity: float
+    running_tools: int = 0
+
+
+class TraceObserver(NullObserver):
+    """Observer that records a run as Chrome trace spans.
+
+    Subscribes to artifact events and hook spans on creation; close()
+    unsubscribes and writes the trace.
+
+    Usage:
+        tracer = TraceObserver()
+        observer = CompositeObserver([live, log, tracer])
+        ...
+        tracer.close(log_path.with_suffix(".trace.json"))
+    """
+
+    def __init__(self) -> None:
+        """Start the run span and subscribe to artifact and hook events."""
+        self.start = time.monotonic()
+        self.spans: list[_Span] = []
+        self._started_at = datetime.now()
+        self._agents: dict[str, _AgentState] = {}
+        # SDK session_id -> agent_id, from init system messages
+        self._sessions: dict[str, str] = {}
+        # (stage|phase, name) -> start time
+        self._open: dict[tuple[str, str], float] = {}
+        # Events emitted under another context belong to another workflow
+        self._ctx = get_workflow_ctx()
+        self._unsubscribe = [
+            subscribe_to_artifacts(self._on_artifact),
+            subscribe_to_hook_spans(self._on_hook_span),
+        ]
+        self._closed = False
+
+    def _state(self, agent_id: str, now: float) -> _AgentState:
+        return self._agents.setdefault(agent_id, _AgentState(now))
+
+    def _model_turn(self, agent_id: str, now: float) -> None:
+        """Record the time since the agent's last activity as model time."""
+        state = self._state(agent_id, now)
+        if state.running_tools == 0 and now - state.last_activity >= _MIN_MODEL_SPAN_S:
+            self.spans.append(
+                _Span("model", "model", agent_id, state.last_activity, now)
+            )
+        state.last_activity = now
+
+    def on_tool_start(
+        self,
+        name: str,  # noqa: ARG002
+        input: dict,  # noqa: ARG002
+        *,
+        agent_id: str = "orchestrator",
+    ) -> None:
+        """Close the model turn that produced the tool call."""
+        now = time.monotonic()
+        self._model_turn(agent_id, now)
+        self._state(agent_id, now).running_tools += 1
+
+    def on_tool_end(
+        self,
+        name: str,
+        result: str | None,  # noqa: ARG002
+        is_error: bool,
+        *,
+        agent_id: str = "orchestrator",
+        duration_ms: float | None = None,
+    ) -> None:
+        """Record the tool call span (if its duration is known)."""
+        now = time.monotonic()
+        state = self._state(agent_id, now)
+        state.running_tools = max(state.running_tools - 1, 0)
+        state.last_activity = now
+        if duration_ms is not None:
+            args = {"error": True} if is_error else {}
+            start = now - duration_ms / 1000
+            self.spans.append(_Span(name, "tool", agent_id, start, now, args))
+
+    def on_text(
+        self,
+        text: str,  # noqa: ARG002
+        *,
+        agent_id: str = "orchestrator",
+    ) -> None:
+        """Close the model turn that produced the text."""
+        self._model_turn(agent_id, time.monotonic())
+
+    def on_thinking(
+        self,
+        text: str,  # noqa: ARG002
+        *,
+        agent_id: str = "orchestrator",
+    ) -> None:
+        """Close the model turn that produced the thinking."""
+        self._model_turn(agent_id, time.monotonic())
+
+    def on_complete(
+        self,
+        turns: int,
+        cost: float,
+        duration_ms: int,
+        *,
+        agent_id: str = "orchestrator",
+        usage: dict | None = None,  # noqa: ARG002
+    ) -> None:
+        """Record the agent session span."""
+        now = time.monotonic()
+        self._agents.pop(agent_id, None)
+        args = {"turns": turns, "cost_usd": round(cost, 4)}
+        start = now - duration_ms / 1000
+        self.spans.append(_Span("session", "session", agent_id, start, now, args))
+
+    def on_system(
+        self, subtype: str, data: dict, *, agent_id: str = "orchestrator"
+    ) -> None:
+        """Map the session to its agent and start its first model turn."""
+        if subtype == "init":
+            now = time.monotonic()
+            if session_id := data.get("session_id"):
+                self._sessions[session_id] = agent_id
+            self._agents[agent_id] = _AgentState(now)
+
+    def _on_artifact(self, event: ArtifactEvent) -> None:
+        kind, _, edge = event.event_type.partition("_")
+        name = event.stage if kind == "stage" else event.phase
+        if kind not in ("stage", "phase") or not name:
+            return
+        if get_workflow_ctx() is not self._ctx:
+            return
+        now = time.monotonic()
+        if edge == "start":
+            self._open[kind, name] = now
+        elif edge == "end":
+            start = self._open.pop((kind, name), None)
+            if start is None:
+                start = now - (event.elapsed or 0.0)
+            self.spans.append(_Span(name, kind, STAGES_TRACK, start, now))
+
+    def _on_hook_span(self, span: HookSpan) -> None:
+        track = self._sessions.get(span.session_id)
+        if track is None:
+            # Hooks run in the session's client task, not the workflow's, so
+            # only unknown sessions are attributed by context
+            if get_workflow_ctx() is not self._ctx:
+                return
+            track = HOOKS_TRACK
+        category = "lint" if span.name == "lint" else "hook"
+        self.spans.append(
+            _Span(span.name, category, track, span.start, span.end, dict(span.args))
+        )
+
+    def close(self, path: Path) -> Path:
+        """Unsubscribe, end the run span and write the trace.
+
+        Args:
+            path: Trace file to write (e.g., next to the run's log file).
+
+        Returns:
+            The trace path.
+        """
+        if not self._closed:
+            self._closed = True
+            for unsubscribe in self._unsubscribe:
+                unsubscribe()
+            self.spans.append(
+                _Span("run", "run", ORCHESTRATOR_TRACK, self.start, time.monotonic())
+            )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_chrome_trace()), encoding="utf-8")
+        return path
+
+    def to_chrome_trace(self) -> dict:
+        """Build the Chrome trace event document for the recorded spans."""
+        origin = min((span.start for span in self.spans), default=self.start)
+        origin = min(origin, self.start)
+        events: list[dict] = [
+            _metadata("process_name", 0, {"name": "π"}),
+        ]
+        for tid, (label, spans) in enumerate(_lanes(self.spans), start=1):
+            events.append(_metadata("thread_name", tid, {"name": label}))
+            events.append(_metadata("thread_sort_index", tid, {"sort_index": tid}))
+            events.extend(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": round((span.start - origin) * 1e6),
+                    "dur": round((span.end - span.start) * 1e6),
+                    "pid": 1,
+                    "tid": tid,
+                    "args": span.args,
+                }
+                for span in spans
+            )
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"started_at": self._started_at.isoformat()},
+        }
+
+
+def _metadata(name: str, tid: int, args: dict) -> dict:
+    return {"name": name, "ph": "M", "pid": 1, "tid": tid, "args": args}
+
+
+def _track_order(track: str) -> tuple[int, str]:
+    if track == ORCHESTRATOR_TRACK:
+        return 0, ""
+    if track == STAGES_TRACK:
+        return 1, ""
+    if track == HOOKS_TRACK:
+        return 3, ""
+    return 2, track
+
+
+def _lanes(spans: list[_Span]) -> list[tuple[str, list[_Span]]]:
+    """Split each track into lanes in which spans nest properly.
+
+    A span goes to the first lane where it starts after or ends within the
+    innermost open span; outer spans are placed first.
+    """
+    tracks: dict[str, list[_Span]] = {}
+    for span in sorted(spans, key=lambda s: (s.start, -s.end)):
+        tracks.setdefault(span.track, []).append(span)
+
+    result: list[tuple[str, list[_Span]]] = []
+    for track in sorted(tracks, key=_track_order):
+        lanes: list[tuple[list[float], list[_Span]]] = []
+        for span in tracks[track]:
+            for open_ends, placed in lanes:
+                while open_ends and open_ends[-1] <= span.start:
+                    open_ends.pop()
+                if not open_ends or span.end <= open_ends[-1]:
+                    open_ends.append(span.end)
+                    placed.append(span)
+                    break
+            else:
+                lanes.append(([span.end], [span]))
+        result.extend(
+            (track if i == 0 else f"{track} ({i + 1})", placed)
+            for i, (_, placed) in enumerate(lanes)
+        )
+    return result
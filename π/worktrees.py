@@ -0,0 +1,221 @@
+"""Pool of git worktrees for concurrent workflows on one repository.
+
+Two workflows on one checkout edit the same files, and commit_changes
+commits whatever is staged. WorktreePool pre-creates detached worktrees of
+the repository (under .π/worktrees) and hands each workflow, or each
+parallel implementation attempt, its own; the path is passed as cwd to the
+orchestrator and stage agents.
+
+On acquire the worktree is switched to a new branch, so its commits outlive
+it. On release it is reset to the base commit and cleaned of untracked
+files; ignored files (build outputs, virtualenvs) are kept, so the next
+workflow starts warm. A worktree that can't be recycled is replaced; if that
+fails too, its slot stays in the pool and the next acquire() retries, so the
+pool never shrinks. close() removes them all.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import re
+import shutil
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+BRANCH_PREFIX = "pi/"
+
+# Characters git rejects (or that need quoting) in branch names
+_UNSAFE_REF_CHARS = re.compile(r"[^A-Za-z0-9._/-]+")
+
+
+def branch_name(*parts: str) -> str:
+    """Build a branch name under BRANCH_PREFIX from arbitrary labels."""
+    cleaned = (_UNSAFE_REF_CHARS.sub("-", part).strip("-./") for part in parts)
+    return BRANCH_PREFIX + "/".join(part for part in cleaned if part)
+
+
+async def _git(cwd: Path, *args: str) -> str:
+    """Run git in cwd and return its stdout.
+
+    Raises:
+        RuntimeError: If git fails or is not installed.
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "git",
+            *args,
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except FileNotFoundError as e:
+        raise RuntimeError("git not found") from e
+    stdout, stderr = await proc.communicate()
+    if proc.returncode:
+        message = stderr.decode(errors="replace").strip()
+        raise RuntimeError(f"git {args[0]} failed: {message}")
+    return stdout.decode(errors="replace").strip()
+
+
+class WorktreePool:
+    """Pre-created git worktrees handed out one per workflow.
+
+    Usage:
+        pool = WorktreePool(repo, root=get_worktrees_dir(), size=4)
+        await pool.start()
+        async with pool.acquire(branch=branch_name("batch", job_id)) as path:
+            await run_workflow(objective, log_path=log_path, cwd=path)
+        await pool.close()
+    """
+
+    def __init__(
+        self, repo: Path, *, root: Path, size: int, base: str = "HEAD"
+    ) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            repo: Repository to create worktrees of.
+            root: Directory to create the worktrees in.
+            size: Number of worktrees (workflows that can run at once).
+            base: Commit every worktree starts from and is reset to.
+        """
+        self.repo = repo
+        self.root = root
+        self.size = max(size, 1)
+        self.base = base
+        self.base_commit = ""
+        # None marks a slot whose worktree must be (re)created
+        self._free: asyncio.Queue[Path | None] = asyncio.Queue()
+        self._paths: set[Path] = set()
+        self._created = 0
+
+    async def start(self) -> None:
+        """Resolve the base commit and create the worktrees.
+
+        Worktrees are added one at a time: concurrent `git worktree add`
+        runs race on the repository's worktree metadata.
+
+        Raises:
+            RuntimeError: If repo is not a git repository or a worktree
+                can't be created (worktrees already made are removed).
+        """
+        self.base_commit = await _git(
+            self.repo, "rev-parse", "--verify", f"{self.base}^{{commit}}"
+        )
+        self.root.mkdir(parents=True, exist_ok=True)
+        try:
+            for _ in range(self.size):
+                self._free.put_nowait(await self._add())
+        except BaseException:
+            self._free = asyncio.Queue()
+            await self.close()
+            raise
+        logger.debug(
+            "Created %d worktrees at %s (%s)", self.size, self.root, self.base_commit
+        )
+
+    @asynccontextmanager
+    async def acquire(self, *, branch: str | None = None) -> AsyncGenerator[Path]:
+        """Check out a worktree, waiting for one to be free.
+
+        Args:
+            branch: Branch to create at the base commit for the workflow's
+                commits (None leaves the worktree detached; commits made
+                there are discarded on release).
+
+        Yields:
+            The worktree path, to use as the workflow's cwd.
+
+        Raises:
+            RuntimeError: If the slot's worktree had to be recreated and
+                that failed (the slot is kept for the next caller).
+        """
+        path = await self._free.get()
+        if path is None:
+            try:
+                path = await self._add()
+            except BaseException:
+                self._free.put_nowait(None)
+                raise
+        recycled: Path | None = None
+        try:
+            if branch:
+                await _git(path, "switch", "--quiet", "--create", branch)
+            yield path
+        finally:
+            try:
+                recycled = await self._recycle(path, branch)
+            finally:
+                self._free.put_nowait(recycled)
+
+    async def close(self) -> None:
+        """Remove every worktree of the pool."""
+        await asyncio.gather(*(self._remove(path) for path in list(self._paths)))
+        with contextlib.suppress(RuntimeError):
+            await _git(self.repo, "worktree", "prune")
+        with contextlib.suppress(OSError):
+            self.root.rmdir()
+
+    async def _add(self) -> Path:
+        # Unique across processes sharing the worktrees directory
+        self._created += 1
+        path = self.root / f"{os.getpid()}-{self._created}"
+        await _git(
+            self.repo,
+            "worktree",
+            "add",
+            "--quiet",
+            "--detach",
+            str(path),
+            self.base_commit,
+        )
+        self._paths.add(path)
+        return path
+
+    async def _recycle(self, path: Path, branch: str | None) -> Path | None:
+        """Reset a released worktree to the base commit, or replace it.
+
+        Returns:
+            The worktree to hand out next, or None if no replacement could
+            be created.
+        """
+        try:
+            await self._reset(path, branch)
+        except RuntimeError:
+            logger.warning("Replacing worktree %s", path, exc_info=True)
+            await self._remove(path)
+            try:
+                return await self._add()
+            except RuntimeError:
+                logger.exception("Failed to replace worktree %s", path)
+                return None
+        return path
+
+    async def _reset(self, path: Path, branch: str | None) -> None:
+        if not branch:
+            head = await _git(path, "rev-parse", "HEAD")
+            if head != self.base_commit:
+                logger.warning(
+                    "Discarding commit %s made on detached worktree %s", head, path
+                )
+        # Untracked files go; ignored ones (build outputs) stay warm
+        await _git(path, "reset", "--quiet", "--hard")
+        await _git(path, "clean", "--quiet", "-fd")
+        await _git(path, "switch", "--quiet", "--detach", self.base_commit)
+
+    async def _remove(self, path: Path) -> None:
+        self._paths.discard(path)
+        try:
+            await _git(self.repo, "worktree", "remove", "--force", str(path))
+        except RuntimeError:
+            logger.warning("Failed to remove worktree %s", path, exc_info=True)
+            shutil.rmtree(path, ignore_errors=True)